@@ -0,0 +1,77 @@
+#
+# This script measures the time to iterate over the component
+# data objects of a deeply nested block model.  The model is a
+# complete tree of blocks where every block declares a variable, but
+# only the leaves of one branch declare constraints.  The output
+# reports the average time (over a specified number of trials) for
+# several common queries.
+#
+
+# tree depth and branching factor of the block hierarchy
+DEPTH = 6
+WIDTH = 4
+
+import gc
+import time
+
+from pyomo.environ import (ConcreteModel, Block, Var, Constraint,
+                           Objective, SortComponents)
+from pyomo.core.base.block import TraversalStrategy
+
+from six.moves import xrange as range
+
+def build_model():
+    model = ConcreteModel()
+    def _populate(blk, depth, with_constraints):
+        blk.x = Var()
+        if depth == DEPTH:
+            if with_constraints:
+                blk.c = Constraint(expr=blk.x >= 0)
+            return
+        blk.b = Block(range(WIDTH))
+        for i in range(WIDTH):
+            _populate(blk.b[i], depth+1, with_constraints and i == 0)
+    _populate(model, 1, True)
+    return model
+
+def measure(f, n=10):
+    """measure average execution time over n trials"""
+    gc.collect()
+    time_seconds = 0
+    for i in range(n):
+        start = time.time()
+        count = f()
+        stop = time.time()
+        time_seconds += stop - start
+    time_seconds /= float(n)
+    return count, time_seconds
+
+if __name__ == "__main__":
+
+    model = build_model()
+    nblocks = len(list(model.block_data_objects()))
+    print("Model: %d blocks (depth=%d, width=%d)"
+          % (nblocks, DEPTH, WIDTH))
+    print("")
+
+    queries = [
+        ("active Constraints",
+         lambda: len(list(model.component_data_objects(
+             Constraint, active=True)))),
+        ("active Constraints (sorted)",
+         lambda: len(list(model.component_data_objects(
+             Constraint, active=True, sort=SortComponents.deterministic)))),
+        ("active Constraints (BFS)",
+         lambda: len(list(model.component_data_objects(
+             Constraint, active=True,
+             descent_order=TraversalStrategy.BreadthFirstSearch)))),
+        ("Objectives",
+         lambda: len(list(model.component_data_objects(Objective)))),
+        ("Vars",
+         lambda: len(list(model.component_data_objects(Var)))),
+        ("all Blocks",
+         lambda: len(list(model.block_data_objects()))),
+        ]
+    for name, query in queries:
+        count, seconds = measure(query)
+        print("%-30s %8d objects %10.5f s" % (name, count, seconds))
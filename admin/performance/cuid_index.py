@@ -0,0 +1,49 @@
+#
+# This script compares resolving and generating CUIDs one component at
+# a time (ComponentUID.find_component and ComponentUID(obj)) with the
+# bulk operations of ComponentUIDIndex.  The model has N blocks, each
+# with an indexed variable of M elements.
+#
+
+# number of blocks (and variables per block)
+N = 2000
+M = 10
+
+import gc
+import time
+
+from pyomo.environ import (ConcreteModel, Block, Var, ComponentUID,
+                           ComponentUIDIndex)
+
+def build_model():
+    model = ConcreteModel()
+    model.b = Block(range(N))
+    for i in range(N):
+        model.b[i].x = Var(range(M))
+    return model
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    model = build_model()
+    objs = list(model.component_data_objects(Var))
+    cuids = [ComponentUID(obj) for obj in objs]
+    strings = [repr(cuid) for cuid in cuids]
+
+    _, seconds = measure(lambda: [ComponentUID(obj) for obj in objs])
+    print("%-30s %10.3f s" % ("ComponentUID(obj)", seconds))
+    _, seconds = measure(lambda: [ComponentUID(s).find_component(model)
+                                  for s in strings])
+    print("%-30s %10.3f s" % ("find_component", seconds))
+
+    _, seconds = measure(lambda: ComponentUIDIndex(model).cuids(objs))
+    print("%-30s %10.3f s" % ("ComponentUIDIndex.cuids", seconds))
+    index = ComponentUIDIndex(model)
+    _, seconds = measure(lambda: index.find_all(strings))
+    print("%-30s %10.3f s" % ("ComponentUIDIndex.find_all", seconds))
@@ -0,0 +1,59 @@
+#
+# This script compares the time to parse a large .dat file with the
+# PLY grammar, with the hand-written scanner, and from the parsed-data
+# cache.  The file declares a set and a two-dimensional parameter.
+#
+
+# number of set elements (and parameter rows)
+N = 200000
+M = 4
+
+import gc
+import os
+import random
+import shutil
+import tempfile
+import time
+
+import pyomo.core.data.parse_datacmds as parse_datacmds
+from pyomo.core.data.parse_datacmds import parse_data_commands
+
+def write_data(fname):
+    random.seed(0)
+    with open(fname, 'w') as f:
+        f.write('set I := %s;\n' % ' '.join(str(i) for i in range(N)))
+        f.write('param p :=\n')
+        for i in range(N):
+            for j in range(M):
+                f.write('%d %d %.6g\n' % (i, j, random.random()))
+        f.write(';\n')
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        fname = os.path.join(tmpdir, 'data.dat')
+        write_data(fname)
+        with open(fname) as f:
+            data = f.read()
+        print("%-20s %10d bytes" % ("data", len(data)))
+        _, seconds = measure(lambda: parse_datacmds._ply_parse(data, 0, None))
+        print("%-20s %10.3f s" % ("ply", seconds))
+        _, seconds = measure(lambda: parse_data_commands(data=data))
+        print("%-20s %10.3f s" % ("scanner", seconds))
+        cachedir = os.path.join(tmpdir, 'cache')
+        _, seconds = measure(lambda: parse_data_commands(filename=fname,
+                                                         cache=cachedir))
+        print("%-20s %10.3f s" % ("scanner+cache", seconds))
+        _, seconds = measure(lambda: parse_data_commands(filename=fname,
+                                                         cache=cachedir))
+        print("%-20s %10.3f s" % ("cached", seconds))
+    finally:
+        shutil.rmtree(tmpdir)
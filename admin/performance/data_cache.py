@@ -0,0 +1,62 @@
+#
+# This script compares the time to load a .dat file and a csv table
+# with a DataPortal, without a data cache and when the processed data
+# is read from a DataCache.
+#
+
+# number of parameter values in each file
+N = 200000
+
+import gc
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from pyomo.environ import DataPortal
+from pyomo.core.data.data_cache import DataCache
+
+def write_files(tmpdir):
+    random.seed(0)
+    values = [(i // 10, 'j%d' % (i % 10), random.random()) for i in range(N)]
+    datfile = os.path.join(tmpdir, 'data.dat')
+    with open(datfile, 'w') as f:
+        f.write("param p :=\n")
+        for row in values:
+            f.write("%d %s %r\n" % row)
+        f.write(";\n")
+    csvfile = os.path.join(tmpdir, 'data.csv')
+    with open(csvfile, 'w') as f:
+        f.write("I,J,p\n")
+        for row in values:
+            f.write("%d,%s,%r\n" % row)
+    return datfile, csvfile
+
+def load(cache, **kwds):
+    data = DataPortal(cache=cache)
+    data.load(**kwds)
+    return data
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        datfile, csvfile = write_files(tmpdir)
+        cache = DataCache(os.path.join(tmpdir, 'cache'))
+        for name, kwds in (('dat', dict(filename=datfile)),
+                           ('csv', dict(filename=csvfile, param='p'))):
+            for label, c in (('no cache', None), ('cache miss', cache),
+                             ('cache hit', cache)):
+                _, seconds = measure(lambda: load(c, **kwds))
+                print("%-20s %10.3f s" % ("%s %s" % (name, label), seconds))
+        print(cache.stats())
+    finally:
+        shutil.rmtree(tmpdir)
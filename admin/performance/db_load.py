@@ -0,0 +1,67 @@
+#
+# This script compares the time to load many tables from one sqlite3
+# database with a DataPortal, when each load opens a new connection
+# and converts the rows to data commands, and when the loads
+# share a pooled connection and stream the rows in chunks.
+#
+
+# number of tables in the database
+T = 40
+# number of rows in each table
+N = 20000
+
+import gc
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from pyomo.environ import DataPortal
+from pyomo.core.data.TableData import TableData
+
+def write_database(fname):
+    random.seed(0)
+    con = sqlite3.connect(fname)
+    for t in range(T):
+        con.execute("CREATE TABLE T%d (I INTEGER, J TEXT, a REAL, b INTEGER)"
+                    % t)
+        con.executemany("INSERT INTO T%d VALUES (?,?,?,?)" % t,
+                        [(i // 10, 'j%d' % (i % 10), random.random(),
+                          random.randint(0, 100)) for i in range(N)])
+    con.commit()
+    con.close()
+
+def load(fname, pooled):
+    data = DataPortal()
+    for t in range(T):
+        data.load(filename=fname, using='sqlite3', table='T%d' % t,
+                  param=('a%d' % t, 'b%d' % t), index='IJ%d' % t)
+        if not pooled:
+            data.close_connections()
+    data.close_connections()
+    return data
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        fname = os.path.join(tmpdir, 'data.sqlite')
+        write_database(fname)
+        for pooled in (False, True):
+            TableData.columnar = pooled
+            _, seconds = measure(lambda: load(fname, pooled))
+            print("%-30s %10.3f s"
+                  % ("pooled, chunked" if pooled else
+                     "connect per load, data commands", seconds))
+    finally:
+        TableData.columnar = True
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,51 @@
+#
+# This script measures the time to compile the constraint matrix of a
+# sparse LP into CSR arrays and, if the solver is available, the time
+# for a direct solver interface to load the model.
+#
+
+# name of the direct solver
+SOLVER = 'cplex_direct'
+# number of variables and constraints
+N = 100000
+# number of nonzeros per constraint
+K = 5
+
+import gc
+import random
+import time
+
+from pyomo.environ import (ConcreteModel, Constraint, Objective, RangeSet,
+                           SolverFactory, Var)
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.repn.beta.matrix import compile_linear_constraint_matrix
+
+def create_model():
+    random.seed(0)
+    model = ConcreteModel()
+    model.I = RangeSet(0, N-1)
+    model.x = Var(model.I, bounds=(0, 1))
+    model.o = Objective(expr=sum(model.x.values()))
+    model.c = Constraint(model.I, rule=lambda m, i: sum(
+        random.random()*m.x[j] for j in random.sample(range(N), K)) >= 1)
+    return model
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    model = create_model()
+    column_index = ComponentMap((v, i) for i, v in enumerate(model.x.values()))
+    _, seconds = measure(lambda: compile_linear_constraint_matrix(
+        list(model.c.values()), column_index))
+    print("%-20s %10.3f s" % ("compile matrix", seconds))
+
+    opt = SolverFactory(SOLVER)
+    if opt.available(exception_flag=False):
+        _, seconds = measure(lambda: opt._set_instance(model))
+        print("%-20s %10.3f s" % ("set_instance", seconds))
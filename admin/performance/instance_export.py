@@ -0,0 +1,70 @@
+#
+# This script measures the time to export the data of a model instance
+# with a 2-D parameter and a 2-D variable to a .dat file, csv files and
+# a .npz file, and compares it with writing the values one at a time.
+#
+
+# size of each axis of the parameter and the variable
+N = 700
+
+import gc
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from pyomo.environ import ConcreteModel, Param, RangeSet, Var, value
+from pyomo.core.base.instance2dat import export_instance, instance_checkpoint
+
+def create_instance():
+    random.seed(0)
+    model = ConcreteModel()
+    model.I = RangeSet(0, N-1)
+    model.J = RangeSet(0, N-1)
+    model.p = Param(model.I, model.J, initialize=dict(
+        ((i, j), random.random()) for i in range(N) for j in range(N)))
+    model.x = Var(model.I, model.J)
+    for i in range(N):
+        for j in range(N):
+            model.x[i, j].value = random.random()
+    return model
+
+def write_per_item(instance, filename):
+    with open(filename, 'w') as f:
+        for comp in (instance.p, instance.x):
+            f.write("param %s :=\n" % comp.local_name)
+            for index in comp:
+                for i in index:
+                    f.write("%s " % i)
+                f.write("%s\n" % value(comp[index]))
+            f.write(";\n")
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        instance = create_instance()
+        _, seconds = measure(lambda: write_per_item(
+            instance, os.path.join(tmpdir, 'items.dat')))
+        print("%-20s %10.3f s" % ("per-item dat", seconds))
+        for label, fname in (('dat', 'out.dat'), ('csv', 'csv'),
+                             ('npz', 'out.npz')):
+            _, seconds = measure(lambda: export_instance(
+                instance, os.path.join(tmpdir, fname), format=label))
+            print("%-20s %10.3f s" % (label, seconds))
+        checkpoint, seconds = measure(lambda: instance_checkpoint(instance))
+        print("%-20s %10.3f s" % ("checkpoint", seconds))
+        instance.x[0, 0].value = -1
+        _, seconds = measure(lambda: export_instance(
+            instance, os.path.join(tmpdir, 'changed.dat'), since=checkpoint))
+        print("%-20s %10.3f s" % ("changed dat", seconds))
+    finally:
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,63 @@
+#
+# This script compares the time to load many independent csv tables
+# with DataPortal.load_all(), serially and with pools of threads and
+# processes.  The speedup depends on the number of processors.
+#
+
+# number of tables
+T = 40
+# number of rows in each table
+N = 20000
+
+import gc
+import os
+import shutil
+import tempfile
+import time
+
+from pyomo.environ import AbstractModel, DataPortal, Param, Set
+
+def write_tables(tmpdir):
+    sources = []
+    for t in range(T):
+        fname = os.path.join(tmpdir, 'p%d.csv' % t)
+        with open(fname, 'w') as f:
+            f.write("I,p%d\n" % t)
+            for i in range(N):
+                f.write("%d,%d.5\n" % (i, i))
+        sources.append({'filename': fname, 'param': 'p%d' % t,
+                        'index': 'I'})
+    return sources
+
+def create_model():
+    model = AbstractModel()
+    model.I = Set()
+    for t in range(T):
+        setattr(model, 'p%d' % t, Param(model.I))
+    return model
+
+def load(model, sources, **kwds):
+    data = DataPortal(model=model)
+    data.load_all(sources, **kwds)
+    return data
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        sources = write_tables(tmpdir)
+        model = create_model()
+        for label, kwds in (('serial', dict(max_workers=1)),
+                            ('threads', dict()),
+                            ('processes', dict(processes=True))):
+            _, seconds = measure(lambda: load(model, sources, **kwds))
+            print("%-20s %10.3f s" % (label, seconds))
+    finally:
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,66 @@
+#
+# This script compares the time to load a solution with
+# ModelSolutions.load_from(), which translates the solver symbols of a
+# SolverResults object, with ModelSolutions.load_arrays(), which
+# assigns the values (and reduced costs) from arrays ordered like the
+# symbol map.
+#
+
+# number of variables
+N = 200000
+
+import gc
+import os
+import time
+
+from pyomo.environ import (ConcreteModel, RangeSet, Var, Objective,
+                           Constraint, Suffix, summation)
+from pyomo.opt import (SolverResults, SolverStatus, SolutionStatus,
+                       TerminationCondition)
+
+def build_model():
+    model = ConcreteModel()
+    model.I = RangeSet(N)
+    model.x = Var(model.I, bounds=(0, 1))
+    model.c = Constraint(expr=summation(model.x) >= 1)
+    model.o = Objective(expr=summation(model.x))
+    model.rc = Suffix(direction=Suffix.IMPORT)
+    return model
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    model = build_model()
+    smap_id = model.write(os.devnull, format='lp')[1]
+    smap = model.solutions.symbol_map[smap_id]
+    symbols = [smap.byObject[id(v)] for v in model.x.values()]
+    values = [0.5]*N
+    rc = [0.0]*N
+
+    def load_from():
+        results = SolverResults()
+        results.solver.status = SolverStatus.ok
+        results.solver.termination_condition = TerminationCondition.optimal
+        soln = results.solution.add()
+        soln.status = SolutionStatus.optimal
+        for symb, val, r in zip(symbols, values, rc):
+            soln.variable[symb] = {'Value': val, 'Rc': r}
+        results._smap_id = smap_id
+        model.solutions.load_from(results, delete_symbol_map=False)
+
+    def load_arrays():
+        model.solutions.load_arrays(variables=symbols,
+                                    values=values,
+                                    variable_suffixes={'rc': rc},
+                                    smap_id=smap_id)
+
+    _, seconds = measure(load_from)
+    print("%-20s %10.3f s" % ("load_from", seconds))
+    _, seconds = measure(load_arrays)
+    print("%-20s %10.3f s" % ("load_arrays", seconds))
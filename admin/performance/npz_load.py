@@ -0,0 +1,62 @@
+#
+# This script compares the time to load a 2-D parameter from a csv
+# table and from a .npz file, and then to construct a model instance
+# with it.
+#
+
+# size of each axis of the parameter
+N = 1000
+
+import gc
+import os
+import shutil
+import tempfile
+import time
+
+import numpy
+
+from pyomo.environ import AbstractModel, DataPortal, Param, RangeSet
+
+def write_files(tmpdir):
+    numpy.random.seed(0)
+    array = numpy.random.random((N, N))
+    csvfile = os.path.join(tmpdir, 'p.csv')
+    with open(csvfile, 'w') as f:
+        f.write("I,J,p\n")
+        for i in range(N):
+            for j in range(N):
+                f.write("%d,%d,%r\n" % (i, j, array[i, j]))
+    npzfile = os.path.join(tmpdir, 'p.npz')
+    numpy.savez(npzfile, p=array)
+    return csvfile, npzfile
+
+def create_model():
+    model = AbstractModel()
+    model.I = RangeSet(0, N-1)
+    model.J = RangeSet(0, N-1)
+    model.p = Param(model.I, model.J)
+    return model
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        csvfile, npzfile = write_files(tmpdir)
+        model = create_model()
+        for name, kwds in (('csv', dict(filename=csvfile, param='p')),
+                           ('npz', dict(filename=npzfile, param='p',
+                                          index=('I', 'J')))):
+            data = DataPortal(model=model)
+            _, seconds = measure(lambda: data.load(**kwds))
+            print("%-20s %10.3f s" % ("%s load" % name, seconds))
+            _, seconds = measure(lambda: model.create_instance(data))
+            print("%-20s %10.3f s" % ("%s instance" % name, seconds))
+    finally:
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,50 @@
+#
+# This script measures how the construction of an indexed Constraint
+# with an expensive rule scales with the number of worker processes
+# (the Constraint 'parallel' keyword).  Each rule computes its
+# coefficients with a pure-Python loop over K terms, and returns a
+# linear expression over M variables.
+#
+
+# number of constraints, variables per constraint, and rule work
+N = 2000
+M = 10
+K = 2000
+
+# numbers of worker processes to compare (None is serial construction)
+PROCESSES = [None, 2, 4, 8]
+
+import gc
+import math
+import time
+
+from pyomo.environ import ConcreteModel, RangeSet, Var, Constraint
+
+def rule(model, i):
+    coefs = []
+    for j in model.J:
+        coefs.append(sum(math.sin(i*j + k) for k in range(K)))
+    return sum(coefs[j-1]*model.x[i, j] for j in model.J) <= i
+
+def build_model(processes):
+    model = ConcreteModel()
+    model.I = RangeSet(N)
+    model.J = RangeSet(M)
+    model.x = Var(model.I, model.J)
+    model.c = Constraint(model.I, rule=rule, parallel=processes)
+    return model
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    for processes in PROCESSES:
+        _, seconds = measure(lambda: build_model(processes))
+        print("%-20s %10.3f s" % ("serial" if processes is None
+                                  else "%d processes" % processes,
+                                  seconds))
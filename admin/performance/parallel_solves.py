@@ -0,0 +1,55 @@
+#
+# This script compares the time to solve a batch of independent models
+# with the 'serial' solver manager and the 'processpool' solver
+# manager.
+#
+
+# name of the shell solver
+SOLVER = 'glpk'
+# number of models
+M = 16
+# number of variables and constraints in each model
+N = 2000
+# number of nonzeros per constraint
+K = 5
+
+import gc
+import random
+import time
+
+from pyomo.environ import (ConcreteModel, Constraint, Integers, Objective,
+                           RangeSet, SolverFactory, Var)
+from pyomo.opt import SolverManagerFactory
+
+def create_model(seed):
+    random.seed(seed)
+    model = ConcreteModel()
+    model.I = RangeSet(0, N-1)
+    model.x = Var(model.I, bounds=(0, 1), within=Integers)
+    model.o = Objective(expr=sum(random.random()*v
+                                 for v in model.x.values()))
+    model.c = Constraint(model.I, rule=lambda m, i: sum(
+        m.x[j] for j in random.sample(range(N), K)) >= 1)
+    return model
+
+def solve_all(manager_name):
+    models = [create_model(i) for i in range(M)]
+    opt = SolverFactory(SOLVER)
+    with SolverManagerFactory(manager_name) as manager:
+        handles = [manager.queue(model, opt=opt) for model in models]
+        manager.wait_all(handles)
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    if not SolverFactory(SOLVER).available(exception_flag=False):
+        raise SystemExit("The %s solver is not available" % (SOLVER,))
+    for name in ('serial', 'processpool'):
+        _, seconds = measure(lambda: solve_all(name))
+        print("%-20s %10.3f s" % (name, seconds))
@@ -0,0 +1,58 @@
+#
+# This script compares the time to add cuts to a persistent solver one
+# at a time and with the batch methods add_vars() and
+# add_constraints().
+#
+
+# name of the persistent solver
+SOLVER = 'cplex_persistent'
+# number of variables
+N = 10000
+# number of cuts
+M = 100000
+
+import gc
+import random
+import time
+
+from pyomo.environ import (ConcreteModel, Constraint, ConstraintList,
+                           Objective, RangeSet, SolverFactory, Var)
+
+def create_model():
+    model = ConcreteModel()
+    model.I = RangeSet(0, N-1)
+    model.x = Var(model.I, bounds=(0, 1))
+    model.o = Objective(expr=sum(model.x.values()))
+    model.c = Constraint(expr=model.x[0] >= 0)
+    model.cuts = ConstraintList()
+    return model
+
+def add_cuts(model):
+    random.seed(0)
+    for k in range(M):
+        i, j = random.sample(range(N), 2)
+        model.cuts.add(model.x[i] + model.x[j] >= 1)
+    return list(model.cuts.values())
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    for label in ('add_constraint', 'add_constraints'):
+        model = create_model()
+        opt = SolverFactory(SOLVER)
+        opt.set_instance(model)
+        cuts = add_cuts(model)
+        if label == 'add_constraint':
+            f = lambda: [opt.add_constraint(con) for con in cuts]
+        else:
+            f = lambda: opt.add_constraints(cuts)
+        _, seconds = measure(f)
+        print("%-20s %10.3f s" % (label, seconds))
+        _, seconds = measure(lambda: opt.remove_constraints(cuts))
+        print("%-20s %10.3f s" % ("remove_constraints", seconds))
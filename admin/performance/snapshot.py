@@ -0,0 +1,55 @@
+#
+# This script compares the time to construct a model from its rules
+# with the time to save and reload the model with save_instance() and
+# load_instance().  The model has a two-dimensional parameter and
+# variable, and one linear constraint for each element of the first
+# index set.
+#
+
+# number of constraints (and variables per constraint)
+N = 20000
+M = 4
+
+import gc
+import os
+import tempfile
+import time
+
+from pyomo.environ import (ConcreteModel, RangeSet, Set, Param, Var,
+                           Constraint, Objective, summation,
+                           save_instance, load_instance)
+
+def build_model():
+    model = ConcreteModel()
+    model.I = RangeSet(N)
+    model.J = RangeSet(M)
+    model.p = Param(model.I, model.J,
+                    initialize=lambda m, i, j: i*0.5 + j)
+    model.x = Var(model.I, model.J, bounds=(0, 10), initialize=1)
+    model.c = Constraint(
+        model.I,
+        rule=lambda m, i: sum(m.p[i,j]*m.x[i,j] for j in m.J) <= 10)
+    model.o = Objective(expr=summation(model.x))
+    return model
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    fd, fname = tempfile.mkstemp(suffix='.snp')
+    os.close(fd)
+    try:
+        model, seconds = measure(build_model)
+        print("%-20s %10.3f s" % ("construct", seconds))
+        _, seconds = measure(lambda: save_instance(model, fname))
+        print("%-20s %10.3f s  (%d bytes)"
+              % ("save_instance", seconds, os.path.getsize(fname)))
+        _, seconds = measure(lambda: load_instance(fname))
+        print("%-20s %10.3f s" % ("load_instance", seconds))
+    finally:
+        os.remove(fname)
@@ -0,0 +1,58 @@
+#
+# This script compares the time to load a large table with the csv
+# and tab data plugins, using the columnar table loader and using the
+# data commands that the plugins generated before.  The table has two
+# index columns and two parameter columns, and the index set is loaded
+# from the table as well.
+#
+
+# number of rows in the table
+N = 500000
+
+import gc
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from pyomo.environ import DataPortal
+from pyomo.core.data.TableData import TableData
+
+def write_table(fname, sep):
+    random.seed(0)
+    with open(fname, 'w') as f:
+        f.write(sep.join(['I', 'J', 'a', 'b']) + '\n')
+        for i in range(N):
+            f.write(sep.join([str(i // 10), 'j%d' % (i % 10),
+                              '%.6g' % random.random(),
+                              str(random.randint(0, 100))]) + '\n')
+
+def load(fname):
+    data = DataPortal()
+    data.load(filename=fname, param=('a', 'b'), index='IJ')
+    return data
+
+def measure(f):
+    gc.collect()
+    start = time.time()
+    ans = f()
+    stop = time.time()
+    return ans, stop - start
+
+if __name__ == "__main__":
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for ext, sep in (('csv', ','), ('tab', ' ')):
+            fname = os.path.join(tmpdir, 'data.' + ext)
+            write_table(fname, sep)
+            for columnar in (False, True):
+                TableData.columnar = columnar
+                _, seconds = measure(lambda: load(fname))
+                print("%-20s %10.3f s"
+                      % ("%s %s" % (ext, "columnar" if columnar else
+                                    "data commands"), seconds))
+    finally:
+        TableData.columnar = True
+        shutil.rmtree(tmpdir)
@@ -32,7 +32,7 @@ from pyomo.core.base import expr as EXPR
 from pyomo.core.base import (Block, Constraint, ConstraintList, Expression,
                              Objective, Set, Suffix, TransformationFactory,
                              Var, maximize, minimize, value)
-from pyomo.core.base.block import generate_cuid_names
+from pyomo.core.base.block import ComponentUIDIndex, generate_cuid_names
 from pyomo.core.base.symbolic import differentiate
 from pyomo.core.kernel import (ComponentMap, ComponentSet, NonNegativeReals,
                                Reals)
@@ -284,21 +284,24 @@ class GDPoptSolver(pyomo.util.plugin.Plugin):
         from_map: a mapping of source model objects to uid names
         to_map: a mapping of uid names to destination model objects
         """
+        from_index = to_index = None
         if from_map is None:
-            from_map = generate_cuid_names(from_model,
-                                           ctype=(Var, Disjunct),
-                                           descend_into=(Block, Disjunct))
+            from_index = ComponentUIDIndex(from_model)
         if to_map is None:
-            tm_obj_to_uid = generate_cuid_names(to_model,
-                                                ctype=(Var, Disjunct),
-                                                descend_into=(Block, Disjunct))
-            to_map = dict((cuid, obj)
-                          for obj, cuid in iteritems(tm_obj_to_uid))
+            to_index = ComponentUIDIndex(to_model)
         for v in from_model.component_data_objects(
                 ctype=Var, descend_into=(Block, Disjunct)):
-            uid = from_map[v]
-            dest_model_var = to_map.get(uid, None)
-            if dest_model_var is not None:
+            if from_index is None:
+                uid = from_map[v]
+            else:
+                uid = from_index.cuid(v)
+            if to_index is not None:
+                dest_model_var = to_index.find(uid)
+            elif from_index is None:
+                dest_model_var = to_map.get(uid, None)
+            else:
+                dest_model_var = to_map.get(repr(uid), None)
+            if dest_model_var is not None and dest_model_var.type() is Var:
                 try:
                     dest_model_var.set_value(value(v))
                 except ValueError as err:
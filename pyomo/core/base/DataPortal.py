@@ -11,11 +11,133 @@
 __all__ = ['DataPortal']
 
 import logging
+import threading
+
+from six import iteritems, string_types
+
+try:
+    import concurrent.futures
+    futures_available = True
+except ImportError:                               #pragma:nocover
+    futures_available = False
+
 from pyomo.core.base.plugin import *
 
 logger = logging.getLogger('pyomo.core')
 
 
+class ConnectionPool(object):
+    """
+    A collection of open database connections, which are shared by
+    the data managers that a DataPortal object uses to load data.
+
+    A pool is active within a ``with`` block, and data managers call
+    :func:`ConnectionPool.active` to find the pool that they should
+    get their connections from.
+    """
+
+    _local = threading.local()
+
+    def __init__(self):
+        self._connections = {}
+
+    def __getstate__(self):
+        # Connections cannot be pickled
+        return {'_connections': {}}
+
+    def __enter__(self):
+        stack = getattr(ConnectionPool._local, 'stack', None)
+        if stack is None:
+            stack = ConnectionPool._local.stack = []
+        stack.append(self)
+        return self
+
+    def __exit__(self, *args):
+        ConnectionPool._local.stack.pop()
+
+    def __len__(self):
+        return len(self._connections)
+
+    @staticmethod
+    def active():
+        """
+        Returns:
+            The innermost pool that is active in this thread, or
+            :const:`None`.
+        """
+        stack = getattr(ConnectionPool._local, 'stack', None)
+        if stack:
+            return stack[-1]
+        return None
+
+    def connect(self, key, connect):
+        """
+        Return the connection for the given key.  The function
+        connect() is called to create the connection the first time
+        that a key is used.
+        """
+        conn = self._connections.get(key, None)
+        if conn is None:
+            conn = connect()
+            if conn is not None:
+                self._connections[key] = conn
+        return conn
+
+    def close(self):
+        """
+        Close all connections in the pool.
+        """
+        connections = self._connections
+        self._connections = {}
+        for conn in connections.values():
+            try:
+                conn.close()
+            except Exception:
+                logger.warning("Error closing database connection %s" % conn)
+
+
+class DataLoadError(IOError):
+    """
+    Raised by :func:`DataPortal.load_all` when data sources fail to
+    load.  The errors attribute is a list of (source, exception)
+    tuples, in the order of the sources.
+    """
+
+    def __init__(self, errors, nsources):
+        self.errors = errors
+        msg = ["Failed to load %d of %d data sources:"
+               % (len(errors), nsources)]
+        for source, err in errors:
+            msg.append("    %s: %s: %s"
+                       % (_source_name(source), type(err).__name__, err))
+        IOError.__init__(self, "\n".join(msg))
+
+
+def _source_name(source):
+    if isinstance(source, string_types):
+        return source
+    for key in ('filename', 'server', 'using'):
+        if source.get(key, None) is not None:
+            return str(source[key])
+    return str(source)
+
+
+def _load_source(model, cache, source):
+    """
+    Load a data source with a new DataPortal object, and return the
+    data and default values.  This is called by worker threads and
+    processes in DataPortal.load_all().
+    """
+    if isinstance(source, string_types):
+        source = {'filename': source}
+    data = DataPortal(model=model, cache=cache)
+    try:
+        data.load(**source)
+    finally:
+        data.close_connections()
+    return data._data, data._default
+
+
 class DataPortal(object):
     """
     An object that manages loading and storing data from external
@@ -39,8 +161,16 @@ class DataPortal(object):
             is :const:`None`.
         data_dict (dict): A dictionary used to initialize the data 
             in this object.  Default is :const:`None`.
+        cache: A :class:`DataCache <pyomo.core.data.data_cache.DataCache>`
+            object, or the name of a cache directory, that is used to
+            cache the data loaded from files.  Default is the value of
+            :attr:`DataPortal.cache`.
     """
 
+    # The default cache for data that is loaded from files.  Caching
+    # is disabled if this is None.
+    cache = None
+
     def __init__(self, *args, **kwds):
         """
         Constructor
@@ -51,6 +181,9 @@ class DataPortal(object):
         # Initialize this object with no data manager
         self._data_manager = None
 
+        # Database connections that are reused by data managers
+        self._connections = ConnectionPool()
+
         # Map initialization data as follows: _data[namespace][symbol] -> data
         self._data={}
 
@@ -60,6 +193,12 @@ class DataPortal(object):
         # Get the model for which this data is associated.
         self._model = kwds.pop('model', None)
 
+        # The cache for data that is loaded from files
+        self._cache = kwds.pop('cache', DataPortal.cache)
+        if isinstance(self._cache, string_types):
+            from pyomo.core.data.data_cache import DataCache
+            self._cache = DataCache(self._cache)
+
         # Load data from a file ...
         if 'filename' in kwds:
             filename = kwds.pop('filename')
@@ -104,16 +243,27 @@ class DataPortal(object):
         if type(self._data_manager) is UnknownDataManager:
             raise IOError("Unknown file format '%s'" % tmp)
         self._data_manager.initialize(**kwds)
-        self._data_manager.open()
+        with self._connections:
+            self._data_manager.open()
 
     def disconnect(self):
         """
         Close the data manager object that is associated with the
         input source.
+
+        Database connections remain open, so they can be reused by
+        later loads.  Call :func:`close_connections` to close them.
         """
         self._data_manager.close()
         self._data_manager = None
 
+    def close_connections(self):
+        """
+        Close the database connections that were opened while
+        loading data.
+        """
+        self._connections.close()
+
     def load(self, **kwds):
         """
         Import data from an external data source.
@@ -160,8 +310,25 @@ class DataPortal(object):
         #
         if __debug__ and logger.isEnabledFor(logging.DEBUG):        #pragma:nocover
             logger.debug("Processing data ...")
-        self._data_manager.read()
-        status = self._data_manager.process(self._model, self._data, self._default)
+        key = None
+        if self._cache is not None:
+            key = self._cache.key(getattr(self._data_manager, 'filename', None),
+                                  self._data_manager.options,
+                                  self._model)
+        if key is None:
+            with self._connections:
+                self._data_manager.read()
+                status = self._data_manager.process(self._model, self._data, self._default)
+        else:
+            cached = self._cache.get(key)
+            if cached is None:
+                from pyomo.core.data.process_data import _collect_sources
+                cached = ({}, {})
+                with self._connections, _collect_sources() as sources:
+                    self._data_manager.read()
+                    self._data_manager.process(self._model, cached[0], cached[1])
+                self._cache.put(key, sources, cached[0], cached[1])
+            self._merge_data(cached[0], cached[1])
         self._data_manager.clear()
         #
         # Disconnect
@@ -171,6 +338,77 @@ class DataPortal(object):
         if __debug__ and logger.isEnabledFor(logging.DEBUG):        #pragma:nocover
             logger.debug("Done.")
 
+    def load_all(self, sources, max_workers=None, processes=False):
+        """
+        Import data from several independent data sources concurrently.
+
+        Each source is loaded by a separate DataPortal object in a pool
+        of threads or processes.  The data is then added to this object
+        in the order of the sources, so it is the same as the data that
+        consecutive calls to :func:`load` would import.
+
+        Args:
+            sources (list): The data sources.  Each source is a
+                filename, or a dictionary of keyword arguments for
+                :func:`load`.
+            max_workers (int): The maximum number of sources that are
+                loaded at the same time.  Default is the number of
+                sources, up to the number of processors.
+            processes (bool): If :const:`True`, sources are loaded in
+                worker processes instead of threads.  The model and
+                the load arguments must be picklable.  Default is
+                :const:`False`.
+
+        Raises:
+            DataLoadError: If any source fails to load.  No data is
+                imported in this case.
+        """
+        sources = list(sources)
+        if max_workers is None:
+            import multiprocessing
+            max_workers = min(len(sources), multiprocessing.cpu_count())
+        results = [None]*len(sources)
+        errors = []
+        if not futures_available or max_workers <= 1 or len(sources) <= 1:
+            for i, source in enumerate(sources):
+                try:
+                    results[i] = _load_source(self._model, self._cache, source)
+                except Exception as err:
+                    errors.append((source, err))
+        else:
+            if processes:
+                executor = concurrent.futures.ProcessPoolExecutor(max_workers)
+            else:
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+            with executor:
+                futures = [executor.submit(_load_source, self._model,
+                                           self._cache, source)
+                           for source in sources]
+                for i, future in enumerate(futures):
+                    try:
+                        results[i] = future.result()
+                    except Exception as err:
+                        errors.append((sources[i], err))
+        if errors:
+            raise DataLoadError(errors, len(sources))
+        for data, default in results:
+            self._merge_data(data, default)
+
+    def _merge_data(self, data, default):
+        """
+        Add data that was loaded into separate dictionaries.  Set and
+        parameter data are merged as data managers merge them into
+        self._data.
+        """
+        for namespace, symbols in iteritems(data):
+            _data = self._data.setdefault(namespace, {})
+            for name, value in iteritems(symbols):
+                if type(value) is dict and type(_data.get(name, None)) is dict:
+                    _data[name].update(value)
+                else:
+                    _data[name] = value
+        self._default.update(default)
+
     def store(self, **kwds):
         """
         Export data to an external data source.
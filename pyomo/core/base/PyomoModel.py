@@ -125,6 +125,14 @@ class ModelSolution(object):
         #
         for name in ['objective', 'variable', 'constraint', 'problem']:
             self._entry[name] = {}
+        #
+        # arrays[name]: (list of objects, {key: list of values})
+        #
+        # Entries of solutions stored as arrays (see
+        # Solution.set_arrays).  A value of None indicates that an
+        # object has no value for that key.
+        #
+        self._arrays = {}
 
     def __getattr__(self, name):
         if name[0] == '_':
@@ -141,10 +149,26 @@ class ModelSolution(object):
             return
         self.__dict__['_metadata'][name] = val
 
+    def _entries(self, name):
+        """
+        Return a dict that maps the id of each object to (a copy of)
+        its entry, including the data stored as arrays.
+        """
+        ans = dict((id_, dict(entry))
+                   for id_, (obj, entry) in iteritems(self._entry[name]))
+        if name in self._arrays:
+            objs, values = self._arrays[name]
+            for key, data in iteritems(values):
+                for obj, val in zip(objs, data):
+                    if val is not None:
+                        ans.setdefault(id(obj), {})[key] = val
+        return ans
+
     def __getstate__(self):
         state = {
             '_metadata': self._metadata,
-            '_entry': {}
+            '_entry': {},
+            '_arrays': self._arrays,
         }
         for (name, data) in iteritems(self._entry):
             tmp = state['_entry'][name] = []
@@ -170,6 +194,7 @@ class ModelSolution(object):
             tmp = self._entry[name] = {}
             for obj, entry in data:
                 tmp[ id(obj) ] = ( weakref_ref(obj), entry )
+        self._arrays = state.get('_arrays', {})
 
 
 class ModelSolutions(object):
@@ -314,33 +339,27 @@ class ModelSolutions(object):
                 labeler = CNameLabeler()
             sm = SymbolMap()
 
-            entry = soln_._entry['objective']
+            entry = soln_._entries('objective')
             for obj in instance.component_data_objects(Objective, active=True):
                 vals = entry.get(id(obj), None)
                 if vals is None:
                     vals = {}
-                else:
-                    vals = vals[1]
                 vals['Value'] = value(obj)
                 soln.objective[ sm.getSymbol(obj, labeler) ] = vals
-            entry = soln_._entry['variable']
+            entry = soln_._entries('variable')
             for obj in instance.component_data_objects(Var, active=True):
                 if obj.stale:
                     continue
                 vals = entry.get(id(obj), None)
                 if vals is None:
                     vals = {}
-                else:
-                    vals = vals[1]
                 vals['Value'] = value(obj)
                 soln.variable[ sm.getSymbol(obj, labeler) ] = vals
-            entry = soln_._entry['constraint']
+            entry = soln_._entries('constraint')
             for obj in instance.component_data_objects(Constraint, active=True):
                 vals = entry.get(id(obj), None)
                 if vals is None:
                     continue
-                else:
-                    vals = vals[1]
                 soln.constraint[ sm.getSymbol(obj, labeler) ] = vals
             results.solution.insert( soln )
 
@@ -382,6 +401,11 @@ class ModelSolutions(object):
                         cache[ComponentUID(obj)] = obj
 
                 for name in ['problem', 'objective', 'variable', 'constraint']:
+                    arrays = solution.get_arrays(name)
+                    if arrays is not None:
+                        soln._arrays[name] = self._resolve_arrays(
+                            arrays, cache.get, ignore_invalid_labels)
+                        continue
                     tmp = soln._entry[name]
                     for cuid, val in iteritems(getattr(solution, name)):
                         obj = cache.get(cuid, None)
@@ -404,6 +428,11 @@ class ModelSolutions(object):
                         cache[obj.name] = obj
 
                 for name in ['problem', 'objective', 'variable', 'constraint']:
+                    arrays = solution.get_arrays(name)
+                    if arrays is not None:
+                        soln._arrays[name] = self._resolve_arrays(
+                            arrays, cache.get, ignore_invalid_labels)
+                        continue
                     tmp = soln._entry[name]
                     for symb, val in iteritems(getattr(solution, name)):
                         obj = cache.get(symb, None)
@@ -419,6 +448,11 @@ class ModelSolutions(object):
             #
             smap = self.symbol_map[smap_id]
             for name in ['problem', 'objective', 'variable', 'constraint']:
+                arrays = solution.get_arrays(name)
+                if arrays is not None:
+                    soln._arrays[name] = self._resolve_arrays(
+                        arrays, _symbol_lookup(smap), ignore_missing_symbols)
+                    continue
                 tmp = soln._entry[name]
                 for symb, val in iteritems(getattr(solution, name)):
                     if symb in smap.bySymbol:
@@ -447,6 +481,10 @@ class ModelSolutions(object):
         # Collect fixed variables
         #
         tmp = soln._entry['variable']
+        if 'variable' in soln._arrays:
+            in_arrays = set(id(obj) for obj in soln._arrays['variable'][0])
+        else:
+            in_arrays = ()
         for vdata in instance.component_data_objects(Var):
             id_ = id(vdata)
             if vdata.fixed:
@@ -454,7 +492,8 @@ class ModelSolutions(object):
             elif (default_variable_value is not None) and \
                  (smap_id is not None) and \
                  (id_ in smap.byObject) and \
-                 (id_ not in tmp):
+                 (id_ not in tmp) and \
+                 (id_ not in in_arrays):
                 tmp[id_] = (weakref_ref(vdata), {'Value':default_variable_value})
 
         self.solutions.append(soln)
@@ -502,14 +541,20 @@ class ModelSolutions(object):
         for suffix in itervalues(valid_import_suffixes):
             suffix.clear_all_values()
         #
+        # Suffix values are collected per suffix and stored with a
+        # single update_values() call (which array-backed suffixes
+        # store with one vectorized assignment)
+        #
+        suffix_data = dict((name, []) for name in valid_import_suffixes)
+        #
         # Load problem (model) level suffixes. These would only come from ampl
         # interfaced solution suffixes at this point in time.
         #
         for id_, (pobj,entry) in iteritems(soln._entry['problem']):
             for _attr_key, attr_value in iteritems(entry):
                 attr_key = _attr_key[0].lower() + _attr_key[1:]
-                if attr_key in valid_import_suffixes:
-                    valid_import_suffixes[attr_key][pobj] = attr_value
+                if attr_key in suffix_data:
+                    suffix_data[attr_key].append((pobj, attr_value))
         #
         # Load objective data (suffixes)
         #
@@ -517,8 +562,8 @@ class ModelSolutions(object):
             odata = odata()
             for _attr_key, attr_value in iteritems(entry):
                 attr_key = _attr_key[0].lower() + _attr_key[1:]
-                if attr_key in valid_import_suffixes:
-                    valid_import_suffixes[attr_key][odata] = attr_value
+                if attr_key in suffix_data:
+                    suffix_data[attr_key].append((odata, attr_value))
         #
         # Load variable data (suffixes and values)
         #
@@ -528,20 +573,10 @@ class ModelSolutions(object):
             if vdata.fixed is True:
                 if ignore_fixed_vars:
                     continue
-                if not allow_consistent_values_for_fixed_vars:
-                    msg = "Variable '%s' in model '%s' is currently fixed - new" \
-                          ' value is not expected in solution'
-                    raise TypeError(msg % (vdata.name, instance.name))
-                if math.fabs(val - vdata.value) > comparison_tolerance_for_fixed_vars:
-                    raise TypeError("Variable '%s' in model '%s' is currently "
-                                    "fixed - a value of '%s' in solution is "
-                                    "not within tolerance=%s of the current "
-                                    "value of '%s'"
-                                    % (vdata.name,
-                                       instance.name,
-                                       str(val),
-                                       str(comparison_tolerance_for_fixed_vars),
-                                       str(vdata.value)))
+                self._check_fixed_var(
+                    vdata, val,
+                    allow_consistent_values_for_fixed_vars,
+                    comparison_tolerance_for_fixed_vars)
 
             vdata.value = val
             vdata.stale = False
@@ -550,8 +585,8 @@ class ModelSolutions(object):
                 attr_key = _attr_key[0].lower() + _attr_key[1:]
                 if attr_key == 'value':
                     continue
-                elif attr_key in valid_import_suffixes:
-                    valid_import_suffixes[attr_key][vdata] = attr_value
+                elif attr_key in suffix_data:
+                    suffix_data[attr_key].append((vdata, attr_value))
         #
         # Load constraint data (suffixes)
         #
@@ -559,8 +594,224 @@ class ModelSolutions(object):
             cdata = cdata()
             for _attr_key, attr_value in iteritems(entry):
                 attr_key = _attr_key[0].lower() + _attr_key[1:]
-                if attr_key in valid_import_suffixes:
-                    valid_import_suffixes[attr_key][cdata] = attr_value
+                if attr_key in suffix_data:
+                    suffix_data[attr_key].append((cdata, attr_value))
+        #
+        # Load data stored as arrays
+        #
+        for name, (objs, values) in iteritems(soln._arrays):
+            for _attr_key, data in iteritems(values):
+                attr_key = _attr_key[0].lower() + _attr_key[1:]
+                if name == 'variable' and attr_key == 'value':
+                    self._load_variable_values(
+                        objs, data,
+                        allow_consistent_values_for_fixed_vars,
+                        comparison_tolerance_for_fixed_vars,
+                        ignore_fixed_vars)
+                elif attr_key in suffix_data:
+                    suffix_data[attr_key].extend(
+                        (obj, val) for obj, val in zip(objs, data)
+                        if val is not None)
+        for name, data in iteritems(suffix_data):
+            if data:
+                valid_import_suffixes[name].update_values(data, expand=False)
+
+    def load_arrays(self,
+                    variables=None,
+                    values=None,
+                    variable_suffixes=None,
+                    constraints=None,
+                    constraint_suffixes=None,
+                    smap_id=None,
+                    allow_consistent_values_for_fixed_vars=False,
+                    comparison_tolerance_for_fixed_vars=1e-5,
+                    ignore_invalid_labels=False,
+                    ignore_fixed_vars=True):
+        """
+        Load a solution from arrays of solver output.
+
+        This is a fast alternative to load_from() for solver
+        interfaces that already hold the solution as arrays: the
+        values are assigned to the model directly, without building
+        a SolverResults object or a ModelSolution.  As with
+        select(), all variables are first flagged as stale, and all
+        active import suffixes are cleared.
+
+        Args:
+            variables: A sequence of variables.  When smap_id is
+                given, this is a sequence of the symbols of the
+                variables in that symbol map.
+            values: A sequence of variable values (or None), aligned
+                with variables.
+            variable_suffixes: A dict that maps suffix names (e.g.,
+                'rc') to a sequence of values aligned with variables.
+            constraints: A sequence of constraints (or their
+                symbols, when smap_id is given).
+            constraint_suffixes: A dict that maps suffix names (e.g.,
+                'dual') to a sequence of values aligned with
+                constraints.
+            smap_id: The id of the symbol map (see add_symbol_map())
+                used to resolve symbols.
+            ignore_invalid_labels: If True, symbols that are not in
+                the symbol map are ignored; otherwise, a RuntimeError
+                is raised.
+
+        The remaining options are the same as for select().
+        """
+        instance = self._instance()
+        if variables is None:
+            variables = ()
+        if constraints is None:
+            constraints = ()
+        if smap_id is not None:
+            lookup = _symbol_lookup(self.symbol_map[smap_id])
+            variables, vkeep = self._resolve_symbols(
+                variables, lookup, ignore_invalid_labels)
+            constraints, ckeep = self._resolve_symbols(
+                constraints, lookup, ignore_invalid_labels)
+        else:
+            vkeep = ckeep = None
+
+        instance._flag_vars_as_stale()
+        if values is not None:
+            values = _as_list(values, vkeep)
+            if len(values) != len(variables):
+                raise ValueError(
+                    "load_arrays: %d values given for %d variables"
+                    % (len(values), len(variables)))
+            self._load_variable_values(
+                variables, values,
+                allow_consistent_values_for_fixed_vars,
+                comparison_tolerance_for_fixed_vars,
+                ignore_fixed_vars)
+
+        valid_import_suffixes = dict(active_import_suffix_generator(instance))
+        for suffix in itervalues(valid_import_suffixes):
+            suffix.clear_all_values()
+        for components, keep, suffix_values in (
+                (variables, vkeep, variable_suffixes),
+                (constraints, ckeep, constraint_suffixes)):
+            if not suffix_values:
+                continue
+            for name, data in iteritems(suffix_values):
+                suffix = valid_import_suffixes.get(name, None)
+                if suffix is None:
+                    continue
+                data = _as_list(data, keep)
+                if len(data) != len(components):
+                    raise ValueError(
+                        "load_arrays: %d values given for suffix '%s' "
+                        "(expected %d)" % (len(data), name, len(components)))
+                suffix.update_values(zip(components, data), expand=False)
+
+    def _resolve_symbols(self, symbols, lookup, ignore_invalid_labels):
+        """
+        Return the list of objects for a sequence of symbols, and the
+        list of positions that were resolved (None if all symbols
+        were resolved).
+        """
+        objs = []
+        keep = None
+        for i, symb in enumerate(symbols):
+            obj = lookup(symb)
+            if obj is None:
+                if not ignore_invalid_labels:
+                    raise RuntimeError(
+                        "Symbol %s is missing from model %s"
+                        % (symb, self._instance().name))
+                if keep is None:
+                    keep = list(range(i))
+                continue
+            objs.append(obj)
+            if keep is not None:
+                keep.append(i)
+        return objs, keep
+
+    def _resolve_arrays(self, arrays, lookup, ignore_invalid_labels):
+        """
+        Resolve the symbols of arrays stored with Solution.set_arrays()
+        """
+        symbols, values = arrays
+        objs, keep = self._resolve_symbols(
+            symbols, lookup, ignore_invalid_labels)
+        return objs, dict((key, _as_list(data, keep))
+                          for key, data in iteritems(values))
+
+    def _load_variable_values(self, variables, values,
+                              allow_consistent_values_for_fixed_vars,
+                              comparison_tolerance_for_fixed_vars,
+                              ignore_fixed_vars):
+        """
+        Set the values of a list of variables (and mark them as not
+        stale).  Values of None are ignored.
+        """
+        for vdata, val in zip(variables, values):
+            if val is None:
+                continue
+            if vdata.fixed:
+                if ignore_fixed_vars:
+                    continue
+                self._check_fixed_var(
+                    vdata, val,
+                    allow_consistent_values_for_fixed_vars,
+                    comparison_tolerance_for_fixed_vars)
+            vdata.value = val
+            vdata.stale = False
+
+    def _check_fixed_var(self, vdata, val,
+                         allow_consistent_values_for_fixed_vars,
+                         comparison_tolerance_for_fixed_vars):
+        """
+        Raise a TypeError if a solution value cannot be loaded into
+        a fixed variable.
+        """
+        instance = self._instance()
+        if not allow_consistent_values_for_fixed_vars:
+            msg = "Variable '%s' in model '%s' is currently fixed - new" \
+                  ' value is not expected in solution'
+            raise TypeError(msg % (vdata.name, instance.name))
+        if math.fabs(val - vdata.value) > comparison_tolerance_for_fixed_vars:
+            raise TypeError("Variable '%s' in model '%s' is currently "
+                            "fixed - a value of '%s' in solution is "
+                            "not within tolerance=%s of the current "
+                            "value of '%s'"
+                            % (vdata.name,
+                               instance.name,
+                               str(val),
+                               str(comparison_tolerance_for_fixed_vars),
+                               str(vdata.value)))
+
+
+def _symbol_lookup(smap):
+    """
+    Return a function that maps a symbol (or alias) in a symbol map
+    to its object (or None)
+    """
+    bySymbol = smap.bySymbol
+    aliases = smap.aliases
+    def lookup(symb):
+        obj = bySymbol.get(symb, None)
+        if obj is None:
+            obj = aliases.get(symb, None)
+            if obj is None:
+                return None
+        return obj()
+    return lookup
+
+
+def _as_list(values, keep=None):
+    """
+    Convert a sequence of values (e.g., a numpy array) to a list of
+    Python numbers, keeping only the given positions.
+    """
+    tolist = getattr(values, 'tolist', None)
+    if tolist is not None:
+        values = tolist()
+    elif type(values) is not list:
+        values = list(values)
+    if keep is not None:
+        values = [values[i] for i in keep]
+    return values
 
 
 class Model(SimpleBlock):
@@ -637,7 +888,9 @@ use the AbstractModel or ConcreteModel class instead.""")
 
         Optional:
             filename:           The name of a Pyomo Data File that will be used
-                                    to load data into the model.
+                                    to load data into the model, or a list
+                                    of data sources that are loaded
+                                    concurrently (see DataPortal.load_all).
             data:               A dictionary containing initialization data for
                                     the model to be used if there is no filename
             name:               The name given to the model.
@@ -772,7 +1025,9 @@ arguments (which have been ignored):"""
 
     def load(self, arg, namespaces=[None], profile_memory=0, report_timing=None):
         """
-        Load the model with data from a file, dictionary or DataPortal object.
+        Load the model with data from a file, dictionary or DataPortal
+        object, or from a list of data sources that are loaded
+        concurrently with DataPortal.load_all().
         """
         if report_timing is not None:
             deprecation_warning(
@@ -781,6 +1036,9 @@ arguments (which have been ignored):"""
                 "construction timing")
         if arg is None or isinstance(arg, basestring):
             dp = DataPortal(filename=arg, model=self)
+        elif type(arg) in (list, tuple):
+            dp = DataPortal(model=self)
+            dp.load_all(arg)
         elif type(arg) is DataPortal:
             dp = arg
         elif type(arg) is dict:
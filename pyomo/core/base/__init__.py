@@ -51,6 +51,7 @@ from pyomo.core.base.util import *
 from pyomo.core.base.rangeset import *
 
 from pyomo.core.base.instance2dat import *
+from pyomo.core.base.snapshot import *
 
 #
 # This is a hack to strip out modules, which shouldn't have been included in these imports
@@ -10,7 +10,7 @@
 
 __all__ = ['Block', 'TraversalStrategy', 'SortComponents',
            'active_components', 'components', 'active_components_data',
-           'components_data']
+           'components_data', 'ComponentUIDIndex']
 
 import copy
 import sys
@@ -21,7 +21,9 @@ from operator import itemgetter, attrgetter
 from six import iteritems, iterkeys, itervalues, StringIO, string_types, \
     advance_iterator, PY3
 
-from pyomo.util.timing import ConstructionTimer
+from pyutilib.misc import PauseGC
+
+from pyomo.util.timing import ConstructionTimer, WriterTimer
 from pyomo.core.base.plugin import *  # register_component, ModelComponentFactory
 from pyomo.core.base.component import Component, ActiveComponentData, \
     ComponentUID
@@ -479,14 +481,29 @@ class _BlockData(ActiveComponentData):
         # marking entries as None and just periodically rebuild the list
         # as opposed to maintaining the list without any holes).
         #
+        # In addition, every block keeps a count of the components
+        # (by ctype) declared on it *and* on all of its sub-blocks:
+        #
+        #    _subtree_ctypes = { ctype : count }
+        #
+        # These counts are updated (for this block and all of its
+        # ancestors) when components are added, deleted, or
+        # reclassified, and let the component iterators skip entire
+        # subtrees that cannot contain the requested ctypes.  The
+        # counts are conservative: they may over-count (e.g., after
+        # deleting a single BlockData from an IndexedBlock), but never
+        # under-count.
+        #
         ActiveComponentData.__init__(self, component)
         # Note: call super() here to bypass the Block __setattr__
         #   _ctypes:      { ctype -> [1st idx, last idx, count] }
         #   _decl:        { name -> idx }
         #   _decl_order:  list( tuples( obj, next_type_idx ) )
+        #   _subtree_ctypes: { ctype -> count }
         super(_BlockData, self).__setattr__('_ctypes', {})
         super(_BlockData, self).__setattr__('_decl', {})
         super(_BlockData, self).__setattr__('_decl_order', [])
+        super(_BlockData, self).__setattr__('_subtree_ctypes', {})
 
     def __getstate__(self):
         # Note: _BlockData is NOT slot-ized, so we must pickle the
@@ -728,6 +745,53 @@ class _BlockData(ActiveComponentData):
             return obj
         raise Exception("BOGUS")
 
+    def _update_subtree_ctypes(self, counts, sign):
+        """
+        Add (sign=1) or remove (sign=-1) the component counts in
+        `counts` from the subtree counts of this block and all of its
+        ancestors.
+        """
+        _block = self
+        while _block is not None:
+            _subtree = _block._subtree_ctypes
+            for ctype, n in iteritems(counts):
+                n = _subtree.get(ctype, 0) + sign*n
+                if n > 0:
+                    _subtree[ctype] = n
+                else:
+                    _subtree.pop(ctype, None)
+            try:
+                _block = _block.parent_block()
+            except AttributeError:
+                # Scalar blocks that declare components in their
+                # __init__ (e.g., Disjunct) do not have a _parent yet
+                _block = None
+
+    @staticmethod
+    def _component_subtree_ctypes(obj):
+        """
+        Return the {ctype: count} contribution of a component (and, for
+        Blocks, all of its constructed BlockData) to the subtree counts
+        of the block that owns it.
+        """
+        counts = {obj.type(): 1}
+        if isinstance(obj, Block):
+            for _data in itervalues(obj._data):
+                for ctype, n in iteritems(_data._subtree_ctypes):
+                    counts[ctype] = counts.get(ctype, 0) + n
+        return counts
+
+    def _subtree_contains(self, ctypes):
+        """
+        Return True if this block or any of its sub-blocks may contain
+        a component whose ctype is in `ctypes` (a tuple of ctypes).
+        """
+        _subtree = self._subtree_ctypes
+        for ctype in ctypes:
+            if ctype in _subtree:
+                return True
+        return False
+
     def _flag_vars_as_stale(self):
         """
         Configure *all* variables (on active blocks) and
@@ -904,6 +968,11 @@ component, use the block del_component() and add_component() methods.
             idx_info[2] += 1
         else:
             self._ctypes[_type] = [_new_idx, _new_idx, 1]
+        self._update_subtree_ctypes(
+            self._component_subtree_ctypes(val), 1)
+        if ComponentUIDIndex._active:
+            for _index in list(ComponentUIDIndex._active):
+                _index._component_added(self, val)
         #
         # Propagate properties to sub-blocks:
         #   suppressed ctypes
@@ -1020,6 +1089,11 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         ctype_info[2] -= 1
         if ctype_info[2] == 0:
             del self._ctypes[obj.type()]
+        self._update_subtree_ctypes(
+            self._component_subtree_ctypes(obj), -1)
+        if ComponentUIDIndex._active:
+            for _index in list(ComponentUIDIndex._active):
+                _index._component_removed(self, obj)
 
         # Clear the _parent attribute
         obj._parent = None
@@ -1078,7 +1152,9 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             if ctype_info[1] == idx:
                 ctype_info[1] = prev
 
+        self._update_subtree_ctypes({obj._type: 1}, -1)
         obj._type = new_ctype
+        self._update_subtree_ctypes({new_ctype: 1}, 1)
 
         # Insert into the new ctype list
         if new_ctype not in self._ctypes:
@@ -1123,13 +1199,18 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         # NonNegativeReals, etc) that are not "owned" by any blocks and
         # should be preserved as singletons.
         #
+        # Note: cloning creates a very large number of (new) objects
+        # and no garbage, so we will pause the cyclic garbage collector
+        # (which would otherwise repeatedly scan the growing heap).
+        #
         save_parent, self._parent = self._parent, None
         try:
-            new_block = copy.deepcopy(
-                self, {
-                    '__block_scope__': {id(self): True, id(None): False},
-                    '__paranoid__': False,
-                    })
+            with PauseGC():
+                new_block = copy.deepcopy(
+                    self, {
+                        '__block_scope__': {id(self): True, id(None): False},
+                        '__paranoid__': False,
+                        })
         except:
             new_block = copy.deepcopy(
                 self, {
@@ -1283,7 +1364,12 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             for x in self.component_map(ctype, active, sort).itervalues():
                 yield x
             return
-        for _block in self.block_data_objects(active, sort, descend_into, descent_order):
+        if ctype is not None and isclass(ctype):
+            ctype = (ctype,)
+        elif ctype is not None:
+            ctype = tuple(ctype)
+        for _block in self._pruned_block_data_objects(
+                ctype, active, sort, descend_into, descent_order):
             for x in _block.component_map(ctype, active, sort).itervalues():
                 yield x
 
@@ -1300,11 +1386,12 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         descends into sub-blocks.
         """
         if descend_into:
-            block_generator = self.block_data_objects(
-                active=active,
-                sort=sort,
-                descend_into=descend_into,
-                descent_order=descent_order)
+            if ctype is not None and isclass(ctype):
+                ctype = (ctype,)
+            elif ctype is not None:
+                ctype = tuple(ctype)
+            block_generator = self._pruned_block_data_objects(
+                ctype, active, sort, descend_into, descent_order)
         else:
             block_generator = (self,)
 
@@ -1328,11 +1415,12 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             ((component name, index value), _ComponentData)
         """
         if descend_into:
-            block_generator = self.block_data_objects(
-                active=active,
-                sort=sort,
-                descend_into=descend_into,
-                descent_order=descent_order)
+            if ctype is not None and isclass(ctype):
+                ctype = (ctype,)
+            elif ctype is not None:
+                ctype = tuple(ctype)
+            block_generator = self._pruned_block_data_objects(
+                ctype, active, sort, descend_into, descent_order)
         else:
             block_generator = (self,)
 
@@ -1383,11 +1471,41 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                                    sort=sort,
                                    traversal=descent_order)
 
+    def _pruned_block_data_objects(self,
+                                   ctype,
+                                   active,
+                                   sort,
+                                   descend_into,
+                                   descent_order):
+        """
+        Equivalent to block_data_objects(), except that (when ctype is
+        not None) blocks whose subtree cannot contain any component
+        with a ctype in `ctype` (a tuple) are not returned or descended
+        into.  This is used by the component iterators so that
+        searching for (e.g.) Constraints does not walk every Block in
+        the model.
+        """
+        if ctype is None:
+            return self.block_data_objects(active=active,
+                                           sort=sort,
+                                           descend_into=descend_into,
+                                           descent_order=descent_order)
+        if descend_into is True:
+            descend_into = (Block,)
+        elif isclass(descend_into):
+            descend_into = (descend_into,)
+        return self._tree_iterator(ctype=descend_into,
+                                   active=active,
+                                   sort=sort,
+                                   traversal=descent_order,
+                                   prune=ctype)
+
     def _tree_iterator(self,
                        ctype=None,
                        active=None,
                        sort=None,
-                       traversal=None):
+                       traversal=None,
+                       prune=None):
 
         # TODO: merge into block_data_objects
         if ctype is None:
@@ -1401,6 +1519,8 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         # count on us always returning a generator)
         if active is not None and self.active != active:
             return ().__iter__()
+        if prune is not None and not self._subtree_contains(prune):
+            return ().__iter__()
 
         # ALWAYS return the "self" Block, even if it does not match
         # ctype.  This is because we map this ctype to the
@@ -1412,19 +1532,20 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
 
         if traversal is None or \
                 traversal == TraversalStrategy.PrefixDepthFirstSearch:
-            return self._prefix_dfs_iterator(ctype, active, sort)
+            return self._prefix_dfs_iterator(ctype, active, sort, prune)
         elif traversal == TraversalStrategy.BreadthFirstSearch:
-            return self._bfs_iterator(ctype, active, sort)
+            return self._bfs_iterator(ctype, active, sort, prune)
         elif traversal == TraversalStrategy.PostfixDepthFirstSearch:
-            return self._postfix_dfs_iterator(ctype, active, sort)
+            return self._postfix_dfs_iterator(ctype, active, sort, prune)
         else:
             raise RuntimeError("unrecognized traversal strategy: %s"
                                % (traversal, ))
 
-    def _prefix_dfs_iterator(self, ctype, active, sort):
+    def _prefix_dfs_iterator(self, ctype, active, sort, prune=None):
         """Helper function implementing a non-recursive prefix order
         depth-first search.  That is, the parent is returned before its
-        children.
+        children.  If prune is not None, sub-blocks whose subtree does
+        not contain any of the ctypes in prune are skipped.
 
         Note: this method assumes it is called ONLY by the _tree_iterator
         method, which centralizes certain error checking and
@@ -1438,18 +1559,24 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                 yield _block
                 if not PM:
                     continue
-                _stack.append(_block.component_data_objects(ctype=ctype,
-                                                            active=active,
-                                                            sort=sort,
-                                                            descend_into=False))
+                _children = _block.component_data_objects(ctype=ctype,
+                                                          active=active,
+                                                          sort=sort,
+                                                          descend_into=False)
+                if prune is not None:
+                    _children = (x for x in _children
+                                 if x._subtree_contains(prune))
+                _stack.append(_children)
             except StopIteration:
                 _stack.pop()
 
-    def _postfix_dfs_iterator(self, ctype, active, sort):
+    def _postfix_dfs_iterator(self, ctype, active, sort, prune=None):
         """
         Helper function implementing a non-recursive postfix
         order depth-first search.  That is, the parent is
-        returned after its children.
+        returned after its children.  If prune is not None,
+        sub-blocks whose subtree does not contain any of the
+        ctypes in prune are skipped.
 
         Note: this method assumes it is called ONLY by the
         _tree_iterator method, which centralizes certain
@@ -1459,16 +1586,20 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         while _stack:
             try:
                 _sub = advance_iterator(_stack[-1][1])[-1]
+                if prune is not None and not _sub._subtree_contains(prune):
+                    continue
                 _stack.append((_sub,
                                _sub.component_data_iterindex(ctype, active, sort, False)
                                ))
             except StopIteration:
                 yield _stack.pop()[0]
 
-    def _bfs_iterator(self, ctype, active, sort):
+    def _bfs_iterator(self, ctype, active, sort, prune=None):
         """Helper function implementing a non-recursive breadth-first search.
         That is, all children at one level in the tree are returned
-        before any of the children at the next level.
+        before any of the children at the next level.  If prune is not
+        None, sub-blocks whose subtree does not contain any of the
+        ctypes in prune are skipped.
 
         Note: this method assumes it is called ONLY by the _tree_iterator
         method, which centralizes certain error checking and
@@ -1508,7 +1639,8 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                     _items[-1].component_data_iterindex(ctype=ctype,
                                                         active=active,
                                                         sort=sort,
-                                                        descend_into=False))
+                                                        descend_into=False)
+                    if prune is None or tmp[1]._subtree_contains(prune))
 
     def fix_all_vars(self):
         # TODO: Simplify based on recursive logic
@@ -1675,10 +1807,12 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
 
         if solver_capability is None:
             def solver_capability(x): return True
+        timer = WriterTimer(format)
         (filename, smap) = problem_writer(self,
                                           filename,
                                           solver_capability,
                                           io_options)
+        timer.report()
         smap_id = id(smap)
         if not hasattr(self, 'solutions'):
             # This is a bit of a hack.  The write() method was moved
@@ -1988,6 +2122,283 @@ def generate_cuid_names(block,
     return cuid_names_
 
 
+class ComponentUIDIndex(object):
+    """
+    A lookup table between CUIDs and the components on a block.
+
+    The index is built (once, on first use) by a single walk over the
+    block, so resolving a CUID to its component or generating the CUID
+    of a component is a dictionary lookup instead of a walk over the
+    model.  CUIDs are relative to the indexed block.
+
+    The index is kept current as components are added to or deleted
+    from blocks within the indexed block: added components are indexed
+    on the next lookup and deleted components (and everything declared
+    below them) are dropped immediately.  Component data created after
+    the index was built (e.g., by ConstraintList.add()) are found by
+    falling back to :py:meth:`ComponentUID.find_component` and are then
+    added to the index.
+
+    Args:
+        block: The block to index.
+    """
+
+    # Live indexes, notified by add_component() / del_component()
+    _active = weakref.WeakSet()
+
+    def __init__(self, block):
+        self._block = block
+        # cids tuple -> component
+        self._objs = None
+        # id(component) -> cids tuple
+        self._keys = {}
+        # id(component) -> (component, [cids tuples])
+        self._owned = {}
+        # str(cuid) -> cids tuple (None for ambiguous strings)
+        self._strings = None
+        self._pending = []
+        ComponentUIDIndex._active.add(self)
+
+    def __len__(self):
+        self._update()
+        return len(self._objs)
+
+    def __contains__(self, cuid):
+        return self.find(cuid) is not None
+
+    def find(self, cuid):
+        """
+        Return the component identified by a CUID (a ComponentUID, its
+        string representation, or its tuple of identifiers), or None if
+        it is not on the block.
+        """
+        self._update()
+        if isinstance(cuid, ComponentUID):
+            key = cuid._cids
+        elif isinstance(cuid, string_types):
+            key = ComponentUID(cuid)._cids
+            if not self._is_exact(key):
+                if self._strings is None:
+                    self._build_strings()
+                key = self._strings.get(cuid, None) or key
+        else:
+            key = tuple(cuid)
+        obj = self._objs.get(key, None)
+        if obj is not None and self._is_current(key):
+            return obj
+        return self._resolve(key)
+
+    def find_all(self, cuids):
+        """
+        Return a list with the component identified by each CUID in
+        `cuids` (None for CUIDs that are not on the block).
+        """
+        return [self.find(cuid) for cuid in cuids]
+
+    def cuid(self, component):
+        """
+        Return the ComponentUID of a component on the block.
+        """
+        self._update()
+        key = self._keys.get(id(component), None)
+        if key is None or self._objs.get(key, None) is not component \
+           or not self._is_current(key):
+            key = ComponentUID(component, context=self._block)._cids
+            self._add(key, component)
+        ans = ComponentUID.__new__(ComponentUID)
+        ans._cids = key
+        return ans
+
+    def cuids(self, components):
+        """
+        Return a list with the ComponentUID of each component in
+        `components`.
+        """
+        return [self.cuid(obj) for obj in components]
+
+    def invalidate(self, component=None):
+        """
+        Drop a component (and everything below it) from the index, or
+        the whole index if `component` is None.  Dropped components are
+        re-indexed on demand.
+        """
+        if component is None or self._objs is None:
+            self._objs = None
+            self._keys = {}
+            self._owned = {}
+            self._strings = None
+            self._pending = []
+            return
+        self._drop(component.parent_component())
+        if component.parent_component() is not component:
+            # component data: re-index through the owning component
+            self._pending.append(component.parent_component())
+
+    #
+    # Notifications from _BlockData.add_component / del_component
+    #
+
+    def _component_added(self, block, component):
+        if self._objs is not None and self._contains(block):
+            self._pending.append(component)
+
+    def _component_removed(self, block, component):
+        if self._objs is not None and self._contains(block):
+            self._drop(component)
+
+    #
+    # Internal methods
+    #
+
+    def _contains(self, block):
+        context = self._block
+        try:
+            while block is not None:
+                if block is context:
+                    return True
+                block = block.parent_block()
+        except AttributeError:
+            # Scalar blocks that declare components in their __init__
+            # (e.g., Disjunct) do not have a _parent yet
+            pass
+        return False
+
+    @staticmethod
+    def _is_exact(key):
+        for name, idx, types in key:
+            if types is not None and ('*' in types or '.' in types):
+                return False
+        return True
+
+    def _is_current(self, key):
+        # Verify that each component data along the path is still
+        # stored in its component (data can be deleted without going
+        # through del_component()).
+        objs = self._objs
+        for i, (name, idx, types) in enumerate(key):
+            if not types:
+                continue
+            obj = objs.get(key[i:], None)
+            if obj is None:
+                return False
+            data = obj.parent_component()._data
+            if data.get(idx[0] if len(idx) == 1 else idx, None) is not obj:
+                return False
+        return True
+
+    def _resolve(self, key):
+        cuid = ComponentUID.__new__(ComponentUID)
+        cuid._cids = key
+        obj = cuid.find_component(self._block)
+        if obj is not None and self._is_exact(key) \
+           and hasattr(obj, 'parent_component'):
+            self._add(key, obj)
+        return obj
+
+    def _update(self):
+        if self._objs is None:
+            self._objs = {}
+            self._index_block(self._block, ())
+        if self._pending:
+            pending, self._pending = self._pending, []
+            for comp in pending:
+                block = comp.parent_block()
+                if block is None or not self._contains(block):
+                    continue
+                self._drop(comp)
+                if block is self._block:
+                    prefix = ()
+                else:
+                    prefix = self._keys.get(id(block), None)
+                    if prefix is None or self._objs.get(prefix) is not block:
+                        prefix = ComponentUID(
+                            block, context=self._block)._cids
+                self._index_component(comp, prefix)
+
+    def _index_block(self, block, prefix):
+        for comp in block.component_objects(descend_into=False):
+            self._index_component(comp, prefix)
+
+    def _index_component(self, comp, prefix):
+        keys = []
+        self._owned[id(comp)] = (comp, keys)
+        name = comp.local_name
+        if not comp.is_indexed():
+            key = ((name, (), ''),) + prefix
+            self._add(key, comp, keys)
+            if isinstance(comp, _BlockData):
+                self._index_block(comp, key)
+            return
+        self._add(((name, '**', None),) + prefix, comp, keys)
+        tDict = ComponentUID.tDict
+        for idx, obj in iteritems(comp._data):
+            if not hasattr(obj, 'parent_component'):
+                # e.g., values of immutable Params
+                continue
+            if idx.__class__ is tuple:
+                key = ((name, idx, ''.join(tDict.get(type(x), '?')
+                                           for x in idx)),) + prefix
+            else:
+                key = ((name, (idx,), tDict.get(type(idx), '?')),) + prefix
+            self._add(key, obj, keys)
+            if isinstance(obj, _BlockData):
+                self._index_block(obj, key)
+
+    def _add(self, key, obj, keys=None):
+        old = self._objs.get(key, None)
+        if old is not None:
+            self._keys.pop(id(old), None)
+        self._objs[key] = obj
+        self._keys[id(obj)] = key
+        if keys is None:
+            owner = self._owned.get(id(obj.parent_component()), None)
+            if owner is None:
+                return
+            keys = owner[1]
+        keys.append(key)
+        if self._strings is not None:
+            self._add_string(key)
+
+    def _drop(self, comp):
+        if self._pending:
+            self._pending = [x for x in self._pending if x is not comp]
+        owner = self._owned.pop(id(comp), None)
+        if owner is None:
+            return
+        objs = self._objs
+        for key in owner[1]:
+            obj = objs.pop(key, None)
+            if obj is None:
+                continue
+            self._keys.pop(id(obj), None)
+            if self._strings is not None:
+                s = str(self._as_cuid(key))
+                if self._strings.get(s, None) == key:
+                    del self._strings[s]
+            if isinstance(obj, _BlockData):
+                for sub in obj.component_objects(descend_into=False):
+                    self._drop(sub)
+
+    @staticmethod
+    def _as_cuid(key):
+        ans = ComponentUID.__new__(ComponentUID)
+        ans._cids = key
+        return ans
+
+    def _build_strings(self):
+        self._strings = {}
+        for key in self._objs:
+            self._add_string(key)
+
+    def _add_string(self, key):
+        # Different CUIDs can have the same string representation
+        # (e.g., x[1] and x['1']); those strings are resolved with
+        # ComponentUID.find_component().
+        s = str(self._as_cuid(key))
+        if self._strings.setdefault(s, key) != key:
+            self._strings[s] = None
+
+
 #
 # Deprecated functions.
 #
@@ -0,0 +1,113 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['ChangeTracker']
+
+from weakref import ref as weakref_ref
+
+from pyomo.core.kernel.component_set import ComponentSet
+
+#
+# Weak references to the trackers that are recording changes.  The
+# modeling components only call record_change() if this list is not
+# empty, so tracking costs a single test when no tracker is active.
+#
+_trackers = []
+
+
+def _in_block(obj, block):
+    """
+    True if obj is the block or a component (or component data) that
+    is declared within it.
+    """
+    while obj is not None:
+        if obj is block:
+            return True
+        obj = obj.parent_block()
+    return False
+
+
+def record_change(obj):
+    """
+    Record that the data of a modeling component changed in all
+    active trackers that track the block of the component.
+    """
+    dead = False
+    for tracker in _trackers:
+        tracker = tracker()
+        if tracker is None:
+            dead = True
+        elif tracker._block is None or _in_block(obj, tracker._block):
+            tracker._changed.add(obj)
+    if dead:
+        _trackers[:] = [t for t in _trackers if t() is not None]
+
+
+class ChangeTracker(object):
+    """
+    Records the modeling components whose data changes while the
+    tracker is active.  The following changes are recorded:
+
+    - variables: the bounds, the domain, the fixed status, and the
+      value of fixed variables (through setlb, setub, fix, unfix and
+      the domain, fixed and value attributes)
+    - mutable parameters: the value
+    - constraints and objectives: the expression and the objective
+      sense
+    - constraints, objectives and blocks: activation and deactivation
+
+    Changes to the values of free variables are not recorded, so loading
+    a solution does not mark the variables as changed.
+
+    Args:
+        block: If specified, only the changes to this block and the
+            components declared within it are recorded.  Otherwise,
+            the changes to all models are recorded.
+    """
+
+    def __init__(self, block=None):
+        self._block = block
+        self._changed = ComponentSet()
+        self._ref = weakref_ref(self)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, t, v, traceback):
+        self.stop()
+
+    @property
+    def active(self):
+        """True if the tracker is recording changes."""
+        return self._ref in _trackers
+
+    def start(self):
+        """Start recording changes."""
+        if self._ref not in _trackers:
+            _trackers.append(self._ref)
+
+    def stop(self):
+        """Stop recording changes."""
+        if self._ref in _trackers:
+            _trackers.remove(self._ref)
+
+    def changes(self):
+        """
+        Returns the components that changed since the tracker was
+        started (or since the last call to this method), and clears
+        the record.
+        """
+        ans = self._changed
+        self._changed = ComponentSet()
+        return ans
+
+    def __len__(self):
+        return len(self._changed)
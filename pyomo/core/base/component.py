@@ -19,6 +19,8 @@ from pickle import PickleError
 
 import pyomo.util
 from pyomo.core.base.misc import tabular_writer
+from pyomo.core.base import change_tracker
+from pyomo.core.kernel.numvalue import _deepcopy_state, _deepcopy_value
 
 from six import iteritems, string_types
 
@@ -172,7 +174,7 @@ class _ComponentBase(object):
         try:
             if paranoid:
                 saved_memo = dict(memo)
-            new_state = deepcopy(state, memo)
+            new_state = _deepcopy_state(state, memo)
         except:
             if paranoid:
                 # Note: memo is intentionally pass-by-reference.  We
@@ -187,7 +189,7 @@ class _ComponentBase(object):
                 try:
                     if paranoid:
                         saved_memo = dict(memo)
-                    new_state[k] = deepcopy(v, memo)
+                    new_state[k] = _deepcopy_value(v, memo)
                 except:
                     if paranoid:
                         memo.clear()
@@ -558,10 +560,14 @@ class ActiveComponent(Component):
     def activate(self):
         """Set the active attribute to True"""
         self._active=True
+        if change_tracker._trackers:
+            change_tracker.record_change(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active=False
+        if change_tracker._trackers:
+            change_tracker.record_change(self)
 
 
 class ComponentData(_ComponentBase):
@@ -872,10 +878,14 @@ class ActiveComponentData(ComponentData):
     def activate(self):
         """Set the active attribute to True"""
         self._active = self.parent_component()._active = True
+        if change_tracker._trackers:
+            change_tracker.record_change(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        if change_tracker._trackers:
+            change_tracker.record_change(self)
 
 
 class ComponentUID(object):
@@ -1055,7 +1065,7 @@ class ComponentUID(object):
             if c is component:
                 yield ( c.local_name, tuple(), '' )
             elif cuid_buffer is not None:
-                if id(self) not in cuid_buffer:
+                if id(component) not in cuid_buffer:
                     for idx, obj in iteritems(c):
                         cuid_buffer[id(obj)] = \
                             self._partial_cuid_from_index(idx)
@@ -26,6 +26,7 @@ from pyomo.core.base.numvalue import (ZeroConstant,
                                       is_constant,
                                       _sub)
 from pyomo.core.base.component import ActiveComponentData
+from pyomo.core.base import change_tracker
 from pyomo.core.base.indexed_component import \
     ( ActiveIndexedComponent,
       UnindexedComponent_set,
@@ -33,6 +34,8 @@ from pyomo.core.base.indexed_component import \
 from pyomo.core.base.misc import (apply_indexed_rule,
                                   tabular_writer)
 from pyomo.core.base.sets import Set
+from pyomo.core.base.parallel_construction import \
+    apply_indexed_rule_in_parallel
 
 from six import StringIO, iteritems
 
@@ -383,6 +386,8 @@ class _GeneralConstraintData(_ConstraintData):
 
     def set_value(self, expr):
         """Set the expression on this constraint."""
+        if change_tracker._trackers:
+            change_tracker.record_change(self)
 
         if expr is None:
             self._body = None
@@ -663,6 +668,15 @@ class Constraint(ActiveIndexedComponent):
                             expressions
         doc             A text string describing this component
         name            A name for this component
+        dense           Evaluate the rule for every index in the index set
+                            when constructing the Constraint (True) or defer
+                            evaluating the rule until an index is first
+                            accessed (False).  Defaults to True.
+        parallel        The number of worker processes used to evaluate
+                            the rule when constructing an indexed
+                            Constraint (True uses one process per CPU).
+                            The rule is evaluated against a read-only
+                            copy of the model.  Defaults to None (serial).
 
     Public class attributes:
         doc             A text string describing this component
@@ -702,6 +716,11 @@ class Constraint(ActiveIndexedComponent):
     def __init__(self, *args, **kwargs):
         self.rule = kwargs.pop('rule', None)
         self._init_expr = kwargs.pop('expr', None)
+        self._dense = kwargs.pop('dense', True)
+        # The indices of a sparse constraint whose rule returned
+        # Constraint.Skip
+        self._skipped = set()
+        self._parallel = kwargs.pop('parallel', None)
         #if self.rule is None and self._init_expr is None:
         #    raise ValueError("A simple Constraint component requires a 'rule' or 'expr' option")
         kwargs.setdefault('ctype', Constraint)
@@ -731,6 +750,74 @@ class Constraint(ActiveIndexedComponent):
             return super(Constraint, self)._setitem_when_not_present(
                 index=index, value=value)
 
+    #
+    # This method must be defined on subclasses of
+    # IndexedComponent that support implicit definition
+    #
+    def _getitem_when_not_present(self, index):
+        """Evaluate the rule for an index that has not been constructed.
+
+        This is only possible for sparse (dense=False) constraints;
+        indices for which the rule returns Constraint.Skip are treated
+        as missing and raise a KeyError.
+        """
+        if self._dense or self.rule is None or not self.is_indexed() \
+           or index in self._skipped:
+            raise KeyError(index)
+        try:
+            tmp = apply_indexed_rule(self,
+                                     self.rule,
+                                     self._parent(),
+                                     index)
+        except Exception:
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed when generating expression for "
+                "constraint %s with index %s:\n%s: %s"
+                % (self.name,
+                   str(index),
+                   type(err).__name__,
+                   err))
+            raise
+        obj = self._setitem_when_not_present(index, tmp)
+        if obj is None:
+            self._skipped.add(index)
+            raise KeyError(index)
+        if not self._active:
+            obj.deactivate()
+        return obj
+
+    def to_dense_data(self):
+        """Evaluate the rule for all indices that have not been
+        constructed"""
+        if self._dense or not self.is_indexed():
+            return
+        for idx in self._index:
+            if idx not in self._data:
+                try:
+                    self._getitem_when_not_present(idx)
+                except KeyError:
+                    pass
+        self._dense = True
+        self._skipped = set()
+
+    #
+    # Iterating over a sparse constraint (including through
+    # component_data_objects) evaluates the rule for the indices that
+    # have not been accessed, so writers and solvers see every
+    # constraint.
+    #
+
+    def __len__(self):
+        if not self._dense and self._constructed:
+            self.to_dense_data()
+        return super(Constraint, self).__len__()
+
+    def __iter__(self):
+        if not self._dense and self._constructed:
+            self.to_dense_data()
+        return super(Constraint, self).__iter__()
+
     def construct(self, data=None):
         """
         Construct the expression(s) for this constraint.
@@ -785,6 +872,22 @@ class Constraint(ActiveIndexedComponent):
                     "of a constraint with a single expression" %
                     (self.name,) )
 
+            if not self._dense:
+                # Defer rule evaluation until the indices are accessed
+                # (see _getitem_when_not_present and to_dense_data)
+                timer.report()
+                return
+
+            if self._parallel:
+                values = apply_indexed_rule_in_parallel(
+                    self, _init_rule, _self_parent, self._index,
+                    self._parallel)
+                if values is not None:
+                    for ndx, tmp in values:
+                        self._setitem_when_not_present(ndx, tmp)
+                    timer.report()
+                    return
+
             for ndx in self._index:
                 try:
                     tmp = apply_indexed_rule(self,
@@ -17,6 +17,7 @@ from weakref import ref as weakref_ref
 from pyomo.util.timing import ConstructionTimer
 from pyomo.core.base.plugin import register_component
 from pyomo.core.base.component import ComponentData
+from pyomo.core.base import change_tracker
 from pyomo.core.base.indexed_component import (
     IndexedComponent,
     UnindexedComponent_set, )
@@ -28,6 +29,8 @@ import pyomo.core.base.expr
 from pyomo.core.base.expr_common import \
     ensure_independent_trees as safe_mode
 from pyomo.core.base.util import is_functor
+from pyomo.core.base.parallel_construction import \
+    apply_indexed_rule_in_parallel
 
 from six import iteritems
 
@@ -225,6 +228,8 @@ class _GeneralExpressionDataImpl(_ExpressionData):
     def set_value(self, expr):
         """Set the expression on this expression."""
         self._expr = as_numeric(expr) if (expr is not None) else None
+        if change_tracker._trackers:
+            change_tracker.record_change(self)
 
     def is_constant(self):
         """A boolean indicating whether this expression is constant."""
@@ -269,6 +274,10 @@ class Expression(IndexedComponent):
                         used to initialize this object.
         expr        A synonym for initialize.
         rule        A rule function used to initialize this object.
+        parallel    The number of worker processes used to evaluate the
+                        rule when constructing an indexed Expression (True
+                        uses one process per CPU).  The rule is evaluated
+                        against a read-only copy of the model.
     """
 
     _ComponentDataClass = _GeneralExpressionData
@@ -287,6 +296,7 @@ class Expression(IndexedComponent):
         self._init_rule = kwds.pop('rule', None)
         self._init_expr = kwds.pop('initialize', None)
         self._init_expr = kwds.pop('expr', self._init_expr)
+        self._parallel = kwds.pop('parallel', None)
         if is_functor(self._init_expr) and \
            (not isinstance(self._init_expr, NumericValue)):
             raise TypeError(
@@ -398,7 +408,15 @@ class Expression(IndexedComponent):
         #
         if _init_rule is not None:
             # construct and initialize with a rule
-            if self.is_indexed():
+            values = None
+            if self.is_indexed() and self._parallel:
+                values = apply_indexed_rule_in_parallel(
+                    self, _init_rule, self._parent(), self._index,
+                    self._parallel)
+            if values is not None:
+                for key, val in values:
+                    self.add(key, val)
+            elif self.is_indexed():
                 for key in self._index:
                     self.add(key,
                              apply_indexed_rule(
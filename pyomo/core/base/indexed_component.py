@@ -392,7 +392,8 @@ class IndexedComponent(Component):
         super(IndexedComponent, self).__setstate__(state)
 
     def to_dense_data(self):
-        """TODO"""
+        """Create the component data for every index in the index set
+        that is not already present"""
         for idx in self._index:
             if idx not in self._data:
                 self._getitem_when_not_present(idx)
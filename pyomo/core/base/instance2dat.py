@@ -2,69 +2,512 @@
 #
 #  Pyomo: Python Optimization Modeling Objects
 #  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
-#  Under the terms of Contract DE-NA0003525 with National Technology and 
-#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain 
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
 #  rights in this software.
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
-__all__ = ['instance2dat']
+__all__ = ['instance2dat', 'export_instance', 'instance_checkpoint']
 
+import csv
+import hashlib
+import io
+import logging
+import os
+import re
+import sys
 import types
-from six import iteritems
-from pyomo.core.base import Set, Param, value
+import zipfile
+from array import array
+from itertools import chain, islice
+from operator import attrgetter
 
+from six import iteritems, string_types, PY2
+from six.moves import zip
 
-# IMPT: Only works on non-nested block models at the moment!
+from pyomo.core.base import Set, Param, Var, value
+from pyomo.core.kernel.numvalue import native_types
+from pyomo.core.base.param import _NotValid
 
-def instance2dat(instance, output_filename):
+try:
+    import numpy
+    numpy_available = True
+except ImportError:                               #pragma:nocover
+    numpy_available = False
 
-    output_file = open(output_filename,"w")
+logger = logging.getLogger('pyomo.core')
 
-    for set_name, set_object in iteritems(instance.component_map(Set, active=True)):
-        if (set_object.initialize is not None) and (type(set_object.initialize) is types.FunctionType):
-            continue
+# The number of values that are formatted at a time
+_chunksize = 10000
+
+# Strings that data commands read as plain words
+_word_re = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_.\-]*$')
+_reserved_words = frozenset(['True', 'true', 'TRUE', 'False', 'false',
+                             'FALSE', 'set', 'param', 'default', 'data',
+                             'end', 'load', 'include', 'store', 'table',
+                             'namespace', 'import', 'export'])
+
+_number_types = set([int, float, bool])
+if PY2:                                           #pragma:nocover
+    _number_types.add(long)
+_integer_types = _number_types.difference([float])
+_array_types = _number_types.union([type(None)])
+
+# ZipFile.open() can write archive members in Python 3.6 and later
+_zip_write_stream = sys.version_info[:2] >= (3, 6)
+
+_var_value = attrgetter('value')
+_param_value = attrgetter('_value')
 
-        if (set_name.find("_index") == -1) and (set_name.find("_domain") == -1):
-            if set_object.dim() == 0:
-                if len(set_object) == 0:
-                    continue
-                print >>output_file, "set "+set_name+" := "
-                for element in set_object:
-                    print >>output_file, element
-                print >>output_file, ";"
-            elif set_object.dim() == 1:
-                for index in set_object:
-                    print >>output_file, "set "+set_name+"[\""+str(index)+"\"]"+" := ",
-                    for element in set_object[index]:
-                        print >>output_file, element,
-                    print >>output_file, ";"
-            else:
-                print >>output_file, "***MULTIPLY INDEXED SETS NOT IMPLEMENTED!!!"
-                pass
 
-            print >>output_file, ""
+#
+# Component data
+#
+# IMPT: Only works on non-nested block models at the moment!
+#
 
-    for param_name, param_object in iteritems(instance.component_map(Param, active=True)):
-        if (param_object._initialize is not None) and (type(param_object._initialize) is types.FunctionType):
+def _components(instance, variables):
+    """
+    Generate the tuples (name, component) for the sets, parameters
+    and (optionally) variables that are exported.  Sets and parameters
+    that are initialized with a rule are skipped, since the model
+    recreates them.
+    """
+    for name, obj in iteritems(instance.component_map(Set, active=True)):
+        if type(getattr(obj, 'initialize', None)) is types.FunctionType:
             continue
-        elif len(param_object) == 0:
+        if name.find("_index") != -1 or name.find("_domain") != -1:
             continue
+        yield name, obj
+    for name, obj in iteritems(instance.component_map(Param, active=True)):
+        if type(getattr(obj, '_rule', None)) is types.FunctionType:
+            continue
+        yield name, obj
+    if variables:
+        for name, obj in iteritems(instance.component_map(Var, active=True)):
+            yield name, obj
+
+def _param_default(obj):
+    """
+    Returns the default value of a parameter if it is a constant,
+    None if the parameter does not have a default value, and _NotValid
+    otherwise (e.g., for defaults that are computed by a function).
+    """
+    default = obj._default_val
+    if default is _NotValid:
+        return None
+    if type(default) in native_types:
+        return default
+    return _NotValid
 
-        if None in param_object:
-            print >>output_file, "param "+param_name+" := "+str(value(param_object[None]))+" ;"
-            print >>output_file, ""
+def _item_chunks(obj, sparse=False):
+    """
+    Generate the tuples (keys, values) of lists with the indices and
+    values of a parameter or variable, in chunks of _chunksize items.
+    Missing values are None.  Parameter values that are not stored are
+    the default value of the parameter, unless sparse is True, in
+    which case only the stored parameter values are generated.
+    """
+    if not obj.is_indexed():
+        if obj.type() is Var:
+            yield [None], [obj.value]
+        elif obj._data or _param_default(obj) is _NotValid:
+            yield [None], [value(obj)]
         else:
-            print >>output_file, "param "+param_name+" := "
-            if param_object.dim() == 1:
-                for index in param_object:
-                    print >>output_file, index, str(value(param_object[index]))
+            yield [None], [_param_default(obj)]
+        return
+    data = obj._data
+    if obj.type() is Var:
+        indices = iter(obj)
+    else:
+        default = _param_default(obj)
+        if sparse or default is None:
+            # The values of the other indices are missing
+            indices = obj.sparse_iterkeys()
+        else:
+            indices = iter(obj)
+    while True:
+        keys = list(islice(indices, _chunksize))
+        if not keys:
+            return
+        if obj.type() is not Var and len(data) < len(obj) and \
+           not all(map(data.__contains__, keys)):
+            yield keys, _param_values(obj, keys, default)
+            continue
+        values = map(data.__getitem__, keys)
+        if obj.type() is Var:
+            values = list(map(_var_value, values))
+        elif obj._mutable:
+            values = [None if val is _NotValid else val
+                      for val in map(_param_value, values)]
+        else:
+            values = list(values)
+        yield keys, values
+
+def _param_values(obj, keys, default):
+    """
+    Returns the values of a parameter for a list of indices, some of
+    which are not stored in the parameter.
+    """
+    data = obj._data
+    values = []
+    for key in keys:
+        if key in data:
+            val = data[key]
+            if obj._mutable:
+                val = val._value
+                if val is _NotValid:
+                    val = None
+        elif default is _NotValid:
+            # The default value is computed for each index
+            val = value(obj[key])
+        else:
+            val = default
+        values.append(val)
+    return values
+
+def _set_blocks(obj):
+    """
+    Returns a list of tuples (index, members) for a set.  The index of
+    a set that is not indexed is None.
+    """
+    if not obj.is_indexed():
+        return [(None, obj)]
+    return [(index, obj[index]) for index in obj]
+
+def _chunks(items):
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, _chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+def _digest(obj):
+    sha = hashlib.sha1()
+    if obj.type() is Set:
+        for index, members in _set_blocks(obj):
+            sha.update(repr(index).encode('utf-8'))
+            for chunk in _chunks(members):
+                sha.update(repr(chunk).encode('utf-8'))
+        return sha.hexdigest()
+    sparse = False
+    if obj.type() is Param:
+        default = _param_default(obj)
+        if default is not _NotValid:
+            # The values that are not stored are the constant default
+            sha.update(repr(default).encode('utf-8'))
+            sparse = True
+    for keys, values in _item_chunks(obj, sparse):
+        sha.update(repr(keys).encode('utf-8'))
+        try:
+            sha.update(array('d', values))
+        except TypeError:
+            sha.update(repr(values).encode('utf-8'))
+    return sha.hexdigest()
+
+
+def instance_checkpoint(instance, variables=True):
+    """
+    Record the data in a model instance, so :func:`export_instance`
+    can export only the components that change after this call.
+
+    Returns:
+        A dictionary that maps component names to digests of their
+        data.
+    """
+    return dict((name, _digest(obj))
+                for name, obj in _components(instance, variables))
+
+
+#
+# Data command files
+#
+
+def _dat_token(val):
+    if type(val) is float:
+        return repr(val)
+    if type(val) in _integer_types:
+        return str(val)
+    if isinstance(val, tuple):
+        return "(" + ",".join(_dat_token(v) for v in val) + ")"
+    val = str(val)
+    if _word_re.match(val) and val not in _reserved_words:
+        return val
+    if "'" in val:
+        return '"' + val + '"'
+    return "'" + val + "'"
+
+def _dat_rows(columns):
+    """
+    Returns the text of the rows of data in a list of columns.  The
+    rows are formatted with a single format string.
+    """
+    specs = []
+    for i, column in enumerate(columns):
+        column_types = set(map(type, column))
+        if column_types == set([float]):
+            specs.append('%r')
+        elif column_types.issubset(_integer_types):
+            specs.append('%s')
+        else:
+            specs.append('%s')
+            columns[i] = list(map(_dat_token, column))
+    fmt = " ".join(specs) + "\n"
+    return (fmt * len(columns[0])) % tuple(chain.from_iterable(zip(*columns)))
+
+def _write_dat(ostream, name, obj):
+    if obj.type() is Set:
+        for index, members in _set_blocks(obj):
+            if index is None:
+                ostream.write("set %s :=\n" % name)
+            else:
+                ostream.write("set %s[%s] :=\n" % (name, ",".join(
+                    map(_dat_token, index if type(index) is tuple
+                        else (index,)))))
+            for chunk in _chunks(members):
+                ostream.write(_dat_rows([chunk]))
+            ostream.write(";\n\n")
+        return
+    if not obj.is_indexed():
+        val = next(_item_chunks(obj))[1][0]
+        if val is not None:
+            ostream.write("param %s := %s ;\n\n" % (name, _dat_token(val)))
+        return
+    default = _param_default(obj) if obj.type() is Param else None
+    if default is None or default is _NotValid:
+        ostream.write("param %s :=\n" % name)
+        chunks = _item_chunks(obj)
+    else:
+        ostream.write("param %s default %s :=\n" % (name, _dat_token(default)))
+        chunks = _item_chunks(obj, sparse=True)
+    for keys, values in chunks:
+        if None in values:
+            present = [i for i, val in enumerate(values) if val is not None]
+            if not present:
+                continue
+            keys = [keys[i] for i in present]
+            values = [values[i] for i in present]
+        if type(keys[0]) is tuple:
+            columns = list(zip(*keys))
+        else:
+            columns = [keys]
+        columns.append(values)
+        ostream.write(_dat_rows(columns))
+    ostream.write(";\n\n")
+
+
+#
+# CSV files
+#
+
+def _csv_column(column):
+    if PY2:                                     #pragma:nocover
+        # str() truncates floats in Python 2
+        return [repr(v) if type(v) is float else v for v in column]
+    return column
+
+def _write_csv(dirname, name, obj):
+    if obj.type() is Set and obj.is_indexed():
+        logger.warning("Indexed set '%s' is not exported to CSV files" % name)
+        return
+    with open(os.path.join(dirname, name + '.csv'), 'w') as ostream:
+        writer = csv.writer(ostream, lineterminator='\n')
+        if obj.type() is Set:
+            dimen = obj.dimen if type(obj.dimen) is int else 1
+            if dimen == 1:
+                writer.writerow([name])
+            else:
+                writer.writerow(["%s_%d" % (name, i+1) for i in range(dimen)])
+            for chunk in _chunks(obj):
+                if dimen == 1:
+                    writer.writerows(zip(_csv_column(chunk)))
+                else:
+                    writer.writerows(zip(*map(_csv_column, zip(*chunk))))
+            return
+        if not obj.is_indexed():
+            writer.writerow([name])
+            writer.writerow(next(_item_chunks(obj))[1])
+            return
+        header = None
+        for keys, values in _item_chunks(obj):
+            if type(keys[0]) is tuple:
+                columns = [_csv_column(c) for c in zip(*keys)]
+            else:
+                columns = [_csv_column(keys)]
+            if header is None:
+                header = ["index_%d" % (i+1) for i in range(len(columns))]
+                header.append(name)
+                writer.writerow(header)
+            columns.append(['.' if v is None else v
+                            for v in _csv_column(values)])
+            writer.writerows(zip(*columns))
+
+
+#
+# NumPy archives
+#
+
+def _axis_sets(obj):
+    """
+    Returns the sets that index the axes of a component, or None if
+    the component cannot be stored as a dense array.
+    """
+    index = obj.index_set()
+    sets = getattr(index, 'set_tuple', None)
+    if sets is None:
+        sets = [index]
+    for s in sets:
+        if s.dimen != 1 or not s.concrete:
+            return None
+    return sets
+
+def _npz_array(data):
+    """
+    Returns an array with a list of values (or of tuples of values).
+    NumPy converts all the values to strings if a list mixes strings
+    with other values, so those lists are stored as arrays of objects.
+    """
+    arr = numpy.asanyarray(data)
+    if arr.dtype.kind in 'US' and type(data) is list:
+        items = data
+        if data and type(data[0]) is tuple:
+            items = chain.from_iterable(data)
+        if not all(isinstance(v, string_types) for v in items):
+            arr = numpy.array(data, dtype=object)
+    return arr
+
+def _npz_write(archive, name, data):
+    data = _npz_array(data)
+    if _zip_write_stream:
+        # Write the array directly into the archive member
+        with archive.open(name + '.npy', 'w', force_zip64=True) as f:
+            numpy.lib.format.write_array(f, data)
+    else:                                       #pragma:nocover
+        buf = io.BytesIO()
+        numpy.lib.format.write_array(buf, data)
+        archive.writestr(name + '.npy', buf.getvalue())
+
+def _write_npz(archive, written, name, obj):
+    if obj.type() is Set:
+        if obj.is_indexed():
+            logger.warning("Indexed set '%s' is not exported to NumPy "
+                           "files" % name)
+            return
+        if name not in written:
+            _npz_write(archive, name, list(obj))
+            written.add(name)
+        return
+    if not obj.is_indexed():
+        val = next(_item_chunks(obj))[1][0]
+        _npz_write(archive, name, numpy.nan if val is None else val)
+        return
+    sets = _axis_sets(obj)
+    numeric = True
+    if sets is not None:
+        # Store the values in a dense array with NaN for missing
+        # values.  The labels of each axis are stored in an array named
+        # by its set.
+        positions = [dict((v, i) for i, v in enumerate(s)) for s in sets]
+        dense = numpy.full(tuple(len(p) for p in positions), numpy.nan)
+        for keys, values in _item_chunks(obj):
+            if not _array_types.issuperset(map(type, values)):
+                numeric = False
+                break
+            if len(sets) == 1:
+                keys = (keys,)
             else:
-                for index in param_object:
-                    for i in index:
-                        print >>output_file, i,
-                    print >>output_file, str(value(param_object[index]))
-            print >>output_file, ";"
-            print >>output_file, ""
-
-    output_file.close()
+                keys = zip(*keys)
+            coords = tuple([p[k] for k in column]
+                           for p, column in zip(positions, keys))
+            dense[coords] = [numpy.nan if v is None else v for v in values]
+        if numeric:
+            _npz_write(archive, name, dense)
+            for s in sets:
+                if s.local_name not in written:
+                    _npz_write(archive, s.local_name, list(s))
+                    written.add(s.local_name)
+            return
+    # Store the values and the indices in separate arrays
+    keys, values = [], []
+    for chunk_keys, chunk_values in _item_chunks(obj):
+        keys.extend(chunk_keys)
+        values.extend(chunk_values)
+    _npz_write(archive, name, values)
+    _npz_write(archive, name + '_index', keys)
+
+
+def export_instance(instance, filename, format=None, variables=True,
+                    since=None):
+    """
+    Export the data in a model instance.  The 'dat' and 'csv' formats
+    write the values in chunks, so the memory used does not grow with
+    the size of the instance.  The 'npz' format builds the array of
+    each component in memory before it is written to the archive.
+
+    The 'dat' format writes data commands.  The 'csv' format writes a
+    file NAME.csv for each component in the directory filename, where
+    the first columns contain the indices and the last column the
+    values.  The 'npz' format writes a NumPy archive.  Parameters and
+    variables that are indexed by sets of single values are stored as
+    dense arrays with NaN for missing values, together with an array
+    with the members of each set, as the 'npz' data manager loads
+    them.  Other components are stored as an array NAME of values and
+    an array NAME_index of indices.  Arrays of values that mix strings
+    with other values (e.g., the members of the set {'a', 1}) are
+    stored as arrays of objects, which are pickled.
+
+    Args:
+        instance: The model instance.
+        filename (str): The output file (or directory for 'csv').
+        format (str): 'dat', 'csv' or 'npz'.  Default is the extension
+            of filename, or 'csv' if filename is a directory.
+        variables (bool): If :const:`True`, the current values of the
+            variables are exported as parameter data.
+        since (dict): A checkpoint returned by
+            :func:`instance_checkpoint`.  If specified, only the
+            components that changed after the checkpoint are exported.
+    """
+    if format is None:
+        if os.path.isdir(filename):
+            format = 'csv'
+        else:
+            format = os.path.splitext(filename)[1][1:].lower()
+    if format not in ('dat', 'csv', 'npz'):
+        raise ValueError("Unknown export format '%s'" % format)
+    if format == 'npz' and not numpy_available:
+        raise ImportError("NumPy is required to export NumPy archives")
+
+    components = _components(instance, variables)
+    if since is not None:
+        components = [(name, obj) for name, obj in components
+                      if since.get(name, None) != _digest(obj)]
+
+    if format == 'dat':
+        with open(filename, 'w') as ostream:
+            for name, obj in components:
+                _write_dat(ostream, name, obj)
+    elif format == 'csv':
+        if not os.path.isdir(filename):
+            os.makedirs(filename)
+        for name, obj in components:
+            _write_csv(filename, name, obj)
+    else:
+        written = set()
+        archive = zipfile.ZipFile(filename, 'w', zipfile.ZIP_STORED,
+                                  allowZip64=True)
+        try:
+            for name, obj in components:
+                _write_npz(archive, written, name, obj)
+        finally:
+            archive.close()
+
+
+def instance2dat(instance, output_filename):
+    """
+    Write the set and parameter data in a model instance to a file
+    of data commands.
+    """
+    export_instance(instance, output_filename, format='dat',
+                    variables=False)
@@ -25,6 +25,7 @@ from pyomo.util.timing import ConstructionTimer
 from pyomo.core.base.numvalue import as_numeric, value
 from pyomo.core.base.plugin import register_component
 from pyomo.core.base.component import ActiveComponentData
+from pyomo.core.base import change_tracker
 from pyomo.core.base.indexed_component import (
     ActiveIndexedComponent,
     UnindexedComponent_set,
@@ -219,6 +220,8 @@ class _GeneralObjectiveData(_GeneralExpressionDataImpl,
         if (sense == minimize) or \
            (sense == maximize):
             self._sense = sense
+            if change_tracker._trackers:
+                change_tracker.record_change(self)
         else:
             raise ValueError("Objective sense must be set to one of "
                              "'minimize' (%s) or 'maximize' (%s). Invalid "
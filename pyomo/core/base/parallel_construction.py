@@ -0,0 +1,217 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""
+Evaluation of construction rules in worker processes.
+
+Components that accept the ``parallel`` keyword (Constraint and
+Expression) can evaluate their rule for each index in a pool of
+forked worker processes.  The index set is split into contiguous
+chunks; each worker evaluates the rule for its chunks against its own
+(copy-on-write) copy of the model, and returns the pickled results.
+References to model components are pickled as persistent ids (the id()
+of the component, which is the same in the parent and in the forked
+worker), so the parent resolves them to its own components when the
+results are unpickled and stored in the component.
+
+Rules are evaluated against a read-only copy of the model: changes
+that a rule makes to the model (e.g., adding components) are lost.
+Worker processes are created with fork(); on platforms that do not
+support it, the rule is evaluated serially.
+"""
+
+import logging
+import multiprocessing
+import pickle
+import sys
+from io import BytesIO
+
+from six import itervalues
+
+from pyomo.util import timing
+from pyomo.core.kernel.numvalue import native_types
+from pyomo.core.base.misc import apply_indexed_rule
+
+logger = logging.getLogger('pyomo.core')
+
+_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# Types that never contain model components
+_plain_types = set(native_types)
+_plain_types.update((tuple, list, dict))
+
+# The job being evaluated: set in the parent before the worker
+# processes are forked (and inherited by them)
+_job = None
+
+# Number of chunks per worker process
+_CHUNKS_PER_PROCESS = 4
+
+
+class _RulePickler(pickle.Pickler):
+    """Pickle rule results, replacing model components with their
+    persistent ids"""
+
+    def __init__(self, known, stream):
+        pickle.Pickler.__init__(self, stream, _PROTOCOL)
+        self._known = known
+
+    def persistent_id(self, obj):
+        if obj.__class__ in _plain_types:
+            return None
+        if id(obj) in self._known:
+            return id(obj)
+        if not hasattr(obj, 'parent_component'):
+            return None
+        # Component data created by the rule (e.g., sparse variables)
+        # are identified by their component and index
+        comp = obj.parent_component()
+        if comp is obj or id(comp) not in self._known:
+            raise ValueError(
+                "Cannot evaluate the rule in parallel: found a reference "
+                "to the component '%s', which is not part of the model"
+                % (obj.name,))
+        return (id(comp), obj.index())
+
+
+class _RuleUnpickler(pickle.Unpickler):
+    """Unpickle rule results, resolving persistent ids to the
+    components of the model"""
+
+    def __init__(self, known, stream):
+        pickle.Unpickler.__init__(self, stream)
+        self._known = known
+
+    def persistent_load(self, ref):
+        if ref.__class__ is tuple:
+            return self._known[ref[0]][ref[1]]
+        return self._known[ref]
+
+
+def _known_components(block):
+    """Return a dict mapping id() to each component (and component
+    data) on the model that contains the block"""
+    from pyomo.core.base.block import _BlockData
+    model = block.model()
+    known = { id(model): model }
+    blocks = [model]
+    while blocks:
+        blk = blocks.pop()
+        for comp in blk.component_objects(descend_into=False):
+            known[id(comp)] = comp
+            if comp.is_indexed():
+                data = itervalues(comp._data)
+            else:
+                data = (comp,)
+            for obj in data:
+                if hasattr(obj, 'parent_component'):
+                    known[id(obj)] = obj
+                    if isinstance(obj, _BlockData):
+                        blocks.append(obj)
+    return known
+
+
+def _evaluate_chunk(chunk):
+    """Evaluate the rule of the current job for a range of indices
+    (called in the worker processes)"""
+    component, rule, block, indices, known = _job
+    results = []
+    for ndx in indices[chunk[0]:chunk[1]]:
+        try:
+            results.append(apply_indexed_rule(component, rule, block, ndx))
+        except Exception:
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed when generating expression for "
+                "%s %s with index %s:\n%s: %s"
+                % (component.type().__name__.lower(),
+                   component.name,
+                   str(ndx),
+                   type(err).__name__,
+                   err))
+            raise
+    stream = BytesIO()
+    _RulePickler(known, stream).dump(results)
+    return stream.getvalue()
+
+
+def _fork_pool(processes):
+    """Return a pool of forked worker processes, or None if fork() is
+    not available"""
+    if multiprocessing.current_process().daemon:
+        # Worker processes cannot create their own workers
+        return None
+    try:
+        context = multiprocessing.get_context('fork')
+    except AttributeError:
+        # Python 2: multiprocessing always forks on POSIX platforms
+        if sys.platform.startswith('win'):
+            return None
+        context = multiprocessing
+    except ValueError:
+        return None
+    return context.Pool(processes)
+
+
+def apply_indexed_rule_in_parallel(component, rule, block, index, processes):
+    """
+    Evaluate a construction rule for every index in a pool of worker
+    processes.
+
+    Args:
+        component: The component being constructed.
+        rule: The rule to evaluate.
+        block: The block passed to the rule.
+        index: The indices for which the rule is evaluated.
+        processes: The number of worker processes (True uses one
+            process per CPU).
+
+    Returns:
+        A list of (index, rule result) tuples (in the order of
+        `index`), or None if the rule should be evaluated serially
+        (fewer than two processes or indices, or fork() is not
+        available).
+    """
+    global _job
+    if processes is True:
+        processes = multiprocessing.cpu_count()
+    indices = list(index)
+    processes = min(processes, len(indices))
+    if processes < 2:
+        return None
+
+    nchunks = min(processes*_CHUNKS_PER_PROCESS, len(indices))
+    bounds = [len(indices)*i//nchunks for i in range(nchunks+1)]
+    chunks = list(zip(bounds[:-1], bounds[1:]))
+
+    known = _known_components(block)
+    _job = (component, rule, block, indices, known)
+    try:
+        pool = _fork_pool(processes)
+        if pool is None:
+            logger.warning(
+                "Parallel construction is not available on this "
+                "platform; constructing %s serially" % (component.name,))
+            return None
+        try:
+            results = pool.map(_evaluate_chunk, chunks)
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        _job = None
+
+    if timing._profile is not None:
+        timing._profile.rule_calls += len(indices)
+    ans = []
+    for (start, stop), data in zip(chunks, results):
+        values = _RuleUnpickler(known, BytesIO(data)).load()
+        ans.extend(zip(indices[start:stop], values))
+    return ans
@@ -18,6 +18,7 @@ from weakref import ref as weakref_ref
 from pyomo.util.timing import ConstructionTimer
 from pyomo.core.base.plugin import register_component
 from pyomo.core.base.component import ComponentData
+from pyomo.core.base import change_tracker
 from pyomo.core.base.indexed_component import IndexedComponent, \
     UnindexedComponent_set
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
@@ -100,6 +101,8 @@ class _ParamData(ComponentData, NumericValue):
     # involves a linear scan of the _data dict.
     def set_value(self, value, idx=_NoArgument):
         self._value = value
+        if change_tracker._trackers:
+            change_tracker.record_change(self)
         if idx is _NoArgument:
             idx = self.index()
         self.parent_component()._validate_value(idx, value)
@@ -382,6 +385,9 @@ class Param(IndexedComponent):
                         if index not in self._data:
                             self._data[index] = _ParamData(self)
                         self._data[index]._value = new_values
+            if change_tracker._trackers:
+                for index in (new_values if _isDict else self._index):
+                    change_tracker.record_change(self._data[index])
         else:
             #
             # Initialize a scalar
@@ -0,0 +1,376 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['CompactTupleStorage']
+
+import logging
+
+from six.moves import xrange
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:                               #pragma:nocover
+    numpy_available = False
+
+logger = logging.getLogger('pyomo.core')
+
+class CompactTupleStorage(object):
+    """
+    Insertion-ordered storage for the members of a Set that
+    encodes each member as a row of integer codes.
+
+    Each dimension of the set interns its distinct values, so a member
+    is stored as one integer per dimension in a NumPy array (one column
+    per dimension).  Each row is also packed into a single integer key
+    (a fixed number of bits per dimension); membership and position
+    lookups search a sorted array of these keys.  Newly added rows are
+    buffered in Python lists (with a dictionary index) and merged into
+    the arrays in bulk.  Removed rows are recorded and deleted from
+    the arrays in bulk the next time positions are needed.  Member
+    tuples are only created when they are requested (e.g., during
+    iteration).
+
+    The packed keys are NumPy integers as long as they fit in 63 bits.
+    Wider keys (e.g., three dimensions with more than 2**21 distinct
+    values each) fall back to Python integers, which is slower than
+    the default Set storage; a warning is logged when this happens.
+
+    Constructor Arguments:
+        dimen       The (fixed) dimension of the set members.
+    """
+
+    # Number of rows decoded at a time when iterating, and the minimum
+    # number of buffered rows before they are merged into the arrays
+    _CHUNK = 4096
+    # Initial number of bits reserved for each code in the packed keys
+    _BITS = 8
+
+    def __init__(self, dimen):
+        if not numpy_available:
+            raise ImportError(
+                "Compact Set storage requires the numpy package")
+        if type(dimen) is not int or dimen < 1:
+            raise ValueError(
+                "Compact Set storage requires a fixed, positive set "
+                "dimension (dimen=%s)" % (dimen,))
+        self.dimen = dimen
+        self._values = [ [] for i in xrange(dimen) ]
+        self._codes = [ {} for i in xrange(dimen) ]
+        self._bits = [ self._BITS ]*dimen
+        self._rows = numpy.empty((0, dimen), dtype=numpy.int32)
+        self._keys = numpy.empty(0, dtype=numpy.int64)
+        self._perm = numpy.empty(0, dtype=numpy.int64)
+        self._pending = []
+        self._pending_index = {}
+        self._removed = set()
+        self._wide_keys = False
+
+    #
+    # Encoding / decoding
+    #
+
+    def _pack(self, codes):
+        """Pack a sequence of integer codes into a single index key."""
+        key = 0
+        for c, b in zip(codes, self._bits):
+            key = (key << b) | c
+        return key
+
+    def _pack_rows(self, rows):
+        """Vectorized version of _pack()."""
+        keys = numpy.zeros(len(rows), dtype=self._keys.dtype)
+        for j, b in enumerate(self._bits):
+            if keys.dtype == object:
+                keys = keys * (1 << b) + rows[:,j].astype(object)
+            else:
+                keys <<= b
+                keys |= rows[:,j]
+        return keys
+
+    def _lookup_key(self, val):
+        """Return the packed key for a member, or None if the member
+        contains a value that has never been stored in this set."""
+        if self.dimen == 1:
+            val = (val,)
+        elif type(val) is not tuple or len(val) != self.dimen:
+            return None
+        key = 0
+        try:
+            for _codes, b, v in zip(self._codes, self._bits, val):
+                key = (key << b) | _codes[v]
+        except (KeyError, TypeError):
+            return None
+        return key
+
+    def _decode(self, row):
+        if self.dimen == 1:
+            return self._values[0][row[0]]
+        return tuple( _vals[c] for _vals, c in zip(self._values, row) )
+
+    #
+    # Index maintenance
+    #
+
+    def _find(self, key):
+        """Return the (0-based) position of the row with the given
+        packed key, or None"""
+        pos = self._pending_index.get(key, None)
+        if pos is not None and pos in self._removed:
+            pos = None
+        if pos is None and self._keys.size:
+            keys = self._keys
+            i = keys.searchsorted(key)
+            if i < keys.size and keys[i] == key:
+                pos = int(self._perm[i])
+                if pos in self._removed:
+                    pos = None
+        return pos
+
+    def _flush(self):
+        """Merge the buffered rows into the row and key arrays, and
+        delete the removed rows."""
+        if not self._pending and not self._removed:
+            return
+        rows = self._rows
+        if self._pending:
+            new_rows = numpy.array(self._pending, dtype=rows.dtype)
+            rows = numpy.concatenate((rows, new_rows))
+        if self._removed:
+            rows = numpy.delete(rows, sorted(self._removed), axis=0)
+        self._rows = rows
+        self._pending = []
+        self._pending_index = {}
+        self._removed = set()
+        self._reindex()
+
+    def _reindex(self):
+        """Rebuild the sorted key array from the row array."""
+        if sum(self._bits) > 63:
+            if not self._wide_keys:
+                self._wide_keys = True
+                logger.warning(
+                    "Compact Set storage: the members of this set need "
+                    "%s bits per packed key, which is more than the 63 "
+                    "bits that fit in a NumPy integer.  Falling back to "
+                    "Python integer keys, which is slower than the "
+                    "default Set storage (compact=False)."
+                    % (sum(self._bits),))
+            self._keys = numpy.empty(0, dtype=object)
+        keys = self._pack_rows(self._rows)
+        self._perm = numpy.argsort(keys, kind='mergesort')
+        self._keys = keys[self._perm]
+
+    def _grow_bits(self, j, code):
+        """Reserve enough bits in the packed keys for a new code in
+        dimension j."""
+        while code >> self._bits[j]:
+            self._bits[j] += 4
+        nrows = len(self._rows)
+        removed = self._removed
+        self._pending_index = dict(
+            (self._pack(codes), nrows+i)
+            for i, codes in enumerate(self._pending)
+            if nrows+i not in removed )
+        self._reindex()
+
+    #
+    # Set API
+    #
+
+    def __len__(self):
+        return len(self._rows) + len(self._pending) - len(self._removed)
+
+    def __contains__(self, val):
+        key = self._lookup_key(val)
+        return key is not None and self._find(key) is not None
+
+    def __iter__(self):
+        self._flush()
+        rows = self._rows
+        for start in xrange(0, len(rows), self._CHUNK):
+            block = rows[start:start+self._CHUNK]
+            cols = [ [ _vals[c] for c in block[:,j].tolist() ]
+                     for j, _vals in enumerate(self._values) ]
+            if self.dimen == 1:
+                for val in cols[0]:
+                    yield val
+            else:
+                for val in zip(*cols):
+                    yield val
+
+    def __getitem__(self, pos):
+        """Return the member at a (0-based) position."""
+        _len = len(self)
+        if pos < 0:
+            pos += _len
+        if pos < 0 or pos >= _len:
+            raise IndexError("CompactTupleStorage index out of range")
+        if self._removed:
+            self._flush()
+        nrows = len(self._rows)
+        if pos >= nrows:
+            return self._decode(self._pending[pos-nrows])
+        return self._decode(self._rows[pos].tolist())
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def add(self, val):
+        """Add a member; return False if it was already present."""
+        if self.dimen == 1:
+            vals = (val,)
+        elif type(val) is tuple and len(val) == self.dimen:
+            vals = val
+        else:
+            raise TypeError(
+                "Member %s does not have dimension %s"
+                % (val, self.dimen))
+        codes = []
+        key = 0
+        grow = False
+        for _codes, _vals, b, v in zip(
+                self._codes, self._values, self._bits, vals):
+            c = _codes.get(v, None)
+            if c is None:
+                c = _codes[v] = len(_vals)
+                _vals.append(v)
+                if c >> b:
+                    grow = True
+            codes.append(c)
+            key = (key << b) | c
+        if grow:
+            for j, c in enumerate(codes):
+                if c >> self._bits[j]:
+                    self._grow_bits(j, c)
+            key = self._pack(codes)
+        elif self._find(key) is not None:
+            return False
+        pending = self._pending
+        self._pending_index[key] = len(self._rows) + len(pending)
+        pending.append(codes)
+        if len(pending) >= self._CHUNK \
+           and len(pending) >= len(self._rows) >> 2:
+            self._flush()
+        return True
+
+    def update(self, values):
+        """
+        Add a sequence of members in bulk.
+
+        Duplicate detection is vectorized over the whole sequence.
+        Returns the list of members that were not added because they
+        were already present (or repeated in the sequence).
+        """
+        self._flush()
+        dimen = self.dimen
+        cols = [ [] for j in xrange(dimen) ]
+        for val in values:
+            if dimen == 1:
+                vals = (val,)
+            elif type(val) is tuple and len(val) == dimen:
+                vals = val
+            else:
+                raise TypeError(
+                    "Member %s does not have dimension %s"
+                    % (val, dimen))
+            for _codes, _vals, col, v in zip(
+                    self._codes, self._values, cols, vals):
+                c = _codes.get(v, None)
+                if c is None:
+                    c = _codes[v] = len(_vals)
+                    _vals.append(v)
+                col.append(c)
+        if not cols[0]:
+            return []
+        grow = False
+        for j, _vals in enumerate(self._values):
+            while (len(_vals) - 1) >> self._bits[j]:
+                self._bits[j] += 4
+                grow = True
+        if grow:
+            self._reindex()
+        rows = numpy.array(cols, dtype=self._rows.dtype).T
+        keys = self._pack_rows(rows)
+        # Keep the first occurrence of each new key
+        keep = numpy.zeros(len(keys), dtype=bool)
+        keep[numpy.unique(keys, return_index=True)[1]] = True
+        if self._keys.size:
+            i = numpy.minimum(self._keys.searchsorted(keys),
+                              self._keys.size - 1)
+            keep &= self._keys[i] != keys
+        self._rows = numpy.concatenate((self._rows, rows[keep]))
+        self._reindex()
+        return [ self._decode(row) for row in rows[~keep].tolist() ]
+
+    def discard(self, val):
+        """Remove a member (if present), preserving insertion order.
+
+        The row is deleted from the arrays the next time the arrays are
+        rebuilt, so a sequence of removals costs a single rebuild.
+        """
+        key = self._lookup_key(val)
+        pos = None if key is None else self._find(key)
+        if pos is None:
+            return
+        self._pending_index.pop(key, None)
+        self._removed.add(pos)
+
+    def position(self, val):
+        """Return the (0-based) position of a member."""
+        if self._removed:
+            self._flush()
+        key = self._lookup_key(val)
+        pos = None if key is None else self._find(key)
+        if pos is None:
+            raise KeyError(val)
+        return pos
+
+    def select(self, pattern):
+        """
+        Iterate over the members matching a pattern.
+
+        The pattern is a tuple with one entry per dimension, where
+        each entry is either a value or slice(None) (a wildcard).
+        Matching rows are found with vectorized comparisons of the
+        code columns.
+        """
+        if type(pattern) is not tuple or len(pattern) != self.dimen:
+            raise IndexError(
+                "Compact Set slices must specify %s indices" % (self.dimen,))
+        self._flush()
+        rows = self._rows
+        mask = None
+        for j, val in enumerate(pattern):
+            if type(val) is slice:
+                if val != slice(None):
+                    raise IndexError(
+                        "Sets can only be indexed with simple slices: "
+                        "start, stop, and step values are not allowed.")
+                continue
+            try:
+                c = self._codes[j].get(val, None)
+            except TypeError:
+                c = None
+            if c is None:
+                return iter(())
+            if mask is None:
+                mask = rows[:,j] == c
+            else:
+                mask &= rows[:,j] == c
+        if mask is None:
+            return iter(self)
+        return ( self._decode(row)
+                 for row in rows[numpy.flatnonzero(mask)].tolist() )
+
+    def nbytes(self):
+        """Return the number of bytes used by the row and index arrays."""
+        self._flush()
+        return self._rows.nbytes + self._keys.nbytes + self._perm.nbytes
@@ -31,6 +31,7 @@ from pyomo.core.base.component import Component, ComponentData
 from pyomo.core.base.indexed_component import IndexedComponent, \
     UnindexedComponent_set
 from pyomo.core.base.numvalue import native_numeric_types
+from pyomo.core.base.set_storage import CompactTupleStorage
 
 from six import itervalues, iteritems, string_types
 from six.moves import xrange
@@ -493,6 +494,88 @@ class _OrderedSetData(_SetDataBase):
         """
         return self.nextw(match_element, k=-k)
 
+class _CompactOrderedSetData(_OrderedSetData):
+    """
+    This class defines the data for an insertion-ordered set whose
+    members are stored in a CompactTupleStorage object.
+
+    Constructor Arguments:
+        owner       The Set object that owns this data.
+        bounds      A tuple of bounds for set values: (lower, upper)
+
+    Public Class Attributes:
+        value       The CompactTupleStorage holding the set values
+        _bounds     The tuple of bound values
+
+    The order_dict attribute is not used: the storage object maps
+    members to their positions.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, owner, bounds):
+        #
+        # The following is equivalent to calling
+        # the base ComponentData constructor.
+        #
+        self._component = weakref_ref(owner)
+        #
+        self._bounds = bounds
+        self._is_sorted = 0
+        self.order_dict = None
+        self._clear()
+
+    def _clear(self):
+        """
+        Reset the set data
+        """
+        self.value = CompactTupleStorage(self.parent_component().dimen)
+
+    def _add(self, val, verify=True):
+        """
+        Add an element, and optionally verify that it is a valid type.
+
+        The type verification is done by the owning component.
+        """
+        if verify:
+            self._component()._verify(val)
+        self.value.add(val)
+
+    def _discard(self, val):
+        """
+        Discard an element of this set.  This does not return an error
+        if the element does not already exist.
+        """
+        self.value.discard(val)
+
+    def __contains__(self, val):
+        """
+        Return True if the set contains a given value.
+        """
+        return val in self.value
+
+    def __getitem__(self, idx):
+        """
+        Return the specified member of the set.
+
+        The public Set API is 1-based.  Indexing with a tuple that
+        contains slices (e.g., A[1,:]) returns an iterator over the
+        members that match the fixed indices.
+        """
+        if type(idx) is tuple:
+            return self.value.select(idx)
+        return _OrderedSetData.__getitem__(self, idx)
+
+    def ord(self, match_element):
+        """
+        Return the position index of the input value.  The
+        position indices start at 1.
+        """
+        try:
+            return self.value.position(match_element) + 1
+        except KeyError:
+            raise IndexError("Unknown input element="+str(match_element)+" provided as input to ord() method for set="+self.name)
+
 class _IndexedSetData(_SetData):
     """
     This class adds the __call__ method, which is expected
@@ -596,6 +679,10 @@ class Set(IndexedComponent):
                             SortedOrder     Ordered by sort order
                             <function>      Ordered with this comparison function
         filter          A function that is used to filter set entries.
+        compact         If True, store the members of a (non-indexed)
+                            set as rows of integer codes in NumPy
+                            arrays (see CompactTupleStorage).  Compact
+                            sets are ordered by insertion order.
 
     Public class attributes:
         concrete        If True, then this set contains elements.(TODO)
@@ -620,7 +707,9 @@ class Set(IndexedComponent):
         if cls != Set:
             return super(Set, cls).__new__(cls)
         if not args or (args[0] is UnindexedComponent_set and len(args)==1):
-            if kwds.get('ordered',False) is False:
+            if kwds.get('compact', False):
+                return CompactOrderedSimpleSet.__new__(CompactOrderedSimpleSet)
+            elif kwds.get('ordered',False) is False:
                 return SimpleSet.__new__(SimpleSet)
             else:
                 return OrderedSimpleSet.__new__(OrderedSimpleSet)
@@ -639,6 +728,10 @@ class Set(IndexedComponent):
         self.filter     = kwds.pop("filter", None)
         self.domain     = kwds.pop("within", None)
         self.domain     = kwds.pop('domain', self.domain )
+        if kwds.pop("compact", False) \
+           and not isinstance(self, CompactOrderedSimpleSet):
+            raise ValueError(
+                "Compact storage is only supported for non-indexed Sets")
         #
         if self.ordered is True:
             self.ordered = Set.InsertionOrder
@@ -1278,6 +1371,75 @@ class OrderedSimpleSet(SimpleSetBase,_OrderedSetData):
         return element in self.order_dict
 
 
+class CompactOrderedSimpleSet(OrderedSimpleSet,_CompactOrderedSetData):
+
+    def __init__(self, *args, **kwds):
+        self._bounds = kwds.pop('bounds', None)
+        SimpleSetBase.__init__(self, *args, **kwds)
+        if self.ordered is False:
+            self.ordered = Set.InsertionOrder
+        elif self.ordered is not Set.InsertionOrder:
+            raise ValueError(
+                "Compact set '%s' only supports insertion ordering"
+                % (self.name,))
+        _CompactOrderedSetData.__init__(self, self, self._bounds)
+
+    def add(self, *args):
+        """
+        Add one or more elements to a set.
+        """
+        # Note: this is equivalent to SimpleSetBase.add(), except that
+        # the storage object reports duplicate elements, so we avoid
+        # a separate membership test.
+        for val in args:
+            tmp = pyutilib_misc_flatten_tuple(val)
+            self._verify(tmp)
+            try:
+                if not self.value.add(tmp):
+                    logger.warning("Element "+str(tmp)+" already exists in set "+self.name+"; no action taken.")
+            except TypeError:
+                raise TypeError("Problem inserting "+str(tmp)+" into set "+self.name)
+
+    def __getitem__(self, key):
+        """
+        Return the specified member of the set.
+        """
+        return _CompactOrderedSetData.__getitem__(self, key)
+
+    def construct(self, values=None):
+        """
+        Apply the rule to construct values in this set
+
+        Members of an initialization list are added to the storage in
+        bulk when no filter, validation rule, or domain needs to be
+        applied to the individual members.
+        """
+        if self._constructed or values is not None \
+           or self.initialize is None or self.dimen == 1 \
+           or type(self.initialize) in (dict, types.FunctionType) \
+           or self.filter is not None or self.validate is not None \
+           or self.domain is not None:
+            return OrderedSimpleSet.construct(self, values)
+        timer = ConstructionTimer(self)
+        self._constructed=True
+        try:
+            duplicates = self.value.update(
+                pyutilib_misc_flatten_tuple(val) for val in self.initialize)
+        except TypeError:
+            e = sys.exc_info()[1]
+            raise ValueError("Problem inserting data into set "+self.name+": "+str(e))
+        for val in duplicates:
+            logger.warning("Element "+str(val)+" already exists in set "+self.name+"; no action taken.")
+        timer.report()
+
+    def _set_contains(self, element):
+        """
+        A wrapper function that tests if the element is in
+        the data associated with a concrete set.
+        """
+        return element in self.value
+
+
 # REVIEW - START
 
 class SetOf(SimpleSet):
@@ -1419,10 +1581,85 @@ class _SetOperator(SimpleSet):
     def _set_contains(self, element):
         raise IOError("Undefined set operation")
 
+    def __getitem__(self, idx):
+        """
+        Return the specified member of an ordered set operation.
+
+        Valid index values are 1 .. len(set), or -1 .. -len(set).
+        Derived classes override this method when the member can be
+        computed without iterating through the set.
+        """
+        idx = self._positional_index(idx)
+        return next(itertools.islice(self, idx-1, None))
+
+    def ord(self, match_element):
+        """
+        Return the position index of the input value.  The
+        position indices start at 1.
+        """
+        if not self.ordered:
+            raise ValueError(
+                "Cannot call ord() on an unordered set '%s'" % (self.name,))
+        for i, elt in enumerate(self):
+            if elt == match_element:
+                return i + 1
+        raise IndexError("Unknown input element="+str(match_element)+" provided as input to ord() method for set="+self.name)
+
+    def first(self):
+        """Return the first element of the set."""
+        return self[1]
+
+    def last(self):
+        """Return the last element of the set."""
+        return self[-1]
+
+    def _positional_index(self, idx):
+        """
+        Validate a 1-based (or negative) position and convert it to a
+        positive 1-based position.
+        """
+        if not self.ordered:
+            raise ValueError("Cannot index an unordered set '%s'" % (self.name,))
+        if idx >= 1:
+            if idx > len(self):
+                raise IndexError("Cannot index a set operation past the last element")
+            return idx
+        elif idx < 0:
+            _len = len(self)
+            if _len+idx < 0:
+                raise IndexError("Cannot index a set operation past the first element")
+            return _len + idx + 1
+        else:
+            raise IndexError("Valid index values for sets are 1 .. len(set) or -1 .. -len(set)")
+
     def data(self):
         """The underlying set data."""
         return set(self)
 
+
+def _intersection_size(setA, setB):
+    """
+    Count the elements common to two concrete sets by testing the
+    members of the smaller set for membership in the larger one.
+    """
+    if len(setB) < len(setA):
+        setA, setB = setB, setA
+    ctr = 0
+    for elt in setA:
+        if elt in setB:
+            ctr += 1
+    return ctr
+
+def _set_ord(_set, element):
+    """Return the (1-based) position of an element in an ordered set."""
+    if type(_set) is OrderedSimpleSet:
+        # optimization: this is the most common case
+        try:
+            return _set.order_dict[element] + 1
+        except KeyError:
+            raise IndexError("Unknown input element="+str(element)+" provided as input to ord() method for set="+_set.name)
+    return _set.ord(element)
+
 class _SetUnion(_SetOperator):
 
     def __init__(self, *args, **kwds):
@@ -1438,6 +1675,30 @@ class _SetUnion(_SetOperator):
     def _set_contains(self, elt):
         return elt in self._setA or elt in self._setB
 
+    def __len__(self):
+        return len(self._setA) + len(self._setB) \
+            - _intersection_size(self._setA, self._setB)
+
+    def __getitem__(self, idx):
+        idx = self._positional_index(idx)
+        lenA = len(self._setA)
+        if idx <= lenA:
+            return self._setA[idx]
+        idx -= lenA
+        for elt in self._setB:
+            if not elt in self._setA:
+                idx -= 1
+                if not idx:
+                    return elt
+
+    def ord(self, match_element):
+        if not self.ordered:
+            raise ValueError(
+                "Cannot call ord() on an unordered set '%s'" % (self.name,))
+        if match_element in self._setA:
+            return _set_ord(self._setA, match_element)
+        return _SetOperator.ord(self, match_element)
+
 class _SetIntersection(_SetOperator):
 
     def __init__(self, *args, **kwds):
@@ -1451,6 +1712,9 @@ class _SetIntersection(_SetOperator):
     def _set_contains(self, elt):
         return elt in self._setA and elt in self._setB
 
+    def __len__(self):
+        return _intersection_size(self._setA, self._setB)
+
 class _SetDifference(_SetOperator):
 
     def __init__(self, *args, **kwds):
@@ -1464,6 +1728,9 @@ class _SetDifference(_SetOperator):
     def _set_contains(self, elt):
         return elt in self._setA and not elt in self._setB
 
+    def __len__(self):
+        return len(self._setA) - _intersection_size(self._setA, self._setB)
+
 class _SetSymmetricDifference(_SetOperator):
 
     def __init__(self, *args, **kwds):
@@ -1480,6 +1747,10 @@ class _SetSymmetricDifference(_SetOperator):
     def _set_contains(self, elt):
         return (elt in self._setA) ^ (elt in self._setB)
 
+    def __len__(self):
+        return len(self._setA) + len(self._setB) \
+            - 2*_intersection_size(self._setA, self._setB)
+
 class _SetProduct(_SetOperator):
 
     def __init__(self, *args, **kwd):
@@ -1524,6 +1795,15 @@ class _SetProduct(_SetOperator):
         # if type(element) is not tuple:
         #    return False
         try:
+            if self.is_flat_product():
+                # optimization: for products of 1-dimensional sets, each
+                # entry in the element maps directly onto a subset
+                if len(element) != len(self.set_tuple):
+                    return False
+                for subset, val in zip(self.set_tuple, element):
+                    if not subset._set_contains(val):
+                        return False
+                return True
             ctr = 0
             for subset in self.set_tuple:
                 d = subset.dimen
@@ -1556,6 +1836,47 @@ class _SetProduct(_SetOperator):
             ans *= len(_set)
         return ans
 
+    def __getitem__(self, idx):
+        """
+        Return the specified member of the set.  The member is computed
+        by treating the (0-based) position as a mixed-radix number whose
+        digits are positions within each of the subsets.
+        """
+        ndx = self._positional_index(idx) - 1
+        ans = []
+        for _set in reversed(self.set_tuple):
+            ndx, i = divmod(ndx, len(_set))
+            ans.append(_set[i+1])
+        ans.reverse()
+        if self.is_flat_product():
+            return tuple(ans)
+        return pyutilib_misc_flatten_tuple(tuple(ans))
+
+    def ord(self, match_element):
+        """
+        Return the position index of the input value.  The
+        position indices start at 1.
+        """
+        if not self.ordered:
+            raise ValueError(
+                "Cannot call ord() on an unordered set '%s'" % (self.name,))
+        if self.dimen is None:
+            return _SetOperator.ord(self, match_element)
+        if type(match_element) is not tuple \
+           or len(match_element) != self.dimen:
+            raise IndexError("Unknown input element="+str(match_element)+" provided as input to ord() method for set="+self.name)
+        ans = 0
+        ctr = 0
+        for _set in self.set_tuple:
+            d = _set.dimen
+            if d == 1:
+                val = match_element[ctr]
+            else:
+                val = match_element[ctr:ctr+d]
+            ctr += d
+            ans = ans*len(_set) + _set_ord(_set, val) - 1
+        return ans + 1
+
     def _compute_dimen(self):
         ans=0
         for _set in self.set_tuple:
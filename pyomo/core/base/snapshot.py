@@ -0,0 +1,816 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""
+Binary snapshots of constructed model instances.
+
+A snapshot file has the following layout:
+
+    header      magic string, format version, and the location of
+                the skeleton (see _HEADER)
+    arrays      raw NumPy arrays (variable values and bounds, numeric
+                parameter values, constraint bounds, and the
+                coefficients of linear expressions), each aligned on a
+                _ALIGN-byte boundary
+    skeleton    a pickled description of the model: one record per
+                component (in declaration order), plus the dtype,
+                shape and offset of each array
+
+Component records are pickled separately, and references to other
+model components are replaced by persistent ids (e.g., the serial
+number of the component record), so the model structure is rebuilt
+one component at a time.  Linear expressions are stored as arrays of
+coefficients and variable positions; all other expressions are
+pickled.
+
+This is a compact binary format, not a shared-memory format: loading a
+snapshot converts every array to Python values as its component is
+rebuilt, and the loaded model holds no references to the file.  Each
+process that loads a snapshot therefore holds its own copy of the
+model data.  (The file is memory-mapped while it is read, which only
+avoids an intermediate copy of the array data.)
+"""
+
+__all__ = ['save_instance', 'load_instance']
+
+import mmap
+import struct
+import pickle
+from io import BytesIO
+
+from six import iteritems, itervalues, integer_types
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:                               #pragma:nocover
+    numpy_available = False
+
+from pyomo.core.kernel import expr_common, expr_coopr3
+from pyomo.core.kernel.numvalue import native_numeric_types
+from pyomo.core.kernel.set_types import _VirtualSet
+from pyomo.core.base.component import Component, ComponentData, \
+    ActiveComponent, ActiveComponentData
+from pyomo.core.base.indexed_component import UnindexedComponent_set
+from pyomo.core.base.action import BuildAction
+from pyomo.core.base.check import BuildCheck
+from pyomo.core.base.sets import Set, IndexedSet, SimpleSet, \
+    OrderedSimpleSet, CompactOrderedSimpleSet
+from pyomo.core.base.param import Param, _ParamData, _NotValid
+from pyomo.core.base.var import Var, _VarData
+from pyomo.core.base.constraint import Constraint
+from pyomo.core.base.objective import Objective
+from pyomo.core.base.expression import Expression
+from pyomo.core.base.suffix import Suffix
+from pyomo.core.base.block import Block, SimpleBlock, IndexedBlock
+from pyomo.core.base.PyomoModel import ConcreteModel
+from pyomo.core.base import set_types
+
+_MAGIC = b'PYOMOSNP'
+_VERSION = 1
+# magic, version, (reserved), skeleton offset, skeleton length
+_HEADER = struct.Struct('<8sIIQQ')
+_ALIGN = 64
+_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# Component types that hold no data once they are constructed
+_skipped_types = (BuildAction, BuildCheck)
+
+# Types that never contain references to model components
+_plain_types = set([str, float, bool, type(None)]) | set(integer_types)
+
+
+def _global_sets():
+    """Return the predefined (virtual) sets, keyed by name"""
+    return dict( (name, obj) for name, obj in iteritems(vars(set_types))
+                 if isinstance(obj, (Set, _VirtualSet)) )
+
+
+def _linear_terms(expr):
+    """
+    Return the constant and the list of (coefficient, variable) terms
+    of a linear expression, or None.
+
+    Only sums of (unfixed) variables with native numeric coefficients
+    are recognized; expressions that involve fixed variables, mutable
+    parameters or named expressions are returned as None, so that they
+    are stored (and restored) verbatim.
+    """
+    if isinstance(expr, _VarData):
+        if expr.fixed:
+            return None
+        return 0, [(1, expr)]
+    if expr_common.mode is not expr_common.Mode.coopr3_trees \
+       or expr.__class__ is not expr_coopr3._SumExpression:
+        return None
+    const = expr._const
+    if const.__class__ not in native_numeric_types:
+        return None
+    terms = []
+    for coef, arg in zip(expr._coef, expr._args):
+        if coef.__class__ not in native_numeric_types:
+            return None
+        if arg.__class__ is expr_coopr3._ProductExpression:
+            if arg._denominator or len(arg._numerator) != 1 \
+               or arg._coef.__class__ not in native_numeric_types:
+                return None
+            coef *= arg._coef
+            arg = arg._numerator[0]
+        if not isinstance(arg, _VarData) or arg.fixed:
+            return None
+        terms.append((coef, arg))
+    return const, terms
+
+
+def _native_array(values):
+    """Return an int64 or float64 array of the values, or None if the
+    values are not all integers or all floats."""
+    types = set(val.__class__ for val in values)
+    if types == set([float]):
+        return numpy.array(values, dtype=numpy.float64)
+    if types and types.issubset(set([int, numpy.int64])):
+        try:
+            return numpy.array(values, dtype=numpy.int64)
+        except OverflowError:
+            return None
+    return None
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """Pickle objects, replacing model components with their
+    persistent ids"""
+
+    def __init__(self, refs, stream):
+        pickle.Pickler.__init__(self, stream, _PROTOCOL)
+        self._refs = refs
+
+    def persistent_id(self, obj):
+        if obj.__class__ in _plain_types:
+            return None
+        ref = self._refs.get(id(obj), None)
+        if ref is None and isinstance(obj, (Component, ComponentData)):
+            raise ValueError(
+                "Cannot save the snapshot: found a reference to the "
+                "component '%s', which is not part of the model"
+                % (obj.name,))
+        return ref
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickle objects, resolving persistent ids with the reader"""
+
+    def __init__(self, reader, stream):
+        pickle.Unpickler.__init__(self, stream)
+        self._reader = reader
+
+    def persistent_load(self, ref):
+        return self._reader.resolve(ref)
+
+
+class _SnapshotWriter(object):
+
+    def __init__(self, model):
+        self.model = model
+        self.refs = { id(model): ('M',),
+                      id(UnindexedComponent_set): ('U',) }
+        for name, obj in iteritems(_global_sets()):
+            self.refs[id(obj)] = ('G', name)
+        self.components = []
+        self.var_pos = {}
+        self.arrays = []
+
+    def dumps(self, obj):
+        stream = BytesIO()
+        _SnapshotPickler(self.refs, stream).dump(obj)
+        return stream.getvalue()
+
+    def add_array(self, values, dtype=None):
+        """Store an array and return its position in the array table"""
+        self.arrays.append(numpy.ascontiguousarray(values, dtype=dtype))
+        return len(self.arrays) - 1
+
+    def add_numbers(self, values):
+        """Store numbers (None is stored as NaN) in a float64 array.
+        Integer values are flagged in a second array so that they are
+        restored as integers.  Return the positions of the arrays."""
+        arr = self.add_array(
+            [ numpy.nan if val is None else val for val in values ],
+            dtype=numpy.float64)
+        ints = [ val.__class__ in integer_types for val in values ]
+        if any(ints):
+            return arr, self.add_array(ints, dtype=bool)
+        return arr, None
+
+    def add_sequence(self, values):
+        """Store a list of integers (or of integer tuples with the same
+        length) as an int64 array and return the position of the array;
+        any other list is returned (to be pickled) as-is."""
+        if not values:
+            return values
+        first = values[0]
+        if first.__class__ is tuple:
+            shape = (len(values), len(first))
+        else:
+            shape = (len(values),)
+            first = (first,)
+        if any(val.__class__ not in integer_types for val in first):
+            return values
+        try:
+            arr = numpy.array(values)
+        except (ValueError, OverflowError):
+            return values
+        # (mixed lists are converted to arrays of a different kind or
+        # shape)
+        if arr.dtype.kind != 'i' or arr.shape != shape:
+            return values
+        return self.add_array(arr, dtype=numpy.int64)
+
+    def collect(self, block):
+        """Register the components of a block (and its sub-blocks) in
+        declaration order"""
+        for comp in block.component_objects(descend_into=False):
+            if isinstance(comp, _skipped_types):
+                continue
+            serial = len(self.components)
+            self.components.append(comp)
+            self.refs[id(comp)] = ('C', serial)
+            for idx, obj in iteritems(getattr(comp, '_data', {})):
+                if isinstance(obj, ComponentData):
+                    self.refs.setdefault(id(obj), ('D', serial, idx))
+            if comp.type() is Block:
+                if comp.__class__ not in (SimpleBlock, IndexedBlock):
+                    raise TypeError(
+                        "Cannot save the snapshot: unsupported block "
+                        "type %s for component '%s'"
+                        % (comp.__class__.__name__, comp.name))
+                for blk in itervalues(comp._data):
+                    self.collect(blk)
+            elif comp.type() is Var:
+                for vardata in itervalues(comp._data):
+                    self.var_pos[id(vardata)] = len(self.var_pos)
+
+    def write(self, filename):
+        self.collect(self.model)
+        records = []
+        for comp in self.components:
+            record, deferred = self._record(comp)
+            records.append((self.dumps(record), self.dumps(deferred)))
+        table = []
+        with open(filename, 'wb') as OUTPUT:
+            OUTPUT.write(b'\0' * _HEADER.size)
+            for arr in self.arrays:
+                OUTPUT.write(b'\0' * (-OUTPUT.tell() % _ALIGN))
+                table.append((OUTPUT.tell(), arr.dtype.str, arr.shape))
+                OUTPUT.write(arr.tobytes())
+            skeleton = { 'name': self.model.name,
+                         'arrays': table,
+                         'records': records }
+            offset = OUTPUT.tell()
+            pickle.dump(skeleton, OUTPUT, _PROTOCOL)
+            length = OUTPUT.tell() - offset
+            OUTPUT.seek(0)
+            OUTPUT.write(_HEADER.pack(_MAGIC, _VERSION, 0, offset, length))
+
+    #
+    # Component records
+    #
+
+    def _record(self, comp):
+        """Return the record of a component, and the part of the record
+        that must be restored once all components have been created"""
+        ctype = comp.type()
+        record = { 'name': comp.local_name,
+                   'parent': comp.parent_block(),
+                   'index': UnindexedComponent_set,
+                   'keys': None }
+        if comp.is_indexed():
+            record['index'] = comp.index_set()
+            record['keys'] = list(comp._data)
+        if isinstance(comp, ActiveComponent):
+            record['active'] = comp._active
+            data = list(itervalues(getattr(comp, '_data', {})))
+            if comp.is_indexed() and data and \
+               isinstance(data[0], ActiveComponentData):
+                record['data_active'] = self.add_array(
+                    [ obj._active for obj in data ], dtype=bool)
+        deferred = {}
+        if isinstance(comp, Set):
+            # (includes RangeSet components)
+            record['kind'] = 'set'
+            self._set_record(comp, record)
+        elif ctype is Param:
+            record['kind'] = 'param'
+            self._param_record(comp, record)
+        elif ctype is Var:
+            record['kind'] = 'var'
+            self._var_record(comp, record, deferred)
+        elif ctype is Block:
+            record['kind'] = 'block'
+        elif ctype is Constraint:
+            record['kind'] = 'constraint'
+            self._constraint_record(comp, record, deferred)
+        elif ctype is Objective:
+            record['kind'] = 'objective'
+            data = list(itervalues(comp._data))
+            record['sense'] = self.add_array(
+                [ obj.sense for obj in data ], dtype=numpy.int8)
+            self._body_record([ obj.expr for obj in data ], record, deferred)
+        elif ctype is Expression:
+            record['kind'] = 'expression'
+            self._body_record([ e.expr for e in itervalues(comp._data) ],
+                              record, deferred)
+        elif ctype is Suffix:
+            record['kind'] = 'suffix'
+            record['direction'] = comp.get_direction()
+            record['datatype'] = comp.get_datatype()
+            deferred['items'] = list(iteritems(comp))
+        else:
+            raise TypeError(
+                "Cannot save the snapshot: unsupported component type "
+                "%s for component '%s'" % (ctype.__name__, comp.name))
+        if record['keys'] is not None:
+            record['keys'] = self.add_sequence(record['keys'])
+        return record, deferred
+
+    def _set_record(self, comp, record):
+        if not getattr(comp, 'concrete', True):
+            raise TypeError(
+                "Cannot save the snapshot: the set '%s' is not concrete"
+                % (comp.name,))
+        # Sets ordered by a user-defined function are restored in
+        # insertion order (the members are saved in sorted order)
+        if comp.ordered is Set.SortedOrder:
+            record['ordered'] = 'sorted'
+        else:
+            record['ordered'] = bool(comp.ordered)
+        record['dimen'] = comp.dimen
+        record['domain'] = comp.domain
+        if comp.domain is not None and \
+           getattr(comp.domain, 'dimen', 0) != comp.dimen:
+            # e.g., RangeSets (within Integers, which has no fixed
+            # dimension); the members have already been validated
+            record['domain'] = None
+        record['compact'] = isinstance(comp, CompactOrderedSimpleSet)
+        if isinstance(comp, IndexedSet):
+            record['members'] = dict(
+                (idx, list(data)) for idx, data in iteritems(comp._data))
+        else:
+            record['members'] = self.add_sequence(list(comp))
+            record['bounds'] = comp._bounds
+
+    def _param_record(self, comp, record):
+        record['mutable'] = comp._mutable
+        record['domain'] = comp.domain
+        record['default'] = comp._default_val
+        keys = []
+        values = []
+        for idx, val in iteritems(comp._data):
+            if isinstance(val, _ParamData):
+                val = val._value
+            if val is _NotValid:
+                continue
+            keys.append(idx)
+            values.append(val)
+        record['keys'] = keys
+        arr = _native_array(values)
+        if arr is None:
+            record['values'] = values
+        else:
+            record['values'] = self.add_array(arr)
+
+    def _var_record(self, comp, record, deferred):
+        record['dense'] = getattr(comp, '_dense', True)
+        data = list(itervalues(comp._data))
+        domains = [ vardata.domain for vardata in data ]
+        if domains and all(domain is domains[0] for domain in domains):
+            record['domain'] = domains[0]
+        else:
+            record['domains'] = domains
+        record['value'] = self.add_numbers(
+            [ vardata.value for vardata in data ])
+        lb = [ vardata._lb for vardata in data ]
+        ub = [ vardata._ub for vardata in data ]
+        if self._bounds_record(lb, ub, record):
+            deferred['bounds'] = (lb, ub)
+        record['fixed'] = self.add_array(
+            [ vardata.fixed for vardata in data ], dtype=bool)
+        record['stale'] = self.add_array(
+            [ vardata.stale for vardata in data ], dtype=bool)
+
+    def _bounds_record(self, lb, ub, record):
+        """Store native bounds (None is stored as NaN) as arrays; return
+        True if the bounds must be pickled instead"""
+        for bound in (lb, ub):
+            for val in bound:
+                if val is not None and \
+                   val.__class__ not in native_numeric_types:
+                    return True
+        record['lb'] = self.add_numbers(lb)
+        record['ub'] = self.add_numbers(ub)
+        return False
+
+    def _constraint_record(self, comp, record, deferred):
+        data = list(itervalues(comp._data))
+        record['equality'] = self.add_array(
+            [ con.equality for con in data ], dtype=bool)
+        lb = [ con.lower for con in data ]
+        ub = [ con.upper for con in data ]
+        if self._bounds_record(lb, ub, record):
+            deferred['bounds'] = (lb, ub)
+        self._body_record([ con.body for con in data ], record, deferred)
+
+    def _body_record(self, exprs, record, deferred):
+        """Store the linear expressions as arrays and pickle the
+        others"""
+        nterms = []
+        const = []
+        var_pos = []
+        coefs = []
+        other = {}
+        for i, expr in enumerate(exprs):
+            linear = None if expr is None else _linear_terms(expr)
+            if linear is None:
+                other[i] = expr
+                nterms.append(-1)
+                const.append(0)
+                continue
+            nterms.append(len(linear[1]))
+            const.append(linear[0])
+            for coef, var in linear[1]:
+                pos = self.var_pos.get(id(var), None)
+                if pos is None:
+                    raise ValueError(
+                        "Cannot save the snapshot: found a reference to "
+                        "the component '%s', which is not part of the "
+                        "model" % (var.name,))
+                coefs.append(coef)
+                var_pos.append(pos)
+        record['nterms'] = self.add_array(nterms, dtype=numpy.int64)
+        record['const'] = self.add_numbers(const)
+        record['vars'] = self.add_array(var_pos, dtype=numpy.int64)
+        record['coefs'] = self.add_numbers(coefs)
+        deferred['exprs'] = other
+
+
+class _SnapshotReader(object):
+
+    def __init__(self, skeleton, arrays):
+        self.skeleton = skeleton
+        self.arrays = arrays
+        self.global_sets = _global_sets()
+        self.model = None
+        self.components = []
+        self.vars = []
+
+    def loads(self, data):
+        return _SnapshotUnpickler(self, BytesIO(data)).load()
+
+    def resolve(self, ref):
+        kind = ref[0]
+        if kind == 'D':
+            return self.components[ref[1]][ref[2]]
+        elif kind == 'C':
+            return self.components[ref[1]]
+        elif kind == 'M':
+            return self.model
+        elif kind == 'U':
+            return UnindexedComponent_set
+        elif kind == 'G':
+            return self.global_sets[ref[1]]
+        raise ValueError("Invalid snapshot reference: %s" % (ref,))
+
+    def read(self):
+        self.model = ConcreteModel(name=self.skeleton['name'])
+        records = self.skeleton['records']
+        loaded = []
+        for record, deferred in records:
+            record = self.loads(record)
+            for key in ('keys', 'members'):
+                if record.get(key, None).__class__ is int:
+                    record[key] = self._sequence(record[key])
+            loaded.append(record)
+            comp = getattr(self, '_create_' + record['kind'])(record)
+            self.components.append(comp)
+        # Expressions (and anything else that may refer to components
+        # declared later in the model) are restored once all the
+        # components exist
+        for comp, record, (_, deferred) in zip(
+                self.components, loaded, records):
+            deferred = self.loads(deferred)
+            if record['kind'] == 'var':
+                if 'bounds' in deferred:
+                    for vardata, lb, ub in zip(
+                            self._data(comp, record), *deferred['bounds']):
+                        vardata._lb = lb
+                        vardata._ub = ub
+            elif record['kind'] == 'constraint':
+                self._restore_constraint(comp, record, deferred)
+            elif record['kind'] == 'objective':
+                self._restore_objective(comp, record, deferred)
+            elif record['kind'] == 'expression':
+                for e, expr in zip(self._data(comp, record),
+                                   self._bodies(record, deferred)):
+                    e.set_value(expr)
+            elif record['kind'] == 'suffix':
+                for key, val in deferred['items']:
+                    comp.set_value(key, val, expand=False)
+            self._restore_active(comp, record)
+        return self.model
+
+    def _add(self, record, comp):
+        record['parent'].add_component(record['name'], comp)
+        return comp
+
+    def _keys(self, record):
+        if record['index'] is UnindexedComponent_set:
+            return [None]
+        return record['keys']
+
+    def _args(self, record):
+        if record['index'] is UnindexedComponent_set:
+            return ()
+        return (record['index'],)
+
+    def _data(self, comp, record):
+        if record['index'] is UnindexedComponent_set:
+            return [comp]
+        # (indexed blocks create their data on first access)
+        _data = comp._data
+        return [ _data[idx] if idx in _data else comp[idx]
+                 for idx in record['keys'] ]
+
+    def _sequence(self, pos):
+        """Return the list stored with add_sequence()"""
+        arr = self.arrays[pos]
+        if arr.ndim == 1:
+            return arr.tolist()
+        return [ tuple(row) for row in arr.tolist() ]
+
+    def _restore_active(self, comp, record):
+        if 'active' not in record:
+            return
+        comp._active = record['active']
+        if 'data_active' in record:
+            for data, active in zip(
+                    self._data(comp, record),
+                    self.arrays[record['data_active']].tolist()):
+                data._active = active
+
+    def _values(self, record):
+        values = record['values']
+        if values.__class__ is int:
+            return self.arrays[values].tolist()
+        return values
+
+    def _numbers(self, arrays):
+        """Return the list of numbers stored with add_numbers()"""
+        values = [ None if val != val else val
+                   for val in self.arrays[arrays[0]].tolist() ]
+        if arrays[1] is not None:
+            values = [ int(val) if is_int else val
+                       for val, is_int in zip(
+                               values, self.arrays[arrays[1]].tolist()) ]
+        return values
+
+    def _bounds(self, record, deferred):
+        if 'bounds' in deferred:
+            return deferred['bounds']
+        return self._numbers(record['lb']), self._numbers(record['ub'])
+
+    def _bodies(self, record, deferred):
+        other = deferred['exprs']
+        const = self._numbers(record['const'])
+        var_pos = self.arrays[record['vars']].tolist()
+        coefs = self._numbers(record['coefs'])
+        variables = self.vars
+        direct = expr_common.mode is expr_common.Mode.coopr3_trees
+        ptr = 0
+        for i, n in enumerate(self.arrays[record['nterms']].tolist()):
+            if n < 0:
+                yield other[i]
+                continue
+            _vars = [ variables[pos] for pos in var_pos[ptr:ptr+n] ]
+            _coefs = coefs[ptr:ptr+n]
+            ptr += n
+            if n > 1 or (n == 1 and const[i]):
+                if direct:
+                    # Build the sum directly (this is the form that
+                    # _linear_terms() recognizes)
+                    expr = expr_coopr3._SumExpression()
+                    expr._args = _vars
+                    expr._coef = _coefs
+                    expr._const = const[i]
+                    yield expr
+                else:
+                    yield sum( ( v if c == 1 else c*v
+                                 for c, v in zip(_coefs, _vars) ),
+                               const[i] )
+            elif n == 1:
+                yield _vars[0] if _coefs[0] == 1 else _coefs[0]*_vars[0]
+            else:
+                yield const[i]
+
+    #
+    # Component construction
+    #
+
+    def _create_set(self, record):
+        ordered = record['ordered']
+        if ordered == 'sorted':
+            ordered = Set.SortedOrder
+        kwds = { 'ordered': ordered,
+                 'dimen': record['dimen'],
+                 'within': record['domain'],
+                 'initialize': record['members'] }
+        if record['compact']:
+            kwds['compact'] = True
+        elif self._args(record) == () and record['ordered'] != 'sorted':
+            # The members were validated when the snapshot was saved, so
+            # they are stored directly in the (empty) set
+            kwds['initialize'] = None
+            kwds['bounds'] = record['bounds']
+            members = record['members']
+            comp = self._add(record, Set(**kwds))
+            if comp.__class__ is OrderedSimpleSet:
+                comp.value = list(members)
+                comp.order_dict = dict(
+                    (val, i) for i, val in enumerate(members))
+            elif comp.__class__ is SimpleSet:
+                comp.value = set(members)
+            else:                                 #pragma:nocover
+                comp.add(*members)
+            return comp
+        return self._add(record, Set(*self._args(record), **kwds))
+
+    def _create_param(self, record):
+        kwds = { 'mutable': record['mutable'],
+                 'within': record['domain'] }
+        if record['default'] is not _NotValid:
+            kwds['default'] = record['default']
+        values = self._values(record)
+        if record['index'] is UnindexedComponent_set:
+            if values:
+                kwds['initialize'] = values[0]
+            return self._add(record, Param(**kwds))
+        # The values were validated when the snapshot was saved, so they
+        # are stored directly in the (empty) parameter
+        param = self._add(record, Param(record['index'], **kwds))
+        if param._mutable:
+            for idx, val in zip(record['keys'], values):
+                obj = param._data[idx] = _ParamData(param)
+                obj._value = val
+        else:
+            param._data.update(zip(record['keys'], values))
+        return param
+
+    def _create_var(self, record):
+        index = record['index']
+        # Dense variables are created in bulk
+        dense = index is UnindexedComponent_set or \
+                len(record['keys']) == len(index)
+        var = self._add(record, Var(*self._args(record), dense=dense))
+        data = self._data(var, record)
+        self.vars.extend(data)
+        var._dense = record['dense']
+        if 'domain' in record:
+            domains = [record['domain']] * len(data)
+        else:
+            domains = record['domains']
+        if 'lb' in record:
+            lb, ub = self._bounds(record, {})
+        else:
+            # the bounds are restored with the expressions
+            lb = ub = [None] * len(data)
+        for vardata, domain, val, _lb, _ub, fixed, stale in zip(
+                data, domains, self._numbers(record['value']), lb, ub,
+                self.arrays[record['fixed']].tolist(),
+                self.arrays[record['stale']].tolist()):
+            vardata._domain = domain
+            vardata._value = val
+            vardata._lb = _lb
+            vardata._ub = _ub
+            vardata.fixed = fixed
+            vardata.stale = stale
+        return var
+
+    def _create_block(self, record):
+        blk = self._add(record, Block(*self._args(record)))
+        # Indexed blocks are populated on first access
+        self._data(blk, record)
+        return blk
+
+    def _create_constraint(self, record):
+        return self._add(record, Constraint(*self._args(record)))
+
+    def _create_objective(self, record):
+        return self._add(record, Objective(*self._args(record)))
+
+    def _create_expression(self, record):
+        return self._add(record, Expression(*self._args(record)))
+
+    def _create_suffix(self, record):
+        return self._add(record, Suffix(direction=record['direction'],
+                                        datatype=record['datatype']))
+
+    def _restore_objective(self, comp, record, deferred):
+        for idx, expr, sense in zip(self._keys(record),
+                                    self._bodies(record, deferred),
+                                    self.arrays[record['sense']].tolist()):
+            if idx is None:
+                comp.set_value(expr)
+                comp.set_sense(sense)
+            else:
+                comp[idx] = expr
+                comp[idx].set_sense(sense)
+
+    def _restore_constraint(self, comp, record, deferred):
+        lb, ub = self._bounds(record, deferred)
+        equality = self.arrays[record['equality']].tolist()
+        for i, (idx, body) in enumerate(
+                zip(self._keys(record), self._bodies(record, deferred))):
+            if equality[i]:
+                expr = (body, lb[i])
+            else:
+                expr = (lb[i], body, ub[i])
+            if idx is None:
+                comp.set_value(expr)
+            else:
+                comp[idx] = expr
+
+
+def save_instance(instance, filename):
+    """
+    Write a binary snapshot of a constructed model instance.
+
+    The snapshot records the sets, parameters, variables (values,
+    bounds, domains, fixed and stale flags), constraints, objectives,
+    named expressions and suffixes of the model and its sub-blocks.
+    Construction rules and other Python attributes are not saved.
+
+    Args:
+        instance: The model (a constructed Block).
+        filename (str): The name of the snapshot file.
+    """
+    if not numpy_available:
+        raise ImportError(
+            "Instance snapshots require the numpy package")
+    if not instance.is_constructed():
+        raise ValueError(
+            "Cannot save a snapshot of the model '%s': the model has not "
+            "been constructed" % (instance.name,))
+    _SnapshotWriter(instance).write(filename)
+
+
+def load_instance(filename):
+    """
+    Load a model instance from a binary snapshot.
+
+    The numeric arrays in the snapshot are converted to Python
+    objects as the components are rebuilt.  The returned model does
+    not keep any memory-mapped state, so models loaded by different
+    processes do not share memory.
+
+    Args:
+        filename (str): The name of a file created by save_instance().
+
+    Returns:
+        A ConcreteModel.  Sets that were defined with rules, ranges or
+        set operations are restored as explicit (concrete) sets.
+    """
+    if not numpy_available:
+        raise ImportError(
+            "Instance snapshots require the numpy package")
+    with open(filename, 'rb') as INPUT:
+        header = INPUT.read(_HEADER.size)
+        if len(header) != _HEADER.size or header[:len(_MAGIC)] != _MAGIC:
+            raise ValueError(
+                "The file '%s' is not a Pyomo instance snapshot"
+                % (filename,))
+        _, version, _, offset, length = _HEADER.unpack(header)
+        if version != _VERSION:
+            raise ValueError(
+                "Unsupported snapshot format version %s in file '%s' "
+                "(expected version %s)" % (version, filename, _VERSION))
+        INPUT.seek(offset)
+        skeleton = pickle.loads(INPUT.read(length))
+        buf = mmap.mmap(INPUT.fileno(), 0, access=mmap.ACCESS_READ)
+    arrays = []
+    for pos, dtype, shape in skeleton['arrays']:
+        dtype = numpy.dtype(dtype)
+        count = 1
+        for dim in shape:
+            count *= dim
+        if count:
+            arr = numpy.frombuffer(buf, dtype=dtype, count=count,
+                                   offset=pos)
+        else:
+            arr = numpy.empty(0, dtype=dtype)
+        arrays.append(arr.reshape(shape))
+    return _SnapshotReader(skeleton, arrays).read()
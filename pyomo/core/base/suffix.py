@@ -9,6 +9,7 @@
 #  ___________________________________________________________________________
 
 __all__ = ('Suffix',
+           'DenseSuffix',
            'active_export_suffix_generator',
            'active_import_suffix_generator')
 
@@ -17,12 +18,21 @@ import pprint
 
 from pyomo.util.timing import ConstructionTimer
 from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.core.kernel.numvalue import native_integer_types
 from pyomo.core.base.plugin import register_component
 from pyomo.core.base.component import ActiveComponent
 
 from six import iteritems, itervalues
 from pyomo.util.deprecation import deprecated
 
+try:
+    import numpy
+    numpy_available = True
+    _array_float_types = set([float, numpy.float64, numpy.float32])
+except ImportError:                               #pragma:nocover
+    numpy_available = False
+    _array_float_types = set([float])
+
 logger = logging.getLogger('pyomo.core')
 
 # A list of convenient suffix generators, including:
@@ -453,3 +463,267 @@ class Suffix(ComponentMap, ActiveComponent):
 
 
 register_component(Suffix, "Declare a container for extraneous model data")
+
+
+class DenseSuffix(Suffix):
+    """A model suffix that stores its values in a NumPy array
+
+    The array is aligned with the data of the components (by default,
+    all variables followed by all constraints) declared on the block
+    that owns the suffix, in declaration order; see
+    :py:meth:`component_order`.  The layout is built on first use.
+    Values for components that are not in the layout, and values that
+    cannot be stored in the array (anything other than floats, or
+    integers for INT suffixes), are stored in a ComponentMap, so the
+    suffix supports the full mapping API.
+
+    Constructor Arguments:
+        direction   The direction of information flow for this suffix.
+                        By default, this is LOCAL, indicating that no
+                        suffix data is exported or imported.
+        datatype    A variable type associated with all values of this
+                        suffix.
+        ctypes      The component types included in the array layout.
+                        Defaults to (Var, Constraint).
+    """
+
+    def __init__(self, **kwds):
+        if not numpy_available:
+            raise ImportError(
+                "DenseSuffix requires NumPy, which is not available")
+        self._layout_ctypes = kwds.pop('ctypes', None)
+        # The components in the array layout (in array order), a map
+        # from id(component) to position, and the array of values (NaN
+        # for components without a value)
+        self._order = None
+        self._pos = None
+        self._values = None
+        Suffix.__init__(self, **kwds)
+
+    def __getstate__(self):
+        state = super(DenseSuffix, self).__getstate__()
+        # object ids change after deepcopy/pickle; the position map is
+        # rebuilt from the component order
+        state['_pos'] = None
+        return state
+
+    def __setstate__(self, state):
+        Suffix.__setstate__(self, state)
+        if self._order is not None:
+            self._pos = dict((id(obj), i) for i, obj in enumerate(self._order))
+
+    def _layout(self):
+        """Build the array layout (if necessary) and return the
+        position map"""
+        if self._pos is not None:
+            return self._pos
+        block = self.parent_block()
+        if block is None:
+            return {}
+        ctypes = self._layout_ctypes
+        if ctypes is None:
+            from pyomo.core.base.var import Var
+            from pyomo.core.base.constraint import Constraint
+            ctypes = (Var, Constraint)
+        elif not isinstance(ctypes, (tuple, list)):
+            ctypes = (ctypes,)
+        order = []
+        for ctype in ctypes:
+            for comp in block.component_objects(ctype, descend_into=True):
+                if not comp.is_indexed():
+                    # (see Block._component_data_iter)
+                    if len(comp) or not hasattr(comp, '_data'):
+                        order.append(comp)
+                elif getattr(comp, '_dense', True):
+                    order.extend(comp.itervalues())
+                else:
+                    # Only include the data that sparse components
+                    # (e.g., Constraint(dense=False)) have constructed
+                    order.extend(itervalues(comp._data))
+        self._order = order
+        self._pos = pos = dict((id(obj), i) for i, obj in enumerate(order))
+        self._values = numpy.empty(len(order), dtype=numpy.float64)
+        self._values.fill(numpy.nan)
+        # Move values stored before the layout was built (or restored
+        # by deepcopy/pickle) into the array
+        if self._dict:
+            items = list(itervalues(self._dict))
+            for obj, val in items:
+                if id(obj) in pos and self._array_value(val):
+                    del self._dict[id(obj)]
+                    self._values[pos[id(obj)]] = val
+        return pos
+
+    def update_layout(self):
+        """Rebuild the array layout, e.g., to include components added
+        to the model after the layout was built"""
+        if self._pos is not None:
+            items = list(self.items())
+            self._order = self._pos = self._values = None
+            self._dict.clear()
+            ComponentMap.update(self, items)
+        self._layout()
+
+    def _array_value(self, val):
+        if self._datatype == Suffix.INT:
+            return val.__class__ in native_integer_types \
+                and val.__class__ is not bool
+        return val.__class__ in _array_float_types and val == val
+
+    def _convert(self, val):
+        if self._datatype == Suffix.INT:
+            return int(val)
+        return float(val)
+
+    def component_order(self):
+        """Return the list of components in array order"""
+        self._layout()
+        return self._order
+
+    def get_array(self):
+        """Return the array of values, aligned with component_order()
+        (NaN for components without a value).  Values stored outside
+        the array are not included."""
+        self._layout()
+        return self._values
+
+    def set_array(self, values):
+        """Set the values of all components in the layout from an
+        array aligned with component_order()"""
+        self._layout()
+        values = numpy.asarray(values, dtype=numpy.float64)
+        if values.shape != self._values.shape:
+            raise ValueError(
+                "Suffix '%s' expects an array of %d values (got shape %s)"
+                % (self.name, len(self._values), values.shape))
+        self._values[:] = values
+        if self._dict:
+            pos = self._pos
+            for key in [key for key in self._dict if key in pos]:
+                del self._dict[key]
+
+    def set_values(self, components, values):
+        """Set the suffix values for a sequence of components"""
+        pos = self._layout()
+        components = list(components)
+        values = list(values)
+        idx = [pos.get(id(obj), -1) for obj in components]
+        if -1 not in idx and \
+           all(self._array_value(val) for val in values):
+            self._values[idx] = values
+            if self._dict:
+                for obj in components:
+                    self._dict.pop(id(obj), None)
+        else:
+            for obj, val in zip(components, values):
+                self[obj] = val
+
+    def update_values(self, data, expand=True):
+        """
+        Updates the suffix data given a list of component,value
+        tuples.  When expand is False, the values are stored with a
+        single vectorized assignment.
+        """
+        if expand:
+            return super(DenseSuffix, self).update_values(data, expand)
+        try:
+            items = iteritems(data)
+        except AttributeError:
+            items = data
+        components = []
+        values = []
+        for obj, val in items:
+            components.append(obj)
+            values.append(val)
+        self.set_values(components, values)
+
+    def _pprint(self):
+        return (
+            [('Direction', self.SuffixDirectionToStr[self._direction]),
+             ('Datatype', self.SuffixDatatypeToStr[self._datatype]),
+             ],
+            ((str(k), v) for k, v in self.items()),
+            ("Value",),
+            lambda k, v: [v]
+        )
+
+    #
+    # Mapping API
+    #
+
+    def __getitem__(self, obj):
+        i = self._layout().get(id(obj), None)
+        if i is not None:
+            val = self._values[i]
+            if val == val:
+                return self._convert(val)
+        return ComponentMap.__getitem__(self, obj)
+
+    def __setitem__(self, obj, val):
+        i = self._layout().get(id(obj), None)
+        if i is not None:
+            if self._array_value(val):
+                self._values[i] = val
+                if self._dict:
+                    self._dict.pop(id(obj), None)
+                return
+            self._values[i] = numpy.nan
+        ComponentMap.__setitem__(self, obj, val)
+
+    def __delitem__(self, obj):
+        i = self._layout().get(id(obj), None)
+        if i is not None and self._values[i] == self._values[i]:
+            self._values[i] = numpy.nan
+            return
+        ComponentMap.__delitem__(self, obj)
+
+    def __contains__(self, obj):
+        i = self._layout().get(id(obj), None)
+        if i is not None and self._values[i] == self._values[i]:
+            return True
+        return id(obj) in self._dict
+
+    def __iter__(self):
+        if self._pos is not None:
+            order = self._order
+            for i in numpy.flatnonzero(~numpy.isnan(self._values)):
+                yield order[i]
+        for obj, val in itervalues(self._dict):
+            yield obj
+
+    def __len__(self):
+        n = len(self._dict)
+        if self._pos is not None:
+            n += int(numpy.count_nonzero(~numpy.isnan(self._values)))
+        return n
+
+    def items(self):
+        ans = []
+        if self._pos is not None:
+            order = self._order
+            values = self._values
+            convert = self._convert
+            for i in numpy.flatnonzero(~numpy.isnan(values)):
+                ans.append((order[i], convert(values[i])))
+        ans.extend(itervalues(self._dict))
+        return ans
+
+    def iteritems(self):
+        return iter(self.items())
+
+    def clear(self):
+        'D.clear() -> None.  Remove all items from D.'
+        if self._values is not None:
+            self._values.fill(numpy.nan)
+        self._dict.clear()
+
+    def get(self, key, default=None):
+        'D.get(k[,d]) -> D[k] if k in D, else d.  d defaults to None.'
+        if key in self:
+            return self[key]
+        return default
+
+
+register_component(
+    DenseSuffix,
+    "Declare a container for extraneous model data stored in an array")
@@ -22,12 +22,21 @@ from pyomo.core.base.indexed_component import IndexedComponent, UnindexedCompone
 from pyomo.core.base.misc import apply_indexed_rule
 from pyomo.core.base.sets import Set
 from pyomo.core.base.util import is_functor
+from pyomo.core.base import change_tracker
 
 from six import iteritems, itervalues
 from six.moves import xrange
 
 logger = logging.getLogger('pyomo.core')
 
+#
+# Stale flags are tracked with epochs: Var.flag_as_stale() records a
+# new epoch on the component, and a variable is stale unless it was
+# marked as not stale during (or after) that epoch.  This makes
+# flagging all variables in a component as stale O(1).
+#
+_stale_epoch = 0
+
 class _VarData(ComponentData, NumericValue):
     """
     This class defines the data for a single variable.
@@ -283,7 +292,7 @@ class _GeneralVarData(_VarData):
     these attributes in certain cases.
     """
 
-    __slots__ = ('_value', '_lb', '_ub', '_domain', 'fixed', 'stale')
+    __slots__ = ('_value', '_lb', '_ub', '_domain', '_fixed', '_fresh_epoch')
 
     def __init__(self, domain=Reals, component=None):
         #
@@ -303,8 +312,10 @@ class _GeneralVarData(_VarData):
         self._lb = None
         self._ub = None
         self._domain = None
-        self.fixed = False
-        self.stale = True
+        self._fixed = False
+        # The epoch in which this variable was last marked as not
+        # stale (-1 if it is stale)
+        self._fresh_epoch = -1
         # don't call the property setter here because
         # the SimplVar constructor will fail
         if hasattr(domain, 'bounds'):
@@ -320,6 +331,11 @@ class _GeneralVarData(_VarData):
         state = super(_GeneralVarData, self).__getstate__()
         for i in _GeneralVarData.__slots__:
             state[i] = getattr(self, i)
+        # Epochs are only meaningful in this process: store the
+        # stale flag instead (it is restored through the property)
+        del state['_fresh_epoch']
+        state.pop('_stale_epoch', None)
+        state['stale'] = self.stale
         return state
 
     # Note: None of the slots on this class need to be edited, so we
@@ -339,6 +355,8 @@ class _GeneralVarData(_VarData):
     @value.setter
     def value(self, val):
         """Set the value for this variable."""
+        if change_tracker._trackers and self._fixed and val != self._value:
+            change_tracker.record_change(self)
         self._value = val
 
     @property
@@ -350,6 +368,8 @@ class _GeneralVarData(_VarData):
         """Set the domain for this variable."""
         if hasattr(domain, 'bounds'):
             self._domain = domain
+            if change_tracker._trackers:
+                change_tracker.record_change(self)
         else:
             raise ValueError(
                 "%s is not a valid domain. Variable domains must be an "
@@ -383,9 +403,37 @@ class _GeneralVarData(_VarData):
     def ub(self, val):
         raise AttributeError("Assignment not allowed. Use the setub method")
 
-    # fixed is an attribute
+    def is_fixed(self):
+        """Returns True if this variable is fixed, otherwise returns False."""
+        return self._fixed
 
-    # stale is an attribute
+    @property
+    def fixed(self):
+        """Return the fixed indicator for this variable."""
+        return self._fixed
+    @fixed.setter
+    def fixed(self, val):
+        """Set the fixed indicator for this variable."""
+        self._fixed = val
+        if change_tracker._trackers:
+            change_tracker.record_change(self)
+
+    @property
+    def stale(self):
+        """Return the stale indicator for this variable."""
+        comp = self._component
+        if comp is not None:
+            comp = comp()
+        if comp is None:
+            return self._fresh_epoch < 0
+        return self._fresh_epoch < comp._stale_epoch
+    @stale.setter
+    def stale(self, val):
+        """Set the stale indicator for this variable."""
+        if val:
+            self._fresh_epoch = -1
+        else:
+            self._fresh_epoch = _stale_epoch
 
     def setlb(self, val):
         """
@@ -395,6 +443,8 @@ class _GeneralVarData(_VarData):
         # Note: is_fixed(None) returns True
         if is_fixed(val):
             self._lb = val
+            if change_tracker._trackers:
+                change_tracker.record_change(self)
         else:
             raise ValueError(
                 "Non-fixed input of type '%s' supplied as variable lower "
@@ -409,6 +459,8 @@ class _GeneralVarData(_VarData):
         # Note: is_fixed(None) returns True
         if is_fixed(val):
             self._ub = val
+            if change_tracker._trackers:
+                change_tracker.record_change(self)
         else:
             raise ValueError(
                 "Non-fixed input of type '%s' supplied as variable upper "
@@ -454,6 +506,9 @@ class Var(IndexedComponent):
 
     _ComponentDataClass = _GeneralVarData
 
+    # The epoch in which flag_as_stale() was last called
+    _stale_epoch = 0
+
     def __new__(cls, *args, **kwds):
         if cls != Var:
             return super(Var, cls).__new__(cls)
@@ -512,9 +567,19 @@ class Var(IndexedComponent):
     def flag_as_stale(self):
         """
         Set the 'stale' attribute of every variable data object to True.
+
+        This starts a new stale epoch for this component, so it does
+        not visit the variable data objects.
         """
-        for var_data in itervalues(self._data):
-            var_data.stale = True
+        global _stale_epoch
+        _stale_epoch += 1
+        self._stale_epoch = _stale_epoch
+
+    def __getstate__(self):
+        state = super(Var, self).__getstate__()
+        # See _GeneralVarData.__getstate__
+        state.pop('_stale_epoch', None)
+        return state
 
     def get_values(self, include_fixed_values=True):
         """
@@ -10,7 +10,10 @@
 
 __all__ = ['TableData']
 
-from six.moves import xrange
+from itertools import islice
+
+from six import string_types
+from six.moves import xrange, zip
 
 from pyomo.util.plugin import Plugin, implements
 from pyutilib.misc import Options
@@ -19,7 +22,88 @@ from pyomo.core.base import value
 from pyomo.core.base.plugin import IDataManager
 from pyomo.core.base.sets import Set
 from pyomo.core.base.param import Param
-from pyomo.core.data.process_data import _process_data
+from pyomo.core.data.process_data import _process_data, _process_token, \
+    numlist
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:                               #pragma:nocover
+    numpy_available = False
+
+
+class _UnsupportedColumnData(Exception):
+    """
+    Raised when a table cannot be converted column-by-column, because
+    _process_data() would interpret some of its cells.
+    """
+    pass
+
+# Cells that _process_data() does not treat as plain values
+_special_cells = frozenset([',', '(', ')', '{', '}', '[', ']', ':', ':=',
+                            '(tr)', '*', 'default'])
+
+_string_types = frozenset([str, type(u'')])
+
+def _process_cell(cell):
+    if cell in _special_cells:
+        raise _UnsupportedColumnData()
+    val = _process_token(cell)
+    if type(val) is tuple:
+        raise _UnsupportedColumnData()
+    return val
+
+def _process_column(cells):
+    """
+    Convert the cells of a column as _process_data() does.  Returns the
+    list of values, and True if all the values are numbers.
+    """
+    types = set(map(type, cells))
+    if not types.issubset(_string_types):
+        # Cells from a database cursor are typically numbers already
+        if types.issubset(numlist):
+            return list(cells), True
+        return [_process_cell(cell) for cell in cells], False
+    if numpy_available:
+        cells = numpy.array(cells)
+        try:
+            return cells.astype(numpy.int64).tolist(), True
+        except (ValueError, OverflowError):
+            pass
+        try:
+            floats = cells.astype(numpy.float64)
+        except ValueError:
+            floats = None
+        if floats is not None:
+            values = floats.tolist()
+            # Integral cells are converted individually, since
+            # _process_token() returns an int for cells like '2'
+            for i in numpy.flatnonzero(floats == numpy.floor(floats)):
+                values[i] = _process_cell(str(cells[i]))
+            return values, True
+        cells = cells.tolist()
+    # Columns of words usually repeat a few values (e.g. set elements),
+    # so each distinct cell is converted once.  NaN values are not
+    # shared, since NaN keys only match the same object.
+    values = {}
+    nan = False
+    for cell in set(cells):
+        val = _process_cell(cell)
+        if val != val:
+            nan = True
+        else:
+            values[cell] = val
+    if nan:
+        return [values[cell] if cell in values else float(cell)
+                for cell in cells], False
+    return [values[cell] for cell in cells], False
+
+def _chunks(rows, size):
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
 
 
 class TableData(Plugin):
@@ -30,11 +114,17 @@ class TableData(Plugin):
 
     implements(IDataManager, service=False)
 
+    # The number of rows that _read_rows() converts at a time
+    chunksize = 10000
+    # If False, _read_rows() always converts tables to data commands
+    columnar = True
+
     def __init__(self):
         """
         Constructor
         """
         self._info=None
+        self._columns=None
         self._data=None
         self.options = Options()
         self.options.ncolumns = 1
@@ -96,6 +186,16 @@ class TableData(Plugin):
             model = self.options.model
         if not self.options.namespace in data:
             data[self.options.namespace] = {}
+        if self._columns is not None:
+            _data = data[self.options.namespace]
+            for name, values in self._columns:
+                if type(values) is list:
+                    _data[name] = {None: values}
+                elif name in _data:
+                    _data[name].update(values)
+                else:
+                    _data[name] = values
+            return True
         return _process_data(
           self._info,
           model,
@@ -112,8 +212,143 @@ class TableData(Plugin):
         Clear the data that was extracted from this table
         """
         self._info = None
+        self._columns = None
+
+    def _read_rows(self, open_rows, empty_msg, scalar=True):
+        """
+        Set the table data from the rows returned by open_rows(), which
+        returns a new iterator over the non-empty rows of the table
+        (including the header row).  If scalar is True, a table without
+        rows after the header row is read as a single value.
+
+        Tables in the 'set' and 'table' formats are converted in
+        chunks of rows, one column at a time, and their set and
+        parameter values are stored in self._columns.  The other
+        formats, and tables containing cells that _process_data()
+        interprets, are read again and converted to data commands.
+        """
+        rows = open_rows()
+        try:
+            try:
+                headers = next(rows)
+            except StopIteration:
+                raise IOError(empty_msg)
+            chunk = list(islice(rows, self.chunksize))
+            if len(chunk) == 0 and scalar:
+                self._set_value(headers[0])
+                return
+            header_index = self._set_options(headers)
+            if self.columnar and self._is_columnar():
+                try:
+                    self._set_columns(headers, header_index, chunk,
+                                      _chunks(rows, self.chunksize))
+                    return
+                except _UnsupportedColumnData:
+                    self._columns = None
+                    rows.close()
+                    rows = open_rows()
+                    next(rows)
+                    chunk = []
+            chunk.extend(rows)
+            self._set_rows(headers, header_index, chunk)
+        finally:
+            rows.close()
+
+    def _set_value(self, value):
+        """
+        Set the data for a table with a single value.
+        """
+        if not self.options.param is None:
+            if type(self.options.param) in (list, tuple):
+                p = self.options.param[0]
+            else:
+                p = self.options.param
+            if isinstance(p, Param):
+                self.options.model = p.model()
+                p = p.local_name
+            self._info = ["param",p,":=",value]
+        elif len(self.options.symbol_map) == 1:
+            self._info = ["param",self.options.symbol_map[self.options.symbol_map.keys()[0]],":=",value]
+        else:
+            raise IOError("Data looks like a parameter, but multiple parameter names have been specified: %s" % str(self.options.symbol_map))
+
+    def _is_columnar(self):
+        """
+        Returns True if the table data can be stored with
+        _set_columns().
+        """
+        if self.options.format == 'set':
+            return self.options.index is None
+        if self.options.format == 'table':
+            return self.options.index is None or \
+                isinstance(self.options.index, string_types)
+        return False
+
+    def _set_columns(self, headers, header_index, chunk, chunks):
+        """
+        Convert the first chunk of rows, and then the remaining chunks,
+        in the 'set' or 'table' format.  The set and parameter values
+        are stored in self._columns.
+        """
+        ncolumns = set([len(headers)])
+        if self.options.format == 'set':
+            name = _process_token(self.options.set)
+            values = []
+            self._columns = [(name, values)]
+            while chunk:
+                if set(map(len, chunk)) != ncolumns:
+                    raise _UnsupportedColumnData()
+                columns = [_process_column(c)[0] for c in zip(*chunk)]
+                if len(columns) > 1:
+                    values.extend(zip(*columns))
+                else:
+                    values.extend(columns[0])
+                chunk = next(chunks, None)
+            return
+
+        self.options.ncolumns = len(header_index)
+        nkeys = len(header_index) - len(self.options.param)
+        if nkeys < 1:
+            raise _UnsupportedColumnData()
+        if self.options.index is not None:
+            keys = []
+            self._columns = [(_process_token(self.options.index), keys)]
+        else:
+            keys = None
+            self._columns = []
+        params = []
+        for p in self.options.param:
+            params.append({})
+            self._columns.append((_process_token(p), params[-1]))
+        while chunk:
+            if set(map(len, chunk)) != ncolumns:
+                raise _UnsupportedColumnData()
+            columns = list(zip(*chunk))
+            columns = [columns[i] for i in header_index]
+            index = [_process_column(c)[0] for c in columns[:nkeys]]
+            if nkeys > 1:
+                index = list(zip(*index))
+            else:
+                index = index[0]
+            if keys is not None:
+                keys.extend(index)
+            for param, column in zip(params, columns[nkeys:]):
+                column, numeric = _process_column(column)
+                if numeric:
+                    param.update(zip(index, column))
+                else:
+                    param.update((k, v) for k, v in zip(index, column)
+                                 if v != '.')
+            chunk = next(chunks, None)
 
     def _set_data(self, headers, rows):
+        self._set_rows(headers, self._set_options(headers), rows)
+
+    def _set_options(self, headers):
+        """
+        Normalize the options for a table with the given headers, and
+        return the indices of the selected columns.
+        """
         header_index = []
         if self.options.select is None:
             for i in xrange(len(headers)):
@@ -163,7 +398,9 @@ class TableData(Plugin):
         elif self.options.set is None and self.options.param is None:
             msg = "Must specify the set or parameter option for data"
             raise IOError(msg)
+        return header_index
 
+    def _set_rows(self, headers, header_index, rows):
         if self.options.format == 'set':
             if not self.options.index is None:
                 msg = "Cannot specify index for data with the 'set' format: %s"
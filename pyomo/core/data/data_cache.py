@@ -0,0 +1,261 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['DataCache']
+
+import os
+import hashlib
+import logging
+import mmap
+import pickle
+import tempfile
+
+from six import iteritems
+
+logger = logging.getLogger('pyomo.core')
+
+_CACHE_VERSION = 1
+_PROTOCOL = pickle.HIGHEST_PROTOCOL
+_SUFFIX = '.data.pickle'
+
+# Option values that can be used in a cache key
+_key_types = (type(None), bool, int, float, str, type(u''))
+
+
+def _source_name(filename):
+    if filename and filename[0] in ('"', "'"):
+        filename = filename[1:-1]
+    return filename
+
+
+def _option_key(value):
+    """
+    Return a value that represents a load option in a cache key, or
+    raise ValueError if the option cannot be used in a key.
+    """
+    if type(value) in _key_types:
+        return value
+    if type(value) in (list, tuple):
+        return tuple(_option_key(v) for v in value)
+    try:
+        # Components are represented by their names
+        return ('component', value.local_name)
+    except AttributeError:
+        raise ValueError(value)
+
+
+def _model_key(model):
+    """
+    Return the names and dimensions of the sets and parameters in a
+    model, which are used to interpret the data in a file.
+    """
+    if model is None:
+        return None
+    from pyomo.core.base.sets import Set
+    from pyomo.core.base.param import Param
+    ans = []
+    for comp in model.component_objects((Set, Param)):
+        ans.append((comp.name, comp.type().__name__, comp.dim(),
+                    repr(getattr(comp, 'dimen', None))))
+    return tuple(sorted(ans))
+
+
+class DataCache(object):
+    """
+    An on-disk cache of the data that a DataPortal object loads from
+    files.
+
+    Cache entries are keyed by the contents of the file, the load
+    options and the sets and parameters declared in the model, and
+    they hold the processed set and parameter data.  Files that are
+    read through include and load commands are recorded in an entry,
+    and the entry is ignored if any of them has changed.  When the
+    cache grows larger than size_limit bytes, the least recently used
+    entries are removed.
+
+    Args:
+        directory (str): The cache directory.
+        size_limit (int): The maximum size of the cache in bytes.
+            Default is 1 GB.
+    """
+
+    def __init__(self, directory, size_limit=1 << 30):
+        self.directory = directory
+        self.size_limit = size_limit
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        # Digests of files, keyed by the file name, modification time
+        # and size
+        self._digests = {}
+
+    def stats(self):
+        """
+        Returns:
+            A dictionary with the number of cache hits, misses, writes
+            and evictions, and the number and total size of the cache
+            entries.
+        """
+        entries = self._entries()
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'evictions': self.evictions,
+                'entries': len(entries),
+                'size': sum(e[1] for e in entries)}
+
+    def clear(self):
+        """
+        Remove all cache entries.
+        """
+        for fname, size, mtime in self._entries():
+            self._remove(fname)
+
+    def key(self, filename, options, model):
+        """
+        Returns:
+            The cache key for data that is loaded from a file with the
+            given options and model, or :const:`None` if the data
+            cannot be cached.
+        """
+        filename = _source_name(filename)
+        if not filename or not os.path.isfile(filename):
+            return None
+        try:
+            opts = tuple(sorted((k, _option_key(v))
+                                for k, v in iteritems(options)
+                                if k != 'model' and v is not None))
+        except ValueError:
+            return None
+        key = repr((_CACHE_VERSION, self._digest(filename), opts,
+                    _model_key(model)))
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Returns:
+            A tuple (data, default) with the data that is cached for
+            the given key, or :const:`None`.
+        """
+        cachefile = os.path.join(self.directory, key + _SUFFIX)
+        try:
+            with open(cachefile, 'rb') as f:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    header = pickle.load(buf)
+                    if header[0] != _CACHE_VERSION or \
+                       any(self._digest(fname) != digest
+                           for fname, digest in header[1]):
+                        ans = None
+                    else:
+                        ans = pickle.load(buf)
+                finally:
+                    buf.close()
+        except Exception:
+            ans = None
+        if ans is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        try:
+            # The modification time orders the entries for eviction
+            os.utime(cachefile, None)
+        except OSError:                         #pragma:nocover
+            pass
+        return ans
+
+    def put(self, key, sources, data, default):
+        """
+        Store the data and default values for the given key.  The data
+        is not cached if sources, the files that were read through
+        include and load commands, are not all local files.
+        """
+        header = [_CACHE_VERSION, []]
+        for fname in sources:
+            fname = _source_name(fname)
+            if not os.path.isfile(fname):
+                return
+            header[1].append((fname, self._digest(fname)))
+        cachefile = os.path.join(self.directory, key + _SUFFIX)
+        tmpname = None
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            fd, tmpname = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(tuple(header), f, _PROTOCOL)
+                pickle.dump((data, default), f, _PROTOCOL)
+            if hasattr(os, 'replace'):
+                os.replace(tmpname, cachefile)
+            else:                                   #pragma:nocover
+                if os.path.exists(cachefile):
+                    os.remove(cachefile)
+                os.rename(tmpname, cachefile)
+        except (IOError, OSError, pickle.PicklingError):
+            logger.debug("Unable to cache data in %s", self.directory)
+            if tmpname is not None and os.path.exists(tmpname):
+                os.remove(tmpname)
+            return
+        self.writes += 1
+        self._evict()
+
+    def _digest(self, filename):
+        stat = os.stat(filename)
+        key = (os.path.abspath(filename), stat.st_mtime, stat.st_size)
+        digest = self._digests.get(key, None)
+        if digest is None:
+            sha = hashlib.sha1()
+            with open(filename, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    sha.update(block)
+            digest = self._digests[key] = sha.hexdigest()
+        return digest
+
+    def _entries(self):
+        """
+        Returns:
+            A list of tuples (filename, size, mtime) for the cache
+            entries.
+        """
+        ans = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return ans
+        for name in names:
+            if not name.endswith(_SUFFIX):
+                continue
+            fname = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(fname)
+            except OSError:                     #pragma:nocover
+                continue
+            ans.append((fname, stat.st_size, stat.st_mtime))
+        return ans
+
+    def _evict(self):
+        entries = self._entries()
+        size = sum(e[1] for e in entries)
+        if size <= self.size_limit:
+            return
+        for fname, fsize, mtime in sorted(entries, key=lambda e: e[2]):
+            if size <= self.size_limit:
+                break
+            if self._remove(fname):
+                size -= fsize
+                self.evictions += 1
+
+    def _remove(self, fname):
+        try:
+            os.remove(fname)
+            return True
+        except OSError:                         #pragma:nocover
+            return False
@@ -13,14 +13,16 @@ __all__ = ['parse_data_commands']
 import sys
 import os
 import os.path
+import re
+import threading
 import ply.lex as lex
 import ply.yacc as yacc
 from inspect import getfile, currentframe
+from six import string_types
 from six.moves import xrange
 
 from pyutilib.misc import flatten_list
 from pyutilib.ply import t_newline, t_ignore, _find_column, p_error, ply_init
-        
 
 ## -----------------------------------------------------------
 ##
@@ -414,6 +416,295 @@ def p_items(p):
         p[0] = tmp_lst
 
 
+## -----------------------------------------------------------
+##
+## Hand-written scanner for data commands
+##
+## -----------------------------------------------------------
+#
+# The PLY lexer and parser create a token object and a production for
+# every data value, which dominates the time needed to load large .dat
+# files.  The scanner below produces the same statements as the grammar
+# above: it matches the same token regular expressions (in the order
+# that PLY tries them) and collects the data following a ':=' directly
+# into the statement.  Unquoted numbers in the data are converted to
+# int/float here, so _process_token() does not need to convert them
+# one at a time.
+#
+# The scanner only handles valid input.  Any text that the grammar does
+# not accept is re-parsed with PLY, which generates the error message.
+#
+
+class _ScanError(Exception):
+    pass
+
+def _rule(name, regex):
+    return '(?P<%s>%s)' % (name, regex)
+
+def _scanner_regex(state):
+    # PLY tries function rules in the order they are defined, then
+    # string rules from the longest regular expression to the shortest.
+    # Rules for the 'data' state are tried before the INITIAL rules.
+    rules = [_rule('WS', '[ \\t\\r\\n]+')]
+    if state == 'data':
+        rules.append(_rule('BRACKETEDSTRING',
+                           t_data_BRACKETEDSTRING.__doc__))
+    for func in (t_COMMENT, t_COLONEQ, t_SEMICOLON, t_WORDWITHLBRACKET,
+                 t_WORD, t_STRING, t_FLOAT_VAL, t_INT_VAL, t_QUOTEDSTRING):
+        rules.append(_rule(func.__name__[2:], func.__doc__))
+    strsym = [(name, value) for name, value in globals().items()
+              if name.startswith('t_') and name[2:] in tokens
+              and isinstance(value, str)]
+    strsym.sort(key=lambda x: -len(x[1]))
+    for name, value in strsym:
+        rules.append(_rule(name[2:], value))
+    return re.compile('|'.join(rules), re.VERBOSE)
+
+_initial_re = _scanner_regex('INITIAL')
+_data_re = _scanner_regex('data')
+
+# Data that only contains words, numbers, '(', ')', ',' and '*' is
+# split into tokens with a single regular expression.
+_simple_data_re = re.compile(r'[a-zA-Z0-9_\.+\-(),* \t\r\n]*;')
+_simple_token_re = re.compile(r'[a-zA-Z0-9_\.+\-]+|[(),*]')
+_number_start = frozenset('0123456789+-.')
+
+_item_tokens = frozenset([
+    'WORD', 'STRING', 'QUOTEDSTRING', 'COMMA', 'COLON', 'LBRACE',
+    'RBRACE', 'LBRACKET', 'RBRACKET', 'TR', 'LPAREN', 'RPAREN',
+    'ASTERISK', 'EQ', 'SET', 'TABLE', 'PARAM', 'INT_VAL', 'FLOAT_VAL'])
+_arg_tokens = frozenset([
+    'WORD', 'STRING', 'QUOTEDSTRING', 'SET', 'TABLE', 'PARAM',
+    'INT_VAL', 'FLOAT_VAL'])
+_data_tokens = frozenset([
+    'WORD', 'STRING', 'QUOTEDSTRING', 'BRACKETEDSTRING', 'SET', 'TABLE',
+    'PARAM', 'INT_VAL', 'FLOAT_VAL', 'LPAREN', 'RPAREN', 'COMMA',
+    'ASTERISK'])
+_data_reserved_error = frozenset(reserved) - \
+                       frozenset(['set', 'table', 'param'])
+
+def _strip_quotes(tmp):
+    if tmp[0] == '"' and tmp[-1] == '"' and len(tmp) > 2 and not ' ' in tmp:
+        return tmp[1:-1]
+    return tmp
+
+def _scan_header(data, pos):
+    """
+    Scan the tokens of a statement up to (and including) the ':=' or
+    ';' that ends its header.  Returns the (type, value) tokens and the
+    position following them.  A namespace declaration ('namespace NAME
+    {') or the '}' that closes it is returned on its own.
+    """
+    header = []
+    for m in _initial_re.finditer(data, pos):
+        if m.start() != pos:
+            raise _ScanError()
+        pos = m.end()
+        kind = m.lastgroup
+        if kind == 'WS' or kind == 'COMMENT':
+            continue
+        value = m.group(kind)
+        if value in reserved:
+            kind = reserved[value]
+        header.append((kind, value))
+        if kind == 'COLONEQ' or kind == 'SEMICOLON':
+            return header, pos
+        if header[0][0] == 'NAMESPACE':
+            if len(header) == 3:
+                return header, pos
+        elif header[0][0] == 'RBRACE':
+            return header, pos
+    if pos != len(data) or header:
+        raise _ScanError()
+    return header, pos
+
+def _number(value):
+    # Convert a word as _process_token() would, leaving True/False and
+    # other words for _process_token().
+    if value[0] in _number_start:
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                pass
+    return value
+
+def _scan_simple_data(data, pos):
+    m = _simple_data_re.match(data, pos)
+    if m is None:
+        return None, pos
+    end = m.end()
+    if data.find('(tr)', pos, end) >= 0:
+        # '(tr)' is a single token, which is not valid data
+        raise _ScanError()
+    values = _simple_token_re.findall(data, pos, end-1)
+    if _data_reserved_error.intersection(values):
+        raise _ScanError()
+    return [_number(value) for value in values], end
+
+def _scan_data(data, pos):
+    """
+    Scan the data following a ':=' up to (and including) the ';' that
+    ends the statement.  Returns the data values and the position
+    following the ';'.
+    """
+    values, pos = _scan_simple_data(data, pos)
+    if values is not None:
+        return values, pos
+    values = []
+    append = values.append
+    for m in _data_re.finditer(data, pos):
+        if m.start() != pos:
+            raise _ScanError()
+        pos = m.end()
+        kind = m.lastgroup
+        if kind == 'WS' or kind == 'COMMENT':
+            continue
+        value = m.group(kind)
+        if kind == 'WORD' or kind == 'STRING':
+            if value in _data_reserved_error:
+                raise _ScanError()
+            value = _number(value)
+        elif kind == 'QUOTEDSTRING':
+            value = _strip_quotes(value)
+        elif kind == 'SEMICOLON':
+            return values, pos
+        elif kind not in _data_tokens:
+            raise _ScanError()
+        append(value)
+    raise _ScanError()
+
+def _items(header, allowed=_item_tokens):
+    items = []
+    for kind, value in header:
+        if kind not in allowed:
+            raise _ScanError()
+        if kind == 'QUOTEDSTRING':
+            value = _strip_quotes(value)
+        items.append(value)
+    return items
+
+def _args(header):
+    # arg : arg COMMA value | value
+    args = _items(header[::2], _arg_tokens)
+    for kind, value in header[1::2]:
+        if kind != 'COMMA':
+            raise _ScanError()
+    if header and header[-1][0] == 'COMMA':
+        raise _ScanError()
+    return args
+
+def _statement(header, data, pos):
+    """
+    Convert the header of a statement (and the data that follows a
+    ':=') into the list generated by p_statement().
+    """
+    stmt = header[0][1]
+    kind = header[0][0]
+    if header[-1][0] == 'SEMICOLON':
+        body = header[1:-1]
+        if kind == 'DATA' or kind == 'END':
+            if body:
+                raise _ScanError()
+            return None, pos
+        if kind == 'LOAD' or kind == 'STORE':
+            if not body:
+                raise _ScanError()
+            return [stmt] + _items(body), pos
+        if kind == 'INCLUDE':
+            if len(body) != 1 or body[0][0] not in ('WORD', 'QUOTEDSTRING'):
+                raise _ScanError()
+            return [stmt, body[0][1]], pos
+        raise _ScanError()
+
+    body = header[1:-1]
+    if kind == 'SET':
+        if not body:
+            raise _ScanError()
+        if body[0][0] == 'WORDWITHLBRACKET':
+            if body[-1][0] != 'RBRACKET':
+                raise _ScanError()
+            prefix = ['set', body[0][1][:-1], '['] + _args(body[1:-1]) \
+                     + [']', ':=']
+        elif body[0][0] != 'WORD':
+            raise _ScanError()
+        elif len(body) == 1:
+            prefix = ['set', body[0][1], ':=']
+        elif body[1][0] == 'COLON':
+            prefix = ['set', body[0][1], ':'] + _items(body[2:]) + [':=']
+        else:
+            raise _ScanError()
+    elif kind == 'PARAM' or kind == 'TABLE':
+        if not body:
+            raise _ScanError()
+        prefix = _items(body)
+    else:
+        raise _ScanError()
+
+    values, pos = _scan_data(data, pos)
+    if kind == 'TABLE':
+        return ['table', prefix, values], pos
+    if kind == 'PARAM':
+        prefix = ['param'] + prefix + [':=']
+    prefix.extend(values)
+    return prefix, pos
+
+def _scan_data_commands(data):
+    """
+    Parse data commands with the hand-written scanner.  Returns the
+    same dictionary as the PLY parser, and raises _ScanError if the
+    data is not accepted by the grammar.
+    """
+    statements = []
+    # Each namespace that is open: the enclosing statement list, the
+    # namespace name, and the number of statements in the enclosing
+    # list (including statements that generate None).
+    stack = []
+    count = 0
+    pos = 0
+    while True:
+        header, pos = _scan_header(data, pos)
+        if not header:
+            break
+        kind = header[0][0]
+        if kind == 'NAMESPACE':
+            if header[1][0] != 'WORD' or header[2][0] != 'LBRACE':
+                raise _ScanError()
+            stack.append((statements, header[1][1], count))
+            statements = []
+            count = 0
+        elif kind == 'RBRACE':
+            if not stack or not count:
+                raise _ScanError()
+            inner = statements
+            statements, name, count = stack.pop()
+            statements.append({name: inner})
+            count += 1
+        else:
+            stmt, pos = _statement(header, data, pos)
+            if stmt is not None:
+                statements.append(stmt)
+            count += 1
+    if stack:
+        raise _ScanError()
+    #
+    # Collect the statements as p_expr() does
+    #
+    parse_info = {None: []}
+    for stmt in statements:
+        if type(stmt) is list:
+            parse_info[None].append(stmt)
+        else:
+            for key in stmt:
+                if key in parse_info:
+                    parse_info[key].append(stmt[key])
+                else:
+                    parse_info[key] = stmt[key]
+    return parse_info
+
+
 # --------------------------------------------------------------
 # the DAT file lexer and yaccer only need to be
 # created once, so have the corresponding objects
@@ -424,90 +715,144 @@ tabmodule = 'parse_table_datacmds'
 
 dat_lexer = None
 dat_yaccer = None
+_ply_lock = threading.RLock()
 
 #
-# The function that performs the parsing
+# Parsed data files can be cached in a DataCache (see
+# pyomo.core.data.data_cache), keyed by the contents of the file.  The
+# cache is disabled by default; set default_cache to a DataCache object
+# or the name of a cache directory to enable it.  Files smaller than
+# cache_min_size bytes are parsed without using the cache.
 #
-def parse_data_commands(data=None, filename=None, debug=0, outputdir=None):
+default_cache = None
+cache_min_size = 1 << 20
+
+# The load option that distinguishes parsed files from the data that
+# DataPortal stores in the same cache
+_CACHE_OPTIONS = {'parse_data_commands': 1}
+
+def _read_file(filename):
+    f = open(filename, 'r')
+    try:
+        data = f.read()
+    except Exception:
+        e = sys.exc_info()[1]
+        f.close()
+        del f
+        raise e
+    f.close()
+    del f
+    return data
+
+def _ply_parse(data, debug, outputdir):
 
     global debugging
     global dat_lexer
     global dat_yaccer
 
-    if outputdir is None:
-        # Try and write this into the module source...
-        outputdir = os.path.dirname(getfile( currentframe() ))
-        # Ideally, we would pollute a per-user configuration directory
-        # first -- something like ~/.pyomo.
-        if not os.access(outputdir, os.W_OK):
-            outputdir = os.getcwd()
-
-    # if the lexer/yaccer haven't been initialized, do so.
-    if dat_lexer is None:
-        #
-        # Always remove the parser.out file, which is generated to
-        # create debugging
-        #
-        if os.path.exists("parser.out"):        #pragma:nocover
-            os.remove("parser.out")
-        if debug > 0:                           #pragma:nocover
+    # The PLY lexer and parser are global, so they parse one file at a time
+    with _ply_lock:
+        if outputdir is None:
+            # Try and write this into the module source...
+            outputdir = os.path.dirname(getfile( currentframe() ))
+            # Ideally, we would pollute a per-user configuration directory
+            # first -- something like ~/.pyomo.
+            if not os.access(outputdir, os.W_OK):
+                outputdir = os.getcwd()
+
+        # if the lexer/yaccer haven't been initialized, do so.
+        if dat_lexer is None:
             #
-            # Remove the parsetab.py* files.  These apparently need to
-            # be removed to ensure the creation of a parser.out file.
+            # Always remove the parser.out file, which is generated to
+            # create debugging
             #
-            if os.path.exists(tabmodule+".py"):
-                os.remove(tabmodule+".py")
-            if os.path.exists(tabmodule+".pyc"):
-                os.remove(tabmodule+".pyc")
-            debugging=True
+            if os.path.exists("parser.out"):        #pragma:nocover
+                os.remove("parser.out")
+            if debug > 0:                           #pragma:nocover
+                #
+                # Remove the parsetab.py* files.  These apparently need to
+                # be removed to ensure the creation of a parser.out file.
+                #
+                if os.path.exists(tabmodule+".py"):
+                    os.remove(tabmodule+".py")
+                if os.path.exists(tabmodule+".pyc"):
+                    os.remove(tabmodule+".pyc")
+                debugging=True
+
+            dat_lexer = lex.lex()
+            #
+            tmpsyspath = sys.path
+            sys.path.append(outputdir)
+            dat_yaccer = yacc.yacc(debug=debug, 
+                                        tabmodule=tabmodule, 
+                                        outputdir=outputdir,
+                                        optimize=True)
+            sys.path = tmpsyspath
 
-        dat_lexer = lex.lex()
         #
-        tmpsyspath = sys.path
-        sys.path.append(outputdir)
-        dat_yaccer = yacc.yacc(debug=debug, 
-                                    tabmodule=tabmodule, 
-                                    outputdir=outputdir,
-                                    optimize=True)
-        sys.path = tmpsyspath
-
-    #
-    # Initialize parse object
-    #
-    global _parse_info
-    _parse_info = {}
-    _parse_info[None] = []
+        # Initialize parse object
+        #
+        global _parse_info
+        _parse_info = {}
+        _parse_info[None] = []
 
-    #
-    # Parse the file
-    #
-    global _parsedata
-    if not data is None:
-        _parsedata=data
-        ply_init(_parsedata)
-        dat_yaccer.parse(data, lexer=dat_lexer, debug=debug)
-    elif not filename is None:
-        f = open(filename, 'r')
-        try:
-            data = f.read()
-        except Exception:
-            e = sys.exc_info()[1]
-            f.close()
-            del f
-            raise e
-        f.close()
-        del f
+        #
+        # Parse the data
+        #
+        global _parsedata
         _parsedata=data
         ply_init(_parsedata)
+        dat_lexer.begin('INITIAL')
         dat_yaccer.parse(data, lexer=dat_lexer, debug=debug)
-    else:
-        _parse_info = None
-    #
-    # Disable parsing I/O
-    #
-    debugging=False
-    #print(_parse_info)
-    return _parse_info
+        #
+        # Disable parsing I/O
+        #
+        debugging=False
+        return _parse_info
+
+def _parse(data, debug, outputdir):
+    if debug > 0:                               #pragma:nocover
+        return _ply_parse(data, debug, outputdir)
+    try:
+        return _scan_data_commands(data)
+    except _ScanError:
+        # The PLY parser reports the syntax error
+        return _ply_parse(data, debug, outputdir)
+
+#
+# The function that performs the parsing
+#
+def parse_data_commands(data=None, filename=None, debug=0, outputdir=None,
+                        cache=None):
+    """
+    Parse data commands from a string or a file.  When a filename is
+    specified, the parsed commands are stored in cache (a DataCache
+    object or the name of a cache directory), or in default_cache if
+    the cache argument is None.
+    """
+    if data is not None:
+        return _parse(data, debug, outputdir)
+    if filename is None:
+        return None
+
+    if cache is None:
+        cache = default_cache
+    if cache is None or debug > 0 or \
+       os.path.getsize(filename) < cache_min_size:
+        return _parse(_read_file(filename), debug, outputdir)
+
+    if isinstance(cache, string_types):
+        from pyomo.core.data.data_cache import DataCache
+        cache = DataCache(cache)
+    key = cache.key(filename, _CACHE_OPTIONS, None)
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached[0]
+    parse_info = _parse(_read_file(filename), debug, outputdir)
+    if key is not None:
+        cache.put(key, (), parse_info, None)
+    return parse_info
 
 if __name__ == '__main__':
     parse_data_commands(filename=sys.argv[1], debug=100)
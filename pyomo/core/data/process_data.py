@@ -13,6 +13,8 @@ import re
 import copy
 import math
 import logging
+import threading
+from contextlib import contextmanager
 
 from pyutilib.misc import quote_split, Options
 import pyutilib.common
@@ -43,6 +45,32 @@ logger = logging.getLogger('pyomo.core')
 global Lineno
 global Filename
 
+# The files that are read in this thread are collected in
+# _local.sources by _collect_sources()
+_local = threading.local()
+
+
+@contextmanager
+def _collect_sources():
+    """
+    Collect the names of the files that _process_include() and
+    _process_load() read in this thread.
+    """
+    saved = getattr(_local, 'sources', None)
+    sources = _local.sources = []
+    try:
+        yield sources
+    finally:
+        _local.sources = saved
+        if saved is not None:
+            saved.extend(sources)
+
+
+def _record_source(filename):
+    sources = getattr(_local, 'sources', None)
+    if sources is not None:
+        sources.append(filename)
+
 
 def _process_token(token):
     if type(token) is tuple:
@@ -584,6 +612,7 @@ def _process_include(cmd, _model, _data, _default, options=None):
     Filename = cmd[1]
     global Lineno
     Lineno = 0
+    _record_source(cmd[1])
 
     try:
         scenarios = parse_data_commands(filename=cmd[1])
@@ -818,6 +847,7 @@ def _process_load(cmd, _model, _data, _default, options=None):
 
     global Filename
     Filename = options.filename
+    _record_source(options.filename)
 
     global Lineno
     Lineno = 0
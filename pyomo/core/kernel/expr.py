@@ -31,6 +31,7 @@ from pyomo.core.kernel.expr_common import clone_expression
 
 _common_module_members = [
     'identify_variables',
+    'identify_mutable_parameters',
     'generate_expression',
     'generate_intrinsic_function_expression',
     'generate_relational_expression',
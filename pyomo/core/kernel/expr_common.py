@@ -56,6 +56,13 @@ def _clear_expression_pool():
         assert mode == Mode.coopr3_trees
         _clear_expression_pool_coopr3()
 
+def _variable_types():
+    # The variable classes are imported here because the modules that
+    # define them import the expression modules
+    from pyomo.core.base import _VarData
+    from pyomo.core.kernel.component_variable import IVariable
+    return (_VarData, IVariable)
+
 def chainedInequalityErrorMessage(gre, msg=None):
     if msg is None:
         msg = "Relational expression used in an unexpected Boolean context."
@@ -29,7 +29,8 @@ except:
 #from pyomo.core.kernel.component import Component
 from pyomo.core.kernel.numvalue import *
 from pyomo.core.kernel.numvalue import (native_numeric_types,
-                                        native_types)
+                                        native_types,
+                                        _deepcopy_state)
 
 from pyomo.core.kernel.expr_common import \
     (_add, _sub, _mul, _div, _pow,
@@ -38,7 +39,8 @@ from pyomo.core.kernel.expr_common import \
      _iadd, _isub, _imul, _idiv, _ipow,
      _lt, _le, _eq, clone_expression,
      chainedInequalityErrorMessage as cIEM,
-     _getrefcount_available, getrefcount)
+     _getrefcount_available, getrefcount,
+     _variable_types)
 from pyomo.core.kernel import expr_common as common
 
 # Wrap the common chainedInequalityErrorMessage to pass the
@@ -68,8 +70,7 @@ def identify_variables(expr,
                        include_fixed=True,
                        allow_duplicates=False,
                        include_potentially_variable=False):
-    from pyomo.core.base import _VarData # TODO
-    from pyomo.core.kernel.component_variable import IVariable # TODO
+    variable_types = _variable_types()
     if not allow_duplicates:
         _seen = set()
     _stack = [ ([expr], 0, 1) ]
@@ -91,7 +92,7 @@ def identify_variables(expr,
                     _argList = _sub._args
                 _idx = 0
                 _len = len(_argList)
-            elif isinstance(_sub, (_VarData, IVariable)):
+            elif isinstance(_sub, variable_types):
                 if ( include_fixed
                      or not _sub.is_fixed()
                      or include_potentially_variable ):
@@ -107,6 +108,40 @@ def identify_variables(expr,
                     _seen.add(id(_sub))
                 yield _sub
 
+def identify_mutable_parameters(expr):
+    """
+    Generate the mutable parameters (and other fixed leaves that are
+    not constant) in an expression.
+    """
+    variable_types = _variable_types()
+    _seen = set()
+    _stack = [ ([expr], 0, 1) ]
+    while _stack:
+        _argList, _idx, _len = _stack.pop()
+        while _idx < _len:
+            _sub = _argList[_idx]
+            _idx += 1
+            if type(_sub) in native_types:
+                pass
+            elif _sub.is_expression():
+                _stack.append(( _argList, _idx, _len ))
+                if type(_sub) is _ProductExpression:
+                    if _sub._denominator:
+                        _stack.append(
+                            (_sub._denominator, 0, len(_sub._denominator)) )
+                    _argList = _sub._numerator
+                else:
+                    _argList = _sub._args
+                _idx = 0
+                _len = len(_argList)
+            elif isinstance(_sub, variable_types):
+                pass
+            elif not _sub.is_constant():
+                if id(_sub) in _seen:
+                    continue
+                _seen.add(id(_sub))
+                yield _sub
+
 class _ExpressionBase(NumericValue):
     """An object that defines a mathematical expression that
     can be evaluated"""
@@ -125,6 +160,15 @@ class _ExpressionBase(NumericValue):
             result[i] = getattr(self, i)
         return result
 
+    def __deepcopy__(self, memo):
+        # Equivalent to the default deepcopy() (through __reduce_ex__),
+        # but copies the state directly: cloning a model copies every
+        # node in every expression tree, and the generic deepcopy
+        # machinery dominates the cost of Block.clone()
+        ans = memo[id(self)] = self.__class__.__new__(self.__class__)
+        ans.__setstate__(_deepcopy_state(self.__getstate__(), memo))
+        return ans
+
     def to_string(self, ostream=None, verbose=None, precedence=0, labeler=None):
         """Print this expression"""
         if ostream is None:
@@ -26,6 +26,7 @@ from pyomo.core.kernel.numvalue import \
      native_types,
      native_numeric_types,
      as_numeric,
+     _deepcopy_state,
      value)
 from pyomo.core.kernel.expr_common import \
     (bypass_backreference,
@@ -37,7 +38,8 @@ from pyomo.core.kernel.expr_common import \
      _rdiv, _rpow, _iadd, _isub,
      _imul, _idiv, _ipow, _lt, _le,
      _eq, clone_expression,
-     chainedInequalityErrorMessage as cIEM)
+     chainedInequalityErrorMessage as cIEM,
+     _variable_types)
 from pyomo.core.kernel import expr_common as common
 
 UNREFERENCED_EXPR_COUNT = 11
@@ -97,8 +99,7 @@ def identify_variables(expr,
                        include_fixed=True,
                        allow_duplicates=False,
                        include_potentially_variable=False):
-    from pyomo.core.base import _VarData # TODO
-    from pyomo.core.kernel.component_variable import IVariable # TODO
+    variable_types = _variable_types()
     if not allow_duplicates:
         _seen = set()
     _stack = [ ([expr], 0, 1) ]
@@ -114,7 +115,7 @@ def identify_variables(expr,
                 _argList = _sub._args
                 _idx = 0
                 _len = len(_argList)
-            elif isinstance(_sub, (_VarData, IVariable)):
+            elif isinstance(_sub, variable_types):
                 if ( include_fixed
                      or not _sub.is_fixed()
                      or include_potentially_variable ):
@@ -130,6 +131,34 @@ def identify_variables(expr,
                     _seen.add(id(_sub))
                 yield _sub
 
+def identify_mutable_parameters(expr):
+    """
+    Generate the mutable parameters (and other fixed leaves that are
+    not constant) in an expression.
+    """
+    variable_types = _variable_types()
+    _seen = set()
+    _stack = [ ([expr], 0, 1) ]
+    while _stack:
+        _argList, _idx, _len = _stack.pop()
+        while _idx < _len:
+            _sub = _argList[_idx]
+            _idx += 1
+            if _sub.__class__ in native_types:
+                pass
+            elif _sub.is_expression():
+                _stack.append(( _argList, _idx, _len ))
+                _argList = _sub._args
+                _idx = 0
+                _len = len(_argList)
+            elif isinstance(_sub, variable_types):
+                pass
+            elif not _sub.is_constant():
+                if id(_sub) in _seen:
+                    continue
+                _seen.add(id(_sub))
+                yield _sub
+
 def _generate_expression__clone_if_needed__getrefcount(target, inplace, *objs):
     ans = ()
     for obj in objs:
@@ -311,6 +340,15 @@ class _ExpressionBase(NumericValue):
                 if hasattr(arg, '_parent_expr'):
                     arg._parent_expr = bypass_backreference or ref(self)
 
+    def __deepcopy__(self, memo):
+        # Equivalent to the default deepcopy() (through __reduce_ex__),
+        # but copies the state directly: cloning a model copies every
+        # node in every expression tree, and the generic deepcopy
+        # machinery dominates the cost of Block.clone()
+        ans = memo[id(self)] = self.__class__.__new__(self.__class__)
+        ans.__setstate__(_deepcopy_state(self.__getstate__(), memo))
+        return ans
+
     def __nonzero__(self):
         return bool(self())
 
@@ -10,6 +10,7 @@
 
 import sys
 import logging
+from copy import deepcopy
 from six import iteritems, PY3, string_types, text_type, binary_type
 
 from pyomo.core.kernel.expr_common import \
@@ -125,6 +126,81 @@ def RegisterBooleanType(new_type):
     native_boolean_types.add(new_type)
     native_types.add(new_type)
 
+def _deepcopy_value(val, memo):
+    """
+    Deepcopy a value using the deepcopy memo.
+
+    Native (immutable) values, and tuples of native values, are
+    returned as-is.  Lists and dicts are copied here (recursing into
+    their contents), and sets of native values are copied with a single
+    shallow copy.  Everything else is passed on to copy.deepcopy().
+    This avoids the (significant) per-object overhead of deepcopy()
+    when cloning the component data and expression trees in a model.
+    """
+    _type = val.__class__
+    if _type in native_types:
+        return val
+    if _type is tuple:
+        for x in val:
+            if x.__class__ not in native_types:
+                return deepcopy(val, memo)
+        return val
+    _id = id(val)
+    if _id in memo:
+        return memo[_id]
+    if _type is list:
+        ans = memo[_id] = []
+        for x in val:
+            if x.__class__ not in native_types:
+                x = _deepcopy_value(x, memo)
+            ans.append(x)
+    elif _type is dict:
+        ans = memo[_id] = {}
+        for k, v in iteritems(val):
+            if k.__class__ not in native_types:
+                k = _deepcopy_value(k, memo)
+            if v.__class__ not in native_types:
+                v = _deepcopy_value(v, memo)
+            ans[k] = v
+    elif _type is set:
+        for x in val:
+            if x.__class__ not in native_types and \
+               (x.__class__ is not tuple or
+                any(y.__class__ not in native_types for y in x)):
+                return deepcopy(val, memo)
+        ans = memo[_id] = set(val)
+    else:
+        # Call the object's __deepcopy__ directly (for Pyomo components
+        # and expressions), bypassing the dispatch in copy.deepcopy()
+        _copier = getattr(val, '__deepcopy__', None)
+        if _copier is None or issubclass(_type, type):
+            return deepcopy(val, memo)
+        ans = _copier(memo)
+        if ans is val:
+            return ans
+        memo[_id] = ans
+    # Keep the original alive for the duration of the copy (so its id
+    # cannot be reused by another object); this mirrors deepcopy()
+    try:
+        memo[id(memo)].append(val)
+    except KeyError:
+        memo[id(memo)] = [val]
+    return ans
+
+def _deepcopy_state(state, memo):
+    """
+    Deepcopy a state dictionary (as returned by __getstate__()).
+
+    This is equivalent to copy.deepcopy(state, memo), but uses
+    _deepcopy_value() to copy the individual attributes.
+    """
+    ans = {}
+    for k, v in iteritems(state):
+        if v.__class__ not in native_types:
+            v = _deepcopy_value(v, memo)
+        ans[k] = v
+    return ans
+
 def value(obj, exception=True):
     """
     A utility function that returns the value of a Pyomo object or
@@ -12,6 +12,7 @@ import pyomo.core.plugins.data.datacommands
 import pyomo.core.plugins.data.csv_table
 import pyomo.core.plugins.data.db_table
 import pyomo.core.plugins.data.json_dict
+import pyomo.core.plugins.data.numpy_array
 import pyomo.core.plugins.data.sheet
 import pyomo.core.plugins.data.text
 import pyomo.core.plugins.data.xml_table
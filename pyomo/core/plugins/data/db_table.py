@@ -45,6 +45,7 @@ except ImportError:
     pymysql_available=False
 
 from pyomo.util.plugin import alias
+from pyomo.core.base.DataPortal import ConnectionPool
 from pyomo.core.data.TableData import TableData
 
 
@@ -75,10 +76,19 @@ class db_Table(TableData):
         if self._data is not None:
             self.db = self._data
         else:
-            try:
+            #
+            # Reuse the connections of the DataPortal that is loading
+            # data, if any
+            #
+            pool = ConnectionPool.active()
+            if pool is None:
                 self.db = self.connect(self.filename, self.options)
-            except Exception:
-                raise
+            else:
+                key = (self.options.using, self.filename, self.options.user,
+                       self.options.password, self.options.driver,
+                       self.options.text_factory)
+                self.db = pool.connect(
+                    key, lambda: self.connect(self.filename, self.options))
 
     def read(self):
         #
@@ -87,7 +97,7 @@ class db_Table(TableData):
         if self.db is None:
             return
         cursor = self.db.cursor()
-        tmp = []
+        header = []
         if self.options.query is None:
             if self.options.table is None:
                 raise IOError("Must specify 'query' or 'table' option!")
@@ -97,16 +107,14 @@ class db_Table(TableData):
         if not self.options.table is None:
             try:
                 for row in cursor.columns(table=self.options.table):
-                    tmp.append(row.column_name)
-                tmp=[tmp]
+                    header.append(row.column_name)
             except:
                 #
                 # TODO: is this only for SQLite?
                 #
                 cursor.execute("SELECT * FROM %s" % self.options.table)
                 for col in cursor.description:
-                    tmp.append(col[0])
-                tmp=[tmp]
+                    header.append(col[0])
         else:
             # TODO: extend this logic to create a header row for a SQL query
             # FIXME: the current regex logic is pretty brittle...
@@ -116,21 +124,32 @@ class db_Table(TableData):
                 if fieldstr == "*":
                     raise ValueError("Couldn't extract field names from query. Please specify database columns explicitly in query.")
                 else:
-                    fields = [f.strip() for f in fieldstr.split(",")]
-                #print "FOUND FIELDS", fields # XXX
-                tmp = [fields]
-                #self.options.index_name = fields[0]
-                #self.options.select = fields[1:]
+                    header = [f.strip() for f in fieldstr.split(",")]
             else:
                 # TODO couldn't figure out field names from query; need another strategy!
                 raise ValueError("Couldn't extract field names from query. Please specify database columns explicitly in query.")
+        #
+        # Process data from the table
+        #
+        self._read_rows(lambda: self._rows(header),
+                        "Empty range '%s'" % self.options.range,
+                        scalar=False)
+
+    def _rows(self, header):
+        """
+        Generate the header and then the rows of the query result.
+        Rows are fetched from the cursor in chunks of self.chunksize.
+        """
+        cursor = self.db.cursor()
         cursor.execute(self.options.query)
-        try:
-            rows = cursor.fetchall()
-        except:
-            import logging
-            logging.getLogger('pyomo.core').error(
-                """Fatal error reading from an external ODBC data source.
+        yield header
+        while True:
+            try:
+                rows = cursor.fetchmany(self.chunksize)
+            except:
+                import logging
+                logging.getLogger('pyomo.core').error(
+                    """Fatal error reading from an external ODBC data source.
                 
 This error was generated outside Pyomo by the Python connector to the
 external data source:
@@ -145,41 +164,24 @@ It is possible that you have an error in your external data file,
 the ODBC connector for this data source is not correctly installed,
 or that there is a bug in the ODBC connector.
 """ % (self.filename, self.options.query) )
-            raise
-        for row in rows:
-            #print("DATA %s" % str(list(row))) # XXX
-            ttmp=[]
-            for data in list(row):
-                if isinstance(data,Decimal):
-                    ttmp.append(float(data))
-                elif data is None:
-                    ttmp.append('.')
-                elif isinstance(data, str) or isinstance(data, basestring):
-                    nulidx = data.find('\x00')
-                    if nulidx > -1:
-                        data = data[:nulidx]
-                    ttmp.append(data)
-                else:
-                    ttmp.append(data)
-            tmp.append(ttmp)
-        #print('FINAL %s' % str(tmp)) # XXX
-        #
-        # Process data from the table
-        #
-        if type(tmp) in (int,long,float):
-            if not self.options.param is None:
-                self._info = ["param", self.options.param.local_name, ":=", tmp]
-            elif len(self.options.symbol_map) == 1:
-                self._info = ["param", self.options.symbol_map[self.options.symbol_map.keys()[0]], ":=", tmp]
-            else:
-                raise IOError("Data looks like a scalar parameter, but multiple parameter names have been specified: %s" % str(self.options.symbol_map))
-        elif len(tmp) == 0:
-            raise IOError("Empty range '%s'" % self.options.range)
-        else:
-            #print("_info %s" % str(self._info))
-            #print("SETTING DATA %s %s" % (str(tmp[0]), str(tmp[1:]))) # XXX
-            #print("OPTIONS %s" % str(self.options))
-            self._set_data(tmp[0], tmp[1:])
+                raise
+            if not rows:
+                return
+            for row in rows:
+                ttmp=[]
+                for data in row:
+                    if isinstance(data,Decimal):
+                        ttmp.append(float(data))
+                    elif data is None:
+                        ttmp.append('.')
+                    elif isinstance(data, basestring):
+                        nulidx = data.find('\x00')
+                        if nulidx > -1:
+                            data = data[:nulidx]
+                        ttmp.append(data)
+                    else:
+                        ttmp.append(data)
+                yield ttmp
 
     def close(self):
         if self._data is None and not self.db is None:
@@ -0,0 +1,384 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os.path
+import zipfile
+from numbers import Integral
+
+try:
+    from collections.abc import Mapping
+except ImportError:                               #pragma:nocover
+    from collections import Mapping
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:                               #pragma:nocover
+    numpy_available = False
+
+from six import string_types
+from six.moves import xrange, zip
+from pyutilib.misc import Options
+
+from pyomo.util.plugin import alias, Plugin, implements
+from pyomo.core.base.plugin import IDataManager
+
+
+class ArrayData(Mapping):
+    """
+    A read-only dictionary view of an array, which maps indices to
+    the array values.  An index contains the labels of the array
+    positions on each axis, and NaN values are missing.  Parameters
+    are constructed from the array without building a dictionary of
+    the values.
+
+    Args:
+        array: The array.
+        labels (list): For each axis, a list with the labels of the
+            positions on the axis, or :const:`None` if the positions
+            are their own labels.
+    """
+
+    # The number of values that are converted to Python objects at a
+    # time when iterating over the data
+    chunksize = 1 << 16
+
+    def __init__(self, array, labels=None):
+        self.array = array
+        if labels is None:
+            labels = [None]*array.ndim
+        self.labels = labels
+        self._positions = None
+
+    def __repr__(self):
+        return "ArrayData(shape=%s)" % (self.array.shape,)
+
+    def __len__(self):
+        if self.array.dtype.kind == 'f':
+            return int(self.array.size -
+                       numpy.count_nonzero(numpy.isnan(self.array)))
+        return self.array.size
+
+    def __getitem__(self, index):
+        if self.array.ndim == 0:
+            if index is not None:
+                raise KeyError(index)
+            value = self.array.item()
+        else:
+            if self.array.ndim == 1:
+                index = (index,)
+            elif type(index) is not tuple or len(index) != self.array.ndim:
+                raise KeyError(index)
+            if self._positions is None:
+                self._positions = [
+                    None if l is None else dict((v, i) for i, v in enumerate(l))
+                    for l in self.labels]
+            pos = []
+            for i, label in enumerate(index):
+                if self._positions[i] is None:
+                    if not isinstance(label, Integral) or \
+                       not 0 <= label < self.array.shape[i]:
+                        raise KeyError(index if len(index) > 1 else index[0])
+                    pos.append(label)
+                elif label in self._positions[i]:
+                    pos.append(self._positions[i][label])
+                else:
+                    raise KeyError(index if len(index) > 1 else index[0])
+            value = self.array[tuple(pos)].item()
+        if value != value:
+            raise KeyError(index)
+        return value
+
+    def __iter__(self):
+        for key, value in self.iteritems():
+            yield key
+
+    def iteritems(self):
+        """
+        Generate the (index, value) tuples of the data.  Values are
+        converted in chunks of self.chunksize.
+        """
+        array = self.array
+        if array.ndim == 0:
+            value = array.item()
+            if value == value:
+                yield None, value
+            return
+        labels = [None if l is None else numpy.array(l, dtype=object)
+                  for l in self.labels]
+        for start in xrange(0, array.size, self.chunksize):
+            stop = min(start + self.chunksize, array.size)
+            coords = numpy.unravel_index(numpy.arange(start, stop),
+                                         array.shape)
+            values = array[coords]
+            if values.dtype.kind == 'f':
+                present = ~numpy.isnan(values)
+                if not present.all():
+                    coords = tuple(c[present] for c in coords)
+                    values = values[present]
+            keys = [c.tolist() if l is None else l[c].tolist()
+                    for c, l in zip(coords, labels)]
+            if len(keys) == 1:
+                keys = keys[0]
+            else:
+                keys = zip(*keys)
+            for item in zip(keys, values.tolist()):
+                yield item
+
+    items = iteritems
+
+
+def _load_npz_member(filename, archive, name):
+    """
+    Return an array in a .npz file.  Arrays that are stored without
+    compression are memory-mapped.  Arrays of objects (e.g., the
+    members of a set that mixes strings and numbers) are unpickled.
+    """
+    info = archive.getinfo(name + '.npy')
+    if info.compress_type == zipfile.ZIP_STORED:
+        with open(filename, 'rb') as f:
+            # Skip the local file header
+            f.seek(info.header_offset + 26)
+            sizes = numpy.frombuffer(f.read(4), dtype='<u2')
+            f.seek(int(sizes[0] + sizes[1]), 1)
+            version = numpy.lib.format.read_magic(f)
+            if version == (1, 0):
+                header = numpy.lib.format.read_array_header_1_0(f)
+            else:
+                header = numpy.lib.format.read_array_header_2_0(f)
+            shape, fortran_order, dtype = header
+            if not dtype.hasobject:
+                return numpy.memmap(filename, dtype=dtype, mode='r',
+                                    offset=f.tell(), shape=shape,
+                                    order='F' if fortran_order else 'C')
+    with archive.open(name + '.npy') as f:
+        return numpy.lib.format.read_array(f, allow_pickle=True)
+
+
+class NumPyArray(Plugin):
+    """
+    Read set and parameter data from a .npy file.  The array is
+    memory-mapped.
+
+    Options:
+        param: The name of the parameter that is loaded from the array.
+        set: The name of the set that is loaded from the array.  The
+            set members are the values of a 1-D array, or the rows of
+            a 2-D array.
+        index: The names of the sets that index the axes of the array.
+            The labels of the positions on an axis are the members of
+            the set, if the set is constructed in the model.
+            Otherwise, the positions are labeled 0, 1, 2, ...
+    """
+
+    alias("npy", "NumPy array file interface")
+
+    implements(IDataManager, service=False)
+
+    def __init__(self):
+        self._arrays = None
+        self.options = Options()
+
+    def available(self):
+        return numpy_available
+
+    def requirements(self):
+        return "numpy"
+
+    def initialize(self, **kwds):
+        self.filename = kwds.pop('filename')
+        self.add_options(**kwds)
+
+    def add_options(self, **kwds):
+        self.options.update(kwds)
+
+    def open(self):
+        if self.filename is None:
+            raise IOError("No filename specified")
+
+    def close(self):
+        pass
+
+    def read(self):
+        """
+        Memory-map the array in the file.
+        """
+        if not os.path.exists(self.filename):
+            raise IOError("Cannot find file '%s'" % self.filename)
+        self._arrays = {None: numpy.load(self.filename, mmap_mode='r')}
+
+    def write(self, data):
+        raise IOError("Cannot write data to NumPy file '%s'" % self.filename)
+
+    def process(self, model, data, default):
+        """
+        Set the data for the selected components
+        """
+        if model is None:
+            model = self.options.model
+        if not self.options.namespace in data:
+            data[self.options.namespace] = {}
+        _data = data[self.options.namespace]
+        index = self._index_names()
+        sets = set(index)
+        if not self.options.set is None:
+            sets.add(_name(self.options.set))
+        labels = self._labels(model, index)
+        for name, array in self._selected():
+            if name in sets:
+                _data[name] = {None: self._set_members(name, array)}
+            elif not index or array.ndim == 0:
+                _data[name] = ArrayData(array)
+            elif array.ndim != len(index):
+                raise IOError(
+                    "Array '%s' in file '%s' has %d axes, but %d index sets "
+                    "were specified" % (name, self.filename, array.ndim,
+                                        len(index)))
+            else:
+                for axis, l in enumerate(labels):
+                    if l is not None and len(l) != array.shape[axis]:
+                        raise IOError(
+                            "Axis %d of array '%s' in file '%s' has length "
+                            "%d, but set '%s' has %d members"
+                            % (axis, name, self.filename, array.shape[axis],
+                               index[axis], len(l)))
+                _data[name] = ArrayData(array, labels)
+
+    def clear(self):
+        self._arrays = None
+
+    def _selected(self):
+        """
+        Returns:
+            A list of tuples (name, array) for the arrays that are
+            loaded.
+        """
+        name = _name(self.options.param if self.options.set is None
+                     else self.options.set)
+        if type(name) in (list, tuple):
+            if len(name) != 1:
+                raise IOError("A single set or parameter name must be "
+                              "specified for file '%s'" % self.filename)
+            name = name[0]
+        if name is None:
+            raise IOError("A set or parameter name must be specified for "
+                          "file '%s'" % self.filename)
+        return [(name, self._arrays[None])]
+
+    def _index_names(self):
+        index = self.options.index
+        if index is None:
+            return ()
+        if type(index) not in (list, tuple):
+            index = (index,)
+        return tuple(_name(s) for s in index)
+
+    def _labels(self, model, index):
+        """
+        Returns:
+            A list with the labels of the positions on each axis of the
+            arrays, or None for axes that are labeled by position.
+        """
+        ans = []
+        for name in index:
+            comp = None
+            if model is not None:
+                comp = getattr(model, name, None)
+            if comp is not None and comp.is_constructed():
+                ans.append(list(comp))
+            else:
+                ans.append(None)
+        return ans
+
+    def _set_members(self, name, array):
+        if array.ndim == 1:
+            return array.tolist()
+        if array.ndim == 2:
+            return [tuple(row) for row in array.tolist()]
+        raise IOError("Array '%s' in file '%s' has %d axes, but set data "
+                      "must have 1 or 2 axes" % (name, self.filename,
+                                                 array.ndim))
+
+
+class NumPyArchive(NumPyArray):
+    """
+    Read set and parameter data from the arrays in a .npz file.  The
+    arrays are named by the components that they are loaded into, and
+    arrays that are stored without compression are memory-mapped.
+
+    Options:
+        param: The names of the parameters that are loaded.  By
+            default, all arrays that are not loaded into sets are
+            loaded into parameters.
+        set: The name of a set that is loaded.
+        index: The names of the sets that index the axes of the
+            parameter arrays.  If the file has an array with the name
+            of an index set, then the array values label the positions
+            on the axis, and the set is loaded from the array.
+    """
+
+    alias("npz", "NumPy archive file interface")
+
+    def read(self):
+        """
+        Memory-map the arrays in the file.
+        """
+        if not os.path.exists(self.filename):
+            raise IOError("Cannot find file '%s'" % self.filename)
+        self._arrays = {}
+        archive = zipfile.ZipFile(self.filename)
+        try:
+            for member in archive.namelist():
+                if member.endswith('.npy'):
+                    name = member[:-4]
+                    self._arrays[name] = \
+                        _load_npz_member(self.filename, archive, name)
+        finally:
+            archive.close()
+
+    def _selected(self):
+        index = self._index_names()
+        if self.options.param is None and self.options.set is None:
+            names = sorted(n for n in self._arrays if n not in index)
+        else:
+            names = []
+            if not self.options.set is None:
+                names.append(_name(self.options.set))
+            if not self.options.param is None:
+                param = self.options.param
+                if type(param) not in (list, tuple):
+                    param = (param,)
+                names.extend(_name(p) for p in param)
+        names.extend(n for n in index if n in self._arrays)
+        ans = []
+        for name in names:
+            if name not in self._arrays:
+                raise IOError("Array '%s' is not available in file '%s'"
+                              % (name, self.filename))
+            ans.append((name, self._arrays[name]))
+        return ans
+
+    def _labels(self, model, index):
+        ans = NumPyArray._labels(self, model, index)
+        for i, name in enumerate(index):
+            if name in self._arrays:
+                ans[i] = self._set_members(name, self._arrays[name])
+        return ans
+
+
+def _name(component):
+    """
+    Returns the name of a component, or the argument if it is a name.
+    """
+    if component is None or isinstance(component, string_types):
+        return component
+    if type(component) in (list, tuple):
+        return type(component)(_name(c) for c in component)
+    return component.local_name
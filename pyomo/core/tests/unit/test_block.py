@@ -572,6 +572,82 @@ class TestBlock(unittest.TestCase):
         del b.x
         self.assertEqual(b.collect_ctypes(), set())
 
+    def test_subtree_ctypes(self):
+        m = ConcreteModel()
+        m.x = Var()
+        self.assertEqual(m._subtree_ctypes, {Var: 1})
+        # (note that the implicit index Sets are counted, too)
+        # Components added to a detached block are counted when the
+        # block is attached
+        b = Block(concrete=True)
+        b.c = Constraint(expr=m.x >= 1)
+        b.d = Block([1,2])
+        b.d[1].y = Var([1,2])
+        b.d[2].y = Var()
+        self.assertEqual(b._subtree_ctypes,
+                         {Constraint: 1, Block: 1, Var: 2, Set: 2})
+        m.b = b
+        self.assertEqual(m._subtree_ctypes,
+                         {Constraint: 1, Block: 2, Var: 3, Set: 2})
+        # Components added to an attached block update the ancestors
+        b.d[1].z = Constraint(expr=m.x <= 2)
+        self.assertEqual(m._subtree_ctypes,
+                         {Constraint: 2, Block: 2, Var: 3, Set: 2})
+        self.assertEqual(b.d[1]._subtree_ctypes,
+                         {Constraint: 1, Var: 1, Set: 1})
+        b.d[1].reclassify_component_type('z', Expression)
+        self.assertEqual(m._subtree_ctypes,
+                         {Constraint: 1, Expression: 1, Block: 2, Var: 3,
+                          Set: 2})
+        m.del_component(m.b)
+        self.assertEqual(m._subtree_ctypes, {Var: 1})
+        self.assertEqual(b._subtree_ctypes,
+                         {Constraint: 1, Expression: 1, Block: 1, Var: 2,
+                          Set: 2})
+        # Cloning preserves the counts
+        m.b = b
+        i = m.clone()
+        self.assertEqual(i._subtree_ctypes, m._subtree_ctypes)
+        self.assertEqual(i.b.d[1]._subtree_ctypes,
+                         {Expression: 1, Var: 1, Set: 1})
+
+    def test_component_data_objects_pruned(self):
+        m = ConcreteModel()
+        m.b = Block([1,2,3])
+        for i in m.b.index_set():
+            m.b[i].sub = Block()
+            m.b[i].sub.sub = Block()
+            m.b[i].sub.v = Var()
+        m.b[2].sub.sub.c = Constraint(expr=m.b[2].sub.v >= 0)
+        m.b[3].sub.sub.c = Constraint(expr=m.b[3].sub.v >= 0)
+        m.b[3].sub.sub.c.deactivate()
+        for order in (TraversalStrategy.PrefixDepthFirstSearch,
+                      TraversalStrategy.PostfixDepthFirstSearch,
+                      TraversalStrategy.BreadthFirstSearch):
+            self.assertEqual(
+                [c.name for c in m.component_data_objects(
+                    Constraint, descent_order=order)],
+                ['b[2].sub.sub.c', 'b[3].sub.sub.c'])
+            self.assertEqual(
+                [c.name for c in m.component_data_objects(
+                    Constraint, active=True, descent_order=order)],
+                ['b[2].sub.sub.c'])
+            self.assertEqual(
+                [c.name for c in m.component_objects(
+                    (Constraint, Objective), descent_order=order)],
+                ['b[2].sub.sub.c', 'b[3].sub.sub.c'])
+            self.assertEqual(
+                sorted(c.name for c in m.component_data_objects(
+                    Var, descent_order=order)),
+                ['b[1].sub.v', 'b[2].sub.v', 'b[3].sub.v'])
+            self.assertEqual(
+                len(list(m.block_data_objects(descent_order=order))), 10)
+        self.assertEqual(list(m.component_data_objects(Objective)), [])
+        # Generators are accepted for the ctype argument
+        self.assertEqual(
+            len(list(m.component_data_objects(
+                (x for x in (Constraint, Var))))), 5)
+
     def test_clear_attribute(self):
         """ Coverage of the _clear_attribute method """
         obj = Set()
@@ -1743,6 +1819,36 @@ class TestBlock(unittest.TestCase):
             sorted(id(x) for x in (n.x, n.y[1], n.b.x, n.b.y[1])),
         )
 
+    def test_clone_containers(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[(1,'a'), (2,'b')])
+        m.p = Param(m.I, initialize={(1,'a'): 1.5, (2,'b'): 2.5})
+        m.x = Var(m.I)
+        m.e = Expression(expr=m.x[1,'a'] + 2*m.x[2,'b'])
+        # Shared (aliased) containers remain shared in the clone
+        shared = [1, 2, m.x[1,'a']]
+        m.b = Block()
+        m.b.l1 = shared
+        m.b.l2 = shared
+        m.b.d = {'x': m.x[2,'b'], (1,'a'): [3.5]}
+
+        n = m.clone()
+        self.assertIs(n.b.l1, n.b.l2)
+        self.assertIsNot(n.b.l1, shared)
+        self.assertEqual(n.b.l1[:2], [1, 2])
+        self.assertIs(n.b.l1[2], n.x[1,'a'])
+        self.assertIs(n.b.d['x'], n.x[2,'b'])
+        self.assertEqual(n.b.d[1,'a'], [3.5])
+        self.assertIsNot(n.b.d[1,'a'], m.b.d[1,'a'])
+        self.assertEqual(
+            sorted(id(x) for x in identify_variables(n.e.expr)),
+            sorted(id(x) for x in (n.x[1,'a'], n.x[2,'b'])))
+        self.assertEqual(n.p[2,'b'], 2.5)
+        # The clone's Set data are independent of the original
+        n.I.add((3,'c'))
+        self.assertEqual(len(n.I), 3)
+        self.assertEqual(len(m.I), 2)
+
     def test_clone_subblock(self):
         m = ConcreteModel()
         m.x = Var()
@@ -0,0 +1,140 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for ChangeTracker
+#
+
+import pickle
+
+import pyutilib.th as unittest
+
+from pyomo.environ import *
+from pyomo.core.base.change_tracker import ChangeTracker
+from pyomo.core.kernel import expr as EXPR
+
+
+class TestChangeTracker(unittest.TestCase):
+
+    def setUp(self):
+        model = ConcreteModel()
+        model.x = Var([1, 2], bounds=(0, 1))
+        model.p = Param([1, 2], initialize=1, mutable=True)
+        model.c = Constraint(expr=model.p[1]*model.x[1] + model.x[2] >= 1)
+        model.o = Objective(expr=model.x[1])
+        model.b = Block()
+        model.b.y = Var()
+        self.model = model
+
+    def test_inactive(self):
+        tracker = ChangeTracker()
+        self.assertFalse(tracker.active)
+        self.model.x[1].setlb(-1)
+        self.assertEqual(len(tracker), 0)
+        with tracker:
+            self.assertTrue(tracker.active)
+        self.assertFalse(tracker.active)
+
+    def test_vars(self):
+        m = self.model
+        with ChangeTracker() as tracker:
+            m.x[1].value = 0.5
+            self.assertEqual(len(tracker), 0)
+            m.x[1].setlb(-1)
+            m.x[2].fix(0.5)
+            m.b.y.domain = Binary
+            changes = tracker.changes()
+            self.assertEqual(set(id(v) for v in changes),
+                             set(id(v) for v in (m.x[1], m.x[2], m.b.y)))
+            self.assertEqual(len(tracker), 0)
+            # the value of a fixed variable is recorded
+            m.x[2].value = 0.25
+            self.assertIn(m.x[2], tracker.changes())
+            m.x[2].unfix()
+            self.assertIn(m.x[2], tracker.changes())
+
+    def test_params(self):
+        m = self.model
+        with ChangeTracker() as tracker:
+            m.p[1] = 2
+            m.p.store_values(3)
+            changes = tracker.changes()
+            self.assertIn(m.p[1], changes)
+            self.assertIn(m.p[2], changes)
+
+    def test_constraints_and_blocks(self):
+        m = self.model
+        with ChangeTracker() as tracker:
+            m.c.deactivate()
+            m.b.deactivate()
+            m.o.sense = maximize
+            changes = tracker.changes()
+            self.assertIn(m.c, changes)
+            self.assertIn(m.b, changes)
+            self.assertIn(m.o, changes)
+            m.c.set_value(m.x[1] <= 1)
+            m.o.expr = m.x[2]
+            changes = tracker.changes()
+            self.assertIn(m.c, changes)
+            self.assertIn(m.o, changes)
+
+    def test_multiple_trackers(self):
+        m = self.model
+        t1 = ChangeTracker()
+        t2 = ChangeTracker()
+        t1.start()
+        t2.start()
+        try:
+            m.x[1].setub(2)
+            t1.stop()
+            m.x[2].setub(2)
+            self.assertEqual(len(t1), 1)
+            self.assertEqual(len(t2), 2)
+        finally:
+            t2.stop()
+        del t1
+        m.x[1].setub(3)
+        self.assertEqual(len(t2), 2)
+
+    def test_block(self):
+        m = self.model
+        other = ConcreteModel()
+        other.x = Var()
+        with ChangeTracker(m) as tracker:
+            with ChangeTracker(m.b) as block_tracker:
+                other.x.setlb(0)
+                other.deactivate()
+                self.assertEqual(len(tracker), 0)
+                m.x[1].setlb(-1)
+                m.b.y.setlb(-1)
+                m.b.deactivate()
+                self.assertEqual(set(id(v) for v in tracker.changes()),
+                                 set(id(v) for v in (m.x[1], m.b.y, m.b)))
+                self.assertEqual(set(id(v) for v in block_tracker.changes()),
+                                 set(id(v) for v in (m.b.y, m.b)))
+
+    def test_pickle_fixed(self):
+        m = self.model
+        m.x[1].fix(0.5)
+        m2 = pickle.loads(pickle.dumps(m))
+        self.assertTrue(m2.x[1].fixed)
+        self.assertTrue(m2.x[1].is_fixed())
+        self.assertFalse(m2.x[2].fixed)
+
+    def test_identify_mutable_parameters(self):
+        m = self.model
+        params = list(EXPR.identify_mutable_parameters(
+            m.p[1]*m.x[1] + m.p[2]*m.p[1] + 3))
+        self.assertEqual(len(params), 2)
+        self.assertIs(params[0], m.p[1])
+        self.assertIs(params[1], m.p[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -465,6 +465,124 @@ class TestComponentUID(unittest.TestCase):
             del cuids[obj]
         self.assertEqual(len(cuids), 0)
 
+class TestComponentUIDIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.m = ConcreteModel()
+        m = self.m
+        m.a = Param()
+        m.s = Set(initialize=[1,'2',3])
+        m.b = Block(m.s, m.s)
+        m.b[1,1].c = Block()
+        m.b[1,'2'].c = Block()
+        m.b[1,'2'].c.a = Param(m.s, initialize=3, mutable=True)
+        m.x = Var([1,'1'])
+
+    def tearDown(self):
+        self.m = None
+
+    def test_find(self):
+        m = self.m
+        index = ComponentUIDIndex(m)
+        for obj in [m.a, m.b, m.b[1,1], m.b[1,'2'].c, m.b[1,'2'].c.a,
+                    m.b[1,'2'].c.a[3], m.b[1,'2'].c.a['2'], m.x[1]]:
+            cuid = ComponentUID(obj)
+            self.assertIs(index.find(cuid), obj)
+            self.assertIs(index.find(repr(cuid)), obj)
+            self.assertIs(index.find(cuid._cids), obj)
+            self.assertIn(cuid, index)
+        self.assertIs(index.find('b[1,2].c.a[3]'), m.b[1,'2'].c.a[3])
+        self.assertIs(index.find('b:#1,$2.c.a:#3'), m.b[1,'2'].c.a[3])
+        self.assertIsNone(index.find('b:1,2.c.a:4'))
+        self.assertIsNone(index.find('b:**.c.a:*'))
+        self.assertNotIn('y', index)
+        # x[1] and x['1'] share a string representation
+        self.assertIs(index.find('x:#1'), m.x[1])
+        self.assertIs(index.find('x:$1'), m.x['1'])
+        self.assertIs(index.find('x[1]'), ComponentUID('x[1]').find_component(m))
+
+    def test_find_all(self):
+        m = self.m
+        index = ComponentUIDIndex(m)
+        objs = list(m.component_data_objects(descend_into=True))
+        cuids = [ComponentUID(obj) for obj in objs]
+        self.assertEqual(len(index), 16)
+        self.assertEqual(index.find_all(cuids), objs)
+        self.assertEqual(index.find_all(['a', 'b:1,4']), [m.a, None])
+
+    def test_cuids(self):
+        m = self.m
+        index = ComponentUIDIndex(m)
+        objs = list(m.component_objects(descend_into=True)) + \
+               list(m.component_data_objects(descend_into=True))
+        self.assertEqual(index.cuids(objs),
+                         [ComponentUID(obj) for obj in objs])
+        self.assertEqual(repr(index.cuid(m.b[1,'2'].c.a[3])),
+                         repr(ComponentUID(m.b[1,'2'].c.a[3])))
+        self.assertIsInstance(index.cuid(m.a), ComponentUID)
+
+    def test_context(self):
+        m = self.m
+        index = ComponentUIDIndex(m.b[1,'2'])
+        self.assertIs(index.find('c.a:3'), m.b[1,'2'].c.a[3])
+        self.assertEqual(index.cuid(m.b[1,'2'].c.a[3]),
+                         ComponentUID(m.b[1,'2'].c.a[3],
+                                      context=m.b[1,'2']))
+        self.assertRaisesRegexp(
+            ValueError, "Context .* does not apply",
+            index.cuid, m.a)
+
+    def test_structural_changes(self):
+        m = self.m
+        index = ComponentUIDIndex(m)
+        self.assertIsNone(index.find('y'))
+        # added components are picked up
+        m.y = Var([1,2])
+        m.b[1,1].c.z = Var()
+        self.assertIs(index.find('y:1'), m.y[1])
+        self.assertIs(index.find('b:1,1.c.z'), m.b[1,1].c.z)
+        self.assertEqual(repr(index.cuid(m.y[2])), 'y:#2')
+        # deleted components (and their subtrees) are dropped
+        c = m.b[1,'2'].c
+        m.b[1,'2'].del_component(c)
+        self.assertIsNone(index.find('b:1,$2.c'))
+        self.assertIsNone(index.find('b:1,$2.c.a:3'))
+        m.del_component(m.y)
+        m.del_component(m.y_index)
+        self.assertIsNone(index.find('y:1'))
+        m.y = Var([3])
+        self.assertIs(index.find('y:3'), m.y[3])
+        self.assertIsNone(index.find('y:1'))
+        # changes outside the indexed block are ignored
+        other = ConcreteModel()
+        other.w = Var()
+        self.assertIsNone(index.find('w'))
+        self.assertEqual(len(index._pending), 0)
+
+    def test_data_changes(self):
+        m = self.m
+        m.c = ConstraintList()
+        m.c.add(m.x[1] >= 0)
+        index = ComponentUIDIndex(m)
+        self.assertIs(index.find('c:1'), m.c[1])
+        m.c.add(m.x[1] <= 1)
+        self.assertIs(index.find('c:2'), m.c[2])
+        self.assertEqual(repr(index.cuid(m.c[2])), 'c:#2')
+        del m.c[1]
+        self.assertIsNone(index.find('c:1'))
+        del m.b[1,1]
+        self.assertIsNone(index.find('b:1,1.c'))
+
+    def test_invalidate(self):
+        m = self.m
+        index = ComponentUIDIndex(m)
+        self.assertIs(index.find('a'), m.a)
+        index.invalidate(m.b[1,'2'].c.a[3])
+        self.assertIs(index.find('b:1,$2.c.a:3'), m.b[1,'2'].c.a[3])
+        index.invalidate()
+        self.assertEqual(len(index), 16)
+
+
 class TestEnviron(unittest.TestCase):
 
     def test_components(self):
@@ -864,6 +864,64 @@ class TestArrayCon(unittest.TestCase):
         self.assertEqual(model.c[1](), 8)
         self.assertEqual(len(model.c), 2)
 
+    def test_rule_sparse(self):
+        model = self.create_model()
+        model.B = RangeSet(1,4)
+        calls = []
+        def f(model, i):
+            calls.append(i)
+            if i%2 == 0:
+                return Constraint.Skip
+            return model.x[i] >= i
+        model.x = Var(model.B, dense=False)
+        model.c = Constraint(model.A, rule=f, dense=False)
+
+        self.assertEqual(len(model.x), 0)
+        self.assertEqual(calls, [])
+
+        self.assertEqual(model.c[3].lower, 3)
+        self.assertEqual(calls, [3])
+        self.assertEqual(list(model.x.keys()), [3])
+        # Accessing an existing index does not re-evaluate the rule
+        model.c[3]
+        self.assertEqual(calls, [3])
+
+        self.assertRaisesRegexp( KeyError, "2", model.c.__getitem__, 2)
+        # Skipped indices do not re-evaluate the rule either
+        self.assertRaisesRegexp( KeyError, "2", model.c.__getitem__, 2)
+        self.assertEqual(calls, [3,2])
+
+        # Iteration evaluates the remaining indices
+        self.assertEqual(sorted(model.c.keys()), [1,3])
+        self.assertEqual(sorted(model.x.keys()), [1,3])
+        self.assertEqual(sorted(calls), [1,2,3,4])
+        model.c.to_dense_data()
+        self.assertEqual(sorted(calls), [1,2,3,4])
+
+    def test_rule_sparse_iteration(self):
+        model = self.create_model()
+        model.x = Var(model.A, dense=False)
+        model.c = Constraint(model.A, rule=lambda m,i: m.x[i] >= 0,
+                             dense=False)
+        self.assertEqual(
+            len(list(model.component_data_objects(Constraint,
+                                                  active=True))),
+            len(model.A))
+        model.d = Constraint(model.A, rule=lambda m,i: m.x[i] >= 0,
+                             dense=False)
+        self.assertEqual(len(model.d), len(model.A))
+        model.e = Constraint(model.A, rule=lambda m,i: m.x[i] >= 0,
+                             dense=False)
+        self.assertEqual(len(list(model.e.values())), len(model.A))
+
+    def test_rule_sparse_deactivated(self):
+        model = self.create_model()
+        model.x = Var(model.A, dense=False)
+        model.c = Constraint(model.A, rule=lambda m,i: m.x[i] >= 0,
+                             dense=False)
+        model.c.deactivate()
+        self.assertFalse(model.c[1].active)
+
     def test_dim(self):
         model = self.create_model()
         model.c = Constraint(model.A)
@@ -0,0 +1,165 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for parsing data commands
+#
+
+import glob
+import os
+import shutil
+import tempfile
+from os.path import abspath, dirname
+
+import pyutilib.th as unittest
+
+import pyomo.core.data.parse_datacmds as parse_datacmds
+from pyomo.core.data.parse_datacmds import parse_data_commands
+from pyomo.core.data.data_cache import DataCache
+
+currdir = dirname(abspath(__file__))+os.sep
+
+
+def _as_numbers(cmd):
+    # Convert numeric strings as _process_token() does
+    if type(cmd) is list:
+        return [_as_numbers(x) for x in cmd]
+    if type(cmd) is dict:
+        return dict((k, _as_numbers(v)) for k, v in cmd.items())
+    if type(cmd) is not str:
+        return cmd
+    try:
+        return int(cmd)
+    except ValueError:
+        pass
+    try:
+        return float(cmd)
+    except ValueError:
+        pass
+    return cmd
+
+
+class TestParseDataCommands(unittest.TestCase):
+
+    def setUp(self):
+        self.cachedir = tempfile.mkdtemp()
+        self.cache_min_size = parse_datacmds.cache_min_size
+        parse_datacmds.cache_min_size = 0
+
+    def tearDown(self):
+        parse_datacmds.cache_min_size = self.cache_min_size
+        shutil.rmtree(self.cachedir)
+
+    def test_scanner_matches_grammar(self):
+        for fname in sorted(glob.glob(currdir+'*.dat')):
+            with open(fname) as f:
+                data = f.read()
+            try:
+                ply_info = parse_datacmds._ply_parse(data, 0, None)
+            except IOError:
+                self.assertRaises(parse_datacmds._ScanError,
+                                  parse_datacmds._scan_data_commands, data)
+                continue
+            self.assertEqual(
+                _as_numbers(parse_datacmds._scan_data_commands(data)),
+                _as_numbers(ply_info), fname)
+
+    def test_data_values(self):
+        info = parse_data_commands(data="""
+set A := a 1 -2.5 "b" 'c d' True;
+set B[1,'x'] := (1,2) *;
+param p default 0 := [1,*] 2 1e3;
+namespace ns { param q := 1; }
+include "foo.dat";
+""")
+        self.assertEqual(info[None], [
+            ['set', 'A', ':=', 'a', 1, -2.5, 'b', "'c d'", 'True'],
+            ['set', 'B', '[', '1', "'x'", ']', ':=',
+             '(', 1, ',', 2, ')', '*'],
+            ['param', 'p', 'default', '0', ':=', '[1,*]', 2, 1000.0],
+            ['include', '"foo.dat"'],
+            ])
+        self.assertEqual(info['ns'], [['param', 'q', ':=', 1]])
+
+    def test_syntax_error(self):
+        try:
+            parse_data_commands(data="set A := 1 2;\nset := 3;")
+            self.fail("Expected IOError")
+        except IOError as e:
+            self.assertIn("Syntax error at token COLONEQ", str(e))
+        self.assertRaises(IOError, parse_data_commands,
+                          data="param p := 1 data;")
+
+    def test_cache(self):
+        fname = os.path.join(self.cachedir, 'data.dat')
+        with open(fname, 'w') as f:
+            f.write("set A := 1 2 3;\nparam p := 1 1.5 2 2.5;\n")
+        cache = DataCache(os.path.join(self.cachedir, 'cache'))
+        info = parse_data_commands(filename=fname, cache=cache)
+        self.assertEqual(info[None], [['set', 'A', ':=', 1, 2, 3],
+                                      ['param', 'p', ':=', 1, 1.5, 2, 2.5]])
+        self.assertEqual(cache.stats()['entries'], 1)
+
+        _parse = parse_datacmds._parse
+        try:
+            parse_datacmds._parse = None
+            # Unchanged file
+            self.assertEqual(
+                parse_data_commands(filename=fname, cache=cache), info)
+            # Touched file with the same contents
+            stat = os.stat(fname)
+            os.utime(fname, (stat.st_atime, stat.st_mtime+10))
+            self.assertEqual(
+                parse_data_commands(filename=fname, cache=cache.directory),
+                info)
+        finally:
+            parse_datacmds._parse = _parse
+        self.assertEqual(cache.hits, 1)
+
+        # Modified file
+        with open(fname, 'w') as f:
+            f.write("set A := 4;\n")
+        self.assertEqual(
+            parse_data_commands(filename=fname, cache=cache),
+            {None: [['set', 'A', ':=', 4]]})
+        self.assertEqual(cache.stats()['entries'], 2)
+
+        # The cache size is limited
+        cache.size_limit = 0
+        with open(fname, 'w') as f:
+            f.write("set A := 5;\n")
+        parse_data_commands(filename=fname, cache=cache)
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_cache_disabled(self):
+        fname = os.path.join(self.cachedir, 'data.dat')
+        with open(fname, 'w') as f:
+            f.write("set A := 1 2 3;\n")
+        cachedir = os.path.join(self.cachedir, 'cache')
+        self.assertIsNone(parse_datacmds.default_cache)
+        parse_data_commands(filename=fname)
+        try:
+            parse_datacmds.default_cache = cachedir
+            parse_data_commands(filename=fname)
+            self.assertEqual(len(os.listdir(cachedir)), 1)
+        finally:
+            parse_datacmds.default_cache = None
+
+    def test_cache_small_files(self):
+        parse_datacmds.cache_min_size = 1 << 20
+        fname = os.path.join(self.cachedir, 'data.dat')
+        with open(fname, 'w') as f:
+            f.write("set A := 1 2 3;\n")
+        cachedir = os.path.join(self.cachedir, 'cache')
+        parse_data_commands(filename=fname, cache=cachedir)
+        self.assertFalse(os.path.exists(cachedir))
+
+
+if __name__ == "__main__":
+    unittest.main()
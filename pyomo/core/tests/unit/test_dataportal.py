@@ -12,6 +12,8 @@
 #
 
 import os
+import shutil
+import tempfile
 from os.path import abspath, dirname
 pyomo_dir=dirname(dirname(abspath(__file__)))+os.sep+".."+os.sep+".."
 
@@ -19,6 +21,8 @@ import pyutilib.common
 import pyutilib.th as unittest
 
 from pyomo.core.base.plugin import DataManagerFactory
+from pyomo.core.data.TableData import TableData
+from pyomo.core.data.data_cache import DataCache
 from pyomo.environ import *
 
 try:
@@ -51,6 +55,15 @@ try:
     yaml_interface = DataManagerFactory('yaml').available()
 except:
     yaml_interface = False
+try:
+    sqlite3_interface = DataManagerFactory('sqlite3').available()
+except:
+    sqlite3_interface = False
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
 
 
 
@@ -1632,5 +1645,364 @@ class TestTableCmd(unittest.TestCase):
         os.remove(currdir+'loadComplex.dat')
 
 
+class TestColumnarTables(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.chunksize = TableData.chunksize
+
+    def tearDown(self):
+        TableData.chunksize = self.chunksize
+        TableData.columnar = True
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, rows, sep=','):
+        fname = os.path.join(self.tmpdir, name)
+        with open(fname, 'w') as f:
+            for row in rows:
+                f.write(sep.join(row)+'\n')
+        return fname
+
+    def load(self, columnar, **kwds):
+        TableData.columnar = columnar
+        data = DataPortal()
+        data.load(**kwds)
+        return data.data()
+
+    def compare(self, **kwds):
+        # Use several chunks for the test tables
+        TableData.chunksize = 2
+        ans = self.load(True, **kwds)
+        self.assertEqual(ans, self.load(False, **kwds))
+        return ans
+
+    def test_table(self):
+        rows = [['I', 'J', 'a', 'b'],
+                ['1', 'x', '1.5', '2'],
+                ['1', 'y', '.', 'True'],
+                ['2', 'x', '2', 'abc'],
+                ['3', 'z', '1e3', '.'],
+                ['3', 'x', '-1', '"q"']]
+        for ext, sep in (('csv', ','), ('tab', ' ')):
+            fname = self.write('table.'+ext, rows, sep)
+            ans = self.compare(filename=fname, param=('a', 'b'), index='K')
+            self.assertEqual(ans['K'], {None: [(1, 'x'), (1, 'y'), (2, 'x'),
+                                               (3, 'z'), (3, 'x')]})
+            self.assertEqual(ans['a'], {(1, 'x'): 1.5, (2, 'x'): 2,
+                                        (3, 'z'): 1000.0, (3, 'x'): -1})
+            self.assertIs(type(ans['a'][2, 'x']), int)
+            self.assertEqual(ans['b'], {(1, 'x'): 2, (1, 'y'): True,
+                                        (2, 'x'): 'abc', (3, 'x'): 'q'})
+            ans = self.compare(filename=fname, param='a', select=('J', 'a'))
+            self.assertEqual(ans, {'a': {'x': -1, 'z': 1000.0}})
+
+    def test_set(self):
+        fname = self.write('set.csv', [['A'], ['1'], ['2.5'], ['x'], ['1']])
+        ans = self.compare(filename=fname, format='set', set='A')
+        self.assertEqual(ans, {'A': {None: [1, 2.5, 'x', 1]}})
+        fname = self.write('set2.csv', [['A', 'B'], ['1', 'x'], ['2', 'y'],
+                                        ['3', 'z']])
+        ans = self.compare(filename=fname, format='set', set='A')
+        self.assertEqual(ans, {'A': {None: [(1, 'x'), (2, 'y'), (3, 'z')]}})
+
+    def test_special_cells(self):
+        # Tables with cells that data commands interpret (here, a set
+        # template and a short row) are read again as data commands
+        fname = self.write('set.csv', [['A', 'B'], ['1', 'x'], ['2', 'y'],
+                                       ['*', 'z'], ['3']])
+        self.compare(filename=fname, format='set', set='A')
+        fname = self.write('param.csv', [['I', 'a'], ['1', '2'], ['(', '3'],
+                                         ['4', ')']])
+        self.compare(filename=fname, param='a')
+
+
+@unittest.skipIf(not sqlite3_interface, "No sqlite3 interface available")
+class TestDatabaseTables(unittest.TestCase):
+
+    def setUp(self):
+        import sqlite3
+        self.tmpdir = tempfile.mkdtemp()
+        self.chunksize = TableData.chunksize
+        self.filename = os.path.join(self.tmpdir, 'data.sqlite')
+        con = sqlite3.connect(self.filename)
+        con.execute("CREATE TABLE T (I TEXT, J INTEGER, a REAL, b TEXT)")
+        con.executemany("INSERT INTO T VALUES (?,?,?,?)",
+                        [('x', 1, 1.5, '2'), ('x', 2, None, 'abc'),
+                         ('y', 1, 3.0, None), ('z', 3, -1.0, 'True')])
+        con.commit()
+        con.close()
+
+    def tearDown(self):
+        TableData.chunksize = self.chunksize
+        TableData.columnar = True
+        shutil.rmtree(self.tmpdir)
+
+    def load(self, columnar):
+        TableData.columnar = columnar
+        data = DataPortal()
+        data.load(filename=self.filename, using='sqlite3', table='T',
+                  param=('a', 'b'), index='K')
+        data.load(filename=self.filename, using='sqlite3',
+                  query="SELECT I FROM T", set='A')
+        self.assertEqual(len(data._connections), 1)
+        data.close_connections()
+        self.assertEqual(len(data._connections), 0)
+        return data.data()
+
+    def test_table(self):
+        # Use several chunks for the test table
+        TableData.chunksize = 3
+        ans = self.load(True)
+        self.assertEqual(ans, self.load(False))
+        self.assertEqual(ans['K'], {None: [('x', 1), ('x', 2), ('y', 1),
+                                           ('z', 3)]})
+        self.assertEqual(ans['a'], {('x', 1): 1.5, ('y', 1): 3.0,
+                                    ('z', 3): -1.0})
+        self.assertEqual(ans['b'], {('x', 1): 2, ('x', 2): 'abc',
+                                    ('z', 3): True})
+        self.assertEqual(ans['A'], {None: ['x', 'x', 'y', 'z']})
+
+    def test_load_command(self):
+        fname = os.path.join(self.tmpdir, 'data.dat')
+        with open(fname, 'w') as f:
+            f.write('load "%s" using=sqlite3 query="SELECT I,J,a FROM T" '
+                    ': K=[I,J] a ;\n' % self.filename)
+            f.write('load "%s" using=sqlite3 query="SELECT I,J,b FROM T" '
+                    ': [I,J] b ;\n' % self.filename)
+        data = DataPortal()
+        data.load(filename=fname)
+        self.assertEqual(len(data._connections), 1)
+        self.assertEqual(data.data('a'), {('x', 1): 1.5, ('y', 1): 3.0,
+                                          ('z', 3): -1.0})
+        self.assertEqual(data.data('b'), {('x', 1): 2, ('x', 2): 'abc',
+                                          ('z', 3): True})
+        data.close_connections()
+
+
+class TestDataCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = DataCache(os.path.join(self.tmpdir, 'cache'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, text):
+        fname = os.path.join(self.tmpdir, name)
+        with open(fname, 'w') as f:
+            f.write(text)
+        return fname
+
+    def load(self, **kwds):
+        data = DataPortal(cache=self.cache)
+        data.load(**kwds)
+        return data
+
+    def test_table(self):
+        fname = self.write('table.csv', "I,a,b\n1,2,x\n2,3.5,y\n")
+        ans = self.load(filename=fname, param=('a', 'b'), index='I')
+        self.assertEqual(self.cache.stats()['misses'], 1)
+        self.assertEqual(self.cache.stats()['writes'], 1)
+        data = self.load(filename=fname, param=('a', 'b'), index='I')
+        self.assertEqual(data.data(), ans.data())
+        self.assertEqual(data.data('a'), {1: 2, 2: 3.5})
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        # Different options and different file contents are cached
+        # separately
+        self.load(filename=fname, param='a', select=('I', 'a'))
+        self.write('table.csv', "I,a,b\n1,2,x\n")
+        data = self.load(filename=fname, param=('a', 'b'), index='I')
+        self.assertEqual(data.data('a'), {1: 2})
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']),
+                         (1, 3, 3))
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_model(self):
+        fname = self.write('data.dat', "param p := 1 2 2 3;\n")
+        model = AbstractModel()
+        model.p = Param([1, 2])
+        instance = model.create_instance(DataPortal(filename=fname,
+                                                    model=model,
+                                                    cache=self.cache))
+        self.assertEqual(instance.p[2], 3)
+        data = DataPortal(filename=fname, model=model, cache=self.cache)
+        self.assertEqual(data.data('p'), {1: 2, 2: 3})
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        # The data is not shared by models with different declarations
+        model.q = Param()
+        DataPortal(filename=fname, model=model, cache=self.cache)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_include(self):
+        included = self.write('included.dat', "set A := 1 2;\n")
+        fname = self.write('data.dat', 'include "%s";\nparam p := 1 2;\n'
+                           % included)
+        data = self.load(filename=fname)
+        self.assertEqual(data.data('A'), [1, 2])
+        self.load(filename=fname)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.write('included.dat', "set A := 3;\n")
+        data = self.load(filename=fname)
+        self.assertEqual(data.data('A'), [3])
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_eviction(self):
+        self.cache.size_limit = 0
+        fname = self.write('table.csv', "I,a\n1,2\n")
+        self.load(filename=fname, param='a')
+        stats = self.cache.stats()
+        self.assertEqual((stats['writes'], stats['evictions'],
+                          stats['entries']), (1, 1, 0))
+
+
+class TestLoadAll(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.sources = []
+        for i in range(6):
+            fname = os.path.join(self.tmpdir, 'p%d.csv' % i)
+            with open(fname, 'w') as f:
+                f.write("I,p%d\n" % i)
+                for j in range(20):
+                    f.write("%d,%d\n" % (j, i*j))
+            self.sources.append({'filename': fname, 'param': 'p%d' % i,
+                                 'index': 'I'})
+        fname = os.path.join(self.tmpdir, 'q.dat')
+        with open(fname, 'w') as f:
+            f.write("param q := 1 2 3 4;\nset I := 1 2;\n")
+        self.sources.append(fname)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def serial(self, sources):
+        data = DataPortal()
+        for source in sources:
+            if isinstance(source, dict):
+                data.load(**source)
+            else:
+                data.load(filename=source)
+        return data.data()
+
+    def test_load_all(self):
+        for processes in (False, True):
+            data = DataPortal()
+            data.load_all(self.sources, max_workers=3, processes=processes)
+            self.assertEqual(data.data(), self.serial(self.sources))
+            # The data in later sources replaces the data in earlier ones
+            self.assertEqual(data.data('I'), [1, 2])
+            data = DataPortal()
+            data.load_all(self.sources[::-1], max_workers=3,
+                          processes=processes)
+            self.assertEqual(data.data(), self.serial(self.sources[::-1]))
+            self.assertEqual(data.data('I'), list(range(20)))
+
+    def test_create_instance(self):
+        model = AbstractModel()
+        model.I = Set()
+        model.J = RangeSet(0, 19)
+        model.p0 = Param(model.J)
+        model.p5 = Param(model.J)
+        model.q = Param([1, 3])
+        instance = model.create_instance([self.sources[0], self.sources[5],
+                                          self.sources[6]])
+        self.assertEqual(list(instance.I), [1, 2])
+        self.assertEqual(instance.p5[2], 10)
+        self.assertEqual(instance.q[3], 4)
+
+    def test_errors(self):
+        missing = os.path.join(self.tmpdir, 'missing.csv')
+        bad = os.path.join(self.tmpdir, 'bad.dat')
+        with open(bad, 'w') as f:
+            f.write("param p := 1;\n")
+        data = DataPortal()
+        try:
+            data.load_all([self.sources[0], missing, self.sources[1], bad],
+                          max_workers=2)
+            self.fail("Expected DataLoadError")
+        except IOError as e:
+            self.assertEqual([x[0] for x in e.errors], [missing, bad])
+            self.assertIn("Failed to load 2 of 4 data sources", str(e))
+            self.assertIn(bad+": ValueError", str(e))
+        self.assertEqual(list(data.namespaces()), [])
+
+
+@unittest.skipIf(not numpy_available, "NumPy is not available")
+class TestNumPyArrays(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.array = numpy.arange(6, dtype=float).reshape(2, 3)
+        self.array[1, 1] = numpy.nan
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_npy(self):
+        fname = os.path.join(self.tmpdir, 'p.npy')
+        numpy.save(fname, self.array)
+        data = DataPortal()
+        data.load(filename=fname, param='p', index=('I', 'J'))
+        self.assertIsInstance(data.data('p').array, numpy.memmap)
+        self.assertEqual(dict(data.data('p')),
+                         {(0, 0): 0, (0, 1): 1, (0, 2): 2, (1, 0): 3, (1, 2): 5})
+        self.assertEqual(len(data.data('p')), 5)
+        self.assertEqual(data.data('p')[1, 2], 5)
+        self.assertNotIn((1, 1), data.data('p'))
+        self.assertNotIn((2, 0), data.data('p'))
+
+        # Axes are labeled by the members of constructed sets
+        model = ConcreteModel()
+        model.I = Set(initialize=['a', 'b'], ordered=True)
+        model.J = Set(initialize=[3, 2, 1], ordered=True)
+        data = DataPortal(model=model)
+        data.load(filename=fname, param='p', index=(model.I, model.J))
+        self.assertEqual(dict(data.data('p')),
+                         {('a', 3): 0, ('a', 2): 1, ('a', 1): 2, ('b', 3): 3,
+                          ('b', 1): 5})
+        model.I.add('c')
+        data = DataPortal(model=model)
+        self.assertRaises(IOError, data.load, filename=fname, param='p',
+                          index=(model.I, model.J))
+
+        fname = os.path.join(self.tmpdir, 'A.npy')
+        numpy.save(fname, numpy.array([[1, 2], [3, 4]]))
+        data = DataPortal()
+        data.load(filename=fname, set='A')
+        self.assertEqual(data.data('A'), [(1, 2), (3, 4)])
+
+    def test_npz(self):
+        for save in (numpy.savez, numpy.savez_compressed):
+            fname = os.path.join(self.tmpdir, 'data.npz')
+            save(fname, p=self.array, q=numpy.array(3.5),
+                 I=numpy.array(['x', 'y']), J=numpy.array([10, 20, 30]))
+            data = DataPortal()
+            data.load(filename=fname, index=('I', 'J'))
+            if save is numpy.savez:
+                self.assertIsInstance(data.data('p').array, numpy.memmap)
+            self.assertEqual(data.data('I'), ['x', 'y'])
+            self.assertEqual(data.data('J'), [10, 20, 30])
+            self.assertEqual(data.data('q'), 3.5)
+            model = AbstractModel()
+            model.I = Set()
+            model.J = Set()
+            model.p = Param(model.I, model.J)
+            model.q = Param()
+            instance = model.create_instance(data)
+            self.assertEqual(instance.p['y', 30], 5)
+            self.assertEqual(len(instance.p), 5)
+            self.assertEqual(value(instance.q), 3.5)
+
+            data = DataPortal()
+            data.load(filename=fname, param='p')
+            self.assertEqual(sorted(data.data()), ['p'])
+            self.assertEqual(data.data('p')[1, 0], 3)
+            self.assertRaises(IOError, DataPortal().load, filename=fname,
+                              param='r')
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,212 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for exporting instance data
+#
+
+import os
+import shutil
+import tempfile
+
+import pyutilib.th as unittest
+
+from pyomo.environ import *
+from pyomo.core.base.instance2dat import export_instance, instance_checkpoint
+
+try:
+    import numpy
+    numpy_available=True
+except ImportError:
+    numpy_available=False
+
+data = """
+set I := a 'b c' 3 ;
+set J := 1 2 ;
+set S := (1,x) (2,'y z') ;
+param p := a 1 0.1 a 2 1e-20 3 1 7 ;
+param q := 2.5 ;
+param r := a True 3 'foo bar' ;
+"""
+
+
+class TestExportInstance(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        model = AbstractModel()
+        model.I = Set()
+        model.J = Set()
+        model.S = Set(dimen=2)
+        model.K = Set(initialize=[1, 2])
+        model.p = Param(model.I, model.J)
+        model.q = Param()
+        model.r = Param(model.I, within=Any)
+        model.s = Param(model.J, initialize={1: 10, 2: 20}, mutable=True)
+        model.x = Var(model.I, model.J)
+        self.model = model
+        datfile = os.path.join(self.tmpdir, 'data.dat')
+        with open(datfile, 'w') as f:
+            f.write(data)
+        self.instance = model.create_instance(datfile)
+        self.instance.x['a', 1].value = 1.5
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_instance2dat(self):
+        fname = os.path.join(self.tmpdir, 'out.dat')
+        instance2dat(self.instance, fname)
+        with open(fname) as f:
+            text = f.read()
+        self.assertNotIn('param x', text)
+        instance = self.model.create_instance(fname)
+        for name in ('I', 'J', 'S', 'K'):
+            self.assertEqual(set(getattr(instance, name)),
+                             set(getattr(self.instance, name)))
+        for name in ('p', 'r', 's'):
+            self.assertEqual(getattr(instance, name).extract_values(),
+                             getattr(self.instance, name).extract_values())
+        self.assertEqual(value(instance.q), 2.5)
+
+    def test_dat_variables(self):
+        instance = ConcreteModel()
+        instance.I = Set(initialize=['a', 'b', 'c'])
+        instance.x = Var(instance.I)
+        instance.x['a'].value = 1.5
+        instance.x['c'].value = -2
+        fname = os.path.join(self.tmpdir, 'out.dat')
+        export_instance(instance, fname)
+        model = AbstractModel()
+        model.I = Set()
+        model.x = Param(model.I)
+        instance = model.create_instance(fname)
+        self.assertEqual(instance.x.extract_values(), {'a': 1.5, 'c': -2})
+
+    def test_default(self):
+        instance = ConcreteModel()
+        instance.I = Set(initialize=[1, 2, 3])
+        instance.p = Param(instance.I, initialize={1: 5}, default=0)
+        instance.q = Param(instance.I, initialize={1: 5}, default=0,
+                           mutable=True)
+        instance.r = Param(instance.I, initialize={1: 5},
+                           default=lambda m, i: 10*i)
+        checkpoint = instance_checkpoint(instance)
+        fname = os.path.join(self.tmpdir, 'out.dat')
+        export_instance(instance, fname)
+        with open(fname) as f:
+            text = f.read()
+        self.assertIn('param p default 0 :=', text)
+        model = AbstractModel()
+        model.I = Set()
+        model.p = Param(model.I)
+        model.q = Param(model.I)
+        model.r = Param(model.I)
+        loaded = model.create_instance(fname)
+        self.assertEqual([loaded.p[i] for i in loaded.I], [5, 0, 0])
+        self.assertEqual([loaded.q[i] for i in loaded.I], [5, 0, 0])
+        self.assertEqual(loaded.r.extract_values(), {1: 5, 2: 20, 3: 30})
+        dirname = os.path.join(self.tmpdir, 'out')
+        export_instance(instance, dirname, format='csv')
+        with open(os.path.join(dirname, 'q.csv')) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines, ["index_1,q", "1,5", "2,0", "3,0"])
+        if numpy_available:
+            fname = os.path.join(self.tmpdir, 'out.npz')
+            export_instance(instance, fname)
+            self.assertEqual(numpy.load(fname)['p'].tolist(), [5, 0, 0])
+        self.assertEqual(instance_checkpoint(instance), checkpoint)
+        # The default values were not stored in the parameters
+        self.assertEqual(len(instance.q._data), 1)
+
+    def test_csv(self):
+        dirname = os.path.join(self.tmpdir, 'out')
+        export_instance(self.instance, dirname, format='csv')
+        self.assertEqual(sorted(os.listdir(dirname)),
+                         ['I.csv', 'J.csv', 'K.csv', 'S.csv', 'p.csv',
+                          'q.csv', 'r.csv', 's.csv', 'x.csv'])
+        with open(os.path.join(dirname, 'p.csv')) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], "index_1,index_2,p")
+        self.assertEqual(sorted(lines[1:]), ["3,1,7", "a,1,0.1", "a,2,1e-20"])
+        with open(os.path.join(dirname, 'S.csv')) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], "S_1,S_2")
+        self.assertEqual(sorted(lines[1:]), ["1,x", "2,y z"])
+        with open(os.path.join(dirname, 'x.csv')) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], "index_1,index_2,x")
+        self.assertIn("a,1,1.5", lines)
+        self.assertIn("3,2,.", lines)
+        data = DataPortal(model=self.model)
+        data.load(filename=os.path.join(dirname, 'p.csv'), param='p',
+                  format='table')
+        self.assertEqual(data.data('p'), {('a', 1): 0.1, ('a', 2): 1e-20,
+                                          (3, 1): 7})
+
+    @unittest.skipIf(not numpy_available, "NumPy is not available")
+    def test_npz(self):
+        fname = os.path.join(self.tmpdir, 'out.npz')
+        export_instance(self.instance, fname)
+        arrays = numpy.load(fname, allow_pickle=True)
+        self.assertEqual(sorted(arrays.files),
+                         ['I', 'J', 'K', 'S', 'p', 'q', 'r', 'r_index', 's',
+                          'x'])
+        self.assertEqual(arrays['p'].shape, (3, 2))
+        self.assertEqual(int(numpy.isnan(arrays['p']).sum()), 3)
+        self.assertEqual(arrays['q'].item(), 2.5)
+        # Values that mix strings with other values keep their types
+        self.assertEqual(arrays['r'].tolist(), [True, 'foo bar'])
+        self.assertEqual(sorted(arrays['I'].tolist(), key=str),
+                         [3, 'a', 'b c'])
+        self.assertEqual(arrays['J'].dtype.kind, 'i')
+        self.assertEqual(sorted(tuple(row) for row in arrays['S'].tolist()),
+                         [(1, 'x'), (2, 'y z')])
+        data = DataPortal(model=self.instance)
+        data.load(filename=fname, param='p', index=('I', 'J'))
+        self.assertEqual(dict(data.data('p')),
+                         {('a', 1): 0.1, ('a', 2): 1e-20, (3, 1): 7})
+
+    @unittest.skipIf(not numpy_available, "NumPy is not available")
+    def test_npz_mixed_set(self):
+        instance = ConcreteModel()
+        instance.A = Set(initialize=['a', 1])
+        fname = os.path.join(self.tmpdir, 'out.npz')
+        export_instance(instance, fname)
+        model = AbstractModel()
+        model.A = Set()
+        data = DataPortal(model=model)
+        data.load(filename=fname, set='A')
+        self.assertEqual(sorted(data.data('A'), key=str), [1, 'a'])
+        loaded = model.create_instance(data)
+        self.assertIn(1, loaded.A)
+        self.assertNotIn('1', loaded.A)
+
+    def test_since(self):
+        checkpoint = instance_checkpoint(self.instance)
+        self.assertEqual(sorted(checkpoint),
+                         ['I', 'J', 'K', 'S', 'p', 'q', 'r', 's', 'x'])
+        self.instance.x['b c', 2].value = 3
+        self.instance.s[1] = 11
+        dirname = os.path.join(self.tmpdir, 'out')
+        export_instance(self.instance, dirname, format='csv',
+                        since=checkpoint)
+        self.assertEqual(sorted(os.listdir(dirname)), ['s.csv', 'x.csv'])
+        self.assertEqual(
+            sorted(instance_checkpoint(self.instance, variables=False)),
+            ['I', 'J', 'K', 'S', 'p', 'q', 'r', 's'])
+
+    def test_bad_format(self):
+        with self.assertRaises(ValueError):
+            export_instance(self.instance,
+                            os.path.join(self.tmpdir, 'out.txt'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -28,6 +28,12 @@ from pyomo.core.base.expr import identify_variables
 
 solvers = pyomo.opt.check_available_solvers('glpk')
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 try:
     import yaml
     yaml_available=True
@@ -792,6 +798,122 @@ class Test(unittest.TestCase):
         model.x = Var()
         instance = model.create_instance()
 
+
+class TestLoadArrays(unittest.TestCase):
+
+    def _model(self):
+        model = ConcreteModel()
+        model.x = Var([1,2,3])
+        model.y = Var(initialize=5)
+        model.y.fix()
+        model.c = Constraint(expr=model.x[1] + model.x[2] >= 1)
+        model.d = Constraint(expr=model.x[3] <= 4)
+        model.dual = Suffix(direction=Suffix.IMPORT)
+        model.rc = Suffix(direction=Suffix.IMPORT)
+        return model
+
+    def test_objects(self):
+        model = self._model()
+        model.dual[model.d] = 7.0
+        model.x[3].value = 9
+        model.solutions.load_arrays(
+            variables=[model.x[1], model.x[2], model.y],
+            values=[1.0, 2.0, 3.0],
+            variable_suffixes={'rc': [0.5, 0.25, 0], 'urc': [1, 1, 1]},
+            constraints=[model.c],
+            constraint_suffixes={'dual': [4.0]})
+        self.assertEqual(model.x[1].value, 1.0)
+        self.assertEqual(model.x[2].value, 2.0)
+        self.assertFalse(model.x[2].stale)
+        self.assertTrue(model.x[3].stale)
+        self.assertEqual(model.x[3].value, 9)
+        # fixed variables are ignored
+        self.assertEqual(model.y.value, 5)
+        self.assertEqual(model.rc[model.x[1]], 0.5)
+        self.assertEqual(model.dual[model.c], 4.0)
+        # import suffixes are cleared before loading
+        self.assertNotIn(model.d, model.dual)
+        self.assertEqual(len(model.solutions), 0)
+
+        self.assertRaisesRegexp(
+            TypeError, "currently fixed",
+            model.solutions.load_arrays,
+            variables=[model.y], values=[3.0], ignore_fixed_vars=False)
+        model.solutions.load_arrays(
+            variables=[model.y], values=[5.0], ignore_fixed_vars=False,
+            allow_consistent_values_for_fixed_vars=True)
+        self.assertRaisesRegexp(
+            ValueError, "2 values given for 1 variables",
+            model.solutions.load_arrays,
+            variables=[model.x[1]], values=[1, 2])
+
+    def test_symbols(self):
+        model = self._model()
+        model.o = Objective(expr=model.x[1])
+        smap = model.write(os.devnull, format='lp',
+                           io_options={'symbolic_solver_labels': True})[1]
+        model.solutions.load_arrays(
+            variables=['x(2)', 'bad', 'x(1)'],
+            values=[2.0, 0.0, 1.0],
+            constraints=['c_l_c_'],
+            constraint_suffixes={'dual': [4.0]},
+            smap_id=smap,
+            ignore_invalid_labels=True)
+        self.assertEqual(model.x[1].value, 1.0)
+        self.assertEqual(model.x[2].value, 2.0)
+        self.assertEqual(model.dual[model.c], 4.0)
+        self.assertRaisesRegexp(
+            RuntimeError, "Symbol bad is missing",
+            model.solutions.load_arrays,
+            variables=['bad'], values=[0.0], smap_id=smap)
+
+    def test_lean_results(self):
+        model = self._model()
+        results = pyomo.opt.SolverResults()
+        results.solver.status = pyomo.opt.SolverStatus.ok
+        soln = results.solution.add()
+        soln.status = SolutionStatus.optimal
+        soln.set_arrays('variable', ['x[1]', 'x[2]', 'y'],
+                        Value=[1.0, 2.0, 3.0], Rc=[0.5, None, 0.0])
+        soln.set_arrays('constraint', ['c', 'd'], Dual=[4.0, None])
+        soln._cuid = False
+        model.solutions.load_from(results)
+        self.assertIsNotNone(soln.get_arrays('variable'))
+        self.assertEqual(model.x[1].value, 1.0)
+        self.assertEqual(model.x[2].value, 2.0)
+        self.assertTrue(model.x[3].stale)
+        self.assertEqual(model.y.value, 5)
+        self.assertEqual(model.rc[model.x[1]], 0.5)
+        self.assertNotIn(model.x[2], model.rc)
+        self.assertEqual(model.dual[model.c], 4.0)
+        self.assertNotIn(model.d, model.dual)
+
+        # The solution can be selected again, stored and pickled
+        model.x[1].value = 0
+        model.solutions.select(0)
+        self.assertEqual(model.x[1].value, 1.0)
+        results = pyomo.opt.SolverResults()
+        model.solutions.store_to(results)
+        self.assertEqual(results.solution(0).variable['x[1]'],
+                         {'Value': 1.0, 'Rc': 0.5})
+        self.assertEqual(results.solution(0).constraint, {'c': {'Dual': 4.0}})
+        inst = pickle.loads(pickle.dumps(model))
+        inst.x[1].value = 0
+        inst.solutions.select(0)
+        self.assertEqual(inst.x[1].value, 1.0)
+
+    @unittest.skipIf(not numpy_available, "NumPy is not available")
+    def test_numpy(self):
+        import numpy
+        model = self._model()
+        model.solutions.load_arrays(
+            variables=[model.x[1], model.x[2]],
+            values=numpy.array([1.0, 2.0]),
+            variable_suffixes={'rc': numpy.array([3.0, 4.0])})
+        self.assertIs(type(model.x[2].value), float)
+        self.assertEqual(model.rc[model.x[2]], 4.0)
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,117 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for evaluating Constraint / Expression rules in parallel
+#
+
+import sys
+
+import pyutilib.th as unittest
+
+from pyomo.environ import *
+from pyomo.util.log import LoggingIntercept
+from pyomo.core.base import parallel_construction
+
+from six import StringIO
+
+_fork_available = not sys.platform.startswith('win')
+
+
+@unittest.skipIf(not _fork_available, "fork() is not available")
+class TestParallelConstruction(unittest.TestCase):
+
+    def _model(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2, 5, 4, 7, 6, 9, 8, 10], ordered=True)
+        m.p = Param(m.I, initialize=lambda m, i: 2*i, mutable=True)
+        m.x = Var(m.I, bounds=(0, None))
+        m.y = Var(m.I, dense=False)
+        m.b = Block()
+        m.b.z = Var()
+        return m
+
+    def test_constraint(self):
+        m = self._model()
+        def rule(m, i):
+            if i % 4 == 0:
+                return Constraint.Skip
+            return (0, m.p[i]*m.x[i] + i*m.y[i] + m.b.z, i)
+        m.c = Constraint(m.I, rule=rule, parallel=3)
+        m.d = Constraint(m.I, rule=rule)
+        self.assertEqual(list(m.c.keys()), list(m.d.keys()))
+        self.assertEqual(list(m.c.keys()), [3, 1, 2, 5, 7, 6, 9, 10])
+        for i in m.c:
+            self.assertEqual(str(m.c[i].body), str(m.d[i].body))
+            self.assertEqual(m.c[i].upper, i)
+        # References resolve to the components of the model
+        body = m.c[5].body
+        self.assertIs(body._args[0]._numerator[0], m.p[5])
+        self.assertIs(body._args[0]._numerator[1], m.x[5])
+        self.assertIs(body._args[1], m.y[5])
+        self.assertIs(body._args[2], m.b.z)
+        # Sparse variables created by the rule are created on the model
+        self.assertEqual(len(m.y), 8)
+
+    def test_expression(self):
+        m = self._model()
+        m.e = Expression(m.I, rule=lambda m, i: m.x[i]**2 + m.p[i],
+                         parallel=2)
+        m.c = Constraint(m.I, rule=lambda m, i: m.e[i] <= 1, parallel=2)
+        self.assertEqual(list(m.e.keys()), list(m.I))
+        self.assertIs(m.c[3].body, m.e[3])
+        m.x[3] = 2
+        m.p[3] = 1
+        self.assertEqual(value(m.e[3]), 5)
+
+    def test_abstract(self):
+        model = AbstractModel()
+        model.I = RangeSet(20)
+        model.x = Var(model.I)
+        model.c = Constraint(model.I, rule=lambda m, i: m.x[i] >= i,
+                             parallel=True)
+        instance = model.create_instance()
+        self.assertEqual(len(instance.c), 20)
+        self.assertIs(instance.c[7].body, instance.x[7])
+        self.assertEqual(instance.c[7].lower, 7)
+
+    def test_serial(self):
+        m = self._model()
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i] >= 0, parallel=1)
+        self.assertEqual(len(m.c), 10)
+        m.d = Constraint([1], rule=lambda m, i: m.x[i] >= 0, parallel=4)
+        self.assertEqual(len(m.d), 1)
+        self.assertIsNone(parallel_construction.apply_indexed_rule_in_parallel(
+            m.d, None, m, [1], 4))
+
+    def test_rule_error(self):
+        m = self._model()
+        def rule(m, i):
+            if i == 6:
+                raise ValueError("bad index")
+            return m.x[i] >= 0
+        output = StringIO()
+        with LoggingIntercept(output, 'pyomo.core'):
+            self.assertRaisesRegexp(
+                ValueError, "bad index",
+                m.add_component, 'c', Constraint(m.I, rule=rule, parallel=2))
+
+    def test_external_component(self):
+        m = self._model()
+        other = ConcreteModel()
+        other.x = Var()
+        self.assertRaisesRegexp(
+            ValueError, "not part of the model",
+            m.add_component, 'c',
+            Constraint(m.I, rule=lambda m, i: m.x[i] + other.x >= 0,
+                       parallel=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -41,6 +41,7 @@ import pyomo.core.base
 from pyomo.core.base.set_types import _AnySet
 from pyomo.environ import *
 from pyomo.core.kernel.set_types import _VirtualSet
+from pyomo.util.log import LoggingIntercept
 
 _has_numpy = False
 try:
@@ -3415,5 +3416,224 @@ class TestNestedSetOperations(unittest.TestCase):
         self.assertEqual(sorted(inst.product3),
                          sorted(prod3))
 
+class TestOrderedSetOperations(unittest.TestCase):
+
+    def setUp(self):
+        self.model = ConcreteModel()
+        self.model.A = Set(initialize=[3,1,2], ordered=True)
+        self.model.B = RangeSet(2,10,2)
+        self.model.C = Set(initialize=[(1,'a'),(2,'b')], dimen=2,
+                           ordered=True)
+        self.model.D = Set(initialize=[5,3,7,1], ordered=True)
+
+    def _check_positions(self, s):
+        members = list(s)
+        self.assertEqual(len(s), len(members))
+        for i, elt in enumerate(members):
+            self.assertEqual(s[i+1], elt)
+            self.assertEqual(s[i-len(members)], elt)
+            self.assertEqual(s.ord(elt), i+1)
+        if members:
+            self.assertEqual(s.first(), members[0])
+            self.assertEqual(s.last(), members[-1])
+        self.assertRaises(IndexError, s.__getitem__, len(members)+1)
+        self.assertRaises(IndexError, s.__getitem__, 0)
+        return members
+
+    def test_product(self):
+        m = self.model
+        self.assertEqual(len(m.A*m.B*m.C), 30)
+        self._check_positions(m.A*m.B)
+        members = self._check_positions(m.A*m.B*m.C)
+        self.assertEqual(members[0], (3,2,1,'a'))
+        self.assertEqual(members[-1], (2,10,2,'b'))
+        self.assertIn((1,4,2,'b'), m.A*m.B*m.C)
+        self.assertNotIn((1,5,2,'b'), m.A*m.B*m.C)
+        self.assertNotIn((1,4), m.A*m.B*m.C)
+        self.assertNotIn((1,4,2), m.A*m.B)
+
+    def test_union(self):
+        m = self.model
+        self.assertEqual(self._check_positions(m.A|m.D), [3,1,2,5,7])
+        self.assertEqual(self._check_positions(m.D|m.A), [5,3,7,1,2])
+
+    def test_intersection(self):
+        m = self.model
+        self.assertEqual(self._check_positions(m.A&m.D), [3,1])
+
+    def test_difference(self):
+        m = self.model
+        self.assertEqual(self._check_positions(m.A-m.D), [2])
+        self.assertEqual(self._check_positions(m.D-m.A), [5,7])
+
+    def test_symmetric_difference(self):
+        m = self.model
+        self.assertEqual(self._check_positions(m.A^m.D), [2,5,7])
+
+    def test_rangeset_ord(self):
+        m = self.model
+        self.assertEqual(m.B.ord(2), 1)
+        self.assertEqual(m.B.ord(10), 5)
+        self.assertRaises(IndexError, m.B.ord, 3)
+
+    def test_unordered(self):
+        m = self.model
+        m.E = Set(initialize=[1,2])
+        self.assertEqual(len(m.A*m.E), 6)
+        self.assertEqual(len(m.A|m.E), 3)
+        self.assertRaises(ValueError, (m.A*m.E).__getitem__, 1)
+        self.assertRaises(ValueError, (m.A|m.E).ord, 1)
+
+@unittest.skipIf(not _has_numpy, "Numpy is not installed")
+class TestCompactSet(unittest.TestCase):
+
+    def setUp(self):
+        self.model = ConcreteModel()
+        self.model.A = Set(initialize=[(1,'a',2),(1,'b',3),(2,'a',1)],
+                           dimen=3, compact=True)
+
+    def test_members(self):
+        m = self.model
+        self.assertIsInstance(m.A, pyomo.core.base.sets.CompactOrderedSimpleSet)
+        self.assertEqual(list(m.A), [(1,'a',2),(1,'b',3),(2,'a',1)])
+        self.assertEqual(len(m.A), 3)
+        self.assertIn((1,'b',3), m.A)
+        self.assertNotIn((1,'b',4), m.A)
+        self.assertNotIn((1,'b'), m.A)
+        self.assertNotIn(1, m.A)
+
+    def test_positions(self):
+        m = self.model
+        self.assertEqual(m.A[2], (1,'b',3))
+        self.assertEqual(m.A[-1], (2,'a',1))
+        self.assertEqual(m.A.first(), (1,'a',2))
+        self.assertEqual(m.A.last(), (2,'a',1))
+        self.assertEqual(m.A.ord((2,'a',1)), 3)
+        self.assertEqual(m.A.next((1,'a',2)), (1,'b',3))
+        self.assertRaises(IndexError, m.A.ord, (2,'b',1))
+        self.assertRaises(IndexError, m.A.__getitem__, 4)
+
+    def test_slice(self):
+        m = self.model
+        self.assertEqual(list(m.A[1,:,:]), [(1,'a',2),(1,'b',3)])
+        self.assertEqual(list(m.A[:,'a',:]), [(1,'a',2),(2,'a',1)])
+        self.assertEqual(list(m.A[1,'a',:]), [(1,'a',2)])
+        self.assertEqual(list(m.A[3,:,:]), [])
+        self.assertRaises(IndexError, m.A.__getitem__, (1,slice(None)))
+
+    def test_add_remove(self):
+        m = self.model
+        m.A.add((5,'z',5))
+        m.A.remove((1,'a',2))
+        self.assertEqual(list(m.A), [(1,'b',3),(2,'a',1),(5,'z',5)])
+        self.assertEqual(m.A.ord((5,'z',5)), 3)
+        self.assertRaises(ValueError, m.A.add, (1,2))
+        m.A.clear()
+        self.assertEqual(len(m.A), 0)
+
+    def test_indexing(self):
+        m = self.model
+        m.x = Var(m.A)
+        self.assertEqual(list(m.x.keys()), list(m.A))
+        self.assertRaises(KeyError, m.x.__getitem__, (1,'a',3))
+
+    def test_clone(self):
+        m = self.model
+        i = m.clone()
+        self.assertEqual(list(i.A), list(m.A))
+        self.assertEqual(i.A, m.A)
+        i.A.add((7,'c',7))
+        self.assertNotIn((7,'c',7), m.A)
+
+    def test_scalar(self):
+        m = self.model
+        m.B = Set(initialize=[3,1,2], compact=True)
+        self.assertEqual(list(m.B), [3,1,2])
+        self.assertEqual(m.B[1], 3)
+        self.assertIn(2, m.B)
+
+    def test_large(self):
+        m = self.model
+        data = [ (i % 300, 'n%d' % (i % 1000), i) for i in range(5000) ]
+        m.B = Set(initialize=data, dimen=3, compact=True)
+        self.assertEqual(list(m.B), data)
+        m.C = Set(dimen=3, compact=True)
+        for val in data:
+            m.C.add(val)
+        self.assertEqual(list(m.C), data)
+        for i in (0, 257, 4999):
+            self.assertEqual(m.B.ord(data[i]), i+1)
+            self.assertEqual(m.C.ord(data[i]), i+1)
+        self.assertEqual(list(m.C[299,:,:]),
+                         [ val for val in data if val[0] == 299 ])
+
+    def test_remove_many(self):
+        m = self.model
+        data = [ (i % 7, 'n%d' % (i % 11), i) for i in range(2000) ]
+        m.B = Set(initialize=data, dimen=3, compact=True)
+        storage = m.B.value
+        for val in data[::2]:
+            m.B.remove(val)
+        # The removals are applied to the arrays in bulk
+        self.assertEqual(len(storage._removed), 1000)
+        self.assertEqual(len(m.B), 1000)
+        self.assertNotIn(data[0], m.B)
+        self.assertIn(data[1], m.B)
+        m.B.add(data[0])
+        self.assertIn(data[0], m.B)
+        self.assertEqual(m.B.ord(data[0]), 1001)
+        self.assertEqual(len(storage._removed), 0)
+        self.assertEqual(list(m.B), data[1::2] + [data[0]])
+        # removing buffered rows
+        m.B.add((9,'x',9))
+        m.B.remove((9,'x',9))
+        self.assertNotIn((9,'x',9), m.B)
+        self.assertEqual(m.B.last(), data[0])
+
+    def test_remove_then_grow_bits(self):
+        m = self.model
+        m.B = Set(initialize=[(0,'a')], dimen=2, compact=True)
+        m.B.add((1,'b'))
+        m.B.remove((1,'b'))
+        # New codes widen the packed keys of the buffered rows
+        for i in range(300):
+            m.B.add((i+2,'c%d' % i))
+        self.assertNotIn((1,'b'), m.B)
+        self.assertEqual(len(m.B), 301)
+        m.B.add((1,'b'))
+        self.assertIn((1,'b'), m.B)
+        self.assertEqual(len(m.B), 302)
+        self.assertEqual(m.B.last(), (1,'b'))
+
+    def test_wide_keys(self):
+        storage = pyomo.core.base.set_storage.CompactTupleStorage(3)
+        output = StringIO()
+        with LoggingIntercept(output, 'pyomo.core'):
+            storage._bits = [22, 22, 22]
+            storage.update([(1,2,3),(4,5,6)])
+        self.assertIn("Falling back to Python integer keys",
+                      output.getvalue())
+        self.assertIn((4,5,6), storage)
+        self.assertEqual(storage.position((4,5,6)), 1)
+
+    def test_duplicates(self):
+        m = self.model
+        output = StringIO()
+        with LoggingIntercept(output, 'pyomo.core'):
+            m.B = Set(initialize=[(1,2),(3,4),(1,2)], compact=True)
+        self.assertEqual(list(m.B), [(1,2),(3,4)])
+        self.assertIn("Element (1, 2) already exists", output.getvalue())
+        output = StringIO()
+        with LoggingIntercept(output, 'pyomo.core'):
+            m.B.add((3,4))
+        self.assertIn("Element (3, 4) already exists", output.getvalue())
+
+    def test_sorted(self):
+        m = self.model
+        def _sorted():
+            m.C = Set(initialize=[3,1,2], compact=True,
+                      ordered=Set.SortedOrder)
+        self.assertRaises(ValueError, _sorted)
+
 if __name__ == "__main__":
     unittest.main()
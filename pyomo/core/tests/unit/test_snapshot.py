@@ -0,0 +1,216 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for instance snapshots (save_instance / load_instance)
+#
+
+import os
+import struct
+import tempfile
+
+from six import StringIO
+
+import pyutilib.th as unittest
+
+from pyomo.environ import *
+from pyomo.core.base.snapshot import save_instance, load_instance
+
+try:
+    import numpy
+    _has_numpy = True
+except ImportError:
+    _has_numpy = False
+
+
+@unittest.skipIf(not _has_numpy, "Numpy is not installed")
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.fname = tempfile.mkstemp(suffix='.snp')
+        os.close(fd)
+
+    def tearDown(self):
+        if os.path.exists(self.fname):
+            os.remove(self.fname)
+
+    def _roundtrip(self, model):
+        save_instance(model, self.fname)
+        return load_instance(self.fname)
+
+    def _pprint(self, model):
+        output = StringIO()
+        model.pprint(ostream=output)
+        return output.getvalue()
+
+    def test_sets_and_params(self):
+        m = ConcreteModel(name='test')
+        m.I = Set(initialize=[3, 1, 2], ordered=True)
+        m.J = Set(initialize=['a', 'b'])
+        m.K = Set(initialize=[(1, 'a'), (2, 'b')], compact=True)
+        m.S = Set(initialize=[5, 4], ordered=Set.SortedOrder)
+        m.R = RangeSet(4)
+        m.T = Set(m.I, initialize={1: [1], 2: [1, 2], 3: []})
+        m.p = Param(m.I, initialize={1: 1.5, 2: 2.5, 3: 3.5})
+        m.q = Param(m.I, mutable=True, default=0, initialize={1: 4})
+        m.r = Param(m.J, initialize={'a': 'x', 'b': (1, 2)})
+        m.s = Param(initialize=7)
+        m.t = Param(mutable=True)
+        n = self._roundtrip(m)
+
+        self.assertEqual(n.name, 'test')
+        self.assertEqual(list(n.I), [3, 1, 2])
+        self.assertEqual(sorted(n.J), ['a', 'b'])
+        self.assertEqual(list(n.K), [(1, 'a'), (2, 'b')])
+        self.assertEqual(n.K.dimen, 2)
+        self.assertEqual(list(n.S), list(m.S))
+        self.assertIs(n.S.ordered, Set.SortedOrder)
+        self.assertEqual(list(n.R), [1, 2, 3, 4])
+        self.assertEqual(list(n.T[2]), [1, 2])
+        self.assertEqual(len(n.T[3]), 0)
+        self.assertEqual(n.p.extract_values(), m.p.extract_values())
+        self.assertIs(type(n.p[1]), float)
+        self.assertTrue(n.q._mutable)
+        self.assertEqual(value(n.q[1]), 4)
+        self.assertEqual(value(n.q[2]), 0)
+        self.assertEqual(n.r['b'], (1, 2))
+        self.assertEqual(n.s.value, 7)
+        self.assertIs(type(n.s.value), int)
+        self.assertEqual(len(n.t._data), 0)
+
+    def test_vars(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.p = Param(mutable=True, initialize=2)
+        m.x = Var(m.I, bounds=(0, 10), initialize=1.5)
+        m.y = Var(within=Binary)
+        m.y.fix(1)
+        m.z = Var(bounds=(m.p, None))
+        m.w = Var(m.I, dense=False)
+        m.w[2].value = 3
+        m.x[3].stale = False
+        m.x[2].setlb(None)
+        n = self._roundtrip(m)
+
+        self.assertEqual(self._pprint(n), self._pprint(m))
+        self.assertIs(n.y.domain, Binary)
+        self.assertTrue(n.y.fixed)
+        self.assertIs(type(n.y.value), int)
+        self.assertIsNone(n.x[2].lb)
+        self.assertFalse(n.x[3].stale)
+        # Bounds that are expressions refer to the loaded components
+        self.assertIs(n.z._lb, n.p)
+        n.p = 5
+        self.assertEqual(n.z.lb, 5)
+        self.assertEqual(list(n.w.keys()), [2])
+
+    def test_constraints_and_objectives(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3], ordered=True)
+        m.p = Param(m.I, mutable=True, initialize=2)
+        m.x = Var(m.I, initialize=1)
+        m.y = Var()
+        m.y.fix(2)
+        m.e = Expression(expr=m.x[1]**2)
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i] + 2*m.x[1] <= i)
+        m.d = Constraint(expr=m.x[1]*m.x[2] == 3)
+        m.f = Constraint(expr=m.e + m.y >= 1)
+        m.g = Constraint(m.I, rule=lambda m, i: m.p[i]*m.x[i] >= 0)
+        m.h = Constraint(expr=(m.p[1], m.x[2], m.p[2]))
+        m.o = Objective(expr=summation(m.x), sense=maximize)
+        m.oo = Objective(m.I, rule=lambda m, i: 3*m.x[i] + 1)
+        m.c[2].deactivate()
+        m.o.deactivate()
+        n = self._roundtrip(m)
+
+        self.assertEqual(self._pprint(n), self._pprint(m))
+        self.assertFalse(n.c[2].active)
+        self.assertFalse(n.o.active)
+        self.assertEqual(n.o.sense, maximize)
+        self.assertEqual(n.oo[1].sense, minimize)
+        self.assertTrue(n.d.equality)
+        # Nonlinear and parameterized expressions keep their structure
+        n.p[1] = 10
+        self.assertEqual(value(n.g[1].body), 10)
+        self.assertEqual(value(n.h.lower), 10)
+        n.y.value = 5
+        self.assertEqual(value(n.f.body), 6)
+        self.assertIs(n.f.body._args[0], n.e)
+
+    def test_blocks_and_suffixes(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.b = Block([1, 2])
+        m.b[1].v = Var(initialize=4)
+        m.b[1].c = Constraint(expr=m.b[1].v + m.x >= 0)
+        m.b[2].deactivate()
+        m.sub = Block()
+        m.sub.sub = Block()
+        m.sub.sub.y = Var()
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        m.dual[m.b[1].c] = 5
+        m.scale = Suffix(direction=Suffix.EXPORT, datatype=Suffix.INT)
+        m.scale[m.x] = 2
+        n = self._roundtrip(m)
+
+        self.assertEqual(self._pprint(n), self._pprint(m))
+        self.assertEqual(sorted(n.b.keys()), [1, 2])
+        self.assertFalse(n.b[2].active)
+        self.assertEqual(n.b[1].v.value, 4)
+        self.assertEqual(n.dual[n.b[1].c], 5)
+        self.assertEqual(n.scale.get_direction(), Suffix.EXPORT)
+        self.assertEqual(n.scale[n.x], 2)
+        self.assertIs(n.sub.sub.y.parent_block(), n.sub.sub)
+
+    def test_shared_arrays(self):
+        m = ConcreteModel()
+        m.x = Var(range(100), bounds=(0, None))
+        m.c = Constraint(expr=sum(i*m.x[i] for i in m.x) <= 1)
+        save_instance(m, self.fname)
+        n1 = load_instance(self.fname)
+        n2 = load_instance(self.fname)
+        self.assertIsNot(n1.x[5], n2.x[5])
+        self.assertEqual(str(n1.c.body), str(m.c.body))
+        self.assertEqual(str(n2.c.body), str(m.c.body))
+
+    def test_errors(self):
+        m = ConcreteModel()
+        m.x = Var()
+        other = ConcreteModel()
+        other.y = Var()
+        m.c = Constraint(expr=m.x + other.y >= 0)
+        self.assertRaisesRegexp(
+            ValueError, "not part of the model",
+            save_instance, m, self.fname)
+
+        m = ConcreteModel()
+        m.x = Var()
+        save_instance(m, self.fname)
+        with open(self.fname, 'r+b') as FILE:
+            FILE.seek(8)
+            FILE.write(struct.pack('<I', 99))
+        self.assertRaisesRegexp(
+            ValueError, "Unsupported snapshot format version 99",
+            load_instance, self.fname)
+
+        with open(self.fname, 'wb') as FILE:
+            FILE.write(b'not a snapshot')
+        self.assertRaisesRegexp(
+            ValueError, "not a Pyomo instance snapshot",
+            load_instance, self.fname)
+
+        model = AbstractModel()
+        model.x = Var()
+        self.assertRaisesRegexp(
+            ValueError, "has not been constructed",
+            save_instance, model, self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
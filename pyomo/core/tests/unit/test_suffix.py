@@ -28,9 +28,17 @@ from pyomo.core.base.suffix import \
      active_suffix_generator,
      suffix_generator)
 from pyomo.environ import *
+from pyomo.opt import (SolverResults, SolverStatus, SolutionStatus,
+                       TerminationCondition)
 
 from six import StringIO
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 def simple_con_rule(model,i):
     return model.x[i] == 1
 def simple_obj_rule(model,i):
@@ -1543,5 +1551,154 @@ class TestSuffixPickleUsage(unittest.TestCase):
         self.assertEqual(inst.junk.get(model),None)
         self.assertEqual(inst.junk.get(inst),1.0)
 
+@unittest.skipIf(not numpy_available, "Numpy is not installed")
+class TestDenseSuffix(unittest.TestCase):
+
+    def _model(self):
+        model = ConcreteModel()
+        model.x = Var([1,2,3])
+        model.b = Block()
+        model.b.y = Var()
+        model.c = Constraint([1,2], noruleinit=True)
+        model.c.add(1, model.x[1] >= 0)
+        model.c.add(2, model.x[2] >= 0)
+        model.o = Objective(expr=model.x[1])
+        model.dual = DenseSuffix(direction=Suffix.IMPORT)
+        return model
+
+    def test_layout(self):
+        model = self._model()
+        self.assertIs(model.dual.type(), Suffix)
+        self.assertEqual(model.dual.component_order(),
+                         [model.x[1], model.x[2], model.x[3], model.b.y,
+                          model.c[1], model.c[2]])
+        self.assertEqual(len(model.dual.get_array()), 6)
+        self.assertEqual(len(model.dual), 0)
+        self.assertIs(dict(active_import_suffix_generator(model))['dual'],
+                      model.dual)
+
+        model.con = DenseSuffix(ctypes=Constraint)
+        self.assertEqual(model.con.component_order(), [model.c[1], model.c[2]])
+
+    def test_layout_sparse_constraint(self):
+        model = self._model()
+        calls = []
+        def rule(m, i):
+            calls.append(i)
+            return m.x[i] >= 0
+        model.s = Constraint([1,2,3], rule=rule, dense=False)
+        model.s[2]
+        # Only the constraints that were constructed are in the layout
+        self.assertEqual(model.dual.component_order()[-1:], [model.s[2]])
+        self.assertEqual(len(model.dual.get_array()), 7)
+        self.assertEqual(calls, [2])
+
+    def test_mapping(self):
+        model = self._model()
+        dual = model.dual
+        dual[model.c[2]] = 1.5
+        dual.set_value(model.x, 2.0)
+        dual[model.o] = 3.0          # not in the layout
+        dual[model.b.y] = 'a'        # not stored in the array
+        self.assertEqual(len(dual), 6)
+        self.assertEqual(dual[model.c[2]], 1.5)
+        self.assertIs(type(dual[model.c[2]]), float)
+        self.assertEqual(dual.get(model.x[1]), 2.0)
+        self.assertEqual(dual[model.o], 3.0)
+        self.assertEqual(dual[model.b.y], 'a')
+        self.assertIsNone(dual.get(model.c[1]))
+        self.assertNotIn(model.c[1], dual)
+        self.assertRaises(KeyError, dual.__getitem__, model.c[1])
+        self.assertEqual(
+            set(id(x) for x in dual),
+            set(id(x) for x in [model.x[1], model.x[2], model.x[3],
+                                model.c[2], model.o, model.b.y]))
+        self.assertEqual(dict((id(k), v) for k, v in dual.items())[id(model.o)],
+                         3.0)
+
+        dual[model.b.y] = 4.0
+        self.assertEqual(dual[model.b.y], 4.0)
+        self.assertEqual(len(dual), 6)
+        del dual[model.x[1]]
+        del dual[model.o]
+        self.assertNotIn(model.x[1], dual)
+        self.assertRaises(KeyError, dual.__delitem__, model.x[1])
+        self.assertEqual(len(dual), 4)
+        dual.clear_value(model.x)
+        self.assertEqual(len(dual), 2)
+        dual.clear_all_values()
+        self.assertEqual(len(dual), 0)
+
+    def test_int_datatype(self):
+        model = self._model()
+        model.status = DenseSuffix(datatype=Suffix.INT)
+        model.status[model.x[1]] = 2
+        model.status[model.x[2]] = 2.5
+        self.assertIs(type(model.status[model.x[1]]), int)
+        self.assertEqual(model.status[model.x[2]], 2.5)
+
+    def test_bulk(self):
+        model = self._model()
+        dual = model.dual
+        dual.set_array([1, 2, 3, 4, 5, 6])
+        self.assertEqual(dual[model.c[1]], 5.0)
+        self.assertRaisesRegexp(ValueError, "expects an array of 6 values",
+                                dual.set_array, [1, 2])
+        dual.clear()
+        dual.set_values([model.c[2], model.x[3]], [7.0, 8.0])
+        self.assertEqual(list(dual.get_array()[[2, 5]]), [8.0, 7.0])
+        self.assertEqual(len(dual), 2)
+        dual.update_values([(model.o, 1.0), (model.x[1], 2.0)],
+                           expand=False)
+        self.assertEqual(dual[model.o], 1.0)
+        self.assertEqual(dual[model.x[1]], 2.0)
+
+    def test_update_layout(self):
+        model = self._model()
+        model.dual[model.x[1]] = 1.0
+        model.z = Var()
+        model.dual[model.z] = 2.0
+        self.assertNotIn(id(model.z),
+                         [id(o) for o in model.dual.component_order()])
+        model.dual.update_layout()
+        self.assertIn(id(model.z),
+                      [id(o) for o in model.dual.component_order()])
+        self.assertEqual(model.dual[model.z], 2.0)
+        self.assertEqual(model.dual[model.x[1]], 1.0)
+        self.assertEqual(len(model.dual._dict), 0)
+
+    def test_clone_and_pickle(self):
+        model = self._model()
+        model.dual[model.x[2]] = 1.0
+        model.dual[model.o] = 2.0
+        for inst in (model.clone(), pickle.loads(pickle.dumps(model))):
+            self.assertEqual(inst.dual[inst.x[2]], 1.0)
+            self.assertEqual(inst.dual[inst.o], 2.0)
+            self.assertNotIn(model.x[2], inst.dual)
+            self.assertIs(inst.dual.component_order()[0], inst.x[1])
+            inst.dual[inst.x[1]] = 3.0
+            self.assertNotIn(model.x[1], model.dual)
+
+    def test_load_solution(self):
+        model = self._model()
+        model.rc = DenseSuffix(direction=Suffix.IMPORT, ctypes=Var)
+        results = SolverResults()
+        results.problem.number_of_variables = 3
+        results.solver.status = SolverStatus.ok
+        results.solver.termination_condition = TerminationCondition.optimal
+        soln = results.solution.add()
+        soln.status = SolutionStatus.optimal
+        soln._cuid = False
+        soln.variable['x[1]'] = {'Value': 1.0, 'Rc': 0.5}
+        soln.variable['x[2]'] = {'Value': 2.0, 'Rc': 0.25}
+        soln.constraint['c[1]'] = {'Dual': 4.0}
+        model.solutions.load_from(results)
+        self.assertEqual(model.x[2].value, 2.0)
+        self.assertEqual(model.rc[model.x[1]], 0.5)
+        self.assertEqual(model.rc[model.x[2]], 0.25)
+        self.assertEqual(model.dual[model.c[1]], 4.0)
+        self.assertEqual(len(model.dual), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -15,6 +15,7 @@
 #
 
 import os
+import pickle
 from os.path import abspath, dirname
 currdir = dirname(abspath(__file__))+os.sep
 
@@ -1336,6 +1337,58 @@ class MiscVarTests(unittest.TestCase):
         model.C = model.A | model.B
         model.x = Var(model.C)
 
+    def test_stale(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3])
+        m.y = Var()
+        m.b = Block()
+        m.b.z = Var()
+        self.assertTrue(m.x[1].stale)
+        self.assertTrue(m.y.stale)
+        for v in (m.x[1], m.x[2], m.y, m.b.z):
+            v.stale = False
+        self.assertFalse(m.x[1].stale)
+        self.assertTrue(m.x[3].stale)
+
+        m.x.flag_as_stale()
+        self.assertTrue(m.x[1].stale)
+        self.assertTrue(m.x[2].stale)
+        self.assertFalse(m.y.stale)
+        m.x[2].stale = False
+        self.assertFalse(m.x[2].stale)
+        self.assertTrue(m.x[1].stale)
+
+        m.b.deactivate()
+        m._flag_vars_as_stale()
+        self.assertTrue(m.y.stale)
+        self.assertTrue(m.x[2].stale)
+        self.assertFalse(m.b.z.stale)
+
+        # Variables added after the component was flagged are stale
+        m.v = VarList()
+        m.v.flag_as_stale()
+        m.v.add()
+        self.assertTrue(m.v[1].stale)
+        m.y.stale = False
+        m.y.stale = True
+        self.assertTrue(m.y.stale)
+
+    def test_stale_clone_and_pickle(self):
+        m = ConcreteModel()
+        m.x = Var([1,2])
+        m.y = Var()
+        m.x.flag_as_stale()
+        m.x[2].stale = False
+        m.y.stale = False
+        for inst in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertTrue(inst.x[1].stale)
+            self.assertFalse(inst.x[2].stale)
+            self.assertFalse(inst.y.stale)
+            inst._flag_vars_as_stale()
+            self.assertTrue(inst.x[2].stale)
+            self.assertTrue(inst.y.stale)
+            self.assertFalse(m.x[2].stale)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -377,6 +377,7 @@ class OptSolver(Plugin):
         # the call to solve, but will be reset to defaults if not given
         self._load_solutions = True
         self._select_index = 0
+        self._lean_results = False
         self._report_timing = False
         self._suffixes = []
         self._log_file = None
@@ -538,44 +539,7 @@ class OptSolver(Plugin):
     def solve(self, *args, **kwds):
         """ Solve the problem """
 
-        self.available(exception_flag=True)
-        #
-        # If the inputs are models, then validate that they have been
-        # constructed! Collect suffix names to try and import from solution.
-        #
-        from pyomo.core.base.block import _BlockData
-        import pyomo.core.base.suffix
-        from pyomo.core.kernel.component_block import IBlockStorage
-        import pyomo.core.kernel.component_suffix
-        _model = None
-        for arg in args:
-            if isinstance(arg, (_BlockData, IBlockStorage)):
-                if isinstance(arg, _BlockData):
-                    if not arg.is_constructed():
-                        raise RuntimeError(
-                            "Attempting to solve model=%s with unconstructed "
-                            "component(s)" % (arg.name,) )
-
-                _model = arg
-                # import suffixes must be on the top-level model
-                if isinstance(arg, _BlockData):
-                    model_suffixes = list(name for (name,comp) \
-                                          in pyomo.core.base.suffix.\
-                                          active_import_suffix_generator(arg))
-                else:
-                    assert isinstance(arg, IBlockStorage)
-                    model_suffixes = list(name for (name,comp) \
-                                          in pyomo.core.kernel.component_suffix.\
-                                          import_suffix_generator(arg,
-                                                                  active=True,
-                                                                  descend_into=False,
-                                                                  return_key=True))
-
-                if len(model_suffixes) > 0:
-                    kwds_suffixes = kwds.setdefault('suffixes',[])
-                    for name in model_suffixes:
-                        if name not in kwds_suffixes:
-                            kwds_suffixes.append(name)
+        _model = self._prepare_solve(args, kwds)
 
         #
         # Handle ephemeral solvers options here. These
@@ -606,62 +570,12 @@ class OptSolver(Plugin):
                 self._initialize_callbacks(_model)
 
             _status = self._apply_solver()
-            if hasattr(self, '_transformation_data'):
-                del self._transformation_data
-            if not hasattr(_status, 'rc'):
-                logger.warning(
-                    "Solver (%s) did not return a solver status code.\n"
-                    "This is indicative of an internal solver plugin error.\n"
-                    "Please report this to the Pyomo developers." )
-            elif _status.rc:
-                logger.error(
-                    "Solver (%s) returned non-zero return code (%s)"
-                    % (self.name, _status.rc,))
-                if self._tee:
-                    logger.error(
-                        "See the solver log above for diagnostic information." )
-                elif hasattr(_status, 'log') and _status.log:
-                    logger.error("Solver log:\n" + str(_status.log))
-                raise pyutilib.common.ApplicationError(
-                    "Solver (%s) did not exit normally" % self.name)
+            self._check_solver_status(_status)
             solve_completion_time = time.time()
             if self._report_timing:
                 print("      %6.2f seconds required for solver" % (solve_completion_time - presolve_completion_time))
 
-            result = self._postsolve()
-            result._smap_id = self._smap_id
-            result._smap = None
-            if _model:
-                if isinstance(_model, IBlockStorage):
-                    if len(result.solution) == 1:
-                        result.solution(0).symbol_map = \
-                            getattr(_model, "._symbol_maps")[result._smap_id]
-                        result.solution(0).default_variable_value = \
-                            self._default_variable_value
-                        if self._load_solutions:
-                            _model.load_solution(result.solution(0))
-                    else:
-                        assert len(result.solution) == 0
-                    # see the hack in the write method
-                    # we don't want this to stick around on the model
-                    # after the solve
-                    assert len(getattr(_model, "._symbol_maps")) == 1
-                    delattr(_model, "._symbol_maps")
-                    del result._smap_id
-                    if self._load_solutions and \
-                       (len(result.solution) == 0):
-                        logger.error("No solution is available")
-                else:
-                    if self._load_solutions:
-                        _model.solutions.load_from(
-                            result,
-                            select=self._select_index,
-                            default_variable_value=self._default_variable_value)
-                        result._smap_id = None
-                        result.solution.clear()
-                    else:
-                        result._smap = _model.solutions.symbol_map[self._smap_id]
-                        _model.solutions.delete_symbol_map(self._smap_id)
+            result = self._process_solve_results(_model)
             postsolve_completion_time = time.time()
 
             if self._report_timing:
@@ -676,12 +590,126 @@ class OptSolver(Plugin):
 
         return result
 
+    def _prepare_solve(self, args, kwds):
+        """
+        Verify that the solver is available and that the models in
+        args are constructed, and add the import suffixes of the
+        models to the 'suffixes' keyword.  Returns the model that is
+        solved (or None).
+        """
+        self.available(exception_flag=True)
+        #
+        # If the inputs are models, then validate that they have been
+        # constructed! Collect suffix names to try and import from solution.
+        #
+        from pyomo.core.base.block import _BlockData
+        import pyomo.core.base.suffix
+        from pyomo.core.kernel.component_block import IBlockStorage
+        import pyomo.core.kernel.component_suffix
+        _model = None
+        for arg in args:
+            if isinstance(arg, (_BlockData, IBlockStorage)):
+                if isinstance(arg, _BlockData):
+                    if not arg.is_constructed():
+                        raise RuntimeError(
+                            "Attempting to solve model=%s with unconstructed "
+                            "component(s)" % (arg.name,) )
+
+                _model = arg
+                # import suffixes must be on the top-level model
+                if isinstance(arg, _BlockData):
+                    model_suffixes = list(name for (name,comp) \
+                                          in pyomo.core.base.suffix.\
+                                          active_import_suffix_generator(arg))
+                else:
+                    assert isinstance(arg, IBlockStorage)
+                    model_suffixes = list(name for (name,comp) \
+                                          in pyomo.core.kernel.component_suffix.\
+                                          import_suffix_generator(arg,
+                                                                  active=True,
+                                                                  descend_into=False,
+                                                                  return_key=True))
+
+                if len(model_suffixes) > 0:
+                    kwds_suffixes = kwds.setdefault('suffixes',[])
+                    for name in model_suffixes:
+                        if name not in kwds_suffixes:
+                            kwds_suffixes.append(name)
+        return _model
+
+    def _check_solver_status(self, _status):
+        """
+        Verify the status returned by _apply_solver(), and raise an
+        ApplicationError if the solver did not exit normally.
+        """
+        if hasattr(self, '_transformation_data'):
+            del self._transformation_data
+        if not hasattr(_status, 'rc'):
+            logger.warning(
+                "Solver (%s) did not return a solver status code.\n"
+                "This is indicative of an internal solver plugin error.\n"
+                "Please report this to the Pyomo developers." )
+        elif _status.rc:
+            logger.error(
+                "Solver (%s) returned non-zero return code (%s)"
+                % (self.name, _status.rc,))
+            if self._tee:
+                logger.error(
+                    "See the solver log above for diagnostic information." )
+            elif hasattr(_status, 'log') and _status.log:
+                logger.error("Solver log:\n" + str(_status.log))
+            raise pyutilib.common.ApplicationError(
+                "Solver (%s) did not exit normally" % self.name)
+
+    def _process_solve_results(self, _model):
+        """
+        Perform the postsolve and load the solution into the model
+        (if load_solutions is True).  Returns the results.
+        """
+        result = self._postsolve()
+        result._smap_id = self._smap_id
+        result._smap = None
+        if _model:
+            from pyomo.core.kernel.component_block import IBlockStorage
+            if isinstance(_model, IBlockStorage):
+                if len(result.solution) == 1:
+                    result.solution(0).symbol_map = \
+                        getattr(_model, "._symbol_maps")[result._smap_id]
+                    result.solution(0).default_variable_value = \
+                        self._default_variable_value
+                    if self._load_solutions:
+                        _model.load_solution(result.solution(0))
+                else:
+                    assert len(result.solution) == 0
+                # see the hack in the write method
+                # we don't want this to stick around on the model
+                # after the solve
+                assert len(getattr(_model, "._symbol_maps")) == 1
+                delattr(_model, "._symbol_maps")
+                del result._smap_id
+                if self._load_solutions and \
+                   (len(result.solution) == 0):
+                    logger.error("No solution is available")
+            else:
+                if self._load_solutions:
+                    _model.solutions.load_from(
+                        result,
+                        select=self._select_index,
+                        default_variable_value=self._default_variable_value)
+                    result._smap_id = None
+                    result.solution.clear()
+                else:
+                    result._smap = _model.solutions.symbol_map[self._smap_id]
+                    _model.solutions.delete_symbol_map(self._smap_id)
+        return result
+
     def _presolve(self, *args, **kwds):
 
         self._log_file                = kwds.pop("logfile", None)
         self._soln_file               = kwds.pop("solnfile", None)
         self._select_index            = kwds.pop("select", 0)
         self._load_solutions          = kwds.pop("load_solutions", True)
+        self._lean_results            = kwds.pop("lean_results", False)
         self._timelimit               = kwds.pop("timelimit", None)
         self._report_timing           = kwds.pop("report_timing", False)
         self._tee                     = kwds.pop("tee", False)
@@ -0,0 +1,206 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# An action manager that executes solves in an asyncio event loop.
+# This module uses the async/await syntax, so it can only be imported
+# by Python 3.5 (or later).
+#
+
+__all__ = ['CoroutineSolverManager']
+
+import asyncio
+import os
+
+import pyomo.opt
+from pyomo.opt.parallel.manager import (ActionManagerError,
+                                        ActionStatus,
+                                        ActionHandle,
+                                        AsynchronousActionManager)
+
+from six import string_types
+
+
+class CoroutineSolverManager(AsynchronousActionManager):
+    """
+    A solver manager that executes queued solves concurrently in an
+    asyncio event loop, using SystemCallSolver.solve_async().
+
+    The queue() method returns an ActionHandle, as with the other
+    solver managers, but the methods that wait for actions (execute,
+    solve, solve_all, wait_all, wait_any and wait_for) are coroutines.
+    For example:
+
+        manager = CoroutineSolverManager()
+        ahs = [manager.queue(model, opt='glpk') for model in models]
+        await manager.wait_all(ahs)
+
+    Each solve uses its own solver object.  If a solver object is
+    passed to queue(), then a new solver is created with the same
+    type, options and executable.
+
+    Keyword Arguments
+    -----------------
+    max_concurrent: int
+        The maximum number of solvers that are executed at the same
+        time (the number of CPUs by default).
+    """
+
+    def __init__(self, max_concurrent=None):
+        if max_concurrent is None:
+            max_concurrent = os.cpu_count() or 1
+        self._max_concurrent = max_concurrent
+        super(CoroutineSolverManager, self).__init__()
+
+    def clear(self):
+        """
+        Clear manager state
+        """
+        super(CoroutineSolverManager, self).clear()
+        self._semaphore = None
+        self._tasks = {}
+        self._errors = {}
+
+    def _perform_queue(self, ah, *args, **kwds):
+        """
+        Create the task that solves the problem.
+        """
+        opt = kwds.pop('solver', kwds.pop('opt', None))
+        if opt is None:
+            raise ActionManagerError(
+                "No solver passed to %s, use keyword option 'solver'"
+                % (type(self).__name__) )
+        opt = self._create_solver(opt, kwds.pop('solver_io', None))
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        self._tasks[ah.id] = asyncio.ensure_future(
+            self._solve(ah, opt, args, kwds))
+        return ah
+
+    def _create_solver(self, opt, solver_io):
+        """
+        Create the solver object used by a single solve.
+        """
+        from pyomo.opt.solver.shellcmd import SystemCallSolver
+
+        if isinstance(opt, string_types):
+            opt = pyomo.opt.SolverFactory(opt, solver_io=solver_io)
+        elif isinstance(opt, SystemCallSolver):
+            new_opt = pyomo.opt.SolverFactory(opt.type)
+            new_opt.options.update(opt.options)
+            new_opt.set_problem_format(opt.problem_format())
+            if opt._user_executable is not None:
+                new_opt.set_executable(opt._user_executable, validate=False)
+            opt = new_opt
+        if not isinstance(opt, SystemCallSolver):
+            raise ActionManagerError(
+                "The %s can only execute solvers that are run with a "
+                "problem file (not %s)" % (type(self).__name__, opt.name))
+        return opt
+
+    async def _solve(self, ah, opt, args, kwds):
+        try:
+            async with self._semaphore:
+                results = await opt.solve_async(*args, **kwds)
+        except asyncio.CancelledError:
+            ah.status = ActionStatus.error
+            raise
+        except Exception as e:
+            ah.status = ActionStatus.error
+            self._errors[ah.id] = e
+        else:
+            ah.status = ActionStatus.done
+            self.results[ah.id] = results
+        finally:
+            self.queued_action_counter -= 1
+            del self._tasks[ah.id]
+            opt.deactivate()
+
+    async def execute(self, *args, **kwds):
+        """
+        Execute an action, and return its results.
+        """
+        ah = self.queue(*args, **kwds)
+        return await self.wait_for(ah)
+
+    async def solve(self, *args, **kwds):
+        """
+        Solve a problem, and return its results.
+        """
+        return await self.execute(*args, **kwds)
+
+    async def solve_all(self, solver, instances, **kwds):
+        """
+        Solve a list of problem instances concurrently.  All keywords
+        are passed to each invocation of the solver, and the solutions
+        are loaded into each instance.
+        """
+        kwds['opt'] = solver
+        action_handles = [self.queue(instance, **kwds)
+                          for instance in instances]
+        for action_handle in action_handles:
+            await self.wait_for(action_handle)
+
+    def get_results(self, ah):
+        """
+        Return solver results.  If the solve failed, then the
+        exception raised by the solve is raised.  If solver results
+        are not available, return None.
+        """
+        if ah.id in self._errors:
+            raise self._errors.pop(ah.id)
+        return super(CoroutineSolverManager, self).get_results(ah)
+
+    async def wait_all(self, *args):
+        """
+        Wait for all actions to complete.  The arguments to this method
+        are expected to be ActionHandle objects or iterators that return
+        ActionHandle objects.  If no arguments are provided, then this
+        method will terminate after all queued actions are complete.
+        """
+        if len(args):
+            tasks = [self._tasks[ah.id] for ah in self._flatten(*args)
+                     if ah.id in self._tasks]
+        else:
+            tasks = list(self._tasks.values())
+        if len(tasks):
+            await asyncio.wait(tasks)
+
+    async def wait_any(self, *args):
+        """
+        Wait for any action (or any of the specified actions) to
+        complete, and return the corresponding ActionHandle.
+        """
+        if len(args):
+            ahs = sorted(self._flatten(*args))
+        else:
+            ahs = sorted(ah for ah in self.event_handle.values()
+                         if (ah.id in self._tasks) or \
+                            (ah.id in self.results) or \
+                            (ah.id in self._errors))
+        while len(ahs):
+            for ah in ahs:
+                if ah.status != ActionStatus.queued:
+                    return ah
+            await asyncio.wait([self._tasks[ah.id] for ah in ahs],
+                               return_when=asyncio.FIRST_COMPLETED)
+        return ActionHandle(
+            error=True,
+            explanation=("No queued evaluations available in the "
+                         "%s" % (type(self).__name__)))
+
+    async def wait_for(self, ah):
+        """
+        Wait for the specified action to complete, and return its
+        results.
+        """
+        if ah.id in self._tasks:
+            await asyncio.wait([self._tasks[ah.id]])
+        return self.get_results(ah)
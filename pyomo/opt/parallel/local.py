@@ -11,15 +11,26 @@
 
 __all__ = ()
 
+import os
+import sys
 import time
+import multiprocessing
+import traceback
+try:
+    import cPickle as pickle
+except:                                     #pragma:nocover
+    import pickle
 
 try:
     from collections import OrderedDict
 except ImportError:                         #pragma:nocover
     from ordereddict import OrderedDict
 
+from pyutilib.services import TempfileManager
+
 from pyomo.util.plugin import alias
 import pyomo.opt
+from pyomo.opt.base.solvers import OptSolver
 from pyomo.opt.parallel.manager import (ActionManagerError,
                                         ActionStatus,
                                         ActionHandle)
@@ -27,6 +38,7 @@ from pyomo.opt.parallel.async_solver import AsynchronousSolverManager
 
 import six
 from six import string_types
+from six.moves import queue
 
 class SolverManager_Serial(AsynchronousSolverManager):
 
@@ -81,3 +93,340 @@ class SolverManager_Serial(AsynchronousSolverManager):
                             explanation=("No queued evaluations available in "
                                          "the 'serial' solver manager, which "
                                          "executes solvers synchronously"))
+
+
+def _solve_problem_file(data):
+    """
+    Solve a problem file in a worker process of the process pool.
+
+    This returns a tuple (True, results), where results is the pickled
+    SolverResults object, or a tuple (False, message) if the solve
+    raised an exception.
+    """
+    try:
+        # Register the solver plugins when the worker process does not
+        # inherit them from the parent (e.g., on Windows)
+        import pyomo.environ
+        time_start = time.time()
+        with TempfileManager.push():
+            with pyomo.opt.SolverFactory(data['opt'],
+                                         solver_io=data['solver_io']) as opt:
+                if opt is None:
+                    raise ActionManagerError(
+                        "Problem constructing solver `%s'" % (data['opt'],))
+                for key, value in data['solver_options'].items():
+                    setattr(opt.options, key, value)
+                if data['executable'] is not None:
+                    opt.set_executable(data['executable'], validate=False)
+                problem_filename = TempfileManager.create_tempfile(
+                    suffix="."+os.path.split(data['filename'])[1])
+                with open(problem_filename, 'w') as f:
+                    f.write(data['file'])
+                kwds = data['kwds']
+                if data['warmstart_filename'] is not None:
+                    warmstart_filename = TempfileManager.create_tempfile(
+                        suffix="."+os.path.split(data['warmstart_filename'])[1])
+                    with open(warmstart_filename, 'w') as f:
+                        f.write(data['warmstart_file'])
+                    kwds['warmstart_file'] = warmstart_filename
+                # The results contain the solutions, because no model
+                # is provided (just a problem file)
+                results = opt.solve(problem_filename, **kwds)
+        results.pyomo_solve_time = time.time()-time_start
+        return True, pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+    except:
+        return False, "".join(traceback.format_exception(*sys.exc_info()))
+
+
+class SolverManager_ProcessPool(AsynchronousSolverManager):
+    """
+    A solver manager that executes queued solves concurrently in a
+    pool of local worker processes.
+
+    The problem file is written in the calling process, the solver
+    executable is run by a worker process, and the results are sent
+    back as a pickled SolverResults object, so the model itself is
+    never copied to the workers.  This requires a solver that is
+    executed through a problem file (e.g., the shell solvers).
+
+    Keyword Arguments
+    -----------------
+    processes: int
+        The number of worker processes (the number of CPUs by default).
+    """
+
+    alias("processpool",
+          doc="Asynchronously execute solvers locally in a pool of processes")
+
+    def __init__(self, **kwds):
+        self._processes = kwds.pop('processes', None)
+        self._pool = None
+        self._finished = queue.Queue()
+        self._task_data = {}
+        super(SolverManager_ProcessPool, self).__init__(**kwds)
+
+    def clear(self):
+        """
+        Clear manager state
+        """
+        super(SolverManager_ProcessPool, self).clear()
+        self.results = OrderedDict()
+        self._task_data = {}
+
+    def close(self):
+        """Terminate the worker processes."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __exit__(self, t, v, traceback):
+        self.close()
+        super(SolverManager_ProcessPool, self).__exit__(t, v, traceback)
+
+    def _perform_queue(self, ah, *args, **kwds):
+        """
+        Perform the queue operation.  This method returns the ActionHandle,
+        and the ActionHandle status indicates whether the queue was successful.
+        """
+        from pyomo.opt.solver.shellcmd import SystemCallSolver
+
+        opt = kwds.pop('solver', kwds.pop('opt', None))
+        if opt is None:
+            raise ActionManagerError(
+                "No solver passed to %s, use keyword option 'solver'"
+                % (type(self).__name__) )
+        solver_io = kwds.pop('solver_io', None)
+        deactivate_opt = False
+        if isinstance(opt, string_types):
+            deactivate_opt = True
+            opt = pyomo.opt.SolverFactory(opt, solver_io=solver_io)
+        if not isinstance(opt, SystemCallSolver):
+            raise ActionManagerError(
+                "The %s solver manager can only execute solvers that "
+                "are run with a problem file (not %s)"
+                % (type(self).__name__, opt.name))
+
+        data, model = self._get_task_data(opt, args, kwds)
+        data['solver_io'] = solver_io
+        self._task_data[ah.id] = (model,
+                                  opt._smap_id,
+                                  opt._load_solutions,
+                                  opt._select_index,
+                                  opt._default_variable_value)
+        if deactivate_opt:
+            opt.deactivate()
+
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self._processes)
+        callbacks = dict(
+            callback=lambda result, _id=ah.id: self._finished.put((_id, result)))
+        if six.PY3:
+            # The pool calls the error callback instead of the callback
+            # if the task fails outside of _solve_problem_file (e.g., if
+            # its result cannot be pickled).  Python 2 does not support
+            # error callbacks.
+            callbacks['error_callback'] = \
+                lambda exc, _id=ah.id: self._finished.put(
+                    (_id, (False, "".join(traceback.format_exception(
+                        type(exc), exc, exc.__traceback__)))))
+        self._pool.apply_async(_solve_problem_file, (data,), **callbacks)
+        return ah
+
+    def _get_task_data(self, opt, args, kwds):
+        """
+        Write the problem file and collect the data needed to solve it
+        in a worker process.
+        """
+        from pyomo.core.base.block import _BlockData
+        import pyomo.core.base.suffix
+        from pyomo.core.kernel.component_block import IBlockStorage
+        import pyomo.core.kernel.component_suffix
+
+        #
+        # The following block of code is taken from the OptSolver.solve()
+        # method, which we do not directly invoke with this interface
+        #
+        model = None
+        for arg in args:
+            if isinstance(arg, (_BlockData, IBlockStorage)):
+                if isinstance(arg, _BlockData):
+                    if not arg.is_constructed():
+                        raise RuntimeError(
+                            "Attempting to solve model=%s with unconstructed "
+                            "component(s)" % (arg.name,) )
+                    model_suffixes = list(name for (name,comp) \
+                                          in pyomo.core.base.suffix.\
+                                          active_import_suffix_generator(arg))
+                else:
+                    model_suffixes = list(name for (name,comp) \
+                                          in pyomo.core.kernel.component_suffix.\
+                                          import_suffix_generator(arg,
+                                                                  active=True,
+                                                                  descend_into=False,
+                                                                  return_key=True))
+                model = arg
+                if len(model_suffixes) > 0:
+                    kwds_suffixes = kwds.setdefault('suffixes',[])
+                    for name in model_suffixes:
+                        if name not in kwds_suffixes:
+                            kwds_suffixes.append(name)
+
+        solver_options = dict(opt.options)
+        solver_options.update(kwds.pop('options', {}))
+        solver_options.update(
+            OptSolver._options_string_to_dict(kwds.pop('options_string', '')))
+
+        #
+        # The problem file is written by the presolve of the solver.
+        # The solver's temporary files are removed once the problem
+        # file has been read, because the worker process writes its
+        # own copy.
+        #
+        kwds['available'] = True
+        try:
+            opt._presolve(*args, **kwds)
+            with open(opt._problem_files[0], 'r') as f:
+                problem_file_string = f.read()
+            warmstart_file_string = None
+            warmstart_filename = None
+            if getattr(opt, "_warm_start_solve", False) and \
+               (opt._warm_start_file_name is not None):
+                warmstart_filename = opt._warm_start_file_name
+                with open(warmstart_filename, 'r') as f:
+                    warmstart_file_string = f.read()
+        finally:
+            TempfileManager.pop(remove=not opt._keepfiles)
+        del kwds['available']
+
+        data = dict(opt=opt.type,
+                    executable=opt._user_executable,
+                    file=problem_file_string,
+                    filename=opt._problem_files[0],
+                    warmstart_file=warmstart_file_string,
+                    warmstart_filename=warmstart_filename,
+                    kwds=kwds,
+                    solver_options=solver_options)
+        return data, model
+
+    def _download_results(self, block=True):
+        """
+        Collect the results of the finished solves.  If block is True,
+        wait until at least one solve finishes.
+        """
+        from pyomo.core.kernel.component_block import IBlockStorage
+
+        finished = []
+        try:
+            finished.append(self._finished.get(block=block))
+            while True:
+                finished.append(self._finished.get(block=False))
+        except queue.Empty:
+            pass
+
+        # All finished solves are processed before an error is raised,
+        # so the results of the other solves are not lost
+        errors = []
+        for ah_id, (ok, results) in finished:
+            self.queued_action_counter -= 1
+            ah = self.event_handle[ah_id]
+            (model,
+             smap_id,
+             load_solutions,
+             select_index,
+             default_variable_value) = self._task_data.pop(ah_id)
+            if not ok:
+                ah.status = ActionStatus.error
+                if isinstance(model, IBlockStorage):
+                    getattr(model, "._symbol_maps").pop(smap_id, None)
+                elif model is not None:
+                    model.solutions.delete_symbol_map(smap_id)
+                errors.append(
+                    "The solve for action %s failed in a worker process:\n%s"
+                    % (ah_id, results))
+                continue
+            ah.status = ActionStatus.done
+
+            results = pickle.loads(results)
+            results._smap_id = smap_id
+            results._smap = None
+            if isinstance(model, IBlockStorage):
+                symbol_maps = getattr(model, "._symbol_maps")
+                if len(results.solution) == 1:
+                    results.solution(0).symbol_map = symbol_maps[smap_id]
+                    results.solution(0).default_variable_value = \
+                        default_variable_value
+                    if load_solutions:
+                        model.load_solution(results.solution(0))
+                del symbol_maps[smap_id]
+                if len(symbol_maps) == 0:
+                    delattr(model, "._symbol_maps")
+                del results._smap_id
+            elif model is not None:
+                if load_solutions:
+                    model.solutions.load_from(
+                        results,
+                        select=select_index,
+                        default_variable_value=default_variable_value)
+                    results._smap_id = None
+                    results.solution.clear()
+                else:
+                    results._smap = model.solutions.symbol_map[smap_id]
+                    model.solutions.delete_symbol_map(smap_id)
+
+            self.results[ah_id] = results
+
+        if errors:
+            raise ActionManagerError("\n".join(errors))
+
+    def get_results(self, ah):
+        return self.results.pop(ah.id, None)
+
+    def wait_all(self, *args):
+        """
+        Wait for all actions to complete.  The arguments to this method
+        are expected to be ActionHandle objects or iterators that return
+        ActionHandle objects.  If no arguments are provided, then this
+        method will terminate after all queued actions are complete.
+        """
+        ahs = self._flatten(*args)
+        if len(ahs):
+            while len(ahs) > 0:
+                ahs.difference_update([ah for ah in ahs
+                                       if ah.status != ActionStatus.queued])
+                if len(ahs):
+                    self._download_results()
+        else:
+            while self.queued_action_counter > 0:
+                self._download_results()
+
+    def wait_any(self, *args):
+        """
+        Wait for any action (or any of the specified actions) to
+        complete, and return the corresponding ActionHandle.
+        """
+        ahs = self._flatten(*args)
+        if len(ahs):
+            while True:
+                for ah in ahs:
+                    if ah.status != ActionStatus.queued:
+                        return ah
+                self._download_results()
+        else:
+            self._download_results(block=False)
+            if len(self.results) == 0:
+                if self.queued_action_counter == 0:
+                    return ActionHandle(
+                        error=True,
+                        explanation=("No queued evaluations available in "
+                                     "the 'processpool' solver manager"))
+                self._download_results()
+            return self.event_handle[next(iter(self.results))]
+
+    def wait_for(self, ah):
+        """
+        Wait for the specified action to complete.
+        """
+        while ah.status == ActionStatus.queued:
+            self._download_results()
+        return self.get_results(ah)
@@ -178,6 +178,11 @@ def minlp_config_block(init=False):
                 bool,
                 'Report various timing statistics during model construction.',
                 None) ).declare_as_argument(dest='report_timing')
+    runtime.declare('profile construction', ConfigValue(
+                None, 
+                str,
+                'Profile model construction, transformations and problem writers, and write the report to the specified file (JSON if the file name ends with .json, and a table otherwise). Use "-" to print the table.',
+                None) ).declare_as_argument(dest='profile_construction', metavar='FILE')
     runtime.declare('tempdir', ConfigValue(
                 None, 
                 str,
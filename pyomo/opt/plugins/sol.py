@@ -167,15 +167,25 @@ class ResultsReader_sol(results.AbstractResultsReader):
             soln.status_description = objno_message
             soln.message = msg.strip()
             soln.message = res.solver.message.replace("\n","; ")
-            soln_variable = soln.variable
-            i = 0
-            for var_value in x:
-                soln_variable["v"+str(i)] = {"Value" : var_value}
-                i = i + 1
-            soln_constraint = soln.constraint
-            if any(re.match(suf,"dual") for suf in suffixes):
-                for i in xrange(0,len(y)):
-                    soln_constraint["c"+str(i)] = {"Dual" : y[i]}
+            lean = res.__dict__.get('_lean', False)
+            if lean:
+                # Store the values (and suffixes) as arrays, which
+                # are aligned with the variable (v0, v1, ...) and
+                # constraint (c0, c1, ...) symbols
+                var_arrays = {"Value" : x}
+                con_arrays = {}
+                if any(re.match(suf,"dual") for suf in suffixes):
+                    con_arrays["Dual"] = y
+            else:
+                soln_variable = soln.variable
+                i = 0
+                for var_value in x:
+                    soln_variable["v"+str(i)] = {"Value" : var_value}
+                    i = i + 1
+                soln_constraint = soln.constraint
+                if any(re.match(suf,"dual") for suf in suffixes):
+                    for i in xrange(0,len(y)):
+                        soln_constraint["c"+str(i)] = {"Dual" : y[i]}
 
             ### Read suffixes ###
             line = fin.readline()
@@ -208,9 +218,20 @@ class ResultsReader_sol(results.AbstractResultsReader):
                 if any(re.match(suf,suffix_name) for suf in suffixes):
                     # ignore translation of the table number to string value for now,
                     # this information can be obtained from the solver documentation
-                    for n in xrange(tabline):
+                    for _ in xrange(tabline):
                         fin.readline()
-                    if kind == 0: # Var
+                    if lean and kind in (0, 1):
+                        if kind == 0:
+                            data = var_arrays[suffix_name] = [None]*n
+                        else:
+                            # see below for the translated name
+                            data = con_arrays[suffix_name[0].upper() +
+                                              suffix_name[1:]] = [None]*m
+                        for cnt in xrange(nvalues):
+                            suf_line = fin.readline().split()
+                            data[int(suf_line[0])] = \
+                                convert_function(suf_line[1])
+                    elif kind == 0: # Var
                         for cnt in xrange(nvalues):
                             suf_line = fin.readline().split()
                             soln_variable["v"+suf_line[0]][suffix_name] = \
@@ -240,10 +261,21 @@ class ResultsReader_sol(results.AbstractResultsReader):
                             soln.problem[suffix_name] = convert_function(suf_line[1])
                 else:
                     # do not store the suffix in the solution object
+                    for _ in xrange(tabline):
+                        fin.readline()
                     for cnt in xrange(nvalues):
                         fin.readline()
                 line = fin.readline()
 
+            if lean:
+                soln.set_arrays('variable',
+                                ["v"+str(i) for i in xrange(n)],
+                                **var_arrays)
+                if con_arrays:
+                    soln.set_arrays('constraint',
+                                    ["c"+str(i) for i in xrange(m)],
+                                    **con_arrays)
+
         #
         # This is a bit of a hack to accommodate PICO.  If
         # the PICO parser has parsed the # of constraints, then
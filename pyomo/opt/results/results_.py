@@ -56,6 +56,9 @@ class SolverResults(MapContainer):
                  pyomo.opt.results.solution.SolutionSet(),
                  False,
                  "Solution Information")
+        # If True, results readers store solution values as arrays
+        # (see Solution.set_arrays)
+        self._lean = False
 
     def add(self, name, value, active, description):
         self.declare(name, value=value, active=active)
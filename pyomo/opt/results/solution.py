@@ -73,6 +73,78 @@ class Solution(MapContainer):
         self.declare('constraint', value={})
 
         self._option = default_print_options
+        #
+        # Entries stored as arrays by set_arrays(): the dictionaries
+        # of these entries are only built when they are accessed.
+        #
+        self._arrays = {}
+
+    def set_arrays(self, name, symbols, **values):
+        """
+        Store the data of a solution map ('variable', 'constraint',
+        'objective' or 'problem') as arrays.
+
+        The symbols are the keys of the map, and each keyword
+        argument is an array of values aligned with the symbols
+        (e.g., Value=[...], Rc=[...]).  A value of None indicates
+        that a symbol has no value for that key.  The map is only
+        built if it is accessed; solution loaders can retrieve the
+        arrays with get_arrays().
+        """
+        key = self._convert(name)
+        if key not in self:
+            self.declare(key, value={})
+        dict.__getitem__(self, key).value = {}
+        self._arrays[key] = (symbols, values)
+
+    def get_arrays(self, name):
+        """
+        Return the (symbols, values) tuple stored with set_arrays(),
+        or None if the map has not been stored as arrays (or has
+        since been accessed).
+        """
+        return self.__dict__.get('_arrays', {}).get(self._convert(name))
+
+    def _expand_arrays(self, key=None):
+        arrays = self.__dict__.get('_arrays', None)
+        if not arrays:
+            return
+        if key is None:
+            keys = list(arrays)
+        elif key in arrays:
+            keys = [key]
+        else:
+            return
+        for key in keys:
+            symbols, values = arrays.pop(key)
+            names = list(values)
+            columns = []
+            for n in names:
+                column = values[n]
+                if hasattr(column, 'tolist'):
+                    column = column.tolist()
+                columns.append(column)
+            data = dict.__getitem__(self, key).value
+            for i, symb in enumerate(symbols):
+                entry = {}
+                for n, column in zip(names, columns):
+                    val = column[i]
+                    if val is not None:
+                        entry[n] = val
+                if entry:
+                    data[symb] = entry
+
+    def __getitem__(self, name):
+        self._expand_arrays(self._convert(name))
+        return MapContainer.__getitem__(self, name)
+
+    def _set_value(self, name, val):
+        self.__dict__.get('_arrays', {}).pop(name, None)
+        MapContainer._set_value(self, name, val)
+
+    def _repn_(self, option):
+        self._expand_arrays()
+        return MapContainer._repn_(self, option)
 
     def load(self, repn):
         # delete key from dictionary, call base class load, handle variable loading.
@@ -100,6 +172,7 @@ class Solution(MapContainer):
         # constraint maps - which are dictionaries of dictionaries, with
         # at a minimum an "id" element per sub-directionary.  
         #
+        self._expand_arrays()
         first = True
         for key in self._order:
             if not key in repn or key == 'Problem':
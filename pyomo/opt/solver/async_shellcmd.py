@@ -0,0 +1,185 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# The coroutine that implements SystemCallSolver.solve_async().  This
+# module uses the async/await syntax, so it can only be imported by
+# Python 3.5 (or later).
+#
+
+__all__ = ['solve_async']
+
+import asyncio
+import sys
+import time
+
+import pyutilib.misc
+from pyutilib.common import ApplicationError
+from pyutilib.misc import Bunch, quote_split
+from pyutilib.services import TempfileManager
+
+from pyomo.opt.solver.shellcmd import SystemCallSolver
+
+
+def _push_tempfiles(tempfiles):
+    """
+    Push a TempfileManager context that contains the specified files.
+    """
+    TempfileManager.push()
+    for filename in tempfiles:
+        TempfileManager.add_tempfile(filename, exists=False)
+
+
+async def solve_async(opt, *args, **kwds):
+    """
+    Solve the problem with the SystemCallSolver opt without blocking
+    the event loop.  See SystemCallSolver.solve_async().
+    """
+    if getattr(opt, '_async_solve_active', False):
+        raise RuntimeError(
+            "Solver (%s) is already executing an asynchronous solve"
+            % (opt.name,))
+    log_callback = kwds.pop('log_callback', None)
+
+    _model = opt._prepare_solve(args, kwds)
+
+    #
+    # Handle ephemeral solvers options here (see OptSolver.solve())
+    #
+    orig_options = opt.options
+
+    opt.options = pyutilib.misc.Options()
+    opt.options.update(orig_options)
+    opt.options.update(kwds.pop('options', {}))
+    opt.options.update(
+        opt._options_string_to_dict(kwds.pop('options_string', '')))
+    opt._async_solve_active = True
+    tempfiles = None
+    try:
+        opt._presolve(*args, **kwds)
+        #
+        # The TempfileManager contexts form a stack, which cannot be
+        # shared by solves that run concurrently.  The files of this
+        # solve are removed from the stack while the solver executes,
+        # and they are pushed back for the postsolve.
+        #
+        tempfiles = TempfileManager._tempfiles[-1]
+        TempfileManager.pop(remove=False)
+
+        if not _model is None:
+            opt._initialize_callbacks(_model)
+
+        _status = await _apply_solver(opt, log_callback)
+        opt._check_solver_status(_status)
+
+        _push_tempfiles(tempfiles)
+        tempfiles = None
+        result = opt._process_solve_results(_model)
+    finally:
+        if tempfiles is not None:
+            _push_tempfiles(tempfiles)
+            TempfileManager.pop(remove=not opt._keepfiles)
+        #
+        # Reset the options dict
+        #
+        opt.options = orig_options
+        opt._async_solve_active = False
+
+    return result
+
+
+async def _apply_solver(opt, log_callback):
+    """
+    The asynchronous version of SystemCallSolver._apply_solver().
+    """
+    opt._prepare_execution()
+    sys.stdout.flush()
+    if type(opt)._execute_command is not SystemCallSolver._execute_command:
+        # Solvers that customize the execution of the command (e.g.,
+        # the mock solvers used for testing) are executed
+        # synchronously
+        opt._rc, opt._log = opt._execute_command(opt._command)
+    else:
+        opt._rc, opt._log = await _execute_command(opt,
+                                                   opt._command,
+                                                   log_callback)
+    sys.stdout.flush()
+    return Bunch(rc=opt._rc, log=opt._log)
+
+
+async def _execute_command(opt, command, log_callback):
+    """
+    Execute the command in a subprocess, and collect its output while
+    it executes.
+    """
+    start_time = time.time()
+
+    cmd = command.cmd
+    if type(cmd) not in (list, tuple):
+        cmd = quote_split(cmd.strip())
+    if 'script' in command:
+        _input = command.script
+    else:
+        _input = None
+    timelimit = opt._timelimit
+    if timelimit is not None:
+        timelimit += max(1, 0.01*timelimit)
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE if _input is not None \
+                else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=command.env)
+    except OSError:
+        err = sys.exc_info()[1]
+        msg = 'Could not execute the command: %s\tError message: %s'
+        raise ApplicationError(msg % (cmd, err))
+
+    log = []
+    try:
+        await asyncio.wait_for(
+            _read_output(proc, _input, log, opt._tee, log_callback),
+            timelimit)
+    except asyncio.TimeoutError:
+        if proc.returncode is None:
+            proc.kill()
+    except:
+        # Do not leave the solver running if the solve is cancelled
+        if proc.returncode is None:
+            proc.kill()
+        raise
+    rc = await proc.wait()
+
+    opt._last_solve_time = time.time() - start_time
+
+    return [rc, "".join(log)]
+
+
+async def _read_output(proc, _input, log, tee, log_callback):
+    """
+    Send the input to the subprocess and read its output until the
+    subprocess closes it.
+    """
+    if _input is not None:
+        proc.stdin.write(_input.encode())
+        await proc.stdin.drain()
+        proc.stdin.close()
+    while True:
+        line = await proc.stdout.readline()
+        if not line:
+            break
+        line = line.decode(errors='replace')
+        log.append(line)
+        if tee:
+            sys.stdout.write(line)
+        if log_callback is not None:
+            log_callback(line)
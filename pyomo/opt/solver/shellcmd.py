@@ -219,7 +219,42 @@ class SystemCallSolver(OptSolver):
            os.path.exists(self._soln_file):
             os.remove(self._soln_file)
 
+    def solve_async(self, *args, **kwds):
+        """
+        Solve the problem without blocking the asyncio event loop.
+
+        This method accepts the same arguments as solve() and returns
+        a coroutine, which executes the solver with
+        asyncio.create_subprocess_exec() and returns the results:
+
+            results = await opt.solve_async(model)
+
+        The solver output is read as it is generated.  It is printed
+        when tee=True, and each line is passed to the callable
+        log_callback (if specified).  Many solves can run concurrently
+        in a single event loop, but each must use a different solver
+        object, because the state of a solve is stored on the solver.
+        This requires Python 3.5 or later (and a ProactorEventLoop on
+        Windows).
+        """
+        if sys.version_info < (3,5):
+            raise RuntimeError(
+                "The solve_async() method requires Python 3.5 or later")
+        from pyomo.opt.solver.async_shellcmd import solve_async
+        return solve_async(self, *args, **kwds)
+
     def _apply_solver(self):
+        self._prepare_execution()
+        sys.stdout.flush()
+        self._rc, self._log = self._execute_command(self._command)
+        sys.stdout.flush()
+        return Bunch(rc=self._rc, log=self._log)
+
+    def _prepare_execution(self):
+        """
+        Report the command and the solver files before the solver is
+        executed.
+        """
         if registered_executable('timer'):
             self._timer = registered_executable('timer').get_path()
         #
@@ -238,11 +273,6 @@ class SystemCallSolver(OptSolver):
             if self._problem_files is not []:
                 print("Solver problem files: %s" % str(self._problem_files))
 
-        sys.stdout.flush()
-        self._rc, self._log = self._execute_command(self._command)
-        sys.stdout.flush()
-        return Bunch(rc=self._rc, log=self._log)
-
     def _postsolve(self):
 
         if self._log_file is not None:
@@ -322,6 +352,7 @@ class SystemCallSolver(OptSolver):
         if self._results_format is None:
             raise ValueError("Results format is None")
         results = self.process_logfile()
+        results._lean = self._lean_results
         log_file_completion_time = time.time()
         if self._report_timing is True:
             print("      %6.2f seconds required to read logfile " % (log_file_completion_time - start_time))
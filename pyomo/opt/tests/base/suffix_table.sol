@@ -0,0 +1,33 @@
+MINOS 5.51: optimal solution found.
+2 iterations, objective 3
+
+Options
+3
+1
+1
+0
+2
+2
+3
+3
+0.5
+0
+1
+2
+0
+objno 0 0
+suffix 4 3 8 45 3
+sstatus
+0	none	no status assigned
+1	bas	basic
+3	low	nonbasic at lower bound
+0 1
+1 1
+2 3
+suffix 5 2 8 45 3
+sstatus
+0	none	no status assigned
+1	bas	basic
+3	low	nonbasic at lower bound
+0 3
+1 1
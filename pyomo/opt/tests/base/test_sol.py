@@ -49,6 +49,50 @@ class Test(unittest.TestCase):
             soln.write(filename=currdir+"factory.txt", format='json')
             self.assertMatchesJsonBaseline(currdir+"factory.txt", currdir+"test4_sol.jsn")
 
+    def test_factory_lean(self):
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            if reader is None:
+                raise IOError("Reader 'sol' is not registered")
+            res = pyomo.opt.SolverResults()
+            res._lean = True
+            soln = reader(currdir+"test4_sol.sol", res=res, suffixes=["dual"])
+            symbols, values = soln.solution(0).get_arrays('variable')
+            self.assertEqual(symbols[:2], ['v0', 'v1'])
+            self.assertEqual(len(values['Value']), len(symbols))
+            self.assertIsNotNone(soln.solution(0).get_arrays('constraint'))
+            soln.write(filename=currdir+"factory.txt", format='json')
+            self.assertMatchesJsonBaseline(currdir+"factory.txt", currdir+"test4_sol.jsn")
+
+    def test_suffix_table_lean(self):
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            if reader is None:
+                raise IOError("Reader 'sol' is not registered")
+            res = pyomo.opt.SolverResults()
+            res._lean = True
+            soln = reader(currdir+"suffix_table.sol", res=res,
+                          suffixes=["dual", "sstatus"])
+            self.assertEqual(soln.problem.number_of_variables, 3)
+            self.assertEqual(soln.problem.number_of_constraints, 2)
+            symbols, values = soln.solution(0).get_arrays('variable')
+            self.assertEqual(symbols, ['v0', 'v1', 'v2'])
+            self.assertEqual(values['Value'], [1, 2, 0])
+            self.assertEqual(values['sstatus'], [1, 1, 3])
+            symbols, values = soln.solution(0).get_arrays('constraint')
+            self.assertEqual(symbols, ['c0', 'c1'])
+            self.assertEqual(values['Dual'], [0.5, 0])
+            self.assertEqual(values['Sstatus'], [3, 1])
+
+    def test_suffix_table_skipped(self):
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            if reader is None:
+                raise IOError("Reader 'sol' is not registered")
+            soln = reader(currdir+"suffix_table.sol", suffixes=["dual"])
+            self.assertEqual(soln.problem.number_of_variables, 3)
+            self.assertEqual(len(soln.solution(0).variable), 3)
+            # the sstatus tables and values are not read as messages
+            self.assertTrue(
+                soln.solver.message.endswith("2 iterations, objective 3"))
+
     def test_infeasible1(self):
         with pyomo.opt.ReaderFactory("sol") as reader:
             if reader is None:
@@ -176,6 +176,35 @@ class Test(unittest.TestCase):
         self.assertEqual(self.soln.variable[4]["Value"],0.3)
         self.assertEqual(self.soln.variable[4]["Slack"],0.4)
 
+    def test_soln_arrays(self):
+        soln = self.results.solution.add()
+        soln.set_arrays('variable', ['x', 'y', 'z'],
+                        Value=[1.0, 2.0, 3.0], Rc=[None, 0.5, None])
+        soln.set_arrays('constraint', ['c'], Dual=[None])
+        symbols, values = soln.get_arrays('variable')
+        self.assertEqual(symbols, ['x', 'y', 'z'])
+        self.assertEqual(values['Rc'], [None, 0.5, None])
+        # The maps are built when they are accessed
+        self.assertEqual(soln.variable,
+                         {'x': {'Value': 1.0},
+                          'y': {'Value': 2.0, 'Rc': 0.5},
+                          'z': {'Value': 3.0}})
+        self.assertIsNone(soln.get_arrays('variable'))
+        self.assertIsNotNone(soln.get_arrays('constraint'))
+        self.assertEqual(soln['Constraint'], {})
+        self.assertIsNone(soln.get_arrays('constraint'))
+        # Assigning a map discards the arrays
+        soln.set_arrays('variable', ['x'], Value=[4.0])
+        soln.variable = {'w': {'Value': 5.0}}
+        self.assertIsNone(soln.get_arrays('variable'))
+        self.assertEqual(soln.variable, {'w': {'Value': 5.0}})
+        # Printing and pickling
+        soln.set_arrays('variable', ['x'], Value=[4.0])
+        tmp = pickle.loads(pickle.dumps(soln))
+        self.assertEqual(tmp.get_arrays('variable'), (['x'], {'Value': [4.0]}))
+        self.assertIn("Value: 4", str(self.results))
+        self.assertIsNone(soln.get_arrays('variable'))
+
 if __name__ == "__main__":
     import pyutilib.misc
     #sys.settrace(pyutilib.misc.traceit)
@@ -32,7 +32,7 @@ from pyomo.core import (value, minimize, maximize,
                         ComponentUID)
 from pyomo.core.base.suffix import ComponentMap
 from pyomo.core.base.block import (_BlockData,
-                                   generate_cuid_names)
+                                   ComponentUIDIndex)
 from pyomo.core.base.sos import _SOSConstraintData
 from pyomo.repn import (generate_canonical_repn,
                         GeneralCanonicalRepn)
@@ -52,20 +52,30 @@ logger = logging.getLogger('pyomo.pysp')
 class _CUIDLabeler(object):
     def __init__(self):
         self._cuid_map = ComponentMap()
+        # block -> ComponentUIDIndex
+        self._indexes = ComponentMap()
 
     def update_cache(self, block):
-        self._cuid_map.update(generate_cuid_names(block))
+        if block not in self._indexes:
+            self._indexes[block] = ComponentUIDIndex(block)
 
     def clear_cache(self):
-        self._cuid_map = {}
+        self._cuid_map = ComponentMap()
+        self._indexes = ComponentMap()
 
     def __call__(self, obj):
         if obj in self._cuid_map:
             return self._cuid_map[obj]
-        else:
+        # use the index of the closest cached block that contains obj
+        block = obj.parent_block()
+        while block is not None and block not in self._indexes:
+            block = block.parent_block()
+        if block is None:
             cuid = repr(ComponentUID(obj))
-            self._cuid_map[obj] = cuid
-            return cuid
+        else:
+            cuid = repr(self._indexes[block].cuid(obj))
+        self._cuid_map[obj] = cuid
+        return cuid
 
 class ScenarioTreeNode(object):
 
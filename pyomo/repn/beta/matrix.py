@@ -9,7 +9,8 @@
 #  ___________________________________________________________________________
 
 __all__ = ("_LinearConstraintData", "MatrixConstraint",
-           "compile_block_linear_constraints",)
+           "compile_block_linear_constraints",
+           "compile_linear_constraint_matrix",)
 
 import time
 import logging
@@ -46,6 +47,113 @@ def _label_bytes(x):
         return str(x / 1.0e6)+" MB"
     return str(x / 1.0e9)+" GB"
 
+def _get_bound(exp):
+    if exp is None:
+        return None
+    if is_fixed(exp):
+        return value(exp)
+    raise ValueError("non-fixed bound: " + str(exp))
+
+def _get_range(constraint_data, constant):
+    """
+    Returns the lower and upper range values (the bounds of a
+    constraint minus the constant in its body) and the
+    MatrixConstraint range type of a constraint.
+    """
+    L = _get_bound(constraint_data.lower)
+    U = _get_bound(constraint_data.upper)
+    if constant is None:
+        constant = 0
+    if (L is not None) and \
+       (U is not None) and \
+       (not constraint_data.equality):
+        range_type = MatrixConstraint.LowerBound | \
+                     MatrixConstraint.UpperBound
+    elif constraint_data.equality:
+        range_type = MatrixConstraint.Equality
+    elif L is not None:
+        range_type = MatrixConstraint.LowerBound
+    elif U is not None:
+        range_type = MatrixConstraint.UpperBound
+    else:
+        raise ValueError("Constraint does not have a lower "
+                         "or an upper bound: %s" % (constraint_data.name,))
+    return (L - constant if (L is not None) else 0,
+            U - constant if (U is not None) else 0,
+            range_type)
+
+#
+# Compile the linear constraints in a list of constraints into sparse
+# matrix (CSR) data without modifying the model.  This lets the
+# direct solver interfaces load the rows with their bulk routines
+# instead of one call per constraint.
+#
+def compile_linear_constraint_matrix(constraints,
+                                     column_index,
+                                     skip_trivial_constraints=False):
+    """
+    Compile the linear constraints in a list of constraint data
+    objects into a sparse matrix in CSR format.
+
+    Args:
+        constraints: The constraint data objects to compile. Each
+            constraint must have a lower or an upper bound.
+        column_index: A mapping (e.g., a ComponentMap) from the
+            variables in the constraints to their column index.
+        skip_trivial_constraints (bool): Skip the linear
+            constraints with a constant body.
+
+    Returns:
+        A tuple (rows, nonlinear, pRows, jCols, Vals, Ranges,
+        RangeTypes, RowVariables), where rows is the list of
+        compiled constraints (the rows of the matrix), nonlinear
+        is the list of constraints that are not linear, and the
+        remaining items are lists that follow the MatrixConstraint
+        storage conventions. RowVariables holds the variables of
+        each row (in the order of the row's columns).
+    """
+    rows = []
+    nonlinear = []
+    SparseMat_pRows = [0]
+    SparseMat_jCols = []
+    SparseMat_Vals = []
+    Ranges = []
+    RangeTypes = []
+    RowVariables = []
+    for constraint_data in constraints:
+        if getattr(constraint_data, "_linear_canonical_form", False):
+            canonical_repn = constraint_data.canonical_form()
+        elif isinstance(constraint_data, LinearCanonicalRepn):
+            canonical_repn = constraint_data
+        else:
+            canonical_repn = generate_canonical_repn(constraint_data.body)
+        if not isinstance(canonical_repn, LinearCanonicalRepn):
+            nonlinear.append(constraint_data)
+            continue
+
+        variables = canonical_repn.variables
+        if variables is None:
+            if skip_trivial_constraints:
+                continue
+            variables = ()
+        else:
+            SparseMat_jCols.extend(column_index[vardata]
+                                   for vardata in variables)
+            SparseMat_Vals.extend(canonical_repn.linear)
+
+        L, U, range_type = _get_range(constraint_data,
+                                      value(canonical_repn.constant))
+        rows.append(constraint_data)
+        RowVariables.append(variables)
+        SparseMat_pRows.append(len(SparseMat_jCols))
+        Ranges.append(L)
+        Ranges.append(U)
+        RangeTypes.append(range_type)
+
+    return (rows, nonlinear,
+            SparseMat_pRows, SparseMat_jCols, SparseMat_Vals,
+            Ranges, RangeTypes, RowVariables)
+
 #
 # Compile a Pyomo constructed model in-place, storing the compiled
 # sparse constraint object on the model under constraint_name.
@@ -76,13 +184,6 @@ def compile_block_linear_constraints(parent_block,
     Ranges = []
     RangeTypes = []
 
-    def _get_bound(exp):
-        if exp is None:
-            return None
-        if is_fixed(exp):
-            return value(exp)
-        raise ValueError("non-fixed bound: " + str(exp))
-
     start_time = time.time()
     if verbose:
         print("Sorting active blocks...")
@@ -198,27 +299,12 @@ def compile_block_linear_constraints(parent_block,
                         nnz += len(row_variable_symbols)
                         nrows += 1
 
-                        L = _get_bound(constraint_data.lower)
-                        U = _get_bound(constraint_data.upper)
-                        constant = value(canonical_repn.constant)
-                        if constant is None:
-                            constant = 0
-
-                        Ranges.append(L - constant if (L is not None) else 0)
-                        Ranges.append(U - constant if (U is not None) else 0)
-                        if (L is not None) and \
-                           (U is not None) and \
-                           (not constraint_data.equality):
-                            RangeTypes.append(MatrixConstraint.LowerBound |
-                                              MatrixConstraint.UpperBound)
-                        elif constraint_data.equality:
-                            RangeTypes.append(MatrixConstraint.Equality)
-                        elif L is not None:
-                            assert U is None
-                            RangeTypes.append(MatrixConstraint.LowerBound)
-                        else:
-                            assert U is not None
-                            RangeTypes.append(MatrixConstraint.UpperBound)
+                        L, U, range_type = _get_range(
+                            constraint_data,
+                            value(canonical_repn.constant))
+                        Ranges.append(L)
+                        Ranges.append(U)
+                        RangeTypes.append(range_type)
 
                         # Start freeing up memory
                         constraint[index] = Constraint.Skip
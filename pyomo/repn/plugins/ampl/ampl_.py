@@ -28,6 +28,7 @@ import time
 from pyutilib.misc import PauseGC
 
 import pyomo.util.plugin
+from pyomo.util import timing
 from pyomo.opt import ProblemFormat
 from pyomo.opt.base import *
 from pyomo.core.base import *
@@ -162,14 +163,25 @@ def _get_bound(exp):
 
 class StopWatch(object):
 
-    def __init__(self):
-        self.start = time.time()
+    def __init__(self, verbose=True, phases=False):
+        # verbose: print the section times
+        # phases: record the sections as writer phases (see
+        #         pyomo.util.timing.WriterTimer)
+        self.verbose = verbose
+        self.phases = phases
+        self.reset()
 
     def report(self, msg):
-        print(msg+" (seconds): "+str(time.time()-self.start))
+        if self.verbose:
+            print(msg+" (seconds): "+str(time.time()-self.start))
+        if self.phases:
+            self.timer.phase = msg
+            self.timer.report()
 
     def reset(self):
         self.start = time.time()
+        if self.phases:
+            self.timer = timing.WriterTimer(ProblemFormat.nl)
 
 class _Counter(object):
 
@@ -689,8 +701,12 @@ class ProblemWriter_nl(AbstractProblemWriter):
         # in the NL format. however, we by convention make them go from
         # x0 upward.
 
-        overall_timer = StopWatch()
-        subsection_timer = StopWatch()
+        # Sections are also timed while construction profiling is
+        # enabled (see pyomo.util.timing.profile_construction)
+        section_timing = show_section_timing or timing._profile is not None
+        overall_timer = StopWatch(show_section_timing)
+        subsection_timer = StopWatch(show_section_timing,
+                                     phases=timing._profile is not None)
 
         # create the symbol_map
         symbol_map = SymbolMap()
@@ -882,7 +898,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
         elif n_objs == 1:
             symbol_map.alias(symbol_map.bySymbol["o0"](),"__default_objective__")
 
-        if show_section_timing:
+        if section_timing:
             subsection_timer.report("Generate objective representation")
             subsection_timer.reset()
 
@@ -1074,7 +1090,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
             [(Constraints_dict[con_ID][0],"c%d"%row_id) for row_id,con_ID in \
              enumerate(itertools.chain(nonlin_con_order_list,lin_con_order_list))])
 
-        if show_section_timing:
+        if section_timing:
             subsection_timer.report("Generate constraint representations")
             subsection_timer.reset()
 
@@ -1176,7 +1192,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
         symbol_map.addSymbols([(Vars_dict[var_ID],"v%d"%column_id)
                                for column_id,var_ID in enumerate(full_var_list)])
 
-        if show_section_timing:
+        if section_timing:
             subsection_timer.report("Partition variable types")
             subsection_timer.reset()
 
@@ -1244,7 +1260,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     max_colname_len = len(varname)
             colf.close()
 
-        if show_section_timing:
+        if section_timing:
             subsection_timer.report("Write .col file")
             subsection_timer.reset()
 
@@ -1562,7 +1578,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
             OUTPUT.write("\n")
             OUTPUT.write("n0\n")
 
-        if show_section_timing:
+        if section_timing:
             subsection_timer.report("Write NL header and suffix lines")
             subsection_timer.reset()
 
@@ -1597,7 +1613,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
             rowf.close()
         del name_labeler
 
-        if show_section_timing:
+        if section_timing:
             subsection_timer.report("Write objective expression")
             subsection_timer.reset()
 
@@ -1679,7 +1695,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
         OUTPUT.writelines(x_init_list)
         del x_init_list
 
-        if show_section_timing:
+        if section_timing:
             subsection_timer.report("Write initializations")
             subsection_timer.reset()
 
@@ -1696,7 +1712,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                           for con_ID in itertools.chain(nonlin_con_order_list,
                                                         lin_con_order_list))
 
-        if show_section_timing:
+        if section_timing:
             subsection_timer.report("Write constraint bounds")
             subsection_timer.reset()
 
@@ -1711,7 +1727,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
         OUTPUT.writelines(var_bound_list)
         del var_bound_list
 
-        if show_section_timing:
+        if section_timing:
             subsection_timer.report("Write variable bounds")
             subsection_timer.reset()
 
@@ -1730,7 +1746,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
             OUTPUT.write("%d\n"%(ktot))
         del cu
 
-        if show_section_timing:
+        if section_timing:
             subsection_timer.report("Write k lines")
             subsection_timer.reset()
 
@@ -1780,7 +1796,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     for con_var in nl_con_vars)
 
 
-        if show_section_timing:
+        if section_timing:
             subsection_timer.report("Write J lines")
             subsection_timer.reset()
 
@@ -1806,7 +1822,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     OUTPUT.write("%d %r\n" % (var_ID,
                                               grad_entries[var_ID]))
 
-        if show_section_timing:
+        if section_timing:
             subsection_timer.report("Write G lines")
             subsection_timer.reset()
             overall_timer.report("Total time")
@@ -0,0 +1,94 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Test the compiled sparse matrix representation of linear constraints
+#
+
+import pyutilib.th as unittest
+
+from pyomo.environ import *
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.repn.beta.matrix import (MatrixConstraint,
+                                    compile_block_linear_constraints,
+                                    compile_linear_constraint_matrix)
+
+
+def _create_model():
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3])
+    m.p = Param(initialize=2, mutable=True)
+    m.c1 = Constraint(expr=m.p*m.x[1] + m.x[2] + 3 >= 1)
+    m.c2 = Constraint(expr=(0, m.x[3] - m.x[1], 4))
+    m.c3 = Constraint(expr=m.x[1]*m.x[2] <= 1)
+    m.c4 = Constraint(expr=m.x[2] == 5)
+    m.c5 = Constraint(expr=m.x[3] <= 2)
+    return m
+
+
+class TestCompileLinearConstraintMatrix(unittest.TestCase):
+
+    def test_matrix(self):
+        m = _create_model()
+        m.x[3].fix(1)
+        column_index = ComponentMap((v, i) for i, v in enumerate(m.x.values()))
+        rows, nonlinear, pRows, jCols, vals, ranges, range_types, row_vars = \
+            compile_linear_constraint_matrix(
+                [m.c1, m.c2, m.c3, m.c4, m.c5], column_index)
+        self.assertEqual([c.name for c in rows], ['c1', 'c2', 'c4', 'c5'])
+        self.assertEqual([c.name for c in nonlinear], ['c3'])
+        self.assertEqual(pRows, [0, 2, 3, 4, 4])
+        self.assertEqual(jCols, [0, 1, 0, 1])
+        self.assertEqual(vals, [2, 1, -1, 1])
+        self.assertEqual(ranges, [-2, 0, -1, 3, 5, 5, 0, 1])
+        self.assertEqual(range_types,
+                         [MatrixConstraint.LowerBound,
+                          MatrixConstraint.LowerBound |
+                          MatrixConstraint.UpperBound,
+                          MatrixConstraint.Equality,
+                          MatrixConstraint.UpperBound])
+        self.assertEqual([len(v) for v in row_vars], [2, 1, 1, 0])
+        self.assertIs(row_vars[1][0], m.x[1])
+
+    def test_skip_trivial(self):
+        m = _create_model()
+        m.x[3].fix(1)
+        column_index = ComponentMap((v, i) for i, v in enumerate(m.x.values()))
+        rows = compile_linear_constraint_matrix(
+            [m.c4, m.c5], column_index, skip_trivial_constraints=True)[0]
+        self.assertEqual([c.name for c in rows], ['c4'])
+
+    def test_no_bounds(self):
+        m = _create_model()
+        m.c6 = Constraint(expr=m.x[1] >= 0)
+        m.c6._lower = None
+        column_index = ComponentMap((v, i) for i, v in enumerate(m.x.values()))
+        with self.assertRaises(ValueError):
+            compile_linear_constraint_matrix([m.c6], column_index)
+
+    def test_compile_block(self):
+        m = _create_model()
+        compile_block_linear_constraints(m, 'A')
+        self.assertEqual(len(m.A), 4)
+        self.assertEqual([c.name for c in
+                          m.component_data_objects(Constraint,
+                                                   descend_into=False)
+                          if not isinstance(c.parent_component(),
+                                            MatrixConstraint)],
+                         ['c3'])
+        self.assertEqual(list(m.A._range_types),
+                         [MatrixConstraint.LowerBound,
+                          MatrixConstraint.LowerBound |
+                          MatrixConstraint.UpperBound,
+                          MatrixConstraint.Equality,
+                          MatrixConstraint.UpperBound])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -273,6 +273,12 @@ def add_misc_group(parser):
         action='store_true',
         dest='report_timing',
         default=False)
+    group.add_argument('--profile-construction',
+        help='Profile model construction, transformations and problem writers, and write the report to the specified file (JSON if the file name ends with .json, and a table otherwise). Use "-" to print the table. Defaults to disabled.',
+        action='store',
+        dest='profile_construction',
+        metavar='FILE',
+        default=None)
     group.add_argument('--tempdir',
         help='Specify the directory where temporary files are generated.',
         action='store',
@@ -20,6 +20,7 @@ import json
 from six import itervalues, iterkeys, iteritems
 from six.moves import xrange
 from pyomo.util import pyomo_api
+import pyomo.util.timing
 
 try:
     import yaml
@@ -114,6 +115,11 @@ def setup_environment(data):
     if data.options.runtime.disable_gc:
         gc.disable()
     #
+    # Enable construction profiling
+    #
+    if data.options.runtime.profile_construction:
+        pyomo.util.timing.profile_construction()
+    #
     # Setup management for temporary files
     #
     if not data.options.runtime.tempdir is None:
@@ -818,6 +824,16 @@ def finalize(data, model=None, instance=None, results=None):
             sys.stdout.write('Maximum memory used = %d bytes\n' % data.local.max_memory)
         sys.stdout.flush()
     #
+    # Write the construction profile
+    #
+    if data.options.runtime.profile_construction:
+        profile = pyomo.util.timing.profile_construction(False)
+        if profile is not None:
+            if data.options.runtime.profile_construction == '-':
+                profile.pprint()
+            else:
+                profile.save(data.options.runtime.profile_construction)
+    #
     model=model
     instance=instance
     results=results
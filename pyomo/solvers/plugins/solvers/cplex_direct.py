@@ -16,6 +16,7 @@ from pyutilib.misc import Bunch
 from pyomo.util.plugin import alias
 from pyomo.core.kernel.numvalue import is_fixed
 from pyomo.repn import generate_canonical_repn, LinearCanonicalRepn, canonical_degree
+from pyomo.repn.beta.matrix import MatrixConstraint, compile_linear_constraint_matrix
 from pyomo.solvers.plugins.solvers.direct_solver import DirectSolver
 from pyomo.solvers.plugins.solvers.direct_or_persistent_solver import DirectOrPersistentSolver
 from pyomo.core.kernel.numvalue import value
@@ -100,9 +101,7 @@ class CPLEXDirect(DirectSolver):
 
     def _apply_solver(self):
         if not self._save_results:
-            for block in self._pyomo_model.block_data_objects(descend_into=True, active=True):
-                for var in block.component_data_objects(ctype=pyomo.core.base.var.Var, descend_into=False, active=True, sort=False):
-                    var.stale = True
+            self._pyomo_model._flag_vars_as_stale()
         if self._tee:
             def _process_stream(arg):
                 sys.stdout.write(arg)
@@ -274,6 +273,39 @@ class CPLEXDirect(DirectSolver):
             self._solver_model.variables.set_lower_bounds(varname, var.value)
             self._solver_model.variables.set_upper_bounds(varname, var.value)
 
+    def _add_vars(self, vars):
+        if len(vars) == 0:
+            return
+
+        varnames = []
+        lbs = []
+        ubs = []
+        vtypes = []
+        for var in vars:
+            varnames.append(self._symbol_map.getSymbol(var, self._labeler))
+            vtypes.append(self._cplex_vtype_from_var(var))
+            if var.is_fixed():
+                lbs.append(var.value)
+                ubs.append(var.value)
+                continue
+            if var.has_lb():
+                lbs.append(value(var.lb))
+            else:
+                lbs.append(-self._cplex.infinity)
+            if var.has_ub():
+                ubs.append(value(var.ub))
+            else:
+                ubs.append(self._cplex.infinity)
+
+        self._solver_model.variables.add(lb=lbs, ub=ubs, types=vtypes, names=varnames)
+
+        for var, varname in zip(vars, varnames):
+            self._pyomo_var_to_solver_var_map[var] = varname
+            self._solver_var_to_pyomo_var_map[varname] = var
+            self._pyomo_var_to_ndx_map[var] = self._ndx_count
+            self._ndx_count += 1
+            self._referenced_variables[var] = 0
+
     def _set_instance(self, model, kwds={}):
         self._pyomo_var_to_ndx_map = ComponentMap()
         self._ndx_count = 0
@@ -306,6 +338,63 @@ class CPLEXDirect(DirectSolver):
                             % (var.name, self._pyomo_model.name,))
 
     def _add_constraint(self, con):
+        self._add_constraints((con,))
+
+    def _add_constraints(self, cons):
+        # The linear constraints are compiled into a sparse matrix
+        # and added to the solver model with a single call
+        cons = [con for con in cons if con.active]
+        rows, nonlinear, pRows, jCols, vals, ranges, range_types, row_vars = \
+            compile_linear_constraint_matrix(
+                cons,
+                self._pyomo_var_to_ndx_map,
+                skip_trivial_constraints=self._skip_trivial_constraints)
+
+        # The other constraints are compiled and checked before any
+        # constraint is added, so nothing is added if one of them is
+        # not supported
+        other_cons = []
+        for con in nonlinear:
+            con_data = self._get_constraint_data(con)
+            if con_data is None:
+                continue
+            conname, cplex_expr, referenced_vars, my_sense, my_rhs, my_range = con_data
+            if len(cplex_expr.q_coefficients) != 0 and my_sense == 'R':
+                raise ValueError("The CPLEXDirect interface does not "
+                                 "support quadratic range constraints: "
+                                 "{0}".format(con))
+            other_cons.append((con, con_data))
+
+        self._add_linear_constraints(rows, pRows, jCols, vals, ranges, range_types, row_vars)
+
+        for con, con_data in other_cons:
+            conname, cplex_expr, referenced_vars, my_sense, my_rhs, my_range = con_data
+            if len(cplex_expr.q_coefficients) == 0:
+                self._solver_model.linear_constraints.add(
+                    lin_expr=[[cplex_expr.variables,
+                               cplex_expr.coefficients]],
+                    senses=[my_sense],
+                    rhs=[my_rhs],
+                    range_values=[my_range] if my_sense == 'R' else [],
+                    names=[conname])
+            else:
+                self._solver_model.quadratic_constraints.add(
+                    lin_expr=[cplex_expr.variables,
+                              cplex_expr.coefficients],
+                    quad_expr=[cplex_expr.q_variables1,
+                               cplex_expr.q_variables2,
+                               cplex_expr.q_coefficients],
+                    sense=my_sense,
+                    rhs=my_rhs,
+                    name=conname)
+            self._add_constraint_references(con, conname, referenced_vars)
+
+    def _get_constraint_data(self, con):
+        """
+        Returns a tuple (conname, cplex_expr, referenced_vars, sense,
+        rhs, range_value) for a constraint, or None if the constraint
+        is skipped.
+        """
         if not con.active:
             return None
 
@@ -339,50 +428,79 @@ class CPLEXDirect(DirectSolver):
 
         if con.equality:
             my_sense = 'E'
-            my_rhs = [value(con.lower) - cplex_expr.offset]
-            my_range = []
+            my_rhs = value(con.lower) - cplex_expr.offset
+            my_range = 0.0
         elif con.has_lb() and con.has_ub():
             my_sense = 'R'
             lb = value(con.lower)
             ub = value(con.upper)
-            my_rhs = [ub - cplex_expr.offset]
-            my_range = [lb - ub]
+            my_rhs = ub - cplex_expr.offset
+            my_range = lb - ub
             self._range_constraints.add(con)
         elif con.has_lb():
             my_sense = 'G'
-            my_rhs = [value(con.lower) - cplex_expr.offset]
-            my_range = []
+            my_rhs = value(con.lower) - cplex_expr.offset
+            my_range = 0.0
         elif con.has_ub():
             my_sense = 'L'
-            my_rhs = [value(con.upper) - cplex_expr.offset]
-            my_range = []
+            my_rhs = value(con.upper) - cplex_expr.offset
+            my_range = 0.0
         else:
             raise ValueError("Constraint does not have a lower "
                              "or an upper bound: {0} \n".format(con))
 
-        if len(cplex_expr.q_coefficients) == 0:
-            self._solver_model.linear_constraints.add(
-                lin_expr=[[cplex_expr.variables,
-                           cplex_expr.coefficients]],
-                senses=my_sense,
-                rhs=my_rhs,
-                range_values=my_range,
-                names=[conname])
-        else:
-            if my_sense == 'R':
-                raise ValueError("The CPLEXDirect interface does not "
-                                 "support quadratic range constraints: "
-                                 "{0}".format(con))
-            self._solver_model.quadratic_constraints.add(
-                lin_expr=[cplex_expr.variables,
-                          cplex_expr.coefficients],
-                quad_expr=[cplex_expr.q_variables1,
-                           cplex_expr.q_variables2,
-                           cplex_expr.q_coefficients],
-                sense=my_sense,
-                rhs=my_rhs[0],
-                name=conname)
+        return conname, cplex_expr, referenced_vars, my_sense, my_rhs, my_range
 
+    def _add_linear_constraints(self, rows, pRows, jCols, vals, ranges, range_types, row_vars):
+        """
+        Add the rows of a sparse matrix returned by
+        compile_linear_constraint_matrix with a single call.
+        """
+        if len(rows) == 0:
+            return
+        lin_exprs = []
+        senses = []
+        rhs = []
+        range_values = []
+        connames = []
+        for i, con in enumerate(rows):
+            start, end = pRows[i], pRows[i+1]
+            lin_exprs.append([jCols[start:end], vals[start:end]])
+            connames.append(self._symbol_map.getSymbol(con, self._labeler))
+            lb = ranges[2*i]
+            ub = ranges[2*i+1]
+            range_type = range_types[i]
+            if range_type == MatrixConstraint.Equality:
+                senses.append('E')
+                rhs.append(lb)
+                range_values.append(0.0)
+            elif range_type == MatrixConstraint.LowerBound:
+                senses.append('G')
+                rhs.append(lb)
+                range_values.append(0.0)
+            elif range_type == MatrixConstraint.UpperBound:
+                senses.append('L')
+                rhs.append(ub)
+                range_values.append(0.0)
+            else:
+                senses.append('R')
+                rhs.append(ub)
+                range_values.append(lb - ub)
+                self._range_constraints.add(con)
+        if 'R' not in senses:
+            range_values = []
+
+        self._solver_model.linear_constraints.add(
+            lin_expr=lin_exprs,
+            senses=senses,
+            rhs=rhs,
+            range_values=range_values,
+            names=connames)
+
+        for con, conname, variables in zip(rows, connames, row_vars):
+            self._add_constraint_references(con, conname, ComponentSet(variables))
+
+    def _add_constraint_references(self, con, conname, referenced_vars):
         for var in referenced_vars:
             self._referenced_variables[var] += 1
         self._vars_referenced_by_con[con] = referenced_vars
@@ -8,6 +8,8 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import bisect
+
 from pyomo.core.base.PyomoModel import ConcreteModel
 from pyomo.solvers.plugins.solvers.cplex_direct import CPLEXDirect
 from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
@@ -59,6 +61,16 @@ class CPLEXPersistent(PersistentSolver, CPLEXDirect):
             except self._cplex.exceptions.CplexError:
                 raise ValueError('Failed to find the cplex constraint {0}'.format(solver_con))
 
+    def _remove_constraints(self, solver_cons):
+        # Note: delete() without arguments deletes all constraints
+        if len(solver_cons) == 0:
+            return
+        try:
+            self._solver_model.linear_constraints.delete(solver_cons)
+        except self._cplex.exceptions.CplexError:
+            # at least one of the constraints is quadratic
+            PersistentSolver._remove_constraints(self, solver_cons)
+
     def _remove_sos_constraint(self, solver_sos_con):
         self._solver_model.SOS.delete(solver_sos_con)
 
@@ -72,6 +84,20 @@ class CPLEXPersistent(PersistentSolver, CPLEXDirect):
         del self._pyomo_var_to_ndx_map[pyomo_var]
         self._solver_model.variables.delete(solver_var)
 
+    def _remove_vars(self, solver_vars):
+        if len(solver_vars) == 0:
+            return
+        removed = sorted(self._pyomo_var_to_ndx_map[self._solver_var_to_pyomo_var_map[solver_var]]
+                         for solver_var in solver_vars)
+        for solver_var in solver_vars:
+            del self._pyomo_var_to_ndx_map[self._solver_var_to_pyomo_var_map[solver_var]]
+        # shift the index of each remaining variable by the number of
+        # removed variables that precede it
+        for tmp_var, tmp_ndx in self._pyomo_var_to_ndx_map.items():
+            self._pyomo_var_to_ndx_map[tmp_var] = tmp_ndx - bisect.bisect_left(removed, tmp_ndx)
+        self._ndx_count -= len(removed)
+        self._solver_model.variables.delete(solver_vars)
+
     def _warm_start(self):
         CPLEXDirect._warm_start(self)
 
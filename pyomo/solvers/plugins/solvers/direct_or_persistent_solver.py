@@ -200,15 +200,18 @@ class DirectOrPersistentSolver(OptSolver):
             self._labeler = NumericLabeler('x')
 
     def _add_block(self, block):
-        for var in block.component_data_objects(
-                ctype=pyomo.core.base.var.Var,
-                descend_into=True,
-                active=True,
-                sort=True):
-            self._add_var(var)
-
-        for sub_block in block.block_data_objects(descend_into=True,
-                                                  active=True):
+        self._add_vars(list(block.component_data_objects(
+            ctype=pyomo.core.base.var.Var,
+            descend_into=True,
+            active=True,
+            sort=True)))
+
+        # The constraints on all blocks are added with a single call
+        # so that the solvers can load the constraint matrix in bulk
+        sub_blocks = list(block.block_data_objects(descend_into=True,
+                                                   active=True))
+        cons = []
+        for sub_block in sub_blocks:
             for con in sub_block.component_data_objects(
                     ctype=pyomo.core.base.constraint.Constraint,
                     descend_into=False,
@@ -218,8 +221,10 @@ class DirectOrPersistentSolver(OptSolver):
                    (not con.has_ub()):
                     assert not con.equality
                     continue  # non-binding, so skip
-                self._add_constraint(con)
+                cons.append(con)
+        self._add_constraints(cons)
 
+        for sub_block in sub_blocks:
             for con in sub_block.component_data_objects(
                     ctype=pyomo.core.base.sos.SOSConstraint,
                     descend_into=False,
@@ -258,6 +263,18 @@ class DirectOrPersistentSolver(OptSolver):
         raise NotImplementedError("This method should be implemented "
                                   "by subclasses")
 
+    def _add_constraints(self, cons):
+        """Add constraints to the solver model. Subclasses should override this method if the solver can add many
+        constraints with a single call."""
+        for con in cons:
+            self._add_constraint(con)
+
+    def _add_vars(self, vars):
+        """Add variables to the solver model. Subclasses should override this method if the solver can add many
+        variables with a single call."""
+        for var in vars:
+            self._add_var(var)
+
     """ This method should be implemented by subclasses."""
     def _get_expr_from_pyomo_repn(self, repn, max_degree=None):
         raise NotImplementedError("This method should be implemented "
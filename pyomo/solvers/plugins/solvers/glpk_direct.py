@@ -46,6 +46,11 @@ from pyomo.opt.base.solvers import _extract_version
 from pyomo.opt.results import *
 from pyomo.opt.solver import *
 from pyomo.core.base.numvalue import value
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.repn import generate_canonical_repn, LinearCanonicalRepn
+from pyomo.repn.beta.matrix import MatrixConstraint, compile_linear_constraint_matrix
+
+from six.moves import xrange
 
 import logging
 logger = logging.getLogger('pyomo.solvers')
@@ -138,11 +143,6 @@ class GLPKDirect ( OptSolver ):
         sense = GLP_MAX
         if objective.is_minimizing(): sense = GLP_MIN
 
-        constraint_list = model.component_map(Constraint, active=True)
-        variable_list   = model.component_map(Var)
-        num_constraints = model.statistics.number_of_constraints
-        num_variables   = model.statistics.number_of_variables
-
         sosn = self._capabilities.sosn
         sos1 = self._capabilities.sos1
         sos2 = self._capabilities.sos2
@@ -153,156 +153,113 @@ class GLPKDirect ( OptSolver ):
         glp_set_prob_name(lp, model.name)
 
         glp_set_obj_dir( lp, sense )
-        glp_add_rows( lp, num_constraints )
-        glp_add_cols( lp, num_variables )
 
-        # 1 extra because GLPK's arrays in this context are 1-based, not 0-based
-        coef_count = num_constraints * num_variables + 1
-        Ai = intArray( coef_count )
-        Aj = intArray( coef_count )
-        Ar = doubleArray( coef_count )
+        # In matrix parlance, variables are columns
+        variables = [ var for var in model.component_data_objects(Var, sort=True)
+                      if not var.fixed ]
+        glp_add_cols( lp, len(variables) )
 
-        row = col = coef_count = 0
         colvar_map = dict()
-        rowvar_map = dict()
+        column_index = ComponentMap()
+        for col, var in enumerate( variables, 1 ):
+            lb = ub = 0.0
+            if (not var.has_lb()) and \
+               (not var.has_ub()):
+                var_type = GLP_FR
+            elif not var.has_lb():
+                var_type = GLP_UB
+                ub = value(var.ub)
+            elif not var.has_ub():
+                var_type = GLP_LO
+                lb = value(var.lb)
+            else:
+                var_type = GLP_DB
+                lb = value(var.lb)
+                ub = value(var.ub)
+
+            colvar_map[ var.label ] = col
+            column_index[ var ] = col
+
+            # the name is perhaps not necessary, but for completeness ...
+            glp_set_col_name( lp, col, var.label )
+            glp_set_col_bnds( lp, col, var_type, lb, ub )
+
+            # Be sure to impart the integer and binary nature of any variables
+            if var.is_integer():
+                glp_set_col_kind( lp, col, GLP_IV )
+            elif var.is_binary():
+                glp_set_col_kind( lp, col, GLP_BV )
+            elif var.is_continuous():
+                glp_set_col_kind( lp, col, GLP_CV )   # continuous
+            else:
+                raise TypeError("Invalid domain type for variable with name '%s'. "
+                                "Variable is not continuous, integer, or binary.")
+
+        # The whole constraint matrix is compiled once in CSR format
+        constraints = [ con for con in model.component_data_objects(Constraint,
+                                                                     active=True,
+                                                                     sort=True)
+                        if con.has_lb() or con.has_ub() ]
+        rows, nonlinear, pRows, jCols, vals, ranges, range_types, _ = \
+            compile_linear_constraint_matrix( constraints, column_index )
+        if len(nonlinear) > 0:
+            msg = "Nonlinear constraint '%s' to GLPK.  GLPK can only handle " \
+                  "linear problems."
+            raise RuntimeError( msg % nonlinear[0].name )
+
+        glp_add_rows( lp, len(rows) )
 
-        # In matrix parlance, variables are columns
-        for name in variable_list:
-            var_set = variable_list[ name ]
-            for ii in var_set:
-                var = var_set[ ii ]
-                if var.fixed is True:
-                    continue
-
-                lb = ub = 0.0
-                if (not var.has_lb()) and \
-                   (not var.has_ub()):
-                    var_type = GLP_FR
-                elif not var.has_lb():
-                    var_type = GLP_UB
-                    ub = value(var.ub)
-                elif not var.has_ub():
-                    var_type = GLP_LO
-                    lb = value(var.lb)
-                else:
-                    var_type = GLP_DB
-                    lb = value(var.lb)
-                    ub = value(var.ub)
-
-                col += 1
-                colvar_map[ var.label ] = col
-
-                # the name is perhaps not necessary, but for completeness ...
-                glp_set_col_name( lp, col, var.label )
-                glp_set_col_bnds( lp, col, var_type, lb, ub )
-
-                # Be sure to impart the integer and binary nature of any variables
-                if var.is_integer():
-                    glp_set_col_kind( lp, col, GLP_IV )
-                elif var.is_binary():
-                    glp_set_col_kind( lp, col, GLP_BV )
-                elif var.is_continuous():
-                    glp_set_col_kind( lp, col, GLP_CV )   # continuous
-                else:
-                    raise TypeError("Invalid domain type for variable with name '%s'. "
-                                    "Variable is not continuous, integer, or binary.")
-
-        model_canonical_repn = getattr(model, "_canonical_repn", None)
-        if model_canonical_repn is None:
-            raise ValueError("No _canonical_repn ComponentMap was found on "
-                             "block with name %s. Did you forget to preprocess?"
-                             % (model.name))
-
-        for name in constraint_list:
-            constraint_set = constraint_list[ name ]
-
-            for ii in constraint_set:
-                constraint = constraint_set[ ii ]
-                if not constraint.active: continue
-                elif (not constraint.has_lb()) and \
-                     (not constraint.has_ub()):
-                    continue
-
-                expression = model_canonical_repn.get(constraint)
-                if constraint is None:
-                    raise ValueError("No entry found in _canonical_repn ComponentMap on "
-                                     "block %s for active constraint with name %s. "
-                                     "Did you forget to preprocess?"
-                                     % (model.name, constraint.name))
-
-                offset = 0.0
-                if 0 in expression:
-                    offset = expression[0][None]
-
-                lbound = ubound = -offset
-
-                if constraint.equality:
-                    var_type = GLP_FX    # Fixed
-                    lbound = ubound = constraint.lower() - offset
-                elif not constraint.has_lb():
-                    var_type = GLP_UP    # Upper bounded only
-                    ubound += constraint.upper()
-                elif not constraint.has_ub():
-                    var_type = GLP_LO    # Lower bounded only
-                    lbound += constraint.lower()
-                else:
-                    var_type = GLP_DB    # Double bounded
-                    lbound += constraint.lower()
-                    ubound += constraint.upper()
-
-                row += 1
-                rowvar_map[ constraint.label ] = row
-
-                # just as with variables, set the name just for completeness ...
-                glp_set_row_name( lp, row, constraint.label )
-                glp_set_row_bnds( lp, row, var_type, lbound, ubound )
-
-                if 1 in expression: # first-order terms
-                    keys = sorted( expression[1].keys() )
-                    for var_key in keys:
-                        index = var_key.keys()[0]
-                        var = expression[-1][ index ]
-                        coef  = expression[ 1][ var_key ]
-                        col = colvar_map[ var.label ]
-
-                        coef_count += 1
-                        Ai[ coef_count ] = row
-                        Aj[ coef_count ] = col
-                        Ar[ coef_count ] = coef
-
-        # with the rows and columns named and bounded, load the coefficients
+        rowvar_map = dict()
+        for row, constraint in enumerate( rows, 1 ):
+            lbound = ranges[ 2*row-2 ]
+            ubound = ranges[ 2*row-1 ]
+            range_type = range_types[ row-1 ]
+            if range_type == MatrixConstraint.Equality:
+                var_type = GLP_FX    # Fixed
+                ubound = lbound
+            elif range_type == MatrixConstraint.UpperBound:
+                var_type = GLP_UP    # Upper bounded only
+            elif range_type == MatrixConstraint.LowerBound:
+                var_type = GLP_LO    # Lower bounded only
+            else:
+                var_type = GLP_DB    # Double bounded
+
+            rowvar_map[ constraint.label ] = row
+
+            # just as with variables, set the name just for completeness ...
+            glp_set_row_name( lp, row, constraint.label )
+            glp_set_row_bnds( lp, row, var_type, lbound, ubound )
+
+        # with the rows and columns named and bounded, load the
+        # coefficients with a single call (1 extra element because
+        # GLPK's arrays in this context are 1-based, not 0-based)
+        coef_count = len(jCols)
+        Ai = intArray( coef_count + 1 )
+        Aj = intArray( coef_count + 1 )
+        Ar = doubleArray( coef_count + 1 )
+        for row in xrange( len(rows) ):
+            for nz in xrange( pRows[row], pRows[row+1] ):
+                Ai[ nz+1 ] = row+1
+                Aj[ nz+1 ] = jCols[ nz ]
+                Ar[ nz+1 ] = vals[ nz ]
         glp_load_matrix( lp, coef_count, Ai, Aj, Ar )
 
         for key in objective:
 
-            expression = model_canonical_repn.get(objective[key])
-            if expression is None:
-                raise ValueError("No entry found in _canonical_repn ComponentMap on "
-                                 "block %s for active objective with name %s. "
-                                 "Did you forget to preprocess?"
-                                 % (model.name, objective[key].name))
+            expression = generate_canonical_repn( objective[key].expr )
 
-            if expression.is_constant():
-                msg = "Ignoring objective '%s[%s]' which is constant"
-                logger.warning( msg % (str(objective), str(key)) )
-                continue
-
-            if 1 in expression: # first-order terms
-                keys = sorted( expression[1].keys() )
-                for var_key in keys:
-                    index = var_key.keys()[0]
-                    label = expression[-1][ index ].label
-                    coef  = expression[ 1][ var_key ]
-                    col = colvar_map[ label ]
-                    glp_set_obj_coef( lp, col, coef )
-
-            elif -1 in expression:
-                pass
-            else:
+            if not isinstance( expression, LinearCanonicalRepn ):
                 msg = "Nonlinear objective to GLPK.  GLPK can only handle "       \
                       "linear problems."
                 raise RuntimeError( msg )
 
+            if expression.variables is None:
+                msg = "Ignoring objective '%s[%s]' which is constant"
+                logger.warning( msg % (str(objective), str(key)) )
+                continue
+
+            for var, coef in zip( expression.variables, expression.linear ):
+                glp_set_obj_coef( lp, column_index[ var ], coef )
 
         self._glpk_instance = lp
         self._glpk_rowvar_map = rowvar_map
@@ -98,13 +98,7 @@ class GurobiDirect(DirectSolver):
 
     def _apply_solver(self):
         if not self._save_results:
-            for block in self._pyomo_model.block_data_objects(descend_into=True,
-                                                              active=True):
-                for var in block.component_data_objects(ctype=pyomo.core.base.var.Var,
-                                                        descend_into=False,
-                                                        active=True,
-                                                        sort=False):
-                    var.stale = True
+            self._pyomo_model._flag_vars_as_stale()
         if self._tee:
             self._solver_model.setParam('OutputFlag', 1)
         else:
@@ -232,6 +226,39 @@ class GurobiDirect(DirectSolver):
             gurobipy_var.setAttr('lb', var.value)
             gurobipy_var.setAttr('ub', var.value)
 
+    def _add_vars(self, vars):
+        if self._version_major < 7 or len(vars) == 0:
+            # Model.addVars was added in Gurobi 7.0
+            return DirectSolver._add_vars(self, vars)
+
+        varnames = []
+        lbs = []
+        ubs = []
+        vtypes = []
+        for var in vars:
+            varnames.append(self._symbol_map.getSymbol(var, self._labeler))
+            vtypes.append(self._gurobi_vtype_from_var(var))
+            if var.is_fixed():
+                lbs.append(var.value)
+                ubs.append(var.value)
+                continue
+            if var.has_lb():
+                lbs.append(value(var.lb))
+            else:
+                lbs.append(-self._gurobipy.GRB.INFINITY)
+            if var.has_ub():
+                ubs.append(value(var.ub))
+            else:
+                ubs.append(self._gurobipy.GRB.INFINITY)
+
+        gurobipy_vars = self._solver_model.addVars(len(vars), lb=lbs, ub=ubs, vtype=vtypes, name=varnames)
+
+        for i, var in enumerate(vars):
+            gurobipy_var = gurobipy_vars[i]
+            self._pyomo_var_to_solver_var_map[var] = gurobipy_var
+            self._solver_var_to_pyomo_var_map[gurobipy_var] = var
+            self._referenced_variables[var] = 0
+
     def _set_instance(self, model, kwds={}):
         self._range_constraints = set()
         DirectOrPersistentSolver._set_instance(self, model, kwds)
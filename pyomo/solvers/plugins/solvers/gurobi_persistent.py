@@ -56,6 +56,12 @@ class GurobiPersistent(PersistentSolver, GurobiDirect):
     def _remove_var(self, solver_var):
         self._solver_model.remove(solver_var)
 
+    def _remove_constraints(self, solver_cons):
+        self._solver_model.remove(solver_cons)
+
+    def _remove_vars(self, solver_vars):
+        self._solver_model.remove(solver_vars)
+
     def add_var(self, var):
         """
         Add a variable to the solver's model. This will keep any existing model components intact.
@@ -79,6 +85,29 @@ class GurobiPersistent(PersistentSolver, GurobiDirect):
         PersistentSolver.add_constraint(self, con)
         self._solver_model.update()
 
+    def add_vars(self, vars):
+        """
+        Add variables to the solver's model. This will keep any existing model components intact.
+
+        Parameters
+        ----------
+        vars: iterable of Var
+            The variables to add to the solver's model.
+        """
+        PersistentSolver.add_vars(self, vars)
+        self._solver_model.update()
+
+    def add_constraints(self, cons):
+        """
+        Add constraints to the solver's model. This will keep any existing model components intact.
+
+        Parameters
+        ----------
+        cons: iterable of Constraint
+        """
+        PersistentSolver.add_constraints(self, cons)
+        self._solver_model.update()
+
     def add_sos_constraint(self, con):
         """
         Add an SOS constraint to the solver's model (if supported). This will keep any existing model components intact.
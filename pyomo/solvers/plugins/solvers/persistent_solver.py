@@ -22,6 +22,14 @@ import logging
 from pyomo.core.base.constraint import Constraint
 from pyomo.core.base.var import Var
 from pyomo.core.base.sos import SOSConstraint
+from pyomo.core.base.var import _VarData
+from pyomo.core.base.param import _ParamData
+from pyomo.core.base.constraint import _ConstraintData
+from pyomo.core.base.objective import _ObjectiveData
+from pyomo.core.base.change_tracker import ChangeTracker
+from pyomo.core.kernel import expr as EXPR
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.core.kernel.component_set import ComponentSet
 
 
 logger = logging.getLogger('pyomo.solvers')
@@ -33,7 +41,8 @@ class PersistentSolver(DirectOrPersistentSolver):
     Rather, they interface directly with the python bindings for the specific solver. Persistent solver interfaces
     are similar except that they "remember" their model. Thus, persistent solver interfaces allow incremental changes
     to the solver model (e.g., the gurobi python model or the cplex python model). Note that users are responsible
-    for notifying the persistent solver interfaces when changes are made to the corresponding pyomo model.
+    for notifying the persistent solver interfaces when changes are made to the corresponding pyomo model, unless
+    the model was set with set_instance(model, auto_update=True).
 
     Keyword Arguments
     -----------------
@@ -50,6 +59,19 @@ class PersistentSolver(DirectOrPersistentSolver):
     def __init__(self, **kwds):
         DirectOrPersistentSolver.__init__(self, **kwds)
 
+        self._change_tracker = None
+        """The ChangeTracker recording the changes to the pyomo model (None unless auto_update is enabled)."""
+
+        self._dependents = ComponentMap()
+        """dict: {var or param: ComponentSet} of the constraints, objective and variables that must be updated
+        in the solver model when the var (fixed status or fixed value) or the param (value) changes."""
+
+        self._dependencies = ComponentMap()
+        """dict: {con, obj or var: list} of the vars and params registered in self._dependents."""
+
+        self._fixed_vars = ComponentSet()
+        """The variables that were fixed when the solver model was last updated."""
+
     def _presolve(self, **kwds):
         DirectOrPersistentSolver._presolve(self, **kwds)
 
@@ -76,8 +98,34 @@ class PersistentSolver(DirectOrPersistentSolver):
             If False then an error will be raised if a fixed variable is used in one of the solver constraints.
             This is useful for catching bugs. Ordinarily a fixed variable should appear as a constant value in the
             solver constraints. If True, then the error will not be raised.
+        auto_update: bool
+            If True, the changes made to the model after this call are recorded and sent to the solver model by
+            the update method, which is called at the start of every solve. Only changes made through the modeling
+            components are recorded (see pyomo.core.base.change_tracker.ChangeTracker): variable bounds, domains
+            and fixed status, mutable parameter values, constraint and objective expressions, and the
+            activation and deactivation of constraints, objectives and blocks. Components added with
+            add_component are picked up when they (or their block) are activated; components deleted from the
+            model must still be removed from the solver explicitly.
         """
-        return self._set_instance(model, kwds)
+        auto_update = kwds.pop('auto_update', False)
+        if self._change_tracker is not None:
+            self._change_tracker.stop()
+            self._change_tracker = None
+        self._dependents = ComponentMap()
+        self._dependencies = ComponentMap()
+        self._fixed_vars = ComponentSet()
+        if auto_update and not isinstance(model, _BlockData):
+            raise ValueError('auto_update is only supported for Block based models')
+        ans = self._set_instance(model, kwds)
+        if auto_update:
+            self._change_tracker = ChangeTracker(model)
+            self._change_tracker.start()
+            self._track(self._pyomo_var_to_solver_var_map.keys())
+            self._track(con for con in self._pyomo_con_to_solver_con_map
+                        if isinstance(con, _ConstraintData))
+            if self._objective is not None:
+                self._track((self._objective,))
+        return ans
 
     def add_block(self, block):
         """Add a single Pyomo Block to the solver's model.
@@ -99,6 +147,13 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self._add_block(block)
         #    return
         self._add_block(block)
+        if self._change_tracker is not None:
+            self._track(var for var in block.component_data_objects(ctype=Var, descend_into=True)
+                        if var in self._pyomo_var_to_solver_var_map)
+            self._track(con for con in block.component_data_objects(ctype=Constraint, descend_into=True)
+                        if con in self._pyomo_con_to_solver_con_map)
+            if self._objective is not None and self._objective not in self._dependencies:
+                self._track((self._objective,))
 
     def set_objective(self, obj):
         """
@@ -111,7 +166,12 @@ class PersistentSolver(DirectOrPersistentSolver):
         """
         if self._pyomo_model is None:
             raise RuntimeError('You must call set_instance before calling set_objective.')
-        return self._set_objective(obj)
+        if self._change_tracker is not None and self._objective is not None:
+            self._untrack((self._objective,))
+        ans = self._set_objective(obj)
+        if self._change_tracker is not None:
+            self._track((obj,))
+        return ans
 
     def add_constraint(self, con):
         """Add a single constraint to the solver's model.
@@ -133,6 +193,8 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self._add_constraint(child_con)
         #else:
         self._add_constraint(con)
+        if self._change_tracker is not None and con in self._pyomo_con_to_solver_con_map:
+            self._track((con,))
 
     def add_var(self, var):
         """Add a single variable to the solver's model.
@@ -154,6 +216,47 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self._add_var(child_var)
         #else:
         self._add_var(var)
+        if self._change_tracker is not None:
+            self._track((var,))
+
+    def add_constraints(self, cons):
+        """Add constraints to the solver's model.
+
+        The constraints are added with as few calls to the solver as
+        possible, so this is much faster than calling add_constraint
+        for each constraint. This will keep any existing model
+        components intact.
+
+        Parameters
+        ----------
+        cons: iterable of Constraint (scalar Constraint or single _ConstraintData)
+
+        """
+        if self._pyomo_model is None:
+            raise RuntimeError('You must call set_instance before calling add_constraints.')
+        cons = list(cons)
+        self._add_constraints(cons)
+        if self._change_tracker is not None:
+            self._track(con for con in cons if con in self._pyomo_con_to_solver_con_map)
+
+    def add_vars(self, vars):
+        """Add variables to the solver's model.
+
+        The variables are added with as few calls to the solver as
+        possible, so this is much faster than calling add_var for each
+        variable. This will keep any existing model components intact.
+
+        Parameters
+        ----------
+        vars: iterable of Var (scalar Var or single _VarData)
+
+        """
+        if self._pyomo_model is None:
+            raise RuntimeError('You must call set_instance before calling add_vars.')
+        vars = list(vars)
+        self._add_vars(vars)
+        if self._change_tracker is not None:
+            self._track(vars)
 
     def add_sos_constraint(self, con):
         """Add a single SOS constraint to the solver's model (if supported).
@@ -188,6 +291,18 @@ class PersistentSolver(DirectOrPersistentSolver):
     def _remove_var(self, solver_var):
         raise NotImplementedError('This method should be implemented by subclasses.')
 
+    def _remove_constraints(self, solver_cons):
+        """Remove constraints from the solver model. Subclasses should override this method if the solver can
+        remove many constraints with a single call."""
+        for solver_con in solver_cons:
+            self._remove_constraint(solver_con)
+
+    def _remove_vars(self, solver_vars):
+        """Remove variables from the solver model. Subclasses should override this method if the solver can
+        remove many variables with a single call."""
+        for solver_var in solver_vars:
+            self._remove_var(solver_var)
+
     def remove_block(self, block):
         """Remove a single block from the solver's model.
 
@@ -208,14 +323,13 @@ class PersistentSolver(DirectOrPersistentSolver):
         #        self.remove_block(sub_block)
         #    return
         for sub_block in block.block_data_objects(descend_into=True, active=True):
-            for con in sub_block.component_data_objects(ctype=Constraint, descend_into=False, active=True):
-                self.remove_constraint(con)
+            self.remove_constraints(
+                sub_block.component_data_objects(ctype=Constraint, descend_into=False, active=True))
 
             for con in sub_block.component_data_objects(ctype=SOSConstraint, descend_into=False, active=True):
                 self.remove_sos_constraint(con)
 
-        for var in block.component_data_objects(ctype=Var, descend_into=True, active=True):
-            self.remove_var(var)
+        self.remove_vars(block.component_data_objects(ctype=Var, descend_into=True, active=True))
 
     def remove_constraint(self, con):
         """Remove a single constraint from the solver's model.
@@ -236,6 +350,7 @@ class PersistentSolver(DirectOrPersistentSolver):
         #    return
         solver_con = self._pyomo_con_to_solver_con_map[con]
         self._remove_constraint(solver_con)
+        self._untrack((con,))
         self._symbol_map.removeSymbol(con)
         self._labeler.remove_obj(con)
         for var in self._vars_referenced_by_con[con]:
@@ -244,6 +359,30 @@ class PersistentSolver(DirectOrPersistentSolver):
         del self._pyomo_con_to_solver_con_map[con]
         del self._solver_con_to_pyomo_con_map[solver_con]
 
+    def remove_constraints(self, cons):
+        """Remove constraints from the solver's model.
+
+        The constraints are removed with as few calls to the solver as
+        possible. This will keep any other model components intact.
+
+        Parameters
+        ----------
+        cons: iterable of Constraint (scalar Constraint or single _ConstraintData)
+
+        """
+        cons = list(cons)
+        solver_cons = [self._pyomo_con_to_solver_con_map[con] for con in cons]
+        self._remove_constraints(solver_cons)
+        self._untrack(cons)
+        for con, solver_con in zip(cons, solver_cons):
+            self._symbol_map.removeSymbol(con)
+            self._labeler.remove_obj(con)
+            for var in self._vars_referenced_by_con[con]:
+                self._referenced_variables[var] -= 1
+            del self._vars_referenced_by_con[con]
+            del self._pyomo_con_to_solver_con_map[con]
+            del self._solver_con_to_pyomo_con_map[solver_con]
+
     def remove_sos_constraint(self, con):
         """Remove a single SOS constraint from the solver's model.
 
@@ -293,12 +432,39 @@ class PersistentSolver(DirectOrPersistentSolver):
                              'objective or one or more constraints')
         solver_var = self._pyomo_var_to_solver_var_map[var]
         self._remove_var(solver_var)
+        self._untrack((var,))
         self._symbol_map.removeSymbol(var)
         self._labeler.remove_obj(var)
         del self._referenced_variables[var]
         del self._pyomo_var_to_solver_var_map[var]
         del self._solver_var_to_pyomo_var_map[solver_var]
 
+    def remove_vars(self, vars):
+        """Remove variables from the solver's model.
+
+        The variables are removed with as few calls to the solver as
+        possible. This will keep any other model components intact.
+
+        Parameters
+        ----------
+        vars: iterable of Var (scalar Var or single _VarData)
+
+        """
+        vars = list(vars)
+        for var in vars:
+            if self._referenced_variables[var] != 0:
+                raise ValueError('Cannot remove Var {0} because it is still referenced by the '.format(var) +
+                                 'objective or one or more constraints')
+        solver_vars = [self._pyomo_var_to_solver_var_map[var] for var in vars]
+        self._remove_vars(solver_vars)
+        self._untrack(vars)
+        for var, solver_var in zip(vars, solver_vars):
+            self._symbol_map.removeSymbol(var)
+            self._labeler.remove_obj(var)
+            del self._referenced_variables[var]
+            del self._pyomo_var_to_solver_var_map[var]
+            del self._solver_var_to_pyomo_var_map[solver_var]
+
     """ This method should be implemented by subclasses."""
     def update_var(self, var):
         """
@@ -311,6 +477,143 @@ class PersistentSolver(DirectOrPersistentSolver):
         """
         raise NotImplementedError('This method should be implemented by subclasses.')
 
+    def _track(self, objs):
+        """Register the vars and params that the solver representation of each object depends on."""
+        for obj in objs:
+            if obj in self._dependencies:
+                self._untrack((obj,))
+            deps = ComponentSet()
+            if isinstance(obj, _VarData):
+                for bound in (getattr(obj, '_lb', None), getattr(obj, '_ub', None)):
+                    if bound is not None:
+                        deps.update(EXPR.identify_mutable_parameters(bound))
+                if obj.fixed:
+                    self._fixed_vars.add(obj)
+                else:
+                    self._fixed_vars.discard(obj)
+            elif isinstance(obj, _ConstraintData):
+                for expr in (obj.body, obj.lower, obj.upper):
+                    if expr is not None:
+                        deps.update(EXPR.identify_variables(expr, include_fixed=True))
+                        deps.update(EXPR.identify_mutable_parameters(expr))
+            else:
+                expr = obj.expr
+                if expr is not None:
+                    deps.update(EXPR.identify_variables(expr, include_fixed=True))
+                    deps.update(EXPR.identify_mutable_parameters(expr))
+            self._dependencies[obj] = list(deps)
+            for dep in deps:
+                if dep not in self._dependents:
+                    self._dependents[dep] = ComponentSet()
+                self._dependents[dep].add(obj)
+
+    def _untrack(self, objs):
+        if self._change_tracker is None:
+            return
+        for obj in objs:
+            for dep in self._dependencies.pop(obj, ()):
+                dependents = self._dependents[dep]
+                dependents.discard(obj)
+                if len(dependents) == 0:
+                    del self._dependents[dep]
+            if isinstance(obj, _VarData):
+                self._fixed_vars.discard(obj)
+
+    def _in_active_model(self, obj):
+        """True if obj and all the blocks between obj and the pyomo model are active."""
+        if not obj.active:
+            return False
+        blk = obj.parent_block()
+        while blk is not None:
+            if not blk.active:
+                return False
+            if blk is self._pyomo_model:
+                return True
+            blk = blk.parent_block()
+        return False
+
+    def update(self):
+        """
+        Send the changes recorded since set_instance (or since the last call to this method) to the solver's model.
+        This method is called automatically by solve and can only be used if set_instance was called with
+        auto_update=True.
+
+        Variables whose bounds, domain or fixed status changed are updated in place. Constraints whose expression
+        changed, or that reference a mutable parameter or a fixed variable whose value changed, are removed and
+        added again. Constraints that were deactivated are removed from the solver's model and constraints that
+        were activated are added. The objective is set again if it changed.
+        """
+        if self._change_tracker is None:
+            raise RuntimeError('The update method can only be used if set_instance was called with '
+                               'auto_update=True.')
+        changes = self._change_tracker.changes()
+        if len(changes) == 0:
+            return
+
+        vars_to_update = ComponentSet()
+        cons_to_check = ComponentSet()
+        cons_to_rebuild = ComponentSet()
+        objectives = ComponentSet()
+
+        def _rebuild(dependents):
+            for obj in dependents:
+                if isinstance(obj, _VarData):
+                    vars_to_update.add(obj)
+                elif isinstance(obj, _ConstraintData):
+                    cons_to_check.add(obj)
+                    cons_to_rebuild.add(obj)
+                else:
+                    objectives.add(obj)
+
+        for obj in changes:
+            if isinstance(obj, _VarData):
+                if obj in self._pyomo_var_to_solver_var_map:
+                    vars_to_update.add(obj)
+                if obj.fixed or obj in self._fixed_vars:
+                    _rebuild(self._dependents.get(obj, ()))
+            elif isinstance(obj, _ParamData):
+                _rebuild(self._dependents.get(obj, ()))
+            elif isinstance(obj, _ConstraintData):
+                cons_to_check.add(obj)
+                cons_to_rebuild.add(obj)
+            elif isinstance(obj, _ObjectiveData):
+                objectives.add(obj)
+            elif isinstance(obj, _BlockData):
+                cons_to_check.update(obj.component_data_objects(ctype=Constraint, descend_into=True))
+                objectives.update(obj.component_data_objects(ctype=Objective, descend_into=True))
+
+        for var in vars_to_update:
+            self.update_var(var)
+            self._track((var,))
+
+        def _should_add(con):
+            return (con.has_lb() or con.has_ub()) and self._in_active_model(con)
+
+        self.remove_constraints(
+            con for con in cons_to_check
+            if con in self._pyomo_con_to_solver_con_map and
+            (con in cons_to_rebuild or not _should_add(con)))
+        cons_to_add = [con for con in cons_to_check
+                       if con not in self._pyomo_con_to_solver_con_map and _should_add(con)]
+
+        new_objective = None
+        for obj in objectives:
+            if obj.active and (obj is self._objective or self._in_active_model(obj)):
+                new_objective = obj
+
+        new_vars = ComponentSet()
+        for expr in [con.body for con in cons_to_add] + \
+                ([new_objective.expr] if new_objective is not None else []):
+            for var in EXPR.identify_variables(expr, include_fixed=False):
+                if var not in self._pyomo_var_to_solver_var_map:
+                    new_vars.add(var)
+        if len(new_vars) > 0:
+            self.add_vars(new_vars)
+        if len(cons_to_add) > 0:
+            self.add_constraints(cons_to_add)
+        if new_objective is not None:
+            self.set_objective(new_objective)
+
     def solve(self, *args, **kwds):
         """
         Solve the model.
@@ -346,6 +649,9 @@ class PersistentSolver(DirectOrPersistentSolver):
 
         self.available(exception_flag=True)
 
+        if self._change_tracker is not None:
+            self.update()
+
         # Collect suffix names to try and import from solution.
         if isinstance(self._pyomo_model, _BlockData):
             model_suffixes = list(name for (name, comp) in active_import_suffix_generator(self._pyomo_model))
@@ -0,0 +1,280 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+from pyomo.environ import *
+from pyomo.core.kernel import expr as EXPR
+from pyomo.core.kernel.component_set import ComponentSet
+from pyomo.solvers.plugins.solvers.direct_or_persistent_solver import DirectOrPersistentSolver
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
+
+try:
+    import gurobipy
+    gurobipy_available = True
+except ImportError:
+    gurobipy_available = False
+
+try:
+    import cplex
+    cplexpy_available = True
+except ImportError:
+    cplexpy_available = False
+
+diff_tol = 1e-4
+
+
+class RecordingPersistent(PersistentSolver):
+    """A persistent solver that records the calls made to its solver model."""
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'recording_persistent'
+        PersistentSolver.__init__(self, **kwds)
+        self.calls = []
+
+    def _set_instance(self, model, kwds={}):
+        DirectOrPersistentSolver._set_instance(self, model, kwds)
+        self._add_block(model)
+
+    def _add_var(self, var):
+        self._symbol_map.getSymbol(var, self._labeler)
+        self._pyomo_var_to_solver_var_map[var] = var.name
+        self._solver_var_to_pyomo_var_map[var.name] = var
+        self._referenced_variables[var] = 0
+        self.calls.append(('add_var', var.name))
+
+    def _add_constraint(self, con):
+        if not con.active:
+            return
+        self._symbol_map.getSymbol(con, self._labeler)
+        referenced_vars = ComponentSet(
+            EXPR.identify_variables(con.body, include_fixed=False))
+        for var in referenced_vars:
+            self._referenced_variables[var] += 1
+        self._vars_referenced_by_con[con] = referenced_vars
+        self._pyomo_con_to_solver_con_map[con] = con.name
+        self._solver_con_to_pyomo_con_map[con.name] = con
+        self.calls.append(('add_constraint', con.name))
+
+    def _set_objective(self, obj):
+        for var in self._vars_referenced_by_obj:
+            self._referenced_variables[var] -= 1
+        self._vars_referenced_by_obj = ComponentSet(
+            EXPR.identify_variables(obj.expr, include_fixed=False))
+        for var in self._vars_referenced_by_obj:
+            self._referenced_variables[var] += 1
+        self._objective = obj
+        self.calls.append(('set_objective', obj.name))
+
+    def _remove_constraint(self, solver_con):
+        self.calls.append(('remove_constraint', solver_con))
+
+    def _remove_var(self, solver_var):
+        self.calls.append(('remove_var', solver_var))
+
+    def update_var(self, var):
+        self.calls.append(('update_var', var.name))
+
+
+class TestAutoUpdate(unittest.TestCase):
+
+    def create_model(self):
+        model = ConcreteModel()
+        model.I = Set(initialize=[1, 2, 3])
+        model.p = Param(model.I, initialize=1, mutable=True)
+        model.x = Var(model.I, bounds=(0, 10))
+        model.o = Objective(expr=sum(model.x[i] for i in model.I))
+        model.c = Constraint(model.I,
+                             rule=lambda m, i: m.p[i]*m.x[i] >= i)
+        model.b = Block()
+        model.b.y = Var(bounds=(0, 1))
+        model.b.c = Constraint(expr=model.b.y + model.x[1] >= 1)
+        return model
+
+    def create_solver(self, model):
+        opt = RecordingPersistent()
+        opt.set_instance(model, auto_update=True)
+        opt.calls = []
+        return opt
+
+    def test_no_changes(self):
+        model = self.create_model()
+        opt = self.create_solver(model)
+        for v in model.component_data_objects(Var):
+            v.value = 1
+        opt.update()
+        self.assertEqual(opt.calls, [])
+
+    def test_not_enabled(self):
+        model = self.create_model()
+        opt = RecordingPersistent()
+        opt.set_instance(model)
+        with self.assertRaises(RuntimeError):
+            opt.update()
+
+    def test_var_bounds(self):
+        model = self.create_model()
+        opt = self.create_solver(model)
+        model.x[2].setub(5)
+        model.b.y.domain = Binary
+        opt.update()
+        self.assertEqual(sorted(opt.calls), [('update_var', 'b.y'),
+                                             ('update_var', 'x[2]')])
+
+    def test_param(self):
+        model = self.create_model()
+        opt = self.create_solver(model)
+        model.p[2] = 3
+        opt.update()
+        self.assertEqual(opt.calls, [('remove_constraint', 'c[2]'),
+                                     ('add_constraint', 'c[2]')])
+
+    def test_fix(self):
+        model = self.create_model()
+        opt = self.create_solver(model)
+        model.x[1].fix(2)
+        opt.update()
+        self.assertEqual(opt.calls[0], ('update_var', 'x[1]'))
+        self.assertEqual(
+            sorted(opt.calls[1:]),
+            [('add_constraint', 'b.c'), ('add_constraint', 'c[1]'),
+             ('remove_constraint', 'b.c'), ('remove_constraint', 'c[1]'),
+             ('set_objective', 'o')])
+        self.assertEqual(opt._referenced_variables[model.x[1]], 0)
+        opt.calls = []
+        # changing the value of a fixed variable rebuilds the
+        # constraints that use it
+        model.x[1].value = 3
+        opt.update()
+        self.assertEqual(len(opt.calls), 6)
+        opt.calls = []
+        model.x[1].unfix()
+        opt.update()
+        self.assertEqual(len(opt.calls), 6)
+        self.assertEqual(opt._referenced_variables[model.x[1]], 3)
+
+    def test_deactivate(self):
+        model = self.create_model()
+        opt = self.create_solver(model)
+        model.c[3].deactivate()
+        model.b.deactivate()
+        opt.update()
+        self.assertEqual(sorted(opt.calls),
+                         [('remove_constraint', 'b.c'),
+                          ('remove_constraint', 'c[3]')])
+        self.assertNotIn(model.c[3], opt._pyomo_con_to_solver_con_map)
+        opt.calls = []
+        model.b.activate()
+        model.c[3].activate()
+        opt.update()
+        self.assertEqual(sorted(opt.calls),
+                         [('add_constraint', 'b.c'),
+                          ('add_constraint', 'c[3]')])
+
+    def test_new_components(self):
+        model = self.create_model()
+        opt = self.create_solver(model)
+        model.z = Var()
+        model.d = Constraint(expr=model.z + model.x[3] <= 4)
+        model.d.activate()
+        opt.update()
+        self.assertEqual(opt.calls, [('add_var', 'z'),
+                                     ('add_constraint', 'd')])
+        opt.calls = []
+        model.o.deactivate()
+        model.o2 = Objective(expr=model.z, sense=maximize)
+        model.o2.activate()
+        opt.update()
+        self.assertEqual(opt.calls, [('set_objective', 'o2')])
+
+    def test_expression(self):
+        model = self.create_model()
+        opt = self.create_solver(model)
+        model.c[1].set_value(model.x[1] + model.x[2] >= 1)
+        model.o.sense = maximize
+        opt.update()
+        self.assertEqual(opt.calls, [('remove_constraint', 'c[1]'),
+                                     ('add_constraint', 'c[1]'),
+                                     ('set_objective', 'o')])
+        self.assertEqual(opt._referenced_variables[model.x[2]], 3)
+
+    def test_remove(self):
+        model = self.create_model()
+        opt = self.create_solver(model)
+        opt.remove_block(model.b)
+        model.b.y.setlb(-1)
+        opt.update()
+        self.assertEqual(opt.calls, [('remove_constraint', 'b.c'),
+                                     ('remove_var', 'b.y')])
+        self.assertNotIn(model.b.y, opt._dependencies)
+
+    def test_set_instance_again(self):
+        model = self.create_model()
+        opt = self.create_solver(model)
+        tracker = opt._change_tracker
+        opt.set_instance(model)
+        self.assertFalse(tracker.active)
+        self.assertIsNone(opt._change_tracker)
+
+
+class PersistentAutoUpdateTests(object):
+
+    solver = None
+
+    def test_auto_update(self):
+        model = ConcreteModel()
+        model.p = Param(initialize=1, mutable=True)
+        model.x = Var(bounds=(0, 10))
+        model.y = Var(bounds=(0, 10))
+        model.o = Objective(expr=model.x + model.y)
+        model.c = Constraint(expr=model.x + model.p*model.y >= 2)
+        model.d = Constraint(expr=model.x >= 1)
+        model.d.deactivate()
+        opt = SolverFactory(self.solver)
+        opt.set_instance(model, auto_update=True)
+        opt.solve()
+        self.assertAlmostEqual(value(model.o), 2, delta=diff_tol)
+
+        model.p = 2
+        opt.solve()
+        self.assertAlmostEqual(value(model.o), 1, delta=diff_tol)
+
+        model.d.activate()
+        opt.solve()
+        self.assertAlmostEqual(value(model.x), 1, delta=diff_tol)
+        self.assertAlmostEqual(value(model.o), 1.5, delta=diff_tol)
+
+        model.x.fix(2)
+        opt.solve()
+        self.assertAlmostEqual(value(model.o), 2, delta=diff_tol)
+
+        model.x.unfix()
+        model.x.setlb(3)
+        opt.solve()
+        self.assertAlmostEqual(value(model.o), 3, delta=diff_tol)
+
+
+@unittest.skipIf(not gurobipy_available,
+                 "The 'gurobipy' python bindings are not available")
+class GurobiPersistentAutoUpdateTests(PersistentAutoUpdateTests,
+                                      unittest.TestCase):
+
+    solver = 'gurobi_persistent'
+
+
+@unittest.skipIf(not cplexpy_available,
+                 "The 'cplex' python bindings are not available")
+class CPLEXPersistentAutoUpdateTests(PersistentAutoUpdateTests,
+                                     unittest.TestCase):
+
+    solver = 'cplex_persistent'
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,312 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+from pyutilib.misc import Bunch
+from pyomo.opt import *
+from pyomo.environ import *
+from pyomo.solvers.plugins.solvers.cplex_persistent import CPLEXPersistent
+
+try:
+    import gurobipy
+    gurobipy_available = True
+except ImportError:
+    gurobipy_available = False
+
+try:
+    import cplex
+    cplexpy_available = True
+except ImportError:
+    cplexpy_available = False
+
+diff_tol = 1e-4
+
+
+class PersistentBatchTests(object):
+
+    solver = None
+
+    def create_model(self):
+        model = ConcreteModel()
+        model.I = RangeSet(0, 9)
+        model.x = Var(model.I, bounds=(0, 10))
+        model.y = Var(model.I, within=NonNegativeIntegers)
+        model.o = Objective(expr=sum(model.x[i] + 2*model.y[i]
+                                     for i in model.I))
+        model.c = Constraint(model.I,
+                             rule=lambda m, i: m.x[i] + m.y[i] >= i + 0.5)
+        model.r = Constraint(model.I,
+                             rule=lambda m, i: (0, m.x[i] - m.y[i], 3))
+        return model
+
+    def test_add_constraints(self):
+        model = self.create_model()
+        model.c.deactivate()
+        opt = SolverFactory(self.solver)
+        opt.set_instance(model)
+        opt.solve()
+        self.assertAlmostEqual(value(model.o), 0, delta=diff_tol)
+
+        model.c.activate()
+        opt.add_constraints(model.c.values())
+        opt.solve()
+        self.assertAlmostEqual(value(model.o), 66, delta=diff_tol)
+
+        opt.remove_constraints(model.c.values())
+        opt.solve()
+        self.assertAlmostEqual(value(model.o), 0, delta=diff_tol)
+
+    def test_add_vars(self):
+        model = self.create_model()
+        model.z = Var(model.I, bounds=(0, 1))
+        model.z_sum = Constraint(expr=sum(model.z.values()) >= 4)
+        model.z_sum.deactivate()
+        opt = SolverFactory(self.solver)
+        opt.set_instance(model)
+
+        opt.remove_vars(model.z.values())
+        opt.add_vars(model.z.values())
+        model.z_sum.activate()
+        opt.add_constraint(model.z_sum)
+        opt.solve()
+        self.assertAlmostEqual(value(model.o), 66, delta=diff_tol)
+        self.assertGreaterEqual(sum(value(v) for v in model.z.values()),
+                                4 - diff_tol)
+
+        opt.remove_constraint(model.z_sum)
+        opt.remove_vars(model.z.values())
+        opt.solve()
+        self.assertAlmostEqual(value(model.o), 66, delta=diff_tol)
+
+    def test_remove_referenced_vars(self):
+        model = self.create_model()
+        opt = SolverFactory(self.solver)
+        opt.set_instance(model)
+        with self.assertRaises(ValueError):
+            opt.remove_vars(model.x.values())
+
+
+class _StubCplexError(Exception):
+    pass
+
+
+class _StubInterface(object):
+    """
+    Records the calls made to one of the interfaces of a CPLEX model
+    (e.g., Cplex.variables).
+    """
+
+    def __init__(self, name, calls):
+        self._name = name
+        self._calls = calls
+        self.type = Bunch(binary='B', integer='I', continuous='C')
+        self.sense = Bunch(minimize=1, maximize=-1)
+
+    def __getattr__(self, attr):
+        def method(*args, **kwds):
+            self._calls.append((self._name, attr, args, kwds))
+        return method
+
+
+class _StubConstraints(_StubInterface):
+    """
+    Records the names of the constraints in a CPLEX model.  Deleting
+    a constraint that does not exist raises an error, like CPLEX does.
+    """
+
+    def __init__(self, name, calls):
+        _StubInterface.__init__(self, name, calls)
+        self.names = []
+
+    def add(self, *args, **kwds):
+        if 'names' in kwds:
+            self.names.extend(kwds['names'])
+        else:
+            self.names.append(kwds['name'])
+        self._calls.append((self._name, 'add', args, kwds))
+
+    def delete(self, names):
+        if not isinstance(names, list):
+            names = [names]
+        if any(name not in self.names for name in names):
+            raise _StubCplexError(names)
+        for name in names:
+            self.names.remove(name)
+        self._calls.append((self._name, 'delete', (names,), {}))
+
+
+class _StubCplexModel(object):
+
+    def __init__(self):
+        self.calls = []
+        self.variables = _StubInterface('variables', self.calls)
+        self.linear_constraints = _StubConstraints(
+            'linear_constraints', self.calls)
+        self.quadratic_constraints = _StubConstraints(
+            'quadratic_constraints', self.calls)
+        self.objective = _StubInterface('objective', self.calls)
+        self.SOS = _StubInterface('SOS', self.calls)
+
+
+# Stands in for the cplex module, so the bookkeeping of the batch
+# methods can be tested without the CPLEX python bindings
+_stub_cplex = Bunch(Cplex=_StubCplexModel,
+                    infinity=1e20,
+                    exceptions=Bunch(CplexError=_StubCplexError))
+
+
+class TestBatchBookkeeping(unittest.TestCase):
+
+    def create_model(self):
+        model = ConcreteModel()
+        model.I = RangeSet(0, 4)
+        model.x = Var(model.I, bounds=(0, 10))
+        model.z = Var(model.I, bounds=(0, 1))
+        model.o = Objective(expr=sum(model.x[i] for i in model.I))
+        model.c = Constraint(model.I,
+                             rule=lambda m, i: m.x[i] + m.z[i] >= i)
+        model.q = Constraint(expr=model.x[0]**2 + model.z[0] <= 4)
+        return model
+
+    def create_solver(self, model):
+        opt = CPLEXPersistent()
+        opt._cplex = _stub_cplex
+        opt.set_instance(model, symbolic_solver_labels=True)
+        opt._solver_model.calls[:] = []
+        return opt
+
+    def test_remove_constraints(self):
+        model = self.create_model()
+        opt = self.create_solver(model)
+        self.assertEqual(opt._referenced_variables[model.z[1]], 1)
+        self.assertEqual(opt._referenced_variables[model.x[0]], 3)
+
+        opt.remove_constraints([model.c[1], model.c[2]])
+        self.assertEqual(
+            opt._solver_model.calls,
+            [('linear_constraints', 'delete', (['c(1)', 'c(2)'],), {})])
+        for i in (1, 2):
+            self.assertNotIn(id(model.c[i]), opt._symbol_map.byObject)
+            self.assertNotIn(model.c[i], opt._pyomo_con_to_solver_con_map)
+            self.assertNotIn(model.c[i], opt._vars_referenced_by_con)
+            self.assertNotIn('c(%s)' % i, opt._solver_con_to_pyomo_con_map)
+            self.assertEqual(opt._referenced_variables[model.x[i]], 1)
+            self.assertEqual(opt._referenced_variables[model.z[i]], 0)
+        self.assertIn(id(model.c[3]), opt._symbol_map.byObject)
+        self.assertEqual(opt._referenced_variables[model.z[3]], 1)
+
+        # the constraints can be added again
+        opt.add_constraints([model.c[1], model.c[2]])
+        self.assertEqual(opt._pyomo_con_to_solver_con_map[model.c[2]],
+                         'c(2)')
+        self.assertEqual(opt._referenced_variables[model.z[1]], 1)
+
+    def test_remove_quadratic_constraints(self):
+        model = self.create_model()
+        opt = self.create_solver(model)
+        opt.remove_constraints([model.c[0], model.q])
+        # the batch delete fails, because q is not a linear
+        # constraint, so each constraint is removed separately
+        self.assertEqual(
+            opt._solver_model.calls,
+            [('linear_constraints', 'delete', (['c(0)'],), {}),
+             ('quadratic_constraints', 'delete', (['q'],), {})])
+        self.assertNotIn(model.q, opt._pyomo_con_to_solver_con_map)
+        self.assertNotIn(id(model.q), opt._symbol_map.byObject)
+        self.assertEqual(opt._referenced_variables[model.x[0]], 1)
+        self.assertEqual(opt._referenced_variables[model.z[0]], 0)
+
+    def test_add_quadratic_range_constraint(self):
+        model = self.create_model()
+        model.c.deactivate()
+        model.q.deactivate()
+        opt = self.create_solver(model)
+        model.d = Constraint(expr=model.x[1] + model.x[2] >= 1)
+        model.e = Constraint(expr=(0, model.x[3]**2, 1))
+        with self.assertRaises(ValueError):
+            opt.add_constraints([model.d, model.e])
+        # the linear constraint is not added either
+        self.assertEqual(opt._solver_model.calls, [])
+        self.assertNotIn(model.d, opt._pyomo_con_to_solver_con_map)
+        self.assertEqual(opt._referenced_variables[model.x[1]], 1)
+
+        opt.add_constraints([model.d])
+        self.assertEqual(
+            [call[:2] for call in opt._solver_model.calls],
+            [('linear_constraints', 'add')])
+        self.assertEqual(opt._referenced_variables[model.x[1]], 2)
+
+    def test_remove_vars(self):
+        model = self.create_model()
+        model.y = Var(model.I)
+        opt = self.create_solver(model)
+        self.assertEqual(
+            [opt._pyomo_var_to_ndx_map[v]
+             for v in model.component_data_objects(Var, sort=True)],
+            list(range(15)))
+
+        opt.remove_vars([model.y[3], model.y[1]])
+        self.assertEqual(
+            opt._solver_model.calls,
+            [('variables', 'delete', (['y(3)', 'y(1)'],), {})])
+        for i in (1, 3):
+            self.assertNotIn(id(model.y[i]), opt._symbol_map.byObject)
+            self.assertNotIn(model.y[i], opt._referenced_variables)
+            self.assertNotIn(model.y[i], opt._pyomo_var_to_solver_var_map)
+            self.assertNotIn(model.y[i], opt._pyomo_var_to_ndx_map)
+            self.assertNotIn('y(%s)' % i, opt._solver_var_to_pyomo_var_map)
+        # the remaining variables keep their order, and the indices
+        # are contiguous, as they are in the CPLEX model
+        remaining = [v for v in model.component_data_objects(Var, sort=True)
+                     if v in opt._pyomo_var_to_ndx_map]
+        self.assertEqual(len(remaining), 13)
+        self.assertEqual([opt._pyomo_var_to_ndx_map[v] for v in remaining],
+                         list(range(13)))
+        self.assertEqual(opt._ndx_count, 13)
+
+        # new variables are appended after the remaining variables
+        opt.add_vars([model.y[1]])
+        self.assertEqual(opt._pyomo_var_to_ndx_map[model.y[1]], 13)
+        self.assertEqual(opt._referenced_variables[model.y[1]], 0)
+
+    def test_remove_referenced_vars(self):
+        model = self.create_model()
+        model.y = Var()
+        opt = self.create_solver(model)
+        with self.assertRaises(ValueError):
+            opt.remove_vars([model.y, model.z[1]])
+        # nothing is removed
+        self.assertEqual(opt._solver_model.calls, [])
+        self.assertIn(model.y, opt._pyomo_var_to_ndx_map)
+        self.assertIn(id(model.y), opt._symbol_map.byObject)
+
+        opt.remove_constraint(model.c[1])
+        opt.remove_vars([model.y, model.z[1]])
+        self.assertNotIn(model.z[1], opt._pyomo_var_to_ndx_map)
+        self.assertEqual(sorted(opt._pyomo_var_to_ndx_map.values()),
+                         list(range(9)))
+
+
+@unittest.skipIf(not gurobipy_available,
+                 "The 'gurobipy' python bindings are not available")
+class GurobiPersistentBatchTests(PersistentBatchTests, unittest.TestCase):
+
+    solver = 'gurobi_persistent'
+
+
+@unittest.skipIf(not cplexpy_available,
+                 "The 'cplex' python bindings are not available")
+class CPLEXPersistentBatchTests(PersistentBatchTests, unittest.TestCase):
+
+    solver = 'cplex_persistent'
+
+
+if __name__ == "__main__":
+    unittest.main()
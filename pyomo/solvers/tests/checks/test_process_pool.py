@@ -0,0 +1,142 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Test the 'processpool' solver manager with a fake AMPL solver that
+# sets every variable to the process id of the worker that ran it
+#
+
+import os
+import time
+
+import pyutilib.th as unittest
+
+from six import PY3
+
+from pyomo.environ import *
+from pyomo.opt import SolverManagerFactory, TerminationCondition
+import pyomo.opt.parallel.local
+from pyomo.opt.parallel.manager import ActionManagerError, ActionStatus
+from pyomo.solvers.tests.fake_solver import (FakeSolverTestCase,
+                                             create_model as _create_model)
+
+
+def _unpicklable_result(data):
+    """A task whose result cannot be sent back from the worker."""
+    return True, lambda: None
+
+
+class TestProcessPool(FakeSolverTestCase):
+
+    # The solver process is started by the worker process
+    solver_value = 'os.getppid()'
+
+    def test_solve(self):
+        model = _create_model(3)
+        with SolverManagerFactory('processpool', processes=2) as manager:
+            results = manager.solve(model, opt='asl:'+self.solver)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertEqual(len(results.solution), 0)
+        pid = value(model.x[0])
+        self.assertNotEqual(pid, os.getpid())
+        self.assertEqual([value(v) for v in model.x.values()], [pid]*3)
+
+    def test_queue(self):
+        models = [_create_model(i+1) for i in range(4)]
+        with SolverManagerFactory('processpool', processes=2) as manager:
+            opt = SolverFactory('asl:'+self.solver)
+            handles = dict((manager.queue(m, opt=opt), m) for m in models)
+            ah = manager.wait_any()
+            self.assertIn(ah, handles)
+            self.assertEqual(ah.status, ActionStatus.done)
+            results = manager.get_results(ah)
+            self.assertEqual(results.solver.termination_condition,
+                             TerminationCondition.optimal)
+            manager.wait_all(handles)
+            for ah, m in handles.items():
+                self.assertEqual(ah.status, ActionStatus.done)
+                self.assertIsNotNone(m.x[0].value)
+                manager.get_results(ah)
+            self.assertEqual(manager.queued_action_counter, 0)
+            ah = manager.wait_any()
+            self.assertEqual(ah.id, -1)
+
+    def test_no_load_solutions(self):
+        model = _create_model(2)
+        with SolverManagerFactory('processpool') as manager:
+            ah = manager.queue(model, opt='asl:'+self.solver,
+                               load_solutions=False)
+            results = manager.wait_for(ah)
+        self.assertIsNone(model.x[0].value)
+        self.assertEqual(len(results.solution), 1)
+        model.solutions.load_from(results)
+        self.assertIsNotNone(model.x[0].value)
+
+    def test_failed_solve(self):
+        model = _create_model(2)
+        with SolverManagerFactory('processpool') as manager:
+            ah = manager.queue(model, opt='asl:'+self.solver+'_missing')
+            with self.assertRaises(ActionManagerError):
+                manager.wait_all()
+            self.assertEqual(ah.status, ActionStatus.error)
+            self.assertEqual(len(model.solutions.symbol_map), 0)
+
+    def test_failed_and_successful_solves(self):
+        models = [_create_model(2), _create_model(2)]
+        with SolverManagerFactory('processpool', processes=2) as manager:
+            bad = manager.queue(models[0], opt='asl:'+self.solver+'_missing')
+            good = manager.queue(models[1], opt='asl:'+self.solver)
+            # Wait until both solves have finished, so their results are
+            # collected together
+            start = time.time()
+            while manager._finished.qsize() < 2:
+                self.assertLess(time.time() - start, 60)
+                time.sleep(0.01)
+            with self.assertRaises(ActionManagerError):
+                manager.wait_all()
+            self.assertEqual(bad.status, ActionStatus.error)
+            self.assertEqual(good.status, ActionStatus.done)
+            self.assertEqual(manager.queued_action_counter, 0)
+            manager.wait_all()
+            results = manager.get_results(good)
+            self.assertEqual(results.solver.termination_condition,
+                             TerminationCondition.optimal)
+            self.assertIsNotNone(models[1].x[0].value)
+
+    @unittest.skipIf(not PY3, "Error callbacks require Python 3")
+    def test_unpicklable_result(self):
+        model = _create_model(2)
+        solve = pyomo.opt.parallel.local._solve_problem_file
+        pyomo.opt.parallel.local._solve_problem_file = _unpicklable_result
+        try:
+            with SolverManagerFactory('processpool') as manager:
+                ah = manager.queue(model, opt='asl:'+self.solver)
+                # The failure is reported instead of never finishing
+                start = time.time()
+                while manager._finished.qsize() < 1:
+                    self.assertLess(time.time() - start, 60)
+                    time.sleep(0.01)
+                with self.assertRaises(ActionManagerError):
+                    manager.wait_all()
+                self.assertEqual(ah.status, ActionStatus.error)
+                self.assertEqual(manager.queued_action_counter, 0)
+                self.assertEqual(len(model.solutions.symbol_map), 0)
+        finally:
+            pyomo.opt.parallel.local._solve_problem_file = solve
+
+    def test_not_shell_solver(self):
+        model = _create_model(2)
+        with SolverManagerFactory('processpool') as manager:
+            with self.assertRaises(ActionManagerError):
+                manager.queue(model, opt='cplex_direct')
+
+
+if __name__ == "__main__":
+    unittest.main()
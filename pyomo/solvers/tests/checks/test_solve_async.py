@@ -0,0 +1,144 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Test SystemCallSolver.solve_async() and the CoroutineSolverManager
+# with a fake AMPL solver that sets every variable to 1
+#
+
+import sys
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+from pyomo.environ import *
+from pyomo.opt import TerminationCondition
+from pyomo.opt.parallel.manager import ActionManagerError, ActionStatus
+from pyomo.solvers.tests.fake_solver import (FakeSolverTestCase,
+                                             create_model as _create_model)
+
+try:
+    import asyncio
+    asyncio_available = sys.version_info >= (3,5)
+except ImportError:                         #pragma:nocover
+    asyncio_available = False
+if asyncio_available:
+    from pyomo.opt.parallel.coroutine import CoroutineSolverManager
+
+
+@unittest.skipIf(not asyncio_available, "asyncio requires Python 3.5")
+class TestSolveAsync(FakeSolverTestCase):
+
+    solver_sleep = 0.5
+
+    def setUp(self):
+        super(TestSolveAsync, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        super(TestSolveAsync, self).tearDown()
+
+    def test_solve(self):
+        model = _create_model(3)
+        results = SolverFactory('asl:'+self.solver).solve(model)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertEqual([value(v) for v in model.x.values()], [1, 1, 1])
+
+    def test_solve_async(self):
+        model = _create_model(3)
+        opt = SolverFactory('asl:'+self.solver)
+        log = []
+        depth = len(TempfileManager._tempfiles)
+        results = self.loop.run_until_complete(
+            opt.solve_async(model, log_callback=log.append,
+                            options={'outlev': 1}))
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertEqual([value(v) for v in model.x.values()], [1, 1, 1])
+        self.assertEqual(log, ['start\n', 'end\n'])
+        self.assertNotIn('outlev', opt.options)
+        self.assertEqual(len(TempfileManager._tempfiles), depth)
+
+    def test_solve_async_twice(self):
+        model = _create_model(3)
+        opt = SolverFactory('asl:'+self.solver)
+        ans = self.loop.run_until_complete(asyncio.gather(
+            opt.solve_async(model), opt.solve_async(model),
+            return_exceptions=True))
+        # the solve that starts second fails
+        ans.sort(key=lambda x: isinstance(x, RuntimeError))
+        self.assertEqual(ans[0].solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertIs(type(ans[1]), RuntimeError)
+
+    def test_failed_solve_async(self):
+        model = _create_model(3)
+        opt = SolverFactory('asl:'+self.solver)
+        opt.set_executable(self.solver+'_missing', validate=False)
+        depth = len(TempfileManager._tempfiles)
+        with self.assertRaises(Exception):
+            self.loop.run_until_complete(
+                opt.solve_async(model, available=True))
+        self.assertEqual(len(TempfileManager._tempfiles), depth)
+
+    def test_manager(self):
+        models = [_create_model(i+1) for i in range(4)]
+        log = []
+        manager = CoroutineSolverManager(max_concurrent=4)
+        opt = SolverFactory('asl:'+self.solver)
+        ahs = [manager.queue(m, opt=opt, log_callback=log.append)
+               for m in models]
+        self.assertEqual(manager.num_queued(), 4)
+        ah = self.loop.run_until_complete(manager.wait_any())
+        self.assertIn(ah, ahs)
+        self.assertEqual(ah.status, ActionStatus.done)
+        self.loop.run_until_complete(manager.wait_all(ahs))
+        self.assertEqual(manager.num_queued(), 0)
+        # the solvers were executed concurrently
+        self.assertEqual(log, ['start\n']*4 + ['end\n']*4)
+        for ah, m in zip(ahs, models):
+            self.assertEqual(ah.status, ActionStatus.done)
+            results = manager.get_results(ah)
+            self.assertEqual(results.solver.termination_condition,
+                             TerminationCondition.optimal)
+            self.assertEqual(value(m.o), len(m.x))
+        ah = self.loop.run_until_complete(manager.wait_any())
+        self.assertEqual(ah.id, -1)
+
+    def test_manager_solve(self):
+        model = _create_model(2)
+        manager = CoroutineSolverManager()
+        results = self.loop.run_until_complete(
+            manager.solve(model, opt='asl:'+self.solver,
+                          load_solutions=False))
+        self.assertIsNone(model.x[0].value)
+        model.solutions.load_from(results)
+        self.assertEqual(value(model.o), 2)
+
+    def test_manager_failed_solve(self):
+        model = _create_model(2)
+        manager = CoroutineSolverManager()
+        ah = manager.queue(model, opt='asl:'+self.solver+'_missing')
+        self.loop.run_until_complete(manager.wait_all())
+        self.assertEqual(ah.status, ActionStatus.error)
+        with self.assertRaises(Exception):
+            manager.get_results(ah)
+
+    def test_manager_not_shell_solver(self):
+        manager = CoroutineSolverManager()
+        with self.assertRaises(ActionManagerError):
+            manager.queue(_create_model(2), opt='cplex_direct')
+
+
+if __name__ == "__main__":
+    unittest.main()
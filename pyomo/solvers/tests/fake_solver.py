@@ -0,0 +1,99 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# A fake AMPL solver for testing the solver managers without installing
+# a solver.  The solver prints 'start', waits, prints 'end' and writes a
+# .sol file that sets every variable to the same value.
+#
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+
+import pyutilib.th as unittest
+
+from pyomo.environ import ConcreteModel, Constraint, Objective, Var
+
+_fake_solver = """#!%(python)s
+import os
+import sys
+import time
+stub = sys.argv[1]
+if stub.endswith('.nl'):
+    stub = stub[:-3]
+with open(stub + '.nl') as f:
+    f.readline()
+    nvar, ncon = [int(x) for x in f.readline().split()[:2]]
+print('start')
+sys.stdout.flush()
+time.sleep(%(sleep)r)
+print('end')
+with open(stub + '.sol', 'w') as f:
+    f.write('fake solver\\n\\nOptions\\n3\\n0\\n1\\n0\\n')
+    f.write('%%d\\n%%d\\n%%d\\n%%d\\n' %% (ncon, ncon, nvar, nvar))
+    for i in range(ncon):
+        f.write('0\\n')
+    for i in range(nvar):
+        f.write('%%r\\n' %% (%(value)s,))
+    f.write('objno 0 0\\n')
+"""
+
+
+def write_fake_solver(dirname, value='1', sleep=0):
+    """
+    Write the fake solver to the directory dirname, and return the
+    name of the executable.
+
+    Args:
+        value (str): A Python expression for the value of the
+            variables, which is evaluated by the solver.
+        sleep (float): The number of seconds between the 'start' and
+            'end' lines of the solver output.
+    """
+    fname = os.path.join(dirname, 'fake_solver')
+    with open(fname, 'w') as f:
+        f.write(_fake_solver % {'python': sys.executable,
+                                'value': value,
+                                'sleep': sleep})
+    os.chmod(fname, os.stat(fname).st_mode | stat.S_IEXEC)
+    return fname
+
+
+def create_model(n):
+    """
+    Returns a model with n variables, which the fake solver solves.
+    """
+    model = ConcreteModel()
+    model.x = Var(range(n), bounds=(0, None))
+    model.o = Objective(expr=sum(model.x.values()))
+    model.c = Constraint(expr=sum(model.x.values()) >= 1)
+    return model
+
+
+class FakeSolverTestCase(unittest.TestCase):
+    """
+    A test case that writes the fake solver to a temporary directory.
+    The name of the solver executable is self.solver.
+    """
+
+    # The arguments of write_fake_solver()
+    solver_value = '1'
+    solver_sleep = 0
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.solver = write_fake_solver(self.tmpdir,
+                                        value=self.solver_value,
+                                        sleep=self.solver_sleep)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
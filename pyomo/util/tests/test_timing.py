@@ -0,0 +1,142 @@
+"""Testing for construction profiling (pyomo.util.timing)."""
+import json
+import os
+import tempfile
+
+import pyutilib.th as unittest
+
+from pyomo.util import timing
+from pyomo.environ import (ConcreteModel, Set, Var, Constraint, Objective,
+                           TransformationFactory)
+
+from six import StringIO
+
+
+class TestConstructionProfile(unittest.TestCase):
+
+    def tearDown(self):
+        timing.profile_construction(False)
+
+    def _build(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.x = Var(m.I, bounds=(0, 1))
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i] + 2*m.x[1] >= 0)
+        m.o = Objective(expr=m.x[1])
+        return m
+
+    def test_disabled(self):
+        self.assertIsNone(timing._profile)
+        self.assertIsNone(timing.profile_construction(False))
+        self._build()
+        self.assertIsNone(timing._profile)
+
+    def test_construction(self):
+        profile = timing.profile_construction()
+        self.assertIs(timing._profile, profile)
+        m = self._build()
+        self.assertIs(timing.profile_construction(False), profile)
+        self.assertIsNone(timing._profile)
+
+        records = dict((r.name, r) for r in profile.records
+                       if r.category == 'construct')
+        self.assertEqual(sorted(records),
+                         ['ConcreteModel', 'I', 'c', 'o', 'x'])
+        self.assertEqual(records['c'].detail, 'Constraint')
+        self.assertEqual(records['c'].rule_calls, 3)
+        # each body is a sum of two terms (with coefficient 1 and 2)
+        self.assertGreater(records['c'].expression_nodes, 3)
+        self.assertEqual(records['o'].expression_nodes, 1)
+        self.assertIsNone(records['x'].expression_nodes)
+        self.assertEqual(records['x'].rule_calls, 0)
+        for r in profile.records:
+            self.assertGreaterEqual(r.seconds, 0)
+            if profile.memory:
+                self.assertIsNotNone(r.bytes)
+
+        # Nonlinear expressions
+        profile = timing.profile_construction()
+        m.d = Constraint(expr=m.x[1]*m.x[2]/(m.x[3] + 1) <= 1)
+        timing.profile_construction(False)
+        self.assertGreaterEqual(profile.records[-1].expression_nodes, 5)
+
+        # Records collected after profiling is disabled are ignored
+        m.y = Var()
+        self.assertNotIn('y', [r.name for r in profile.records])
+
+    def test_sparse_constraint(self):
+        m = self._build()
+        calls = []
+        def rule(m, i):
+            calls.append(i)
+            return m.x[i] >= 0
+        profile = timing.profile_construction()
+        m.s = Constraint(m.I, rule=rule, dense=False)
+        timing.profile_construction(False)
+        # Profiling does not construct the constraints of sparse
+        # components
+        self.assertEqual(calls, [])
+        self.assertEqual(len(m.s._data), 0)
+        self.assertIsNone(profile.records[-1].expression_nodes)
+
+    def test_no_memory(self):
+        profile = timing.profile_construction(memory=False)
+        self._build()
+        timing.profile_construction(False)
+        self.assertFalse(profile.memory)
+        self.assertTrue(all(r.bytes is None for r in profile.records))
+
+    def test_transformation_and_writer(self):
+        m = self._build()
+        profile = timing.profile_construction()
+        TransformationFactory('core.relax_integrality').apply_to(m)
+        fd, fname = tempfile.mkstemp(suffix='.lp')
+        os.close(fd)
+        try:
+            m.write(fname)
+        finally:
+            os.remove(fname)
+        timing.profile_construction(False)
+        categories = [(r.category, r.detail) for r in profile.records]
+        self.assertIn(('transform', 'in-place'), categories)
+        self.assertIn(('write', ''), categories)
+        record = [r for r in profile.records if r.category == 'write'][0]
+        self.assertEqual(record.name, 'cpxlp')
+
+    def test_export(self):
+        profile = timing.profile_construction()
+        self._build()
+        timing.profile_construction(False)
+
+        data = profile.to_list()
+        self.assertEqual(len(data), len(profile.records))
+        self.assertEqual(
+            sorted(data[0]),
+            ['bytes', 'category', 'detail', 'expression_nodes',
+             'name', 'rule_calls', 'seconds'])
+
+        output = StringIO()
+        profile.write_json(output)
+        self.assertEqual(json.loads(output.getvalue()), data)
+
+        output = StringIO()
+        profile.pprint(output, sort_by='expression_nodes', limit=2)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0].split(),
+                         ['Seconds', 'Rules', 'Nodes', 'Bytes',
+                          'Category', 'Detail', 'Name'])
+        self.assertEqual(lines[1].split()[-1], 'c')
+
+        fd, fname = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            profile.save(fname)
+            with open(fname) as INPUT:
+                self.assertEqual(json.load(INPUT), data)
+        finally:
+            os.remove(fname)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,13 @@
 import sys
+import json
 import logging
 from pyutilib.misc.timing import TicTocTimer
 
+try:
+    import tracemalloc
+except ImportError:                               #pragma:nocover
+    tracemalloc = None
+
 _logger = logging.getLogger('pyomo.util.timing')
 _logger.propagate = False
 _logger.setLevel(logging.WARNING)
@@ -20,29 +26,247 @@ def report_timing(stream=True):
         for h in _logger.handlers:
             _logger.removeHandler(h)
 
+
+#
+# Construction profiling
+#
+
+# The active ConstructionProfile (None when profiling is disabled)
+_profile = None
+
+def profile_construction(enable=True, memory=True):
+    """Enable (or disable) profiling of model construction
+
+    While profiling is enabled, every ConstructionTimer,
+    TransformationTimer and WriterTimer adds a record to a
+    ConstructionProfile with the elapsed time, the number of rules
+    called, the number of expression nodes in the constructed
+    component, and the number of bytes allocated (if `memory` is True
+    and tracemalloc is available).
+
+    Returns the active ConstructionProfile when enabling profiling and
+    the completed profile when disabling it.
+    """
+    global _profile
+    ans = _profile
+    if ans is not None:
+        ans._stop()
+        _profile = None
+    if enable:
+        _profile = ans = ConstructionProfile(memory)
+    return ans
+
+def _count_expression_nodes(expr):
+    # Count the nodes (including leaves) of an expression tree.  Named
+    # expressions (component data) are counted as a single node: their
+    # trees are counted for the component that owns them.
+    count = 0
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        count += 1
+        if node is expr or not hasattr(node, 'parent_component'):
+            try:
+                if not node.is_expression():
+                    continue
+            except AttributeError:
+                continue
+            args = node._args
+            if args is None:
+                # coopr3 product expressions
+                stack.extend(node._numerator)
+                stack.extend(node._denominator)
+            else:
+                stack.extend(args)
+    return count
+
+def _component_expression_nodes(obj):
+    # Count the expression nodes stored on the data of a constraint,
+    # objective or expression component (None for other components).
+    # Only the data that was already constructed is counted, so the
+    # rules of sparse components (e.g., Constraint(dense=False)) are
+    # not evaluated.
+    try:
+        if obj.is_indexed():
+            data = list(obj._data.values())
+        else:
+            data = [obj]
+    except Exception:
+        return None
+    if not data:
+        return None
+    for attr in ('body', 'expr'):
+        if hasattr(data[0], attr):
+            break
+    else:
+        return None
+    count = 0
+    for item in data:
+        expr = getattr(item, attr, None)
+        if expr is not None:
+            count += _count_expression_nodes(expr)
+    return count
+
+
+class ConstructionProfileRecord(object):
+    """The statistics collected for one timed operation"""
+
+    __slots__ = ('category', 'name', 'detail', 'seconds', 'rule_calls',
+                 'expression_nodes', 'bytes')
+
+    def __init__(self, category, name, detail, seconds, rule_calls,
+                 expression_nodes, bytes):
+        self.category = category
+        self.name = name
+        self.detail = detail
+        self.seconds = seconds
+        self.rule_calls = rule_calls
+        self.expression_nodes = expression_nodes
+        self.bytes = bytes
+
+    def to_dict(self):
+        return dict((key, getattr(self, key)) for key in self.__slots__)
+
+
+class ConstructionProfile(object):
+    """Profile statistics collected by profile_construction()
+
+    Records are stored in the order in which the operations finished.
+    Times, rule calls and allocated bytes are inclusive: a block
+    record includes the components constructed on that block.
+    """
+
+    # (attribute, heading, format) for each column of the table
+    _columns = (
+        ('seconds', 'Seconds', '%.3f'),
+        ('rule_calls', 'Rules', '%d'),
+        ('expression_nodes', 'Nodes', '%d'),
+        ('bytes', 'Bytes', '%d'),
+        ('category', 'Category', '%s'),
+        ('detail', 'Detail', '%s'),
+        ('name', 'Name', '%s'),
+    )
+
+    def __init__(self, memory=True):
+        self.records = []
+        self.rule_calls = 0
+        self._stop_tracemalloc = False
+        self.memory = bool(memory) and tracemalloc is not None
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._stop_tracemalloc = True
+
+    def _stop(self):
+        if self._stop_tracemalloc:
+            tracemalloc.stop()
+            self._stop_tracemalloc = False
+
+    def _snapshot(self):
+        if self.memory and tracemalloc.is_tracing():
+            return (self.rule_calls, tracemalloc.get_traced_memory()[0])
+        return (self.rule_calls, None)
+
+    def _record(self, category, name, detail, seconds, start,
+                expression_nodes=None):
+        rule_calls, mem = start
+        if mem is not None and tracemalloc.is_tracing():
+            mem = tracemalloc.get_traced_memory()[0] - mem
+        else:
+            mem = None
+        self.records.append(ConstructionProfileRecord(
+            category, name, detail, seconds, self.rule_calls - rule_calls,
+            expression_nodes, mem))
+
+    def to_list(self):
+        """Return the records as a list of dicts"""
+        return [record.to_dict() for record in self.records]
+
+    def write_json(self, ostream=None):
+        """Write the records to a stream as a JSON list"""
+        if ostream is None:
+            ostream = sys.stdout
+        json.dump(self.to_list(), ostream, indent=1)
+        ostream.write("\n")
+
+    def pprint(self, ostream=None, sort_by='seconds', limit=None):
+        """Write the records to a stream as a table
+
+        Records are sorted (in decreasing order) by the `sort_by`
+        attribute; if `sort_by` is None, records are listed in the
+        order in which they were collected.  If `limit` is not None,
+        only the first `limit` records are written.
+        """
+        if ostream is None:
+            ostream = sys.stdout
+        records = self.records
+        if sort_by is not None:
+            records = sorted(
+                records, reverse=True,
+                key=lambda x: (getattr(x, sort_by) is not None,
+                               getattr(x, sort_by)))
+        if limit is not None:
+            records = records[:limit]
+        rows = [tuple(heading for attr, heading, fmt in self._columns)]
+        for record in records:
+            row = []
+            for attr, heading, fmt in self._columns:
+                val = getattr(record, attr)
+                row.append('-' if val is None else fmt % (val,))
+            rows.append(tuple(row))
+        widths = [max(len(row[i]) for row in rows)
+                  for i in range(len(self._columns))]
+        for row in rows:
+            line = []
+            for i, (attr, heading, fmt) in enumerate(self._columns):
+                if fmt == '%s':
+                    line.append(row[i].ljust(widths[i]))
+                else:
+                    line.append(row[i].rjust(widths[i]))
+            ostream.write("  ".join(line).rstrip() + "\n")
+
+    def save(self, filename):
+        """Write the records to a file (JSON if the file name ends with
+        '.json', and a table otherwise)"""
+        with open(filename, 'w') as ostream:
+            if filename.endswith('.json'):
+                self.write_json(ostream)
+            else:
+                self.pprint(ostream)
+
+
 _construction_logger = logging.getLogger('pyomo.util.timing.construction')
 class ConstructionTimer(object):
     fmt = "%%6.%df seconds to construct %s %s; %d %s total"
     def __init__(self, obj):
         self.obj = obj
+        self.profile = _profile
+        if self.profile is not None:
+            self.start = self.profile._snapshot()
         self.timer = TicTocTimer()
 
     def report(self):
         # Record the elapsed time, as some log handlers may not
         # immediately generate the messge string
         self.timer = self.timer.toc(msg="")
+        if self.profile is not None:
+            self.profile._record(
+                'construct', self._name(), self.obj.type().__name__,
+                self.timer, self.start, _component_expression_nodes(self.obj))
         _construction_logger.info(self)
 
-    def __str__(self):
-        total_time = self.timer
-        idx = len(self.obj.index_set())
+    def _name(self):
         try:
-            name = self.obj.name
+            return self.obj.name
         except RuntimeError:
             try:
-                name = self.obj.local_name
+                return self.obj.local_name
             except RuntimeError:
-                name = '(unknown)'
+                return '(unknown)'
+
+    def __str__(self):
+        total_time = self.timer
+        idx = len(self.obj.index_set())
+        name = self._name()
         try:
             return self.fmt % ( 2 if total_time>=0.005 else 0,
                                 self.obj.type().__name__,
@@ -66,12 +290,19 @@ class TransformationTimer(object):
             self.mode = ''
         else:
             self.mode = " (%s)" % (mode,)
+        self.profile = _profile
+        if self.profile is not None:
+            self.start = self.profile._snapshot()
         self.timer = TicTocTimer()
 
     def report(self):
         # Record the elapsed time, as some log handlers may not
         # immediately generate the message string
         self.timer = self.timer.toc(msg="")
+        if self.profile is not None:
+            self.profile._record(
+                'transform', self.obj.__class__.__name__,
+                self.mode.strip(' ()'), self.timer, self.start)
         _transform_logger.info(self)
 
     def __str__(self):
@@ -86,3 +317,39 @@ class TransformationTimer(object):
             return "TransformationTimer object for %s; %s elapsed seconds" % (
                 name,
                 self.timer.toc("") )
+
+
+_writer_logger = logging.getLogger('pyomo.util.timing.writer')
+class WriterTimer(object):
+    fmt = "%%6.%df seconds to write %s file%s"
+    def __init__(self, format, phase=None):
+        self.format = str(format)
+        self.phase = phase
+        self.profile = _profile
+        if self.profile is not None:
+            self.start = self.profile._snapshot()
+        self.timer = TicTocTimer()
+
+    def report(self):
+        # Record the elapsed time, as some log handlers may not
+        # immediately generate the message string
+        self.timer = self.timer.toc(msg="")
+        if self.profile is not None:
+            self.profile._record(
+                'write', self.format, self.phase or '',
+                self.timer, self.start)
+        _writer_logger.info(self)
+
+    def __str__(self):
+        total_time = self.timer
+        phase = '' if self.phase is None else " (%s)" % (self.phase,)
+        try:
+            return self.fmt % ( 2 if total_time>=0.005 else 0,
+                                self.format,
+                                phase,
+                            ) % total_time
+        except TypeError:
+            return "WriterTimer object for %s%s; %s elapsed seconds" % (
+                self.format,
+                phase,
+                self.timer.toc("") )